@@ -0,0 +1,314 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the catalog of the AT commands used by the tabs.
+
+Every command is described once, by name, with a format string and the
+parameters that fill it in. Each parameter has a function that validates its
+value and returns the text to put in the command, so building a command is a
+lookup in the catalog followed by one string format:
+
+    >>> build('dtmf', tones='1, 2, a')
+    'AT+VTS="1,2,A"'
+    >>> build('barring_query', facility='AO')
+    'AT+CLCK="AO", 2'
+
+Invalid parameters raise a ValueError with a message suitable for showing to
+the user. The catalog does not depend on Qt, so the tabs, the command line tool
+and scripts all build their commands from it.
+"""
+
+# Standard library modules
+import shlex
+
+# Commands of the "Basic Info" tab as (catalog name, command, description)
+INFO_COMMANDS = (
+    ('imei', 'AT+CGSN', 'Display the IMEI'),
+    ('imsi', 'AT+CIMI', 'Display the IMSI'),
+    ('manufacturer', 'AT+GMI', 'Display the manufacturer'),
+    ('model', 'AT+GMM', 'Display the model'),
+    ('revision', 'AT+GMR', 'Display the software revision'),
+    ('capabilities', 'AT+GCAP', 'Display the modem capabilities'),
+    ('commands', 'AT+CLAC', 'List the available AT commands'),
+)
+
+# Call barring facilities, and those that can only be disabled
+BARRING_FACILITIES = ('AO', 'OI', 'OX', 'AI', 'IR', 'AC', 'AG', 'AB')
+DISABLE_ONLY_FACILITIES = ('AC', 'AG', 'AB')
+ENABLE_FACILITIES = tuple(f for f in BARRING_FACILITIES if f not in DISABLE_ONLY_FACILITIES)
+
+# Facilities that have a password which can be changed with AT+CPWD
+PASSWORD_FACILITIES = ('PS', 'SC', 'P2', 'AO', 'OI', 'AI', 'IR', 'OX', 'AB', 'AG', 'AC')
+
+# Bearer service classes, which are added together in call barring commands
+BEARER_CLASSES = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Phone functionality levels of AT+CFUN
+FUNCTIONALITY_LEVELS = (0, 1, 2, 3, 4, 5, 6)
+
+# Tones that can be sent with AT+VTS
+DTMF_TONES = '0123456789*#ABCD'
+
+# Largest DTMF tone duration of AT+VTD, in tenths of a second
+MAX_TONE_DURATION = 255
+
+def validate_password(password):
+    """
+    Check that a given network password is valid. The network
+    password must be exactly 4 digits.
+    """
+    password = str(password)
+
+    # Check that the network password is not empty
+    if len(password) == 0:
+        raise ValueError('Please enter a network password.')
+
+    # Check that the network password is only digits
+    if not password.isdigit():
+        raise ValueError('The network password can only contain digits.')
+
+def validate_dtmf_string(dtmf_string):
+    """
+    Checks for any errors in the string to be used in the DTMF AT command.
+
+    If an error is found the error message will be returned, as a string.
+    If no errors occur then "None" is returned.
+    """
+
+    # Check for any invalid characters
+    allowed_chars = DTMF_TONES + ','
+
+    for char in dtmf_string:
+        char_original = char.strip()
+        char_upper = char_original.upper()
+        if char_upper and char_upper not in allowed_chars:
+            return 'Character "%s" is invalid.' % char_original
+
+    # Strip spaces and commas from both ends of the string
+    dtmf_string = dtmf_string.strip(' ,')
+
+    # Check each "item" is valid
+    items = dtmf_string.split(',')
+
+    for item in items:
+        item = item.strip()
+        if len(item) != 1:
+            return 'The specified tone string is invalid, please check.'
+
+def capability_name(command):
+    """
+    Return the name under which a command is listed by AT+CLAC: the name of
+    an extended command, e.g. "+CLCK" for 'AT+CLCK="AO", 2', or the letter
+    of a basic command, e.g. "D" for "ATD123;" and "&F" for "AT&F".
+    """
+    name = command.strip().upper()
+    if name.startswith('AT'):
+        name = name[2:]
+    if name[:1].isalpha():
+        return name[:1]
+    if name[:1] == '&':
+        return name[:2]
+    for separator in ';=?"':
+        index = name.find(separator)
+        if index >= 0:
+            name = name[:index]
+    return name.strip()
+
+# Parameter value functions. Each validates a value and returns its text in
+# the command.
+
+def password_text(password):
+    validate_password(password)
+    return str(password)
+
+def dtmf_text(dtmf_string):
+    dtmf_string = str(dtmf_string).strip(' ,')
+    error_msg = validate_dtmf_string(dtmf_string)
+    if error_msg:
+        raise ValueError(error_msg)
+    return ','.join(i.strip().upper() for i in dtmf_string.split(','))
+
+def duration_text(duration):
+    """
+    Return a DTMF tone duration in tenths of a second, 0 meaning the
+    device default.
+    """
+    try:
+        duration = int(duration)
+    except ValueError:
+        duration = -1
+    if not 0 <= duration <= MAX_TONE_DURATION:
+        raise ValueError('The tone duration must be from 0 to %d tenths of a second.' % MAX_TONE_DURATION)
+    return str(duration)
+
+def dial_text(dial_string):
+    dial_string = str(dial_string).strip()
+    if len(dial_string) == 0:
+        raise ValueError('Please enter a string to dial')
+    return dial_string
+
+def classes_text(classes):
+    """
+    Return the optional class argument of AT+CLCK, which is left out when
+    no classes are given so the network default applies.
+    """
+    classes = int(classes)
+    if not 0 <= classes <= sum(BEARER_CLASSES):
+        raise ValueError('The classes must be a sum of %s.' % ', '.join(str(c) for c in BEARER_CLASSES))
+    return ', %d' % classes if classes else ''
+
+def query_classes_text(classes):
+    """
+    Return the optional class argument of an AT+CLCK interrogation, which
+    follows an empty password.
+    """
+    text = classes_text(classes)
+    return ', ""' + text if text else ''
+
+def choice(values, description):
+    """
+    Return a function that accepts only the given values.
+    """
+    by_text = dict((str(value), value) for value in values)
+
+    def choice_text(value):
+        if str(value) not in by_text:
+            raise ValueError('The %s must be one of %s.' % (description, ', '.join(str(v) for v in values)))
+        return str(value)
+
+    return choice_text
+
+# Marks a parameter that has no default value
+REQUIRED = object()
+
+class Parameter(object):
+    """
+    A parameter of a command: its name, the function returning the text of
+    a value and the default value, if it may be left out.
+    """
+
+    def __init__(self, name, text, default=REQUIRED):
+        self.name = name
+        self.text = text
+        self.default = default
+
+class CommandSpec(object):
+    """
+    A command of the catalog: a format string with a "%(name)s" field for
+    each of its parameters. "capability" is the name AT+CLAC lists the
+    command under.
+    """
+
+    def __init__(self, name, template, parameters=(), description=''):
+        self.name = name
+        self.template = template
+        self.parameters = parameters
+        self.description = description
+        self.names = frozenset(parameter.name for parameter in parameters)
+        self.capability = capability_name(template)
+
+    def __repr__(self):
+        return '<CommandSpec %s>' % self.name
+
+    def build(self, **values):
+        """
+        Validate the parameter values and return the command.
+        """
+        if not self.parameters:
+            if values:
+                raise ValueError('%s does not take parameters.' % self.name)
+            return self.template
+
+        unknown = set(values) - self.names
+        if unknown:
+            raise ValueError('Unknown parameter "%s" for %s.' % (sorted(unknown)[0], self.name))
+        fields = {}
+        for parameter in self.parameters:
+            value = values.get(parameter.name, parameter.default)
+            if value is REQUIRED:
+                raise ValueError('The %s parameter of %s is required.' % (parameter.name, self.name))
+            fields[parameter.name] = parameter.text(value)
+        return self.template % fields
+
+# The commands of the catalog by name
+CATALOG = dict((name, CommandSpec(name, command, description=description))
+               for name, command, description in INFO_COMMANDS)
+for spec in (
+    CommandSpec('answer', 'ATA', description='Answer an incoming call'),
+    CommandSpec('hangup', 'ATH', description='Terminate the active call'),
+    CommandSpec('voice_call', 'ATD%(number)s;', (Parameter('number', dial_text),),
+                description='Make a voice call'),
+    CommandSpec('data_call', 'ATD%(number)s', (Parameter('number', dial_text),),
+                description='Make a data call'),
+    CommandSpec('functionality', 'AT+CFUN=%(level)s',
+                (Parameter('level', choice(FUNCTIONALITY_LEVELS, 'functionality level')),),
+                description='Set the phone functionality level'),
+    CommandSpec('dtmf', 'AT+VTS="%(tones)s"', (Parameter('tones', dtmf_text),),
+                description='Send comma separated DTMF tones'),
+    CommandSpec('dtmf_duration', 'AT+VTD=%(duration)s', (Parameter('duration', duration_text),),
+                description='Set the DTMF tone duration in tenths of a second'),
+    CommandSpec('barring_enable', 'AT+CLCK="%(facility)s", 1, "%(password)s"%(classes)s',
+                (Parameter('facility', choice(ENABLE_FACILITIES, 'facility')),
+                 Parameter('password', password_text),
+                 Parameter('classes', classes_text, 0)),
+                description='Enable call barring'),
+    CommandSpec('barring_disable', 'AT+CLCK="%(facility)s", 0, "%(password)s"%(classes)s',
+                (Parameter('facility', choice(BARRING_FACILITIES, 'facility')),
+                 Parameter('password', password_text),
+                 Parameter('classes', classes_text, 0)),
+                description='Disable call barring'),
+    CommandSpec('barring_query', 'AT+CLCK="%(facility)s", 2%(classes)s',
+                (Parameter('facility', choice(ENABLE_FACILITIES, 'facility')),
+                 Parameter('classes', query_classes_text, 0)),
+                description='Interrogate the call barring status of a facility'),
+    CommandSpec('change_password', 'AT+CPWD="%(facility)s", "%(old_password)s", "%(new_password)s"',
+                (Parameter('facility', choice(PASSWORD_FACILITIES, 'facility')),
+                 Parameter('old_password', password_text),
+                 Parameter('new_password', password_text)),
+                description='Change the password of a facility'),
+    CommandSpec('password_test', 'AT+CPWD=?', description='List the facilities that have passwords'),
+    CommandSpec('error_format', 'AT+CMEE=%(mode)s', (Parameter('mode', choice((0, 1, 2), 'error format')),),
+                description='Report errors as ERROR (0), numeric (1) or verbose (2) +CME ERROR codes'),
+):
+    CATALOG[spec.name] = spec
+
+def build(name, **values):
+    """
+    Build the command called "name" in the catalog from parameter values.
+    """
+    try:
+        spec = CATALOG[name]
+    except KeyError:
+        raise ValueError('Unknown command "%s".' % name)
+    return spec.build(**values)
+
+def build_text(text):
+    """
+    Build a command written as its catalog name followed by "name=value"
+    parameters, e.g. 'barring_query facility=AO'. Values may be quoted.
+    """
+    words = shlex.split(text)
+    if not words:
+        raise ValueError('No command given.')
+    values = {}
+    for word in words[1:]:
+        name, sep, value = word.partition('=')
+        if not sep:
+            raise ValueError('Expected "name=value" instead of "%s".' % word)
+        values[name] = value
+    return build(words[0], **values)
@@ -0,0 +1,239 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Command line entry point of the AT Command Toolkit, for use without a display.
+
+Sends the AT commands given on the command line to a serial port and prints
+one result per command, e.g.
+
+    python atk.py --port /dev/ttyUSB3 --baud 115200 AT+CGSN AT+CIMI
+
+Commands can also be built from the command catalog used by the tabs of the
+application, e.g. "--info" sends all the Basic Info commands, "--dtmf 1,2,3"
+sends AT+VTS="1,2,3" and "@barring_query facility=AO" sends AT+CLCK="AO", 2.
+"--catalog" lists the commands of the catalog. Commands built by options are
+sent before the others, each in the order given, and pipelined up to the
+"--window" size. Results are printed as one JSON object per line, or as a
+table with "--text". The exit status is 0 if every command succeeded.
+
+Qt is never imported, so the tool starts quickly on servers without PyQt4.
+"""
+
+# Standard library modules
+import json
+import sys
+from optparse import OptionParser, OptionValueError
+
+# 3rd party modules
+import serial
+
+# Local application modules
+import atcommands
+from capabilities import DEFAULT_CACHE_PATH, CapabilityCache, probe
+from commandqueue import DEFAULT_TIMEOUT, DEFAULT_WINDOW
+from session import AtSession, SessionLoop
+from snapshot import SnapshotCache, export_data, take_snapshot
+
+# Exit statuses
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_PORT_ERROR = 2
+
+def response_record(response):
+    """
+    Return a finished "CommandResponse" as a dictionary for printing.
+    """
+    rtt = response.round_trip_time()
+    return {
+        'command': response.command,
+        'ok': response.is_ok(),
+        'result': response.result,
+        'lines': response.lines,
+        'timed_out': response.timed_out,
+        'skipped': False,
+        'rtt_ms': round(rtt * 1000.0, 3) if rtt is not None else None,
+    }
+
+def skipped_record(command):
+    """
+    Return the record of a command that was not sent because the device
+    does not support it.
+    """
+    return {
+        'command': command,
+        'ok': False,
+        'result': None,
+        'lines': [],
+        'timed_out': False,
+        'skipped': True,
+        'rtt_ms': None,
+    }
+
+def format_record(record):
+    """
+    Return a one line text form of a response record.
+    """
+    if record['ok']:
+        text = ' '.join(record['lines']) or record['result']
+    elif record['skipped']:
+        text = 'NOT SUPPORTED'
+    elif record['timed_out']:
+        text = 'TIMEOUT'
+    else:
+        text = record['result'] or 'FAILED'
+    rtt = '%.1f ms' % record['rtt_ms'] if record['rtt_ms'] is not None else '-'
+    status = 'OK' if record['ok'] else 'SKIP' if record['skipped'] else 'FAIL'
+    return '%-30s %-4s %10s  %s' % (record['command'], status, rtt, text)
+
+def build_option(option, opt_str, value, parser, name, parameter=None):
+    """
+    optparse callback adding the command "name" of the catalog to the list
+    of commands, with the option's value as its parameter, so built commands
+    keep the order they were given.
+    """
+    try:
+        if parameter is None:
+            command = atcommands.build(name)
+        else:
+            command = atcommands.build(name, **{parameter: value})
+    except ValueError, e:
+        raise OptionValueError('%s: %s' % (opt_str, e))
+    parser.values.commands.append(command)
+
+def info_option(option, opt_str, value, parser):
+    """
+    optparse callback adding all the Basic Info commands.
+    """
+    parser.values.commands.extend(atcommands.build(name) for name, command, description in atcommands.INFO_COMMANDS)
+
+def format_catalog():
+    """
+    Return a text listing of the commands in the catalog.
+    """
+    lines = []
+    for name, spec in sorted(atcommands.CATALOG.items()):
+        parameters = ' '.join('%s=...' % parameter.name for parameter in spec.parameters)
+        lines.append('@%-40s %s' % (('%s %s' % (name, parameters)).strip(), spec.description))
+    return '\n'.join(lines)
+
+def make_parser():
+    parser = OptionParser(usage='%prog --port PORT [options] [COMMAND...]')
+    parser.set_defaults(commands=[])
+    parser.add_option('-p', '--port',
+                      help='serial port the modem is connected to')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the port [default: %default]')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='seconds to wait for each response [default: %default]')
+    parser.add_option('-w', '--window', type='int', default=DEFAULT_WINDOW,
+                      help='number of commands sent before waiting for a response [default: %default]')
+    parser.add_option('--text', action='store_true', default=False,
+                      help='print a table instead of JSON')
+    parser.add_option('-s', '--skip-unsupported', action='store_true', default=False,
+                      help='skip commands the device does not list with AT+CLAC')
+    parser.add_option('--cache', default=DEFAULT_CACHE_PATH, metavar='FILE',
+                      help='file the supported commands of each device are cached in [default: %default]')
+    parser.add_option('--info', action='callback', callback=info_option,
+                      help='send all the Basic Info commands')
+    parser.add_option('--dtmf', action='callback', type='string', callback=build_option,
+                      callback_args=('dtmf', 'tones'), metavar='TONES',
+                      help='send comma separated DTMF tones')
+    parser.add_option('--dial', action='callback', type='string', callback=build_option,
+                      callback_args=('voice_call', 'number'), metavar='NUMBER',
+                      help='make a voice call')
+    parser.add_option('--hangup', action='callback', callback=build_option,
+                      callback_args=('hangup',),
+                      help='terminate the active call')
+    parser.add_option('--cfun', action='callback', type='int', callback=build_option,
+                      callback_args=('functionality', 'level'), metavar='LEVEL',
+                      help='set the phone functionality level')
+    parser.add_option('--snapshot', action='store_true', default=False,
+                      help='print a JSON snapshot of the Basic Info fields before the results')
+    parser.add_option('--catalog', action='store_true', default=False,
+                      help='list the commands of the catalog and exit')
+    return parser
+
+def main(argv=None):
+    parser = make_parser()
+    options, args = parser.parse_args(argv)
+    if options.catalog:
+        print format_catalog()
+        return EXIT_OK
+
+    # Arguments starting with "@" are built from the catalog
+    commands = options.commands
+    for arg in args:
+        try:
+            commands.append(atcommands.build_text(arg[1:]) if arg.startswith('@') else arg)
+        except ValueError, e:
+            parser.error('%s: %s' % (arg, e))
+
+    if not options.port:
+        parser.error('a port is required')
+    if not commands and not options.snapshot:
+        parser.error('no commands given')
+
+    try:
+        session = AtSession.open(options.port, options.baud, window=options.window, timeout=options.timeout)
+    except serial.SerialException, e:
+        sys.stderr.write('%s: %s\n' % (options.port, e))
+        return EXIT_PORT_ERROR
+
+    try:
+        loop = SessionLoop([session])
+        capabilities = None
+        if options.skip_unsupported:
+            capabilities = probe(session, CapabilityCache(options.cache), loop)
+            if capabilities is None and session not in loop.failed:
+                sys.stderr.write('%s: the supported commands could not be found\n' % options.port)
+
+        if options.snapshot:
+            record = take_snapshot(session, SnapshotCache(), loop)
+            if record is not None:
+                print json.dumps(export_data(record, port=options.port), sort_keys=True)
+
+        # Unsupported commands are skipped, None takes their place
+        responses = []
+        for command in commands:
+            if capabilities is not None and not capabilities.supports(command):
+                responses.append(None)
+            else:
+                responses.append(session.command(command))
+        loop.run_until_done([response for response in responses if response is not None])
+        if session in loop.failed:
+            sys.stderr.write('%s: %s\n' % (options.port, loop.failed[session]))
+            return EXIT_PORT_ERROR
+    finally:
+        session.close()
+
+    status = EXIT_OK
+    for command, response in zip(commands, responses):
+        if response is None:
+            record = skipped_record(command)
+        else:
+            record = response_record(response)
+        if options.text:
+            print format_record(record)
+        else:
+            print json.dumps(record, sort_keys=True)
+        if not record['ok'] and not record['skipped']:
+            status = EXIT_FAILED
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
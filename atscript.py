@@ -0,0 +1,341 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for running scripts of AT commands against a modem.
+
+A script has one command per line. Indented lines below a command set the
+options of that step:
+
+    # Provisioning recipe
+    AT+CFUN=1
+        timeout: 30
+    AT+CGSN
+        expect: ^\d{15}$
+        retries: 2
+
+A command starting with "@" is built from the command catalog, e.g.
+"@barring_query facility=AO" (see atcommands.py).
+
+"expect" is a regular expression that must match one of the lines of the
+response (the result code included) and may be given more than once. A step
+without one passes if the command returns OK. "timeout" is in seconds and
+"retries" is the number of times a failed step is sent again. Blank lines and
+lines starting with "#" are ignored.
+
+Steps are pipelined up to the session's window, but a step with "expect" or
+"retries" is waited for before any later step is queued, so that a retry is
+sent before the steps after it. The script stops at the first step that fails
+for good; the steps after it that were not sent are reported as not run. The
+result of each step, with its latency, is written to a JSON report.
+"""
+
+# Standard library modules
+import json
+import re
+
+# Local application modules
+from atcommands import build_text
+from clock import monotonic
+from session import SessionLoop
+
+class Step(object):
+    """
+    A command of a script, with the rules that decide whether it passed.
+    """
+
+    def __init__(self, command, expect=(), timeout=None, retries=0, line_number=None):
+        self.command = command
+        self.expect = [re.compile(pattern) for pattern in expect]
+        self.timeout = timeout
+        self.retries = retries
+        self.line_number = line_number
+
+    def __repr__(self):
+        return '<Step %r>' % self.command
+
+    def check(self, response):
+        """
+        Return None if a finished response passes the step, otherwise the
+        reason it failed.
+        """
+        if response.timed_out:
+            return 'timed out'
+        if response.result is None:
+            return 'cancelled'
+        if not self.expect:
+            if response.is_ok():
+                return None
+            return 'result %s' % response.result
+
+        lines = response.lines + [response.result]
+        for pattern in self.expect:
+            if not any(pattern.search(line) for line in lines):
+                return 'no line matched "%s"' % pattern.pattern
+        return None
+
+def parse_script(lines):
+    """
+    Parse the lines of a script into a list of "Step" objects. Raises a
+    ValueError naming the line of the first error.
+    """
+    steps = []
+    options = None
+    for line_number, line in enumerate(lines, 1):
+        text = line.strip()
+        if not text or text.startswith('#'):
+            continue
+
+        # Lines that are not indented are commands
+        if not line[0].isspace():
+            if text.startswith('@'):
+                try:
+                    text = build_text(text[1:])
+                except ValueError, e:
+                    raise ValueError('Line %d: %s' % (line_number, e))
+            options = {'expect': [], 'timeout': None, 'retries': 0}
+            steps.append((text, options, line_number))
+            continue
+
+        if options is None:
+            raise ValueError('Line %d: option before the first command' % line_number)
+        name, sep, value = text.partition(':')
+        name = name.strip().lower()
+        value = value.strip()
+        try:
+            if not sep:
+                raise ValueError('expected "name: value"')
+            if name == 'expect':
+                re.compile(value)
+                options['expect'].append(value)
+            elif name == 'timeout':
+                options['timeout'] = float(value)
+            elif name == 'retries':
+                options['retries'] = int(value)
+            else:
+                raise ValueError('unknown option "%s"' % name)
+        except (ValueError, re.error), e:
+            raise ValueError('Line %d: %s' % (line_number, e))
+
+    return [Step(command, line_number=line_number, **step_options)
+            for command, step_options, line_number in steps]
+
+def load_script(path):
+    """
+    Parse the script in a file.
+    """
+    with open(path) as f:
+        return parse_script(f)
+
+class ScriptRunner(object):
+    """
+    Runs the steps of a script on a session and records their results.
+
+    If the capabilities of the device are given, steps whose commands the
+    device does not support are skipped rather than sent.
+    """
+
+    def __init__(self, session, steps, loop=None, capabilities=None):
+        self.session = session
+        self.steps = steps
+        self.loop = loop if loop is not None else SessionLoop([session])
+        self.capabilities = capabilities
+        self.results = [None] * len(steps)
+        self.attempts = [0] * len(steps)
+        self.running = 0
+        self.elapsed = None
+
+        # Index of the next step to queue, the step with "expect" or
+        # "retries" being waited for, and whether a step has failed
+        self.next_index = 0
+        self.waiting_for = None
+        self.stopped = False
+
+    def submit_steps(self):
+        """
+        Queue the next steps, up to and including the next step that has
+        to finish before later steps are sent.
+        """
+        while self.next_index < len(self.steps) and self.waiting_for is None and not self.stopped:
+            index = self.next_index
+            self.next_index += 1
+            step = self.steps[index]
+            if self.capabilities is not None and not self.capabilities.supports(step.command):
+                self.record(index, 'not supported', skipped=True)
+                continue
+            self.submit(index)
+            if step.expect or step.retries:
+                self.waiting_for = index
+
+    def submit(self, index):
+        step = self.steps[index]
+        self.attempts[index] += 1
+        self.running += 1
+        response = self.session.command(step.command, step.timeout)
+        response.add_callback(lambda response: self.step_finished(index, response))
+
+    def step_finished(self, index, response):
+        """
+        Record the result of a step, or send it again if it failed and has
+        retries left. A step that failed for good stops the script.
+
+        When a step times out the command queue keeps the place of that
+        attempt until its late reply has arrived (or a further timeout has
+        passed), so the late reply is discarded rather than taken as the
+        reply to the retry or to a later step.
+        """
+        self.running -= 1
+        step = self.steps[index]
+        reason = step.check(response)
+        if reason is not None and self.attempts[index] <= step.retries:
+            self.submit(index)
+            return
+
+        self.record(index, reason, response)
+        if reason is not None:
+            self.stopped = True
+        if index == self.waiting_for:
+            self.waiting_for = None
+        self.submit_steps()
+
+    def record(self, index, reason, response=None, skipped=False):
+        """
+        Record the result of a step, which passed if there is no reason for
+        it to have failed.
+        """
+        step = self.steps[index]
+        rtt = response.round_trip_time() if response is not None else None
+        self.results[index] = {
+            'step': index + 1,
+            'line': step.line_number,
+            'command': step.command,
+            'passed': reason is None,
+            'skipped': skipped,
+            'reason': reason,
+            'attempts': self.attempts[index],
+            'result': response.result if response is not None else None,
+            'lines': response.lines if response is not None else [],
+            'latency_ms': round(rtt * 1000.0, 3) if rtt is not None else None,
+        }
+
+    def run(self):
+        """
+        Run the steps and return their results. Steps that did not finish
+        because the serial port failed are reported as failed, and steps not
+        sent because an earlier step failed are reported as not run.
+        """
+        start = monotonic()
+        self.submit_steps()
+        while self.running and self.session in self.loop.sessions:
+            self.loop.run_once()
+        self.elapsed = monotonic() - start
+
+        for index in range(len(self.steps)):
+            if self.results[index] is None:
+                if self.session not in self.loop.sessions:
+                    self.record(index, 'port failed')
+                else:
+                    self.record(index, 'not run', skipped=True)
+        return self.results
+
+    def report(self):
+        """
+        Return the report of the last run as a dictionary.
+        """
+        passed = sum(1 for result in self.results if result['passed'])
+        skipped = sum(1 for result in self.results if result['skipped'])
+        return {
+            'steps': len(self.results),
+            'passed': passed,
+            'skipped': skipped,
+            'failed': len(self.results) - passed - skipped,
+            'elapsed_s': round(self.elapsed, 3),
+            'results': self.results,
+        }
+
+def format_result(result):
+    """
+    Return a one line text form of the result of a step.
+    """
+    latency = '%.1f ms' % result['latency_ms'] if result['latency_ms'] is not None else '-'
+    if result['passed']:
+        status = 'PASS'
+    elif result['skipped']:
+        status = 'SKIPPED (%s)' % result['reason']
+    else:
+        status = 'FAIL (%s)' % result['reason']
+    return '%4d %-30s %10s  %s' % (result['step'], result['command'], latency, status)
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    import sys
+
+    import serial
+
+    from capabilities import DEFAULT_CACHE_PATH, CapabilityCache, probe
+    from commandqueue import DEFAULT_TIMEOUT, DEFAULT_WINDOW
+    from session import AtSession
+
+    parser = OptionParser(usage='%prog [options] PORT SCRIPT')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the port [default: %default]')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='default seconds to wait for each response [default: %default]')
+    parser.add_option('-w', '--window', type='int', default=DEFAULT_WINDOW,
+                      help='number of commands sent before waiting for a response [default: %default]')
+    parser.add_option('-r', '--report', metavar='FILE',
+                      help='write the report to FILE as JSON')
+    parser.add_option('-s', '--skip-unsupported', action='store_true', default=False,
+                      help='skip commands the device does not list with AT+CLAC')
+    parser.add_option('--cache', default=DEFAULT_CACHE_PATH, metavar='FILE',
+                      help='file the supported commands of each device are cached in [default: %default]')
+    options, args = parser.parse_args()
+    if len(args) != 2:
+        parser.error('a port and a script are required')
+    port, path = args
+
+    try:
+        steps = load_script(path)
+    except (IOError, ValueError), e:
+        sys.exit('%s: %s' % (path, e))
+
+    try:
+        session = AtSession.open(port, options.baud, window=options.window, timeout=options.timeout)
+    except serial.SerialException, e:
+        sys.exit('%s: %s' % (port, e))
+
+    runner = ScriptRunner(session, steps)
+    try:
+        if options.skip_unsupported:
+            runner.capabilities = probe(session, CapabilityCache(options.cache), runner.loop)
+            if runner.capabilities is None:
+                sys.stderr.write('%s: the supported commands could not be found\n' % port)
+        runner.run()
+    finally:
+        session.close()
+    if session in runner.loop.failed:
+        sys.stderr.write('%s: %s\n' % (port, runner.loop.failed[session]))
+
+    report = runner.report()
+    for result in report['results']:
+        print format_result(result)
+    print '%d of %d steps passed, %d skipped in %.3f s' % (report['passed'], report['steps'],
+                                                         report['skipped'], report['elapsed_s'])
+    if options.report:
+        with open(options.report, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    sys.exit(0 if report['failed'] == 0 else 1)
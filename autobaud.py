@@ -0,0 +1,132 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for detecting the baud rate and data format of modems.
+
+A modem is detected by sending "AT" with each candidate setting in turn
+until it answers with a clean "OK". The candidates are ordered so that
+the most common settings are tried first. Several ports are probed at
+the same time, each in its own thread, so a rack of modems takes about
+as long as the slowest one.
+"""
+
+# Standard library modules
+import threading
+
+# 3rd party modules
+import serial
+
+# Local application modules
+from clock import monotonic
+from framing import LineFramer
+
+# Baud rates to try, most common first
+CANDIDATE_BAUDRATES = (115200, 9600, 57600, 38400, 19200, 230400, 460800, 921600, 4800, 2400, 1200)
+
+# Data formats to try as (data bits, parity, stop bits), most common first
+CANDIDATE_FORMATS = ((serial.EIGHTBITS, serial.PARITY_NONE, serial.STOPBITS_ONE),
+                     (serial.SEVENBITS, serial.PARITY_EVEN, serial.STOPBITS_ONE),
+                     (serial.SEVENBITS, serial.PARITY_ODD, serial.STOPBITS_ONE),
+                     (serial.EIGHTBITS, serial.PARITY_NONE, serial.STOPBITS_TWO))
+
+# Seconds to wait for the answer to each "AT"
+PROBE_TIMEOUT = 0.3
+
+# Number of times "AT" is sent with each setting (some modems only learn
+# the baud rate from the first "AT" they receive)
+PROBE_ATTEMPTS = 2
+
+def probe(port, baudrate, bytesize, parity, stopbits, timeout=PROBE_TIMEOUT):
+    """
+    Open the port with the given settings, send "AT" and return True if the
+    modem answers with "OK". Raises "serial.SerialException" if the port
+    can not be opened.
+    """
+    conn = serial.Serial(port, baudrate, bytesize, parity, stopbits, timeout=timeout / 4.0)
+    try:
+        for attempt in range(PROBE_ATTEMPTS):
+            conn.flushInput()
+            conn.write('AT\r')
+            framer = LineFramer()
+            end = monotonic() + timeout
+            while monotonic() < end:
+                for line in framer.feed(conn.read(max(1, conn.inWaiting()))):
+                    if line == 'OK':
+                        return True
+    finally:
+        conn.close()
+    return False
+
+def detect(port, baudrates=CANDIDATE_BAUDRATES, formats=CANDIDATE_FORMATS, timeout=PROBE_TIMEOUT,
+           cancelled=None):
+    """
+    Find the settings at which the modem on a port answers. Returns a
+    dictionary of serial port settings (baudrate, bytesize, parity and
+    stopbits) or None if the modem did not answer at any of them. Raises
+    "serial.SerialException" if the port can not be opened.
+
+    If a "cancelled" function is given it is called before each setting
+    is tried, and None is returned as soon as it returns True.
+    """
+    for bytesize, parity, stopbits in formats:
+        for baudrate in baudrates:
+            if cancelled is not None and cancelled():
+                return None
+            if probe(port, baudrate, bytesize, parity, stopbits, timeout):
+                return {'baudrate': baudrate, 'bytesize': bytesize,
+                        'parity': parity, 'stopbits': stopbits}
+    return None
+
+def detect_all(ports, baudrates=CANDIDATE_BAUDRATES, formats=CANDIDATE_FORMATS, timeout=PROBE_TIMEOUT):
+    """
+    Detect the settings of several ports at the same time. Returns a
+    dictionary of port names and settings (as returned by "detect"), or
+    the "serial.SerialException" raised for ports that could not be opened.
+    """
+    results = {}
+
+    def detect_port(port):
+        try:
+            results[port] = detect(port, baudrates, formats, timeout)
+        except serial.SerialException, e:
+            results[port] = e
+
+    threads = [threading.Thread(target=detect_port, args=(port,)) for port in ports]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def format_settings(settings):
+    """
+    Return settings in the usual short form, e.g. "115200 8N1".
+    """
+    return '%d %d%s%s' % (settings['baudrate'], settings['bytesize'],
+                          settings['parity'], settings['stopbits'])
+
+if __name__ == '__main__':
+    import sys
+
+    for port, settings in sorted(detect_all(sys.argv[1:]).items()):
+        if settings is None:
+            print '%s: no answer' % port
+        elif isinstance(settings, serial.SerialException):
+            print '%s: %s' % (port, settings)
+        else:
+            print '%s: %s' % (port, format_settings(settings))
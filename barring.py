@@ -0,0 +1,361 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for interrogating and enforcing the call barring status of a SIM card.
+
+A sweep queues AT+CLCK interrogations of every facility that can be
+interrogated (the disable-only AC, AG and AB facilities are skipped) for every
+bearer class at once, pipelined up to the session's window, and parses the
+"+CLCK: <status>,<class>" lines of the responses into a matrix of facility by
+bearer class:
+
+    {'AO': {1: True, 2: False, ...}, 'OI': {...}, ...}
+
+True means barring is active for the class, False that it is not. Every class
+of a facility whose interrogation failed is None. Classes a response does not
+report as active are not barred.
+
+A policy is the desired state: the classes that should be barred for each
+facility it names, e.g. {"AO": [1, 4], "IR": 255, "OI": []}. Syncing a policy
+sweeps the facilities it names and only sends the AT+CLCK commands needed to
+enable or disable the classes that differ, at most two per facility. Facilities
+the policy does not name are left as they are.
+"""
+
+# Standard library modules
+import json
+import re
+
+# Local application modules
+from atcommands import BEARER_CLASSES, ENABLE_FACILITIES, build, classes_text, validate_password
+from session import SessionLoop
+
+# Facilities a sweep interrogates, and the classes it asks about
+SWEEP_FACILITIES = ENABLE_FACILITIES
+SWEEP_CLASSES = sum(BEARER_CLASSES)
+
+# Classes a status applies to when the response does not give them
+# (voice, data and fax, as defined by 3GPP TS 27.007)
+DEFAULT_CLASSES = 7
+
+CLCK_PATTERN = re.compile(r'^\+CLCK:\s*(\d+)\s*(?:,\s*(\d+))?')
+
+def parse_status(lines):
+    """
+    Return a dictionary of bearer class to barring status (True if active)
+    from the lines of an AT+CLCK interrogation response.
+    """
+    status = dict((bearer_class, False) for bearer_class in BEARER_CLASSES)
+    for line in lines:
+        match = CLCK_PATTERN.match(line)
+        if match is None:
+            continue
+        active = match.group(1) == '1'
+        classes = int(match.group(2)) if match.group(2) else DEFAULT_CLASSES
+        if active:
+            for bearer_class in BEARER_CLASSES:
+                if classes & bearer_class:
+                    status[bearer_class] = True
+    return status
+
+class BarringSweep(object):
+    """
+    Interrogates the call barring status of every facility through a
+    function that queues a command and returns its "CommandResponse"
+    (e.g. "AtSession.command" or "TerminalWidget.send_command").
+
+    "done" is called with the matrix once every response has arrived. The
+    result code of each failed interrogation is kept in "errors".
+    """
+
+    def __init__(self, send, done, facilities=SWEEP_FACILITIES):
+        self.send = send
+        self.done = done
+        self.facilities = facilities
+        self.responses = {}
+        self.errors = {}
+        self.matrix = None
+
+    def start(self):
+        """
+        Queue the interrogations. If there are no facilities to interrogate
+        "done" is called straight away with an empty matrix.
+        """
+        if not self.facilities:
+            self.matrix = {}
+            self.done(self.matrix)
+            return
+        for facility in self.facilities:
+            self.responses[facility] = self.send(build('barring_query', facility=facility,
+                                                       classes=SWEEP_CLASSES))
+        for response in self.responses.values():
+            response.add_callback(self.response_finished)
+
+    def response_finished(self, response):
+        if self.matrix is not None or not all(r.is_done() for r in self.responses.values()):
+            return
+        matrix = {}
+        for facility, response in self.responses.items():
+            if response.is_ok():
+                matrix[facility] = parse_status(response.lines)
+            else:
+                matrix[facility] = dict((bearer_class, None) for bearer_class in BEARER_CLASSES)
+                self.errors[facility] = 'TIMEOUT' if response.timed_out else response.result or 'FAILED'
+        self.matrix = matrix
+        self.done(matrix)
+
+def parse_policy(data):
+    """
+    Return a policy as a dictionary of facility to the sum of the classes
+    that should be barred. The classes of each facility may be given as a
+    sum or a list. Raises a ValueError if the policy is not valid.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('The policy must map facilities to classes.')
+    policy = {}
+    for facility, classes in data.items():
+        facility = str(facility).upper()
+        if facility not in SWEEP_FACILITIES:
+            raise ValueError('The facility must be one of %s, not "%s".' % (', '.join(SWEEP_FACILITIES), facility))
+        if isinstance(classes, list):
+            if [c for c in classes if c not in BEARER_CLASSES]:
+                raise ValueError('The classes of %s must be some of %s.' %
+                                 (facility, ', '.join(str(c) for c in BEARER_CLASSES)))
+            classes = sum(set(classes))
+        classes_text(classes)
+        policy[facility] = int(classes)
+    return policy
+
+def load_policy(path):
+    """
+    Load a policy from a JSON file.
+    """
+    with open(path) as f:
+        return parse_policy(json.load(f))
+
+def plan_changes(policy, matrix):
+    """
+    Return the changes needed to bring the barring status of a matrix to
+    a policy, as a list of (facility, enable, classes) tuples. Facilities
+    whose status is not known are left out.
+    """
+    changes = []
+    for facility in SWEEP_FACILITIES:
+        if facility not in policy or facility not in matrix:
+            continue
+        status = matrix[facility]
+        if None in status.values():
+            continue
+        barred = sum(bearer_class for bearer_class in BEARER_CLASSES if status[bearer_class])
+        enable = policy[facility] & ~barred
+        disable = barred & ~policy[facility]
+        if enable:
+            changes.append((facility, True, enable))
+        if disable:
+            changes.append((facility, False, disable))
+    return changes
+
+def sweep(session, loop=None, facilities=SWEEP_FACILITIES):
+    """
+    Interrogate the call barring status of a session's SIM card, waiting
+    for the responses, and return the "BarringSweep" with its matrix.
+    """
+    if loop is None:
+        loop = SessionLoop([session])
+    barring_sweep = BarringSweep(session.command, lambda matrix: None, facilities)
+    barring_sweep.start()
+    while barring_sweep.matrix is None and session in loop.sessions:
+        loop.run_once()
+    return barring_sweep
+
+class BarringSync(object):
+    """
+    Brings the call barring status of a SIM card to a policy through a
+    function that queues a command and returns its "CommandResponse".
+
+    The facilities of the policy are swept and the changes needed are sent,
+    unless "dry_run" is set. "done" is called with the list of changes once
+    their responses have arrived. The result code of each change is kept in
+    "results" and the errors of facilities that could not be interrogated
+    are kept in "errors".
+    """
+
+    def __init__(self, send, policy, password, done, dry_run=False):
+        if not dry_run:
+            validate_password(password)
+        self.send = send
+        self.policy = policy
+        self.password = password
+        self.done = done
+        self.dry_run = dry_run
+        self.sweep = None
+        self.changes = None
+        self.responses = []
+        self.results = []
+        self.errors = {}
+        self.finished = False
+
+    def start(self):
+        facilities = [facility for facility in SWEEP_FACILITIES if facility in self.policy]
+        self.sweep = BarringSweep(self.send, self.swept, facilities)
+        self.sweep.start()
+
+    def swept(self, matrix):
+        self.errors.update(self.sweep.errors)
+        self.changes = plan_changes(self.policy, matrix)
+        if self.dry_run or not self.changes:
+            self.finish()
+            return
+        for facility, enable, classes in self.changes:
+            command = build('barring_enable' if enable else 'barring_disable',
+                            facility=facility, password=self.password, classes=classes)
+            self.responses.append(self.send(command))
+        for response in self.responses:
+            response.add_callback(self.changed)
+
+    def changed(self, response):
+        if self.finished or not all(r.is_done() for r in self.responses):
+            return
+        self.results = ['TIMEOUT' if r.timed_out else r.result or 'FAILED' for r in self.responses]
+        self.finish()
+
+    def finish(self):
+        self.finished = True
+        self.done(self.changes)
+
+def sync(session, policy, password, loop=None, dry_run=False):
+    """
+    Bring the call barring status of a session's SIM card to a policy,
+    waiting for the responses, and return the "BarringSync".
+    """
+    if loop is None:
+        loop = SessionLoop([session])
+    barring_sync = BarringSync(session.command, policy, password, lambda changes: None, dry_run)
+    barring_sync.start()
+    while not barring_sync.finished and session in loop.sessions:
+        loop.run_once()
+    return barring_sync
+
+def format_change(change, result=None):
+    """
+    Return a one line text form of a change planned by a policy sync.
+    """
+    facility, enable, classes = change
+    text = '%s %s %s' % ('enable' if enable else 'disable', facility,
+                         ', '.join(str(c) for c in BEARER_CLASSES if classes & c))
+    if result is not None:
+        text += ': %s' % result
+    return text
+
+def format_matrix(matrix, facilities=SWEEP_FACILITIES):
+    """
+    Return a barring matrix as a text table, "X" marking the classes that
+    are barred and "?" those whose status is not known.
+    """
+    lines = ['    ' + ''.join('%5d' % bearer_class for bearer_class in BEARER_CLASSES)]
+    for facility in facilities:
+        status = matrix[facility]
+        marks = [{True: 'X', False: '-', None: '?'}[status[bearer_class]] for bearer_class in BEARER_CLASSES]
+        lines.append('%-4s' % facility + ''.join('%5s' % mark for mark in marks))
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    import sys
+
+    from commandqueue import DEFAULT_TIMEOUT, DEFAULT_WINDOW
+    from fleet import Fleet
+
+    parser = OptionParser(usage='%prog [options] PORT...')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the ports [default: %default]')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='seconds to wait for each response [default: %default]')
+    parser.add_option('-w', '--window', type='int', default=DEFAULT_WINDOW,
+                      help='number of commands sent before waiting for a response [default: %default]')
+    parser.add_option('--policy', metavar='FILE',
+                      help='bring the barring status to the policy in FILE (JSON)')
+    parser.add_option('--password', default='',
+                      help='network password used to apply a policy')
+    parser.add_option('-n', '--dry-run', action='store_true', default=False,
+                      help='print the changes a policy needs without sending them')
+    parser.add_option('--json', action='store_true', default=False,
+                      help='print the results as JSON')
+    options, ports = parser.parse_args()
+    if not ports:
+        parser.error('at least one port is required')
+
+    policy = None
+    if options.policy:
+        try:
+            policy = load_policy(options.policy)
+            if not options.dry_run:
+                validate_password(options.password)
+        except (IOError, ValueError), e:
+            sys.exit('%s: %s' % (options.policy, e))
+
+    # Sweep or sync every port at once from a single loop
+    fleet = Fleet(window=options.window, timeout=options.timeout)
+    for port, error in sorted(fleet.open_all(ports, options.baud).items()):
+        sys.stderr.write('%s: %s\n' % (port, error))
+    jobs = {}
+    for port in fleet.ports():
+        send = fleet.sessions[port].command
+        if policy is None:
+            jobs[port] = BarringSweep(send, lambda matrix: None)
+        else:
+            jobs[port] = BarringSync(send, policy, options.password, lambda changes: None, options.dry_run)
+        jobs[port].start()
+
+    def running():
+        return [port for port, job in jobs.items()
+                if fleet.sessions[port] in fleet.loop.sessions
+                and (job.matrix is None if policy is None else not job.finished)]
+
+    while running():
+        fleet.loop.run_once()
+    for session, error in fleet.loop.failed.items():
+        sys.stderr.write('%s: %s\n' % (session.serial_conn.portstr, error))
+
+    results = {}
+    for port, job in sorted(jobs.items()):
+        barring_sweep = job if policy is None else job.sweep
+        if barring_sweep.matrix is None or (policy is not None and not job.finished):
+            continue
+        changes = []
+        if policy is not None:
+            changes = zip(job.changes, job.results or [None] * len(job.changes))
+        if options.json:
+            results[port] = {'matrix': barring_sweep.matrix, 'errors': barring_sweep.errors}
+            if policy is not None:
+                results[port]['changes'] = [dict(facility=facility, enable=enable, classes=classes, result=result)
+                                            for (facility, enable, classes), result in changes]
+            continue
+        print port
+        if policy is None:
+            print format_matrix(barring_sweep.matrix)
+        elif not changes:
+            print 'no changes'
+        for change, result in changes:
+            print format_change(change, result)
+        for facility, error in sorted(barring_sweep.errors.items()):
+            print '%s: %s' % (facility, error)
+        print
+    if options.json:
+        print json.dumps(results, indent=2, sort_keys=True)
+    fleet.close_all()
@@ -0,0 +1,225 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmarks of the serial I/O path, run against the simulated modem.
+
+Two paths are measured:
+
+  * terminal - commands sent with "TerminalWidget.send_command", read by
+    its reader thread and displayed in its log, as in the application
+  * session - commands sent with a headless "AtSession" driven by a
+    "SessionLoop"
+
+For each path the command rate and the round trip time percentiles are
+reported for every round, along with the time taken to add text to the
+terminal log and the peak resident memory of the process. Round trip
+times run from the command being written to its final result code being
+processed (for the terminal, after the response has been added to the
+log).
+
+The results are printed as JSON, so they can be stored and compared
+between versions. The terminal benchmark needs a display (e.g. Xvfb).
+
+    python benchmark.py --commands 2000 --rounds 5 --output results.json
+"""
+
+# Standard library modules
+import json
+import platform
+import resource
+import sys
+import time
+
+# Local application modules
+from clock import monotonic
+from modemsim import ModemSimulator
+
+# Command used for the round trip benchmarks
+BENCHMARK_COMMAND = 'AT+CGSN'
+
+def percentile(values, fraction):
+    """
+    Return the value at the given fraction (0 to 1) of the sorted values,
+    using the nearest rank.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(0, int(round(fraction * len(values))) - 1)
+    return values[min(rank, len(values) - 1)]
+
+def peak_rss_kb():
+    """
+    Return the peak resident set size of the process in KB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+def summarize(responses, elapsed):
+    """
+    Return the statistics of a round of commands.
+    """
+    times = [r.round_trip_time() * 1000 for r in responses if r.is_ok()]
+    return {
+        'commands': len(responses),
+        'failed': len(responses) - len(times),
+        'elapsed_s': elapsed,
+        'commands_per_s': len(responses) / elapsed if elapsed else None,
+        'rtt_ms': {
+            'p50': percentile(times, 0.50),
+            'p95': percentile(times, 0.95),
+            'p99': percentile(times, 0.99),
+            'max': max(times) if times else None,
+        },
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+def benchmark_session(port, commands, rounds, window):
+    """
+    Run rounds of commands through a headless session.
+    """
+    from session import AtSession, SessionLoop
+
+    session = AtSession.open(port, 115200, window=window)
+    loop = SessionLoop([session])
+    results = []
+    try:
+        for i in range(rounds):
+            start = monotonic()
+            responses = [session.command(BENCHMARK_COMMAND) for j in range(commands)]
+            loop.run_until_done(responses)
+            results.append(summarize(responses, monotonic() - start))
+    finally:
+        session.close()
+    return results
+
+def benchmark_terminal(port, commands, rounds, window, log_kb):
+    """
+    Run rounds of commands through the terminal widget, then time adding
+    text to its log.
+    """
+    from PyQt4.QtCore import QEventLoop
+    from PyQt4.QtGui import QApplication
+    import serial
+
+    from connectdlg import SERIAL_PORT_TIMEOUT
+    from terminal import TerminalWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    terminal = TerminalWidget()
+    terminal.serial_conn = serial.Serial(port, 115200, timeout=SERIAL_PORT_TIMEOUT)
+    terminal.set_command_options(window, 10.0)
+    terminal.connect_com_port()
+    terminal.show()
+
+    def wait_for(responses):
+        event_loop = QEventLoop()
+        remaining = [len(responses)]
+        def finished(response):
+            remaining[0] -= 1
+            if not remaining[0]:
+                event_loop.quit()
+        for response in responses:
+            response.add_callback(finished)
+        if remaining[0]:
+            event_loop.exec_()
+
+    results = []
+    try:
+        for i in range(rounds):
+            start = monotonic()
+            responses = [terminal.send_command(BENCHMARK_COMMAND) for j in range(commands)]
+            wait_for(responses)
+            results.append(summarize(responses, monotonic() - start))
+    finally:
+        terminal.disconnect_com_port()
+
+    # Time adding text to the log, in lines of about 64 characters, first
+    # to an empty log and then to a log that is kept at half that size, so
+    # that old lines are removed while the text is added
+    line = '+CLIP: "+441234567890",145,,,"BENCHMARK",0 0123456789ABCDEF\r\n'
+    lines = (log_kb * 1024) // len(line)
+    render = {}
+    for state in ('empty', 'at_limit'):
+        if state == 'empty':
+            terminal.log.clear()
+        else:
+            terminal.set_log_limits(0, log_kb * 512)
+        start = monotonic()
+        for j in range(lines):
+            terminal.log.append_text(line)
+        app.processEvents()
+        render[state + '_ms_per_kb'] = (monotonic() - start) * 1000 / log_kb
+
+    return results, render
+
+def run(commands=1000, rounds=3, window=1, latency=0.0, log_kb=256, terminal=True):
+    """
+    Run the benchmarks and return the results as a dictionary.
+    """
+    simulator = ModemSimulator(latency=latency)
+    simulator.start()
+    try:
+        results = {
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'settings': {
+                'commands': commands,
+                'rounds': rounds,
+                'window': window,
+                'latency_s': latency,
+                'log_kb': log_kb,
+            },
+            'session': benchmark_session(simulator.port, commands, rounds, window),
+        }
+        if terminal:
+            results['terminal'], results['log_render'] = benchmark_terminal(simulator.port, commands, rounds, window, log_kb)
+        results['peak_rss_kb'] = peak_rss_kb()
+    finally:
+        simulator.stop()
+    return results
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('--commands', type='int', default=1000,
+                      help='number of commands per round [default: %default]')
+    parser.add_option('--rounds', type='int', default=3,
+                      help='number of rounds [default: %default]')
+    parser.add_option('--window', type='int', default=1,
+                      help='commands in flight at once [default: %default]')
+    parser.add_option('--latency', type='float', default=0.0,
+                      help='simulated modem latency in seconds [default: %default]')
+    parser.add_option('--log-kb', type='int', default=256,
+                      help='KB of text added to the log [default: %default]')
+    parser.add_option('--no-terminal', action='store_false', dest='terminal', default=True,
+                      help='only benchmark the headless session (no display needed)')
+    parser.add_option('--output', metavar='FILE',
+                      help='write the results to FILE instead of stdout')
+    options, args = parser.parse_args()
+
+    results = run(options.commands, options.rounds, options.window, options.latency, options.log_kb, options.terminal)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if options.output:
+        open(options.output, 'w').write(output + '\n')
+    else:
+        print output
@@ -0,0 +1,227 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for finding out which AT commands a device supports.
+
+The commands a device supports are listed by AT+CLAC. The list is parsed into
+a "Capabilities" object and cached on disk, keyed by the manufacturer, model
+and software revision of the device (AT+GMI, AT+GMM and AT+GMR), so that
+AT+CLAC is only sent the first time a type of device is seen.
+
+"CapabilityProbe" does this without blocking: it sends the commands through
+any function that queues a command and returns its "CommandResponse" (e.g.
+"AtSession.command" or "TerminalWidget.send_command") and calls a function
+with the result when the responses have arrived. "probe" does the same on a
+session and waits for the result.
+"""
+
+# Standard library modules
+import json
+import os
+
+# Local application modules
+from atcommands import CATALOG, build, capability_name
+from session import SessionLoop
+
+# File the capabilities of each type of device are cached in
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.atcommandtoolkit', 'capabilities.json')
+
+def parse_command_list(lines):
+    """
+    Return the set of command names in the lines of an AT+CLAC response.
+    Each line may list several commands separated by commas, and may be
+    followed by a description.
+    """
+    names = set()
+    for line in lines:
+        for item in line.split(','):
+            words = item.split()
+            if words:
+                names.add(capability_name(words[0]))
+    names.discard('')
+    return names
+
+def response_value(response, prefix):
+    """
+    Return the information lines of an identification response as one
+    string, without the "+GMI: " style prefix some devices add.
+    """
+    text = ' '.join(response.lines).strip()
+    if text.upper().startswith(prefix + ':'):
+        text = text[len(prefix) + 1:].strip()
+    return text
+
+def device_key(manufacturer, model, revision):
+    """
+    Return the key a type of device is cached under.
+    """
+    return '%s/%s/%s' % (manufacturer, model, revision)
+
+class Capabilities(object):
+    """
+    The set of commands supported by a type of device.
+    """
+
+    def __init__(self, key, commands):
+        self.key = key
+        self.commands = frozenset(commands)
+
+    def __repr__(self):
+        return '<Capabilities %s (%d commands)>' % (self.key, len(self.commands))
+
+    def supports(self, command):
+        """
+        Return True if the device supports an AT command, e.g. 'AT+CLCK="AO", 2'.
+        A bare "AT" is always supported.
+        """
+        name = capability_name(command)
+        return not name or name in self.commands
+
+    def supports_name(self, name):
+        """
+        Return True if the device supports a command of the command catalog.
+        """
+        return CATALOG[name].capability in self.commands
+
+class CapabilityCache(object):
+    """
+    The capabilities of every type of device seen, stored as JSON.
+
+    The file is read when first needed and written whenever a type of device
+    is added, so that other processes see it.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.entries = None
+
+    def load(self):
+        if self.entries is not None:
+            return
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (IOError, ValueError):
+            self.entries = {}
+
+    def get(self, key):
+        """
+        Return the cached capabilities of a type of device, or None. An
+        empty list of commands is not taken as capabilities.
+        """
+        self.load()
+        if not self.entries.get(key):
+            return None
+        return Capabilities(key, self.entries[key])
+
+    def put(self, capabilities):
+        """
+        Add the capabilities of a type of device and save the cache. Errors
+        writing the file are ignored, the capabilities are found again next
+        time.
+        """
+        self.load()
+        self.entries[capabilities.key] = sorted(capabilities.commands)
+        directory = os.path.dirname(self.path)
+        temp_path = self.path + '.tmp'
+        try:
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(temp_path, 'w') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            # Renaming replaces the old file in one step, except on Windows
+            # where the old file has to be removed first
+            if os.name == 'nt' and os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(temp_path, self.path)
+        except (IOError, OSError):
+            pass
+
+class CapabilityProbe(object):
+    """
+    Finds the capabilities of the device connected to a session.
+
+    "send" queues a command and returns its "CommandResponse". "done" is
+    called with the "Capabilities" of the device, or None if they could not
+    be found (e.g. the device does not support AT+CLAC or listed no
+    commands). Only capabilities that were found are cached.
+    """
+
+    def __init__(self, send, cache, done):
+        self.send = send
+        self.cache = cache
+        self.done = done
+        self.key = None
+        self.responses = []
+        self.capabilities = None
+        self.finished = False
+
+    def start(self):
+        """
+        Queue the identification commands, which are pipelined if the
+        session's window allows it.
+        """
+        self.responses = [self.send(build(name)) for name in ('manufacturer', 'model', 'revision')]
+        for response in self.responses:
+            response.add_callback(self.identified)
+
+    def identified(self, response):
+        if self.finished or self.key is not None or not all(r.is_done() for r in self.responses):
+            return
+        if not all(r.is_ok() for r in self.responses):
+            self.finish(None)
+            return
+
+        manufacturer, model, revision = [response_value(r, p) for r, p in
+                                         zip(self.responses, ('+GMI', '+GMM', '+GMR'))]
+        self.key = device_key(manufacturer, model, revision)
+        capabilities = self.cache.get(self.key)
+        if capabilities is not None:
+            self.finish(capabilities)
+            return
+
+        self.send(build('commands')).add_callback(self.listed)
+
+    def listed(self, response):
+        # An empty list would disable every command of the device for good
+        # once cached, so it is treated as the list not being available
+        commands = parse_command_list(response.lines) if response.is_ok() else None
+        if not commands:
+            self.finish(None)
+            return
+        capabilities = Capabilities(self.key, commands)
+        self.cache.put(capabilities)
+        self.finish(capabilities)
+
+    def finish(self, capabilities):
+        self.capabilities = capabilities
+        self.finished = True
+        self.done(capabilities)
+
+def probe(session, cache, loop=None):
+    """
+    Find the capabilities of the device connected to a session, waiting
+    for the responses. Returns None if they could not be found.
+    """
+    if loop is None:
+        loop = SessionLoop([session])
+    capability_probe = CapabilityProbe(session.command, cache, lambda capabilities: None)
+    capability_probe.start()
+    while not capability_probe.finished and session in loop.sessions:
+        loop.run_once()
+    return capability_probe.capabilities
@@ -0,0 +1,284 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for capturing the traffic of a session to disk and replaying it.
+
+A capture file starts with a header (the "CAPTURE_MAGIC" string followed
+by the wall clock time the capture started) and then holds one record
+for everything sent or received. Each record is a "RECORD_FORMAT" struct
+holding the time since the start of the capture (from the monotonic
+clock), the direction (session.SENT or session.RECEIVED) and the length
+of the data, followed by the data itself. The data is stored exactly as
+it was sent or received.
+
+A sidecar index file (the capture file name plus ".idx") holds the file
+offset of every record as a little endian 64 bit integer, so that the
+"CaptureReader" can memory map both files and fetch any record directly.
+"""
+
+# Standard library modules
+import mmap
+import os
+import struct
+import time
+
+# Local application modules
+from clock import monotonic
+from framing import ResponseMatcher
+from session import RECEIVED, SENT
+from urc import UrcDispatcher
+
+CAPTURE_MAGIC = 'ATKCAP1\n'
+HEADER_FORMAT = '<d'
+RECORD_FORMAT = '<dcI'
+INDEX_FORMAT = '<Q'
+
+HEADER_SIZE = len(CAPTURE_MAGIC) + struct.calcsize(HEADER_FORMAT)
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+INDEX_SIZE = struct.calcsize(INDEX_FORMAT)
+
+def index_path(path):
+    """
+    Return the path of the index file of a capture file.
+    """
+    return path + '.idx'
+
+class CaptureWriter(object):
+    """
+    Writes the traffic of a session to a capture file.
+
+    The "record" method has the signature of a session monitor, so a
+    capture is started with session.add_monitor(writer.record). Each
+    record is flushed as it is written, so a capture can be read while
+    it is still running and is not lost if the application stops.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.capture_file = open(path, 'wb')
+        self.index_file = open(index_path(path), 'wb')
+        self.start_time = monotonic()
+        self.capture_file.write(CAPTURE_MAGIC + struct.pack(HEADER_FORMAT, time.time()))
+        self.offset = HEADER_SIZE
+        self.capture_file.flush()
+
+    def record(self, direction, data):
+        """
+        Append the data sent or received to the capture.
+        """
+        timestamp = monotonic() - self.start_time
+        self.capture_file.write(struct.pack(RECORD_FORMAT, timestamp, direction, len(data)) + data)
+        self.index_file.write(struct.pack(INDEX_FORMAT, self.offset))
+        self.offset += RECORD_SIZE + len(data)
+        self.flush()
+
+    def flush(self):
+        """
+        Write the records buffered so far to disk. The capture is flushed
+        before the index, so the index never points past the end of it.
+        """
+        self.capture_file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.capture_file.close()
+        self.index_file.close()
+
+class CaptureReader(object):
+    """
+    Gives random access to the records of a capture file.
+
+    The reader behaves as a sequence of (timestamp, direction, data)
+    tuples. Both the capture and its index are memory mapped, so opening
+    a capture is quick however large it is.
+
+    A capture that is still being written can be read: its index always
+    lists a leading part of its records, so the records written since
+    the last index entry are indexed in memory and the index file is left
+    alone for the writer. The index file is only rebuilt if it is missing
+    or does not match the capture, by writing a new one and renaming it
+    into place.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+        # The index is mapped before the capture, a "CaptureWriter" flushes
+        # each record before its index entry so every entry mapped points
+        # to a record in the mapped capture
+        try:
+            self.index_file = open(index_path(path), 'rb')
+        except IOError:
+            self.index_file = None
+            self.index = ''
+        else:
+            self.index = self.map_file(self.index_file)
+
+        self.capture_file = open(path, 'rb')
+        self.capture = self.map_file(self.capture_file)
+        if self.capture[:len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+            raise ValueError('%s is not a capture file' % path)
+        self.start_time = struct.unpack_from(HEADER_FORMAT, self.capture, len(CAPTURE_MAGIC))[0]
+
+        if self.index_file is None or not self.index_is_valid():
+            self.build_index()
+        else:
+            unindexed = self.scan(self.indexed_size())
+            if unindexed:
+                self.index = self.index[:] + unindexed
+
+    def map_file(self, file_obj):
+        """
+        Memory map a whole file for reading. Empty files can not be
+        mapped, so an empty string is returned for them instead.
+        """
+        if os.fstat(file_obj.fileno()).st_size == 0:
+            return ''
+        return mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def index_is_valid(self):
+        """
+        Check that the last entry of the index points to a whole record in
+        the capture.
+        """
+        if len(self.index) % INDEX_SIZE:
+            return False
+        if not self.index:
+            return True
+        offset = struct.unpack_from(INDEX_FORMAT, self.index, len(self.index) - INDEX_SIZE)[0]
+        if offset < HEADER_SIZE or offset + RECORD_SIZE > len(self.capture):
+            return False
+        length = struct.unpack_from(RECORD_FORMAT, self.capture, offset)[2]
+        return offset + RECORD_SIZE + length <= len(self.capture)
+
+    def indexed_size(self):
+        """
+        Return the size of the part of the capture covered by the index.
+        """
+        if not self.index:
+            return HEADER_SIZE
+        offset = struct.unpack_from(INDEX_FORMAT, self.index, len(self.index) - INDEX_SIZE)[0]
+        return offset + RECORD_SIZE + struct.unpack_from(RECORD_FORMAT, self.capture, offset)[2]
+
+    def scan(self, offset):
+        """
+        Return the index entries of the records in the capture from an
+        offset on. A partially written record at the end of the capture is
+        left out.
+        """
+        entries = []
+        while offset + RECORD_SIZE <= len(self.capture):
+            length = struct.unpack_from(RECORD_FORMAT, self.capture, offset)[2]
+            if offset + RECORD_SIZE + length > len(self.capture):
+                break
+            entries.append(struct.pack(INDEX_FORMAT, offset))
+            offset += RECORD_SIZE + length
+        return ''.join(entries)
+
+    def build_index(self):
+        """
+        Index the capture by scanning it and replace the index file. Errors
+        writing the file are ignored, the index is kept in memory.
+        """
+        if self.index_file is not None:
+            if self.index:
+                self.index.close()
+            self.index_file.close()
+            self.index_file = None
+        self.index = self.scan(HEADER_SIZE)
+
+        temp_path = index_path(self.path) + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(self.index)
+            if os.name == 'nt' and os.path.exists(index_path(self.path)):
+                os.remove(index_path(self.path))
+            os.rename(temp_path, index_path(self.path))
+        except (IOError, OSError):
+            pass
+
+    def __len__(self):
+        return len(self.index) // INDEX_SIZE
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('record index out of range')
+        offset = struct.unpack_from(INDEX_FORMAT, self.index, i * INDEX_SIZE)[0]
+        timestamp, direction, length = struct.unpack_from(RECORD_FORMAT, self.capture, offset)
+        start = offset + RECORD_SIZE
+        return timestamp, direction, self.capture[start:start + length]
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def close(self):
+        for mapped in (self.capture, self.index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self.capture_file.close()
+        if self.index_file is not None:
+            self.index_file.close()
+
+def replay(path, matcher=None):
+    """
+    Feed a capture back through the response matching code, as fast as
+    possible, and return the list of "CommandResponse" objects for the
+    commands in the capture.
+
+    Sent records register their commands with the matcher without sending
+    anything and received records are fed to it, exactly as a live session
+    would. The sent and finish times of the responses are taken from the
+    capture, so round trip times are as they were recorded. A matcher with
+    a "UrcDispatcher" is created if none is given; pass one in to handle
+    the unsolicited result codes in the capture.
+    """
+    if matcher is None:
+        matcher = ResponseMatcher(UrcDispatcher())
+
+    reader = CaptureReader(path)
+    responses = []
+    unfinished = 0
+    try:
+        for timestamp, direction, data in reader:
+            if direction == SENT:
+                for command in data.split('\r\n'):
+                    if command.strip():
+                        response = matcher.command_sent(command.strip())
+                        response.sent_time = timestamp
+                        responses.append(response)
+            elif direction == RECEIVED:
+                matcher.feed(data)
+                while unfinished < len(responses) and responses[unfinished].is_done():
+                    responses[unfinished].finish_time = timestamp
+                    unfinished += 1
+    finally:
+        reader.close()
+    return responses
+
+if __name__ == '__main__':
+    import sys
+
+    # Print the records of a capture file
+    reader = CaptureReader(sys.argv[1])
+    print 'Capture started %s' % time.ctime(reader.start_time)
+    for timestamp, direction, data in reader:
+        print '%12.6f %s %r' % (timestamp, direction, data)
+    reader.close()
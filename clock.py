@@ -0,0 +1,61 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module providing a monotonic clock for timing serial port activity.
+
+Intervals measured with "time.time" go wrong when the system clock is
+adjusted, so a monotonic clock is used wherever round trip times and
+timestamps are recorded. The clock's epoch is undefined, only the
+difference between two readings is meaningful.
+"""
+
+# Standard library modules
+import sys
+import time
+
+# Clock ID of the POSIX monotonic clock
+CLOCK_MONOTONIC = 1
+
+try:
+    import ctypes
+    import ctypes.util
+
+    class _Timespec(ctypes.Structure):
+        _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    _clock_gettime = _libc.clock_gettime
+    _clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_Timespec)]
+
+    def monotonic():
+        """
+        Return the value (in fractional seconds) of a monotonic clock.
+        """
+        t = _Timespec()
+        if _clock_gettime(CLOCK_MONOTONIC, ctypes.byref(t)) != 0:
+            raise OSError(ctypes.get_errno(), 'clock_gettime failed')
+        return t.tv_sec + t.tv_nsec * 1e-9
+
+    monotonic()
+
+# Fall back to the best clock available on platforms without clock_gettime
+except (ImportError, AttributeError, OSError, TypeError):
+    if sys.platform == 'win32':
+        monotonic = time.clock
+    else:
+        monotonic = time.time
@@ -0,0 +1,208 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the queue that sends commands to the modem.
+"""
+
+# Standard library modules
+from collections import deque
+
+# Local application modules
+from clock import monotonic
+from framing import CommandResponse, ResponseMatcher
+
+# Default number of commands that may be waiting for a response at once
+DEFAULT_WINDOW = 1
+
+# Default number of seconds to wait for the response to a command
+DEFAULT_TIMEOUT = 10.0
+
+class CommandQueue(object):
+    """
+    Queue of commands to be sent to the modem.
+
+    Commands are sent strictly in the order they are queued. Up to
+    "window" commands are sent ahead without waiting for a response,
+    the next command is sent as soon as a response finishes. A window of
+    1 waits for each response before sending the next command, which is
+    what most modems expect; modems that buffer their input can be kept
+    busy with a larger window.
+
+    A command that has not received its final result code within its
+    timeout is finished without a result and its "timed_out" flag set.
+    Its place in the window is kept until the late final result code
+    arrives, so the late reply is discarded rather than credited to the
+    next command; if nothing arrives within a further "timeout" of the
+    queue (or of the command, if that is longer) the modem is assumed to
+    have dropped the command. The queue does not keep time
+    itself, "check_timeouts" has to be called once the time returned by
+    "next_deadline" has passed.
+
+    While the queue is paused (e.g. because the serial port is not
+    connected) commands are queued but not sent, and commands that are
+    waiting for a response can be finished without a result with
+    "cancel_in_flight" if their responses will never arrive.
+
+    The queue does not perform any I/O either: sent commands are passed
+    to the "write" function and received data must be passed to "feed".
+    If "write" raises an exception the command is cancelled, then the
+    exception is passed to the "write_error" function if one was given,
+    otherwise it is raised.
+    """
+
+    def __init__(self, write, window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, write_error=None, dispatcher=None):
+        self.write = write
+        self.write_error = write_error
+        self.window = window
+        self.timeout = timeout
+        self.matcher = ResponseMatcher(dispatcher)
+        self.waiting = deque()
+        self.deadlines = {}
+        self.timeouts = {}
+        self.expired = set()
+        self.paused = False
+
+    def submit(self, command, timeout=None):
+        """
+        Queue a command and return the "CommandResponse" object that will
+        hold its response. The command is sent immediately if the window
+        allows it.
+
+        The timeout is in seconds and defaults to the queue's "timeout".
+        """
+        response = CommandResponse(command)
+        if timeout is None:
+            timeout = self.timeout
+        self.waiting.append((response, timeout))
+        self.send_next()
+        return response
+
+    def send_next(self):
+        """
+        Send waiting commands until the window is full.
+        """
+        while not self.paused and self.waiting and len(self.matcher.pending) < self.window:
+            response, timeout = self.waiting.popleft()
+            self.matcher.response_sent(response)
+            self.deadlines[response] = response.sent_time + timeout
+            self.timeouts[response] = timeout
+            response.add_callback(self.response_finished)
+            try:
+                self.write(response.command)
+            except Exception, e:
+                self.matcher.cancel(response)
+                if self.write_error is None:
+                    raise
+                self.write_error(e)
+
+    def feed(self, data):
+        """
+        Process data received from the modem, then send any waiting
+        commands the finished responses have made room for.
+        """
+        self.matcher.feed(data)
+        self.send_next()
+
+    def response_finished(self, response):
+        """
+        Forget the deadline of a finished response.
+        """
+        self.deadlines.pop(response, None)
+        self.timeouts.pop(response, None)
+        self.expired.discard(response)
+
+    def next_deadline(self):
+        """
+        Return the "monotonic" time at which the next command times out,
+        or None if no command is waiting for a response.
+        """
+        if not self.deadlines:
+            return None
+        return min(self.deadlines.itervalues())
+
+    def check_timeouts(self):
+        """
+        Finish every response whose timeout has expired, then send any
+        waiting commands that there is now room for. A timed out command
+        keeps its place in the window for one more timeout, waiting for
+        its late reply, even if it was given a shorter timeout than the
+        queue's.
+        """
+        now = monotonic()
+        for response, deadline in self.deadlines.items():
+            if deadline > now:
+                continue
+            if response in self.expired:
+                self.matcher.cancel(response)
+                continue
+            timeout = max(self.timeouts[response], self.timeout)
+            response.timed_out = True
+            placeholder = self.matcher.expire(response)
+            if placeholder is not None:
+                self.deadlines[placeholder] = now + timeout
+                self.timeouts[placeholder] = timeout
+                self.expired.add(placeholder)
+                placeholder.add_callback(self.response_finished)
+        self.send_next()
+
+    def set_window(self, window):
+        """
+        Set the maximum number of commands waiting for a response at once.
+        """
+        self.window = max(1, window)
+        self.send_next()
+
+    def pause(self):
+        """
+        Stop sending commands, they are kept in the queue until "resume"
+        is called.
+        """
+        self.paused = True
+
+    def resume(self):
+        """
+        Start sending queued commands again.
+        """
+        self.paused = False
+        self.send_next()
+
+    def cancel_in_flight(self):
+        """
+        Finish the commands that are waiting for a response without a
+        result code, and discard any partially received response. They are
+        not sent again, as the modem may already have carried them out
+        (e.g. dialled or changed a password). Commands that have not been
+        sent stay queued.
+        """
+        self.matcher.reset()
+
+    def in_flight(self):
+        """
+        Return the number of commands that are waiting for a response,
+        including timed out commands whose late reply is still awaited.
+        """
+        return len(self.matcher.pending)
+
+    def reset(self):
+        """
+        Cancel all queued commands and those waiting for a response.
+        """
+        waiting, self.waiting = self.waiting, deque()
+        self.matcher.reset()
+        for response, timeout in waiting:
+            response.finish()
@@ -0,0 +1,242 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for streaming long sequences of DTMF tones.
+
+Many devices reject or cut short an AT+VTS command with more than a few tones,
+so a stream splits the tones into chunks of at most "chunk_size" tones and
+sends each chunk as soon as the previous one has returned OK. If a device
+rejects a chunk with an error that a command that is too long can cause (ERROR
+or "+CME ERROR: 50", incorrect parameters), the chunk size is halved and the
+tones are sent again in smaller chunks, so the largest size a device accepts is
+found by the first stream and can be given to the next ones. Any other error
+(e.g. "+CME ERROR: 3" when there is no call) has nothing to do with the length,
+so the chunk is sent once more at the same size and the stream stops if it
+fails again.
+
+The tone duration can be set with AT+VTD before the first chunk. When the
+stream finishes the number of tones sent per second is reported.
+"""
+
+# Local application modules
+from atcommands import DTMF_TONES, build
+from clock import monotonic
+from session import SessionLoop
+
+# Number of tones sent in one AT+VTS command until a device rejects it
+DEFAULT_CHUNK_SIZE = 32
+
+# Result codes of a command that may have been rejected for being too long
+LENGTH_ERRORS = ('ERROR', '+CME ERROR: 50', '+CME ERROR: INCORRECT PARAMETERS')
+
+def parse_tones(text):
+    """
+    Return a string of DTMF tones from text that may separate them with
+    commas and spaces, e.g. "1,2,a,3" or "12A3". Raises a ValueError if
+    there are no tones or a character is not a tone.
+    """
+    tones = ''.join(char for char in text.upper() if char not in ' ,')
+    for char in tones:
+        if char not in DTMF_TONES:
+            raise ValueError('Character "%s" is invalid.' % char)
+    if not tones:
+        raise ValueError('Please enter the tones to send.')
+    return tones
+
+class DtmfStream(object):
+    """
+    Sends a sequence of DTMF tones in chunks through a function that
+    queues a command and returns its "CommandResponse" (e.g.
+    "AtSession.command" or "TerminalWidget.send_command").
+
+    "duration" is the tone duration in tenths of a second, sent with AT+VTD
+    first if given. "done" is called with the stream when every tone has
+    been sent, or when a chunk can not be sent, in which case "error" holds
+    its result code.
+    """
+
+    def __init__(self, send, tones, done, chunk_size=DEFAULT_CHUNK_SIZE, duration=None):
+        self.send = send
+        self.tones = parse_tones(tones)
+        self.done = done
+        self.chunk_size = max(1, chunk_size)
+        self.duration = duration
+        self.duration_command = build('dtmf_duration', duration=duration) if duration is not None else None
+        self.position = 0
+        self.chunk = ''
+        self.chunks = 0
+        self.retried = False
+        self.error = None
+        self.finished = False
+        self.start_time = None
+        self.elapsed = None
+
+    def start(self):
+        self.start_time = monotonic()
+        if self.duration_command is not None:
+            self.send(self.duration_command).add_callback(self.duration_set)
+        else:
+            self.send_chunk()
+
+    def duration_set(self, response):
+        if not response.is_ok():
+            self.finish(result_text(response))
+            return
+        self.send_chunk()
+
+    def send_chunk(self):
+        self.chunk = self.tones[self.position:self.position + self.chunk_size]
+        self.send(build('dtmf', tones=','.join(self.chunk))).add_callback(self.chunk_sent)
+
+    def chunk_sent(self, response):
+        """
+        Send the next chunk, or the same tones in smaller chunks if the
+        device rejected this one as too long. Other errors are retried once
+        at the same size.
+        """
+        if response.is_ok():
+            self.position += len(self.chunk)
+            self.chunks += 1
+            self.retried = False
+            if self.position < len(self.tones):
+                self.send_chunk()
+            else:
+                self.finish()
+        elif len(self.chunk) > 1 and is_length_error(response):
+            self.chunk_size = len(self.chunk) // 2
+            self.send_chunk()
+        elif not self.retried and response.result is not None:
+            self.retried = True
+            self.send_chunk()
+        else:
+            self.finish(result_text(response))
+
+    def finish(self, error=None):
+        self.error = error
+        self.elapsed = monotonic() - self.start_time
+        self.finished = True
+        self.done(self)
+
+    def tones_per_second(self):
+        """
+        Return the number of tones sent per second, or None if no time was
+        measured.
+        """
+        if not self.elapsed:
+            return None
+        return self.position / self.elapsed
+
+    def report(self):
+        """
+        Return the result of the stream as a dictionary.
+        """
+        rate = self.tones_per_second()
+        return {
+            'tones': len(self.tones),
+            'sent': self.position,
+            'chunks': self.chunks,
+            'chunk_size': self.chunk_size,
+            'duration': self.duration,
+            'elapsed_s': round(self.elapsed, 3) if self.elapsed is not None else None,
+            'tones_per_s': round(rate, 1) if rate is not None else None,
+            'error': self.error,
+        }
+
+def is_length_error(response):
+    """
+    Return True if a response is an error that a command that is too long
+    can cause.
+    """
+    return not response.timed_out and (response.result or '').upper() in LENGTH_ERRORS
+
+def result_text(response):
+    return 'TIMEOUT' if response.timed_out else response.result or 'FAILED'
+
+def stream(session, tones, loop=None, chunk_size=DEFAULT_CHUNK_SIZE, duration=None):
+    """
+    Send a sequence of DTMF tones on a session, waiting for them to be
+    sent, and return the "DtmfStream".
+    """
+    if loop is None:
+        loop = SessionLoop([session])
+    dtmf_stream = DtmfStream(session.command, tones, lambda dtmf_stream: None, chunk_size, duration)
+    dtmf_stream.start()
+    while not dtmf_stream.finished and session in loop.sessions:
+        loop.run_once()
+    return dtmf_stream
+
+def format_report(report):
+    """
+    Return a one line text form of the report of a stream.
+    """
+    text = '%d of %d tones sent in %d chunks of up to %d' % (report['sent'], report['tones'],
+                                                             report['chunks'], report['chunk_size'])
+    if report['tones_per_s'] is not None:
+        text += ', %.1f tones/s' % report['tones_per_s']
+    if report['error']:
+        text += ' (%s)' % report['error']
+    return text
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    import json
+    import sys
+
+    import serial
+
+    from commandqueue import DEFAULT_TIMEOUT
+    from session import AtSession
+
+    parser = OptionParser(usage='%prog [options] PORT TONES')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the port [default: %default]')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='seconds to wait for each response [default: %default]')
+    parser.add_option('-c', '--chunk', type='int', default=DEFAULT_CHUNK_SIZE,
+                      help='largest number of tones sent in one command [default: %default]')
+    parser.add_option('-d', '--duration', type='int',
+                      help='tone duration in tenths of a second, set with AT+VTD')
+    parser.add_option('--json', action='store_true', default=False,
+                      help='print the report as JSON')
+    options, args = parser.parse_args()
+    if len(args) != 2:
+        parser.error('a port and the tones to send are required')
+    port, tones = args
+
+    try:
+        session = AtSession.open(port, options.baud, timeout=options.timeout)
+    except serial.SerialException, e:
+        sys.exit('%s: %s' % (port, e))
+
+    loop = SessionLoop([session])
+    try:
+        dtmf_stream = stream(session, tones, loop, options.chunk, options.duration)
+    except ValueError, e:
+        sys.exit(str(e))
+    finally:
+        session.close()
+    if session in loop.failed:
+        sys.stderr.write('%s: %s\n' % (port, loop.failed[session]))
+        dtmf_stream.finish('PORT ERROR')
+
+    report = dtmf_stream.report()
+    if options.json:
+        print json.dumps(report, sort_keys=True)
+    else:
+        print format_report(report)
+    sys.exit(0 if report['sent'] == report['tones'] else 1)
@@ -0,0 +1,170 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for driving a fleet of modems from a single process.
+
+Every modem has its own "AtSession", with its own command queue and
+state, and all of the sessions are driven by one "SessionLoop" in one
+thread. An idle modem costs an open file descriptor and a few small
+objects, so hundreds of modems can be handled at once.
+
+Run the module to send commands to several modems and print a table of
+the results:
+
+    python fleet.py --baud 115200 -c AT+CGSN -c AT+CIMI /dev/ttyUSB*
+"""
+
+# 3rd party modules
+import serial
+
+# Local application modules
+from commandqueue import DEFAULT_TIMEOUT, DEFAULT_WINDOW
+from session import AtSession, SessionLoop
+
+class Fleet(object):
+    """
+    A set of modems, identified by their port names.
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT):
+        self.window = window
+        self.timeout = timeout
+        self.loop = SessionLoop()
+        self.sessions = {}
+
+    def open(self, port, baudrate=9600):
+        """
+        Open a modem's port and add it to the fleet. Raises
+        "serial.SerialException" if the port can not be opened.
+        """
+        session = AtSession.open(port, baudrate, window=self.window, timeout=self.timeout)
+        self.sessions[port] = session
+        self.loop.add(session)
+        return session
+
+    def open_all(self, ports, baudrate=9600):
+        """
+        Open a number of ports and return a dictionary of the ports that
+        could not be opened and the errors raised.
+        """
+        errors = {}
+        for port in ports:
+            try:
+                self.open(port, baudrate)
+            except serial.SerialException, e:
+                errors[port] = e
+        return errors
+
+    def close(self, port):
+        session = self.sessions.pop(port)
+        if session in self.loop.sessions:
+            self.loop.remove(session)
+        session.close()
+
+    def close_all(self):
+        for port in self.sessions.keys():
+            self.close(port)
+
+    def ports(self):
+        return sorted(self.sessions)
+
+    def send(self, commands):
+        """
+        Queue commands on many modems. "commands" is a dictionary of port
+        names and lists of commands, the result is a dictionary of port
+        names and lists of "CommandResponse" objects.
+        """
+        responses = {}
+        for port, port_commands in commands.iteritems():
+            session = self.sessions[port]
+            responses[port] = [session.command(command) for command in port_commands]
+        return responses
+
+    def run(self, commands, ports=None, timeout=None):
+        """
+        Send the same list of commands to every modem (or to the given
+        ports) concurrently, and wait up to "timeout" seconds for them to
+        finish. Returns a dictionary of port names and lists of responses.
+        """
+        if ports is None:
+            ports = self.ports()
+        responses = self.send(dict((port, commands) for port in ports))
+        self.wait(responses, timeout)
+        return responses
+
+    def wait(self, responses, timeout=None):
+        """
+        Drive the fleet until all of the responses (a dictionary as returned
+        by "send") have finished. Returns True if they all finished.
+        """
+        all_responses = []
+        for port_responses in responses.itervalues():
+            all_responses.extend(port_responses)
+        return self.loop.run_until_done(all_responses, timeout)
+
+def response_text(response):
+    """
+    Return a short text form of a response for use in a table: the
+    information lines if it succeeded, otherwise the result code.
+    """
+    if response.is_ok():
+        return ' '.join(response.lines) or response.result
+    if response.timed_out:
+        return 'TIMEOUT'
+    return response.result or 'FAILED'
+
+def format_table(commands, responses):
+    """
+    Format the results of "Fleet.run" as a text table, with a row for each
+    port and a column for each command.
+    """
+    rows = [['Port'] + list(commands)]
+    for port in sorted(responses):
+        rows.append([port] + [response_text(r) for r in responses[port]])
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        lines.append('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    import sys
+
+    parser = OptionParser(usage='%prog [options] PORT...')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the ports [default: %default]')
+    parser.add_option('-c', '--command', action='append', dest='commands', default=[],
+                      help='command to send to every modem (may be repeated)')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='seconds to wait for each response [default: %default]')
+    options, ports = parser.parse_args()
+    if not ports or not options.commands:
+        parser.error('at least one port and one command are required')
+
+    fleet = Fleet(timeout=options.timeout)
+    for port, error in sorted(fleet.open_all(ports, options.baud).items()):
+        sys.stderr.write('%s: %s\n' % (port, error))
+
+    responses = fleet.run(options.commands)
+    for session, error in fleet.loop.failed.items():
+        sys.stderr.write('%s: %s\n' % (session.serial_conn.portstr, error))
+    print format_table(options.commands, responses)
+    fleet.close_all()
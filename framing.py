@@ -0,0 +1,272 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for splitting the data received from a modem into lines and
+matching the responses to the commands that caused them.
+
+The classes in this module do not perform any I/O and do not depend on
+Qt, data read from the serial port is passed to them by the caller.
+"""
+
+# Standard library modules
+from collections import deque
+import threading
+
+# Local application modules
+from clock import monotonic
+
+# Final result codes that end the response to a command
+OK_RESULT_CODES = ('OK', 'CONNECT')
+ERROR_RESULT_CODES = ('ERROR', 'NO CARRIER', 'NO DIALTONE', 'BUSY', 'NO ANSWER')
+
+# Prefixes of final result codes that carry extra information
+OK_RESULT_PREFIXES = ('CONNECT ',)
+ERROR_RESULT_PREFIXES = ('+CME ERROR:', '+CMS ERROR:')
+
+def is_final_result(line):
+    """
+    Return True if the line is a final result code.
+    """
+    return is_ok_result(line) or is_error_result(line)
+
+def is_ok_result(line):
+    """
+    Return True if the line is a final result code indicating success.
+    """
+    return line in OK_RESULT_CODES or line.startswith(OK_RESULT_PREFIXES)
+
+def is_error_result(line):
+    """
+    Return True if the line is a final result code indicating failure.
+    """
+    return line in ERROR_RESULT_CODES or line.startswith(ERROR_RESULT_PREFIXES)
+
+class LineFramer(object):
+    """
+    Splits a stream of data into lines.
+
+    Data is passed to the "feed" method in chunks of any size, which
+    returns the lines completed by that chunk. Line terminators and
+    surrounding white space are removed and empty lines are dropped.
+    """
+
+    def __init__(self):
+        self.buffer = ''
+
+    def feed(self, data):
+        """
+        Add data to the stream and return a list of the completed lines.
+        """
+        if '\n' not in data:
+            self.buffer += data
+            return []
+
+        lines = (self.buffer + data).split('\n')
+        self.buffer = lines.pop()
+        return [line.strip() for line in lines if line.strip()]
+
+    def reset(self):
+        """
+        Discard any partially received line.
+        """
+        self.buffer = ''
+
+class CommandResponse(object):
+    """
+    Handle for the response to a command sent to the modem.
+
+    The information lines of the response are collected in "lines" and
+    the final result code is stored in "result" once it is received.
+    A response that ends without a final result code (e.g. because the
+    serial port was disconnected) has a "result" of None, and "timed_out"
+    is set if it ended because no result arrived in time.
+
+    Functions registered with "add_callback" are called with the response
+    as their only parameter when it is finished, in the thread that
+    passed the final line of data to the "ResponseMatcher".
+    """
+
+    def __init__(self, command):
+        self.command = command
+        self.lines = []
+        self.result = None
+        self.timed_out = False
+        self.sent_time = None
+        self.finish_time = None
+        self.callbacks = []
+        self.finished = threading.Event()
+
+    def __repr__(self):
+        return '<CommandResponse %r: %r>' % (self.command, self.result)
+
+    def is_done(self):
+        """
+        Return True if the response has finished.
+        """
+        return self.finished.isSet()
+
+    def is_ok(self):
+        """
+        Return True if the response ended with a successful result code.
+        """
+        return self.result is not None and is_ok_result(self.result)
+
+    def is_error(self):
+        """
+        Return True if the response ended with an error result code.
+        """
+        return self.result is not None and is_error_result(self.result)
+
+    def round_trip_time(self):
+        """
+        Return the time in seconds between sending the command and the
+        response finishing, or None if the response has not finished.
+        """
+        if self.sent_time is None or self.finish_time is None:
+            return None
+        return self.finish_time - self.sent_time
+
+    def add_callback(self, callback):
+        """
+        Register a function to be called when the response finishes. The
+        function is called immediately if the response has finished.
+        """
+        if self.is_done():
+            callback(self)
+        else:
+            self.callbacks.append(callback)
+
+    def wait(self, timeout=None):
+        """
+        Block until the response finishes or the timeout (in seconds)
+        expires. Returns True if the response has finished.
+        """
+        self.finished.wait(timeout)
+        return self.is_done()
+
+    def finish(self, result=None):
+        """
+        Finish the response with the given final result code.
+        """
+        self.result = result
+        self.finish_time = monotonic()
+        self.finished.set()
+
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+class ResponseMatcher(object):
+    """
+    Matches lines received from the modem to the commands that were sent.
+
+    A modem answers commands in the order they were sent, so each line
+    belongs to the oldest command that is still waiting for its final
+    result code. Echoes of the command are not included in the response.
+
+    If a "UrcDispatcher" is given, every line is offered to it first and
+    unsolicited result codes never become part of a response.
+    """
+
+    def __init__(self, dispatcher=None):
+        self.framer = LineFramer()
+        self.pending = deque()
+        self.dispatcher = dispatcher
+
+    def command_sent(self, command):
+        """
+        Record that a command has been sent and return the
+        "CommandResponse" object that will hold its response.
+        """
+        response = CommandResponse(command)
+        self.response_sent(response)
+        return response
+
+    def response_sent(self, response):
+        """
+        Record that the command of an existing "CommandResponse" object
+        has been sent.
+        """
+        response.sent_time = monotonic()
+        self.pending.append(response)
+
+    def feed(self, data):
+        """
+        Process data received from the modem.
+        """
+        for line in self.framer.feed(data):
+            self.process_line(line)
+
+    def process_line(self, line):
+        """
+        Add a single line to the response of the oldest pending command.
+        Lines received while no command is pending are unsolicited, they
+        are passed to the dispatcher (if any) or ignored.
+        """
+        command = self.pending[0].command if self.pending else None
+        if self.dispatcher is not None and self.dispatcher.process_line(line, command):
+            return
+        if not self.pending:
+            return
+
+        response = self.pending[0]
+        if is_final_result(line):
+            self.pending.popleft()
+            response.finish(line)
+        elif response.lines or line.upper() != response.command.upper():
+            response.lines.append(line)
+
+    def expire(self, response):
+        """
+        Finish the response to a command that was not answered in time,
+        without a result code, but keep its place among the pending
+        commands so that a late reply is discarded instead of being taken
+        as the response to the next command. Returns the "CommandResponse"
+        that takes its place and finishes when the late final result code
+        arrives, or None if the command was not pending.
+        """
+        placeholder = None
+        if response in self.pending:
+            placeholder = CommandResponse(response.command)
+            placeholder.sent_time = response.sent_time
+            self.pending = deque(placeholder if pending is response else pending
+                                 for pending in self.pending)
+        if not response.is_done():
+            response.finish()
+        return placeholder
+
+    def cancel(self, response):
+        """
+        Stop waiting for the response to a command (e.g. because it could
+        not be sent). The response is finished without a result code.
+        """
+        if response in self.pending:
+            self.pending.remove(response)
+        if not response.is_done():
+            response.finish()
+
+    def reset(self):
+        """
+        Discard any partially received data and cancel all pending commands.
+        """
+        self.framer.reset()
+        if self.dispatcher is not None:
+            self.dispatcher.reset()
+        pending, self.pending = self.pending, deque()
+        for response in pending:
+            response.finish()
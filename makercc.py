@@ -0,0 +1,72 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Script that builds the binary resource file "resources.rcc".
+
+The normal way to build the file is with Qt's resource compiler:
+
+    rcc -binary resources.qrc -o resources.rcc
+
+When rcc is not installed the file can be built from "resources.py" (as
+generated by pyrcc4) instead, by running this script. The tree, name and
+data blocks of a binary resource file are the same as those embedded in
+the Python module, only a header holding their offsets is added. The
+Python module is parsed, not imported, so Qt is not needed.
+"""
+
+# Standard library modules
+import ast
+import os
+import struct
+
+RCC_MAGIC = 'qres'
+RCC_VERSION = 1
+RCC_HEADER_FORMAT = '>4sIIII'
+
+def read_resource_module(path):
+    """
+    Return the (struct, name, data) blocks embedded in a pyrcc4 module.
+    """
+    blocks = {}
+    for node in ast.parse(open(path).read()).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            name = getattr(node.targets[0], 'id', None)
+            if name in ('qt_resource_struct', 'qt_resource_name', 'qt_resource_data'):
+                blocks[name] = ast.literal_eval(node.value)
+    return blocks['qt_resource_struct'], blocks['qt_resource_name'], blocks['qt_resource_data']
+
+def build_rcc(tree, names, data):
+    """
+    Return the contents of a binary resource file holding the given blocks.
+    The blocks are written in the same order as rcc writes them.
+    """
+    header_size = struct.calcsize(RCC_HEADER_FORMAT)
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = struct.pack(RCC_HEADER_FORMAT, RCC_MAGIC, RCC_VERSION, tree_offset, data_offset, names_offset)
+    return header + data + names + tree
+
+if __name__ == '__main__':
+    directory = os.path.dirname(os.path.abspath(__file__))
+    source = os.path.join(directory, 'resources.py')
+    target = os.path.join(directory, 'resources.rcc')
+
+    contents = build_rcc(*read_resource_module(source))
+    open(target, 'wb').write(contents)
+    print 'Wrote %s (%d bytes)' % (target, len(contents))
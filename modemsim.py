@@ -0,0 +1,440 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing a simulated modem that answers AT commands on a pseudo
+terminal (Linux and other POSIX systems only).
+
+The simulator opens a pty pair and answers on the master side, the slave
+side ("port") can be opened like any serial port, e.g. from the connect
+dialog or with "AtSession.open". This allows the application to be tried
+out, benchmarked and load tested without any hardware.
+
+Supported commands: AT, ATE0/1, ATZ, ATD, ATA, ATH, AT+CGSN, AT+CIMI,
+AT+GMI, AT+GMM, AT+GMR, AT+GCAP, AT+CLAC, AT+CLCK, AT+CPWD, AT+VTS, AT+VTD,
+AT+CFUN and AT+CMEE. Anything else is answered with ERROR.
+
+Run the module to start a simulator from the command line:
+
+    python modemsim.py --latency 0.05 --link /tmp/ttySIM0
+"""
+
+# Standard library modules
+import os
+import pty
+import random
+import select
+import threading
+import time
+import tty
+
+# Local application modules
+from urc import command_name
+
+# Identity reported by the simulator
+MANUFACTURER = 'Shelltoad'
+MODEL = 'ATK Simulated Modem'
+REVISION = '1.0'
+IMEI = '350000000000001'
+IMSI = '001010123456789'
+
+# Call barring facilities and those that can only be disabled
+BARRING_FACILITIES = ('AO', 'OI', 'OX', 'AI', 'IR', 'AC', 'AG', 'AB')
+DISABLE_ONLY_FACILITIES = ('AC', 'AG', 'AB')
+OUTGOING_FACILITIES = ('AO', 'OI', 'OX')
+INCOMING_FACILITIES = ('AI', 'IR')
+
+# Password lengths of the facilities that have a password
+PASSWORD_LENGTHS = {'SC': 8, 'P2': 8, 'PS': 8, 'AB': 4}
+
+# Class used by AT+CLCK when none is given (voice, data & fax)
+DEFAULT_CLASSES = 7
+
+# Text of the +CME ERROR codes used, reported when AT+CMEE=2 is set
+CME_ERROR_TEXT = {3: 'operation not allowed', 16: 'incorrect password', 50: 'incorrect parameters'}
+
+# Characters allowed in AT+VTS tone strings
+DTMF_CHARS = '0123456789*#ABCD'
+
+class ModemSimulator(object):
+    """
+    A simulated modem answering on a pseudo terminal.
+
+    latency - seconds to wait before answering each command
+    echo - initial echo setting (can be changed with ATE0/ATE1)
+    error_rate - probability (0 to 1) that a command fails with ERROR
+    fail_commands - names of commands that always fail, e.g. ('+CIMI',)
+    vts_max - maximum number of tones accepted by one AT+VTS command
+    seed - seed for the random number generator used by "error_rate"
+    """
+
+    def __init__(self, latency=0.0, echo=True, error_rate=0.0, fail_commands=(), vts_max=None, seed=None):
+        self.latency = latency
+        self.echo = echo
+        self.error_rate = error_rate
+        self.fail_commands = set(name.upper() for name in fail_commands)
+        self.vts_max = vts_max
+        self.random = random.Random(seed)
+
+        # Device state
+        self.functionality = 1
+        self.call_active = False
+        self.ringing = False
+        self.barring = dict((facility, 0) for facility in BARRING_FACILITIES)
+        self.locks = {'SC': False, 'PS': False}
+        self.passwords = {'SC': '1234', 'P2': '5678', 'PS': '1234', 'AB': '0000'}
+        self.tones_played = 0
+        self.tone_duration = 0
+        self.error_format = 1
+
+        # Open the pseudo terminal
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+
+        self.running = False
+        self.thread = None
+        self.write_lock = threading.Lock()
+
+        self.handlers = {
+            '': self.at, 'E0': self.echo_off, 'E1': self.echo_on, 'Z': self.at,
+            'D': self.dial, 'A': self.answer, 'H': self.hang_up,
+            '+CGSN': self.imei, '+CIMI': self.imsi, '+GMI': self.manufacturer,
+            '+GMM': self.model, '+GMR': self.revision, '+GCAP': self.capabilities,
+            '+CLAC': self.command_list, '+CLCK': self.facility_lock,
+            '+CPWD': self.change_password, '+VTS': self.dtmf, '+VTD': self.tone_duration_command,
+            '+CFUN': self.set_functionality, '+CMEE': self.set_error_format,
+        }
+
+    def start(self):
+        """
+        Start answering commands in a background thread.
+        """
+        self.running = True
+        self.thread = threading.Thread(target=self.run)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread and close the pseudo terminal.
+        """
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        os.close(self.master)
+        os.close(self.slave)
+
+    def run(self):
+        buffer = ''
+        while self.running:
+            if not select.select([self.master], [], [], 0.1)[0]:
+                continue
+            try:
+                data = os.read(self.master, 4096)
+            except OSError:
+                break
+
+            # Commands are terminated by a carriage return, line feeds
+            # sent after it are ignored
+            buffer += data.replace('\n', '')
+            while '\r' in buffer:
+                line, buffer = buffer.split('\r', 1)
+                if self.echo:
+                    self.write(line + '\r')
+                if line.strip():
+                    self.answer_command(line.strip())
+
+    def write(self, data):
+        self.write_lock.acquire()
+        try:
+            os.write(self.master, data)
+        finally:
+            self.write_lock.release()
+
+    def send_urc(self, line):
+        """
+        Send an unsolicited result code.
+        """
+        self.write('\r\n%s\r\n' % line)
+
+    def ring(self, number='+441234567890'):
+        """
+        Simulate an incoming call, which can be answered with ATA.
+        """
+        self.ringing = True
+        self.send_urc('RING')
+        self.send_urc('+CLIP: "%s",145' % number)
+
+    def answer_command(self, line):
+        """
+        Work out the answer to a command line and send it.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        if not line.upper().startswith('AT'):
+            self.write('\r\nERROR\r\n')
+            return
+
+        # Dial commands contain characters that are not part of a name
+        if line[2:3].upper() == 'D':
+            name, args = 'D', line[3:]
+        else:
+            name = command_name(line)
+            args = line[2 + len(name):]
+
+        handler = self.handlers.get(name)
+        if handler is None or name in self.fail_commands or self.random.random() < self.error_rate:
+            result, lines = 'ERROR', []
+        else:
+            result, lines = handler(args)
+        result = self.format_error(result)
+
+        response = ''.join('\r\n%s\r\n' % l for l in lines)
+        self.write(response + '\r\n%s\r\n' % result)
+
+    def format_error(self, result):
+        """
+        Return a final result code in the error format set by AT+CMEE.
+        """
+        if not result.startswith('+CME ERROR: '):
+            return result
+        if self.error_format == 0:
+            return 'ERROR'
+        if self.error_format == 2:
+            code = int(result.split(':')[1])
+            return '+CME ERROR: %s' % CME_ERROR_TEXT.get(code, code)
+        return result
+
+    def parse_args(self, args):
+        """
+        Split the arguments of a set command ("=a,b,c") into a list.
+        """
+        return [arg.strip().strip('"') for arg in args.lstrip('=').split(',')]
+
+    # Command handlers, each takes the text following the command name and
+    # returns the final result code and a list of information lines
+
+    def at(self, args):
+        return 'OK', []
+
+    def echo_off(self, args):
+        self.echo = False
+        return 'OK', []
+
+    def echo_on(self, args):
+        self.echo = True
+        return 'OK', []
+
+    def imei(self, args):
+        return 'OK', [IMEI]
+
+    def imsi(self, args):
+        return 'OK', [IMSI]
+
+    def manufacturer(self, args):
+        return 'OK', [MANUFACTURER]
+
+    def model(self, args):
+        return 'OK', [MODEL]
+
+    def revision(self, args):
+        return 'OK', [REVISION]
+
+    def capabilities(self, args):
+        return 'OK', ['+GCAP: +CGSM,+FCLASS,+DS']
+
+    def command_list(self, args):
+        names = sorted(n for n in self.handlers if n.startswith('+'))
+        return 'OK', ['AT%s' % n for n in ['D', 'A', 'H', 'E', 'Z'] + names]
+
+    def dial(self, args):
+        if self.functionality != 1 or self.call_active or not args.strip(' ;'):
+            return 'NO CARRIER', []
+        if not args.endswith(';'):
+            return 'NO CARRIER', []
+        self.call_active = True
+        return 'OK', []
+
+    def answer(self, args):
+        if not self.ringing:
+            return 'NO CARRIER', []
+        self.ringing = False
+        self.call_active = True
+        return 'OK', []
+
+    def hang_up(self, args):
+        self.ringing = False
+        self.call_active = False
+        return 'OK', []
+
+    def set_functionality(self, args):
+        if args == '?':
+            return 'OK', ['+CFUN: %d' % self.functionality]
+        if args == '=?':
+            return 'OK', ['+CFUN: (0-6)']
+        level = self.parse_args(args)[0]
+        if not level.isdigit() or int(level) > 6:
+            return '+CME ERROR: 50', []
+        self.functionality = int(level)
+        return 'OK', []
+
+    def facility_lock(self, args):
+        if args == '=?':
+            facilities = ','.join('"%s"' % f for f in ('SC', 'PS') + BARRING_FACILITIES)
+            return 'OK', ['+CLCK: (%s)' % facilities]
+
+        params = self.parse_args(args)
+        facility = params[0].upper()
+        if len(params) < 2 or not params[1].isdigit():
+            return '+CME ERROR: 50', []
+        mode = int(params[1])
+        password = params[2] if len(params) > 2 else ''
+        classes = int(params[3]) if len(params) > 3 and params[3].isdigit() else DEFAULT_CLASSES
+
+        # Locks of the SIM card & phone
+        if facility in self.locks:
+            if mode == 2:
+                return 'OK', ['+CLCK: %d' % self.locks[facility]]
+            if password != self.passwords[facility]:
+                return '+CME ERROR: 16', []
+            self.locks[facility] = mode == 1
+            return 'OK', []
+
+        if facility not in self.barring:
+            return '+CME ERROR: 50', []
+
+        # Interrogate the classes barred by a facility
+        if mode == 2:
+            if facility in DISABLE_ONLY_FACILITIES:
+                return '+CME ERROR: 3', []
+            barred = self.barring[facility] & classes
+            if not barred:
+                return 'OK', ['+CLCK: 0,%d' % classes]
+            return 'OK', ['+CLCK: 1,%d' % c for c in (1, 2, 4, 8, 16, 32, 64, 128) if barred & c]
+
+        if password != self.passwords['AB']:
+            return '+CME ERROR: 16', []
+        if mode == 1:
+            if facility in DISABLE_ONLY_FACILITIES:
+                return '+CME ERROR: 3', []
+            self.barring[facility] |= classes
+        elif mode == 0:
+            if facility == 'AB':
+                affected = BARRING_FACILITIES
+            elif facility == 'AG':
+                affected = OUTGOING_FACILITIES
+            elif facility == 'AC':
+                affected = INCOMING_FACILITIES
+            else:
+                affected = (facility,)
+            for f in affected:
+                self.barring[f] &= ~classes
+        else:
+            return '+CME ERROR: 50', []
+        return 'OK', []
+
+    def change_password(self, args):
+        if args == '=?':
+            lengths = [('SC', 8), ('P2', 8), ('PS', 8)] + [(f, 4) for f in BARRING_FACILITIES]
+            return 'OK', ['+CPWD: %s' % ','.join('("%s",%d)' % l for l in lengths)]
+
+        params = self.parse_args(args)
+        if len(params) != 3:
+            return '+CME ERROR: 50', []
+        facility, old_password, new_password = params
+        facility = facility.upper()
+        if facility in BARRING_FACILITIES:
+            facility = 'AB'
+        if facility not in self.passwords:
+            return '+CME ERROR: 50', []
+        if old_password != self.passwords[facility]:
+            return '+CME ERROR: 16', []
+        if not new_password.isdigit() or len(new_password) > PASSWORD_LENGTHS[facility]:
+            return '+CME ERROR: 50', []
+        self.passwords[facility] = new_password
+        return 'OK', []
+
+    def dtmf(self, args):
+        tones = ''.join(self.parse_args(args)).upper()
+        if not tones or [t for t in tones if t not in DTMF_CHARS]:
+            return '+CME ERROR: 50', []
+        if self.vts_max is not None and len(tones) > self.vts_max:
+            return '+CME ERROR: 50', []
+        self.tones_played += len(tones)
+        return 'OK', []
+
+    def set_error_format(self, args):
+        if args == '?':
+            return 'OK', ['+CMEE: %d' % self.error_format]
+        if args == '=?':
+            return 'OK', ['+CMEE: (0-2)']
+        mode = self.parse_args(args)[0]
+        if mode not in ('0', '1', '2'):
+            return '+CME ERROR: 50', []
+        self.error_format = int(mode)
+        return 'OK', []
+
+    def tone_duration_command(self, args):
+        if args == '?':
+            return 'OK', ['+VTD: %d' % self.tone_duration]
+        if args == '=?':
+            return 'OK', ['+VTD: (0-255)']
+        duration = self.parse_args(args)[0]
+        if not duration.isdigit() or int(duration) > 255:
+            return '+CME ERROR: 50', []
+        self.tone_duration = int(duration)
+        return 'OK', []
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('--latency', type='float', default=0.0,
+                      help='seconds to wait before answering each command')
+    parser.add_option('--no-echo', action='store_false', dest='echo', default=True,
+                      help='do not echo commands')
+    parser.add_option('--error-rate', type='float', default=0.0,
+                      help='probability (0 to 1) that a command fails')
+    parser.add_option('--fail', action='append', default=[], metavar='NAME',
+                      help='name of a command that always fails, e.g. +CIMI')
+    parser.add_option('--vts-max', type='int',
+                      help='maximum number of tones accepted by AT+VTS')
+    parser.add_option('--link', metavar='PATH',
+                      help='create a symbolic link to the port at PATH')
+    options, args = parser.parse_args()
+
+    simulator = ModemSimulator(options.latency, options.echo, options.error_rate, options.fail, options.vts_max)
+    port = simulator.port
+    if options.link:
+        if os.path.islink(options.link):
+            os.remove(options.link)
+        os.symlink(simulator.port, options.link)
+        port = options.link
+
+    print 'Simulated modem listening on %s (Ctrl+C to stop)' % port
+    simulator.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    simulator.stop()
+    if options.link:
+        os.remove(options.link)
@@ -0,0 +1,222 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for finding the serial ports available on the system.
+
+Ports are found by enumerating the operating system's device list rather
+than by opening every possible port, so discovery is quick and does not
+disturb devices that are in use by other programs:
+
+  * pyserial's "list_ports" is used when it is available (pyserial 2.6+)
+  * on Linux the serial devices registered in sysfs are listed
+  * on other POSIX systems the usual serial device names in /dev are used
+  * on Windows the ports are read from the registry
+
+Only if none of these work are candidate ports probed by opening them,
+in parallel and with a short timeout.
+
+The result is cached until a change in the device list is detected (on
+POSIX systems, a change to the /dev directory).
+"""
+
+# Standard library modules
+import glob
+import os
+import sys
+import threading
+import time
+
+# 3rd party modules
+import serial
+
+# Seconds to wait for the probe of a port to finish
+PROBE_TIMEOUT = 0.5
+
+# Device name patterns of serial ports on POSIX systems
+DEVICE_PATTERNS = ('/dev/ttyS*', '/dev/ttyUSB*', '/dev/ttyACM*', '/dev/ttyAMA*',
+                   '/dev/rfcomm*', '/dev/cu.*', '/dev/tty.*')
+
+SYSFS_TTY = '/sys/class/tty'
+
+def pyserial_ports():
+    """
+    Return the ports found by pyserial's "list_ports", or None if it is
+    not available.
+    """
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return None
+    return [port[0] for port in list_ports.comports()]
+
+def sysfs_ports():
+    """
+    Return the serial ports registered in sysfs (Linux), or None if sysfs
+    is not available. Only ttys backed by a device are serial ports, legacy
+    8250 ports without hardware are left out.
+    """
+    if not os.path.isdir(SYSFS_TTY):
+        return None
+
+    ports = []
+    for name in os.listdir(SYSFS_TTY):
+        device = os.path.join(SYSFS_TTY, name, 'device')
+        if not os.path.exists(device):
+            continue
+        driver = os.path.basename(os.path.realpath(os.path.join(device, 'driver')))
+        if driver == 'serial8250' and not serial8250_present(name):
+            continue
+        ports.append('/dev/' + name)
+    return ports
+
+def serial8250_present(name):
+    """
+    Check whether an 8250 UART port has hardware behind it. The kernel
+    registers a number of these ports whether or not they exist; the
+    ones without hardware report a UART type of 0.
+    """
+    try:
+        return open(os.path.join(SYSFS_TTY, name, 'type')).read().strip() != '0'
+    except IOError:
+        return True
+
+def device_ports():
+    """
+    Return the devices in /dev with the usual serial port names.
+    """
+    ports = []
+    for pattern in DEVICE_PATTERNS:
+        ports.extend(glob.glob(pattern))
+    return ports
+
+def registry_ports():
+    """
+    Return the serial ports listed in the Windows registry.
+    """
+    import _winreg
+
+    ports = []
+    try:
+        key = _winreg.OpenKey(_winreg.HKEY_LOCAL_MACHINE, r'HARDWARE\DEVICEMAP\SERIALCOMM')
+    except WindowsError:
+        return ports
+    try:
+        i = 0
+        while True:
+            try:
+                ports.append(str(_winreg.EnumValue(key, i)[1]))
+            except WindowsError:
+                break
+            i += 1
+    finally:
+        _winreg.CloseKey(key)
+    return ports
+
+def probe_ports(candidates, timeout=PROBE_TIMEOUT):
+    """
+    Try to open each of the candidate ports, all at the same time, and
+    return those that could be opened within the timeout.
+    """
+    found = []
+
+    def probe(port):
+        try:
+            s = serial.Serial(port)
+        except (serial.SerialException, ValueError, OSError):
+            return
+        found.append(s.portstr)
+        s.close()
+
+    threads = [threading.Thread(target=probe, args=(port,)) for port in candidates]
+    for thread in threads:
+        thread.setDaemon(True)
+        thread.start()
+    end = time.time() + timeout
+    for thread in threads:
+        thread.join(max(0, end - time.time()))
+    return list(found)
+
+def port_sort_key(port):
+    """
+    Sort key that puts "COM10" after "COM9" and "ttyUSB10" after "ttyUSB9".
+    """
+    head = port.rstrip('0123456789')
+    tail = port[len(head):]
+    return head, int(tail) if tail else -1
+
+def find_ports():
+    """
+    Return a sorted list of the serial ports available on the system.
+    """
+    if sys.platform == 'win32':
+        ports = registry_ports()
+        if not ports:
+            ports = probe_ports(['COM%d' % i for i in range(1, 257)])
+    else:
+        ports = pyserial_ports()
+        if ports is None:
+            ports = sysfs_ports()
+        if ports is None:
+            ports = device_ports()
+    return sorted(set(ports), key=port_sort_key)
+
+class PortScanner(object):
+    """
+    Finds the available serial ports and caches the result until the
+    device list changes.
+    """
+
+    def __init__(self):
+        self.signature = None
+        self.ports = None
+
+    def current_signature(self):
+        """
+        Return a value that changes when devices are added or removed, or
+        None if changes can not be detected on this system.
+        """
+        if sys.platform == 'win32':
+            return None
+        try:
+            return os.stat('/dev').st_mtime
+        except OSError:
+            return None
+
+    def available_ports(self, refresh=False):
+        """
+        Return the list of available ports. The cached list is returned
+        unless "refresh" is True or the device list has changed.
+        """
+        signature = self.current_signature()
+        if refresh or self.ports is None or signature is None or signature != self.signature:
+            self.ports = find_ports()
+            self.signature = signature
+        return list(self.ports)
+
+# Scanner shared by the whole application
+scanner = PortScanner()
+
+def available_ports(refresh=False):
+    """
+    Return the list of available ports, using the shared scanner.
+    """
+    return scanner.available_ports(refresh)
+
+if __name__ == '__main__':
+    for port in available_ports():
+        print port
@@ -0,0 +1,196 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module providing the "--profile FILE" switch of the application.
+
+Profiling is off unless "start" is called, which the application does only
+when the switch is given on the command line. When it is off the only cost
+is a call to "mark" for each startup phase; nothing on the command path is
+wrapped. When it is on the following are recorded and written to FILE as
+JSON when the application exits, with a summary printed to stderr:
+
+    - the time taken to import each module (including the modules it imports)
+    - the time at which each startup phase of the main window finished
+    - the time spent enumerating serial ports for the connection dialog
+    - the time taken by each call to "send_command" and "read_serial_data"
+"""
+
+# Standard library modules
+import __builtin__
+import atexit
+import json
+import sys
+
+# Local application modules
+from clock import monotonic
+
+# Command line switch that enables profiling
+PROFILE_OPTION = '--profile'
+
+# The active profiler, None when profiling is off
+profiler = None
+
+class Profiler(object):
+    """
+    This class records import, startup phase and call timings.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.start_time = monotonic()
+        self.imports = {}
+        self.phases = []
+        self.calls = {}
+        self.original_import = None
+
+    def elapsed_ms(self):
+        return (monotonic() - self.start_time) * 1000.0
+
+    def install_import_hook(self):
+        """
+        Time every import of a module that has not been imported yet.
+        """
+        original_import = self.original_import = __builtin__.__import__
+        imports = self.imports
+
+        def timed_import(name, *args, **kwargs):
+            if name in sys.modules:
+                return original_import(name, *args, **kwargs)
+            start = monotonic()
+            try:
+                return original_import(name, *args, **kwargs)
+            finally:
+                imports[name] = imports.get(name, 0.0) + (monotonic() - start) * 1000.0
+
+        __builtin__.__import__ = timed_import
+
+    def remove_import_hook(self):
+        if self.original_import is not None:
+            __builtin__.__import__ = self.original_import
+            self.original_import = None
+
+    def mark(self, phase):
+        self.phases.append((phase, self.elapsed_ms()))
+
+    def instrument(self, owner, attribute, label):
+        """
+        Replace the function "attribute" of "owner" (a class or module) with
+        a wrapper that records the duration of every call under "label".
+        """
+        function = getattr(owner, attribute)
+        durations = self.calls.setdefault(label, [])
+
+        def timed_call(*args, **kwargs):
+            start = monotonic()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                durations.append((monotonic() - start) * 1000.0)
+
+        timed_call.__name__ = function.__name__
+        timed_call.__doc__ = function.__doc__
+        setattr(owner, attribute, timed_call)
+
+    def report(self):
+        """
+        Return the recorded timings as a dictionary. All times are in ms.
+        """
+        imports = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+        calls = {}
+        for label, durations in self.calls.items():
+            if not durations:
+                continue
+            ordered = sorted(durations)
+            calls[label] = {
+                'count': len(ordered),
+                'total_ms': round(sum(ordered), 3),
+                'mean_ms': round(sum(ordered) / len(ordered), 3),
+                'p95_ms': round(ordered[max(0, int(round(0.95 * len(ordered))) - 1)], 3),
+                'max_ms': round(ordered[-1], 3),
+            }
+        return {
+            'imports': [{'module': name, 'ms': round(ms, 3)} for name, ms in imports],
+            'phases': [{'phase': phase, 'ms': round(ms, 3)} for phase, ms in self.phases],
+            'calls': calls,
+            'run_ms': round(self.elapsed_ms(), 3),
+        }
+
+    def write(self):
+        """
+        Write the report to the profile file and a summary to stderr.
+        """
+        self.remove_import_hook()
+        report = self.report()
+        with open(self.path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+        sys.stderr.write('Profile written to %s\n' % self.path)
+        sys.stderr.write('Slowest imports:\n')
+        for entry in report['imports'][:10]:
+            sys.stderr.write('  %-40s %9.1f ms\n' % (entry['module'], entry['ms']))
+        sys.stderr.write('Startup phases:\n')
+        for entry in report['phases']:
+            sys.stderr.write('  %-40s %9.1f ms\n' % (entry['phase'], entry['ms']))
+        sys.stderr.write('Calls:\n')
+        for label, stats in sorted(report['calls'].items()):
+            sys.stderr.write('  %-40s %6d calls, mean %.3f ms, p95 %.3f ms, max %.3f ms\n' %
+                             (label, stats['count'], stats['mean_ms'], stats['p95_ms'], stats['max_ms']))
+
+def start(argv):
+    """
+    Start profiling if "--profile FILE" is in argv, removing the switch from
+    it so it is not passed on to Qt. Returns the profiler or None.
+    """
+    global profiler
+    if PROFILE_OPTION not in argv:
+        return None
+    index = argv.index(PROFILE_OPTION)
+    if index + 1 >= len(argv):
+        sys.exit('%s requires a file name' % PROFILE_OPTION)
+    path = argv[index + 1]
+    del argv[index:index + 2]
+
+    profiler = Profiler(path)
+    profiler.install_import_hook()
+    atexit.register(profiler.write)
+    return profiler
+
+def mark(phase):
+    """
+    Record the end of a startup phase if profiling is on.
+    """
+    if profiler is not None:
+        profiler.mark(phase)
+
+def instrument_application():
+    """
+    Wrap the serial port enumeration and command path of the application if
+    profiling is on. Must be called before the main window is created so the
+    signal connections made by its widgets use the wrapped methods.
+    """
+    if profiler is None:
+        return
+
+    import connectdlg
+    import portscan
+    import terminal
+
+    profiler.instrument(portscan, 'find_ports', 'portscan.find_ports')
+    profiler.instrument(connectdlg.ConnectDlg, 'populate_port', 'ConnectDlg.populate_port')
+    profiler.instrument(terminal.TerminalWidget, 'send_command', 'TerminalWidget.send_command')
+    profiler.instrument(terminal.TerminalWidget, 'read_serial_data', 'TerminalWidget.read_serial_data')
@@ -0,0 +1,51 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for loading the application's Qt resources (icons).
+
+The resources are read from the binary resource file "resources.rcc",
+which Qt memory maps when it is registered, so nothing has to be parsed
+or copied at startup. The "resources" module (the same resources as
+Python byte strings, generated by pyrcc4) is only imported if the binary
+file is missing or can not be registered. Run "makercc.py" to rebuild
+the binary file.
+"""
+
+# Standard library modules
+import os
+
+# 3rd party modules
+from PyQt4.QtCore import QResource
+
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources.rcc')
+
+loaded = False
+
+def load_resources(binary=True):
+    """
+    Make the application's resources available, if that has not been done
+    already. Set "binary" to False to use the "resources" module even if
+    the binary resource file exists.
+    """
+    global loaded
+    if loaded:
+        return
+
+    if not (binary and QResource.registerResource(RESOURCE_FILE)):
+        import resources
+    loaded = True
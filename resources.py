@@ -1,1161 +1,1161 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: Fri 22. Jan 09:26:40 2010
-#      by: The Resource Compiler for PyQt (Qt v4.5.3)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt4 import QtCore
-
-qt_resource_data = "\
-\x00\x00\x31\xd0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\
-\x25\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\
-\x30\x00\x00\xea\x60\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\
-\x46\x00\x00\x31\x56\x49\x44\x41\x54\x78\xda\xec\x7d\x59\x90\x63\
-\xd7\x79\xde\x77\xce\xb9\x2b\x70\x01\x34\x7a\x9f\xe9\x9e\x95\x33\
-\x24\x67\x86\x43\x8a\x12\x29\x52\x32\x25\x92\x52\xb9\x62\xd9\xda\
-\xed\x17\xab\x1c\xd9\x49\x6c\x95\x2a\x29\x3b\x4e\x39\x8e\x93\x4a\
-\xa5\x62\x3b\x7e\xc8\x52\xb1\x63\x3b\x4e\x52\x2e\xc7\x6b\x52\x8e\
-\xcb\x65\x5b\xb6\x16\x5b\xa2\x29\x8a\xa2\x48\x71\x95\x48\x0e\x77\
-\xce\xda\xd3\xb3\xf4\xf4\x8a\xf5\x6e\x67\xc9\xc3\x39\xf7\xe2\x02\
-\x0d\x60\x28\x4a\x0f\xa3\x2a\x5c\x16\x38\x68\x74\x37\x80\xc6\xff\
-\x9d\x7f\xf9\xfe\x8d\x28\xa5\x70\xa3\x5d\x69\x9a\x62\xfd\xda\x35\
-\xa4\x42\xe1\xda\xfa\x06\x08\x14\xe2\x94\xa3\x1b\x0b\x30\xc7\xc7\
-\xb5\xed\x0e\x5c\xc7\x41\x94\x70\x74\xc3\x18\x37\xed\x5b\xb0\x9e\
-\x7d\xf9\xcc\xfc\xbb\x4e\x1c\xde\xfb\xe8\x93\x2f\x1e\xbd\xeb\xf6\
-\x9b\xf7\xbc\x7e\xf6\xe2\x2d\x29\x17\xf3\xfb\x16\xea\x33\xdb\x3b\
-\xcd\xc5\x44\xa8\x2a\xb3\x5c\x9b\x32\x46\x00\x05\x28\x00\x50\x20\
-\x84\x82\x10\x02\x42\x29\x04\xe7\x48\xd3\x14\x29\x17\xe0\x9c\xe7\
-\xff\xc6\x71\x22\x13\x2e\x62\x8b\xd1\x70\xaa\x52\xda\x4a\x52\x7e\
-\xed\xf4\xb9\xd5\xce\xc1\xe5\xb9\x6b\xb7\x1e\x39\x74\xee\xa1\x6f\
-\x7c\x6b\x67\xdf\x8c\xb3\x75\xec\xa6\xfd\x6f\x9c\x3a\xf5\xf2\xfa\
-\x47\x3f\xf4\xfe\x8d\x17\x5e\x78\x49\xc5\x71\x02\x9b\x01\x7b\xf7\
-\x2c\xa0\x54\xf2\xf1\xfe\x07\x1e\x44\x10\x04\x37\xd4\x67\x4d\xbe\
-\x1f\x00\x40\x09\xb4\xb0\x63\x01\x30\xc7\xda\xd8\xe9\x1c\xf2\x1c\
-\x76\x3c\x8c\x92\x3b\x7d\x9b\xbe\xc3\xf3\x9c\x9b\x14\x8f\x0f\x94\
-\x4a\xa5\x8a\x45\x04\xa0\x14\x7c\xcf\x01\x94\x84\x14\x02\x96\xc5\
-\xc0\x18\x05\xa3\x5a\xd8\x94\x10\x2d\xf4\xec\x46\x09\x08\xa1\xa0\
-\x94\xea\x9f\x63\x16\x2c\xdb\x06\x25\x14\x84\x52\x80\x50\xc4\x29\
-\x47\x1c\x27\x68\xb5\xda\xd8\xda\x6e\xa0\xd5\x8d\xd0\x68\x75\x70\
-\xe9\xca\x06\x22\x0e\x6c\x34\x22\x5c\xd9\xe8\x48\xc7\xa2\x3b\x15\
-\x8f\x5e\xb0\x54\xfc\x52\xc9\x51\x8f\x4f\x07\xf4\x6b\xc7\x6f\x3e\
-\xf4\xba\x5f\x2a\xe3\x07\xee\x7b\x1f\x82\x4a\x65\x02\x80\xb7\x02\
-\x80\x8d\xf5\x75\xa4\x42\x61\xed\xda\x7a\x5d\x49\x71\x52\x2a\xdc\
-\x1d\xc7\xc9\xbb\xa4\x54\xef\x22\x10\x07\x94\xe0\xae\x52\x02\x82\
-\xa7\x10\x42\x40\x70\x01\xa9\x24\x40\x08\xa4\x94\x20\x84\xc0\xb2\
-\x6c\x58\x96\x05\xc6\x2c\x78\x9e\x07\xc7\xb1\xa1\xcc\xc9\x97\x52\
-\x82\x73\x01\xce\x53\xa4\x69\x8a\x24\x8e\x21\xa4\x84\x52\x0a\x71\
-\x1c\x43\x49\x09\xdb\xb6\xc1\x18\x33\xc0\x60\x28\x97\xcb\xf0\x7d\
-\x1f\x95\x6a\x05\xb5\x6a\x15\xb6\x6d\xa3\xd9\x6c\xe2\xc2\xf9\xf3\
-\xd8\xda\xde\xc1\x85\x2b\x9b\x78\xf4\x85\x35\xa4\xa4\x04\x91\x24\
-\x50\x3c\x85\xe2\x21\x3f\xb4\xe0\x3e\xf2\xee\xdb\x96\x7e\xf1\xd3\
-\x3f\xf5\x8f\x5e\x70\x3d\x6f\x02\x80\xeb\x5d\x82\x73\x5c\xbe\x7c\
-\xf9\xae\xed\x9d\xc6\x2f\x34\x76\x76\x7e\x30\x49\xe2\x99\x38\x8e\
-\x90\xa6\x09\xa4\x90\x20\x94\xc0\x62\x16\x6c\xc7\x81\xeb\x79\x28\
-\xf9\x25\x23\x60\x07\x9e\xe7\xc1\xf3\x7d\xb8\xae\x0b\xdb\xb6\xf3\
-\x1b\xa5\xb4\xff\x35\x84\x30\x37\x0e\xce\x39\x84\x10\x48\x39\x07\
-\x4f\x0d\x20\x92\x04\x49\x9c\x20\x4e\x62\x44\x51\x84\xa8\x1b\x22\
-\x49\x13\x84\xdd\x2e\xa2\x28\x02\x65\x0c\xf3\x73\x73\x38\x7c\xd3\
-\x11\x50\x4a\xf1\xf2\xcb\x2f\x43\xf2\x18\x4f\x3e\xf7\x12\xbe\xf9\
-\x66\x0c\xdb\xf6\x20\xd2\x04\x9c\x73\x34\x9b\x6d\x38\xc9\xd5\xad\
-\xff\xfa\x6b\x3f\xf7\xc0\xd1\x9b\x6f\x39\x35\x3d\x3d\x33\x01\xc0\
-\xb8\x6b\xf5\xe2\xc5\x7f\xf9\xea\xab\xaf\xfe\xa7\xed\xed\x2d\x4a\
-\x08\x72\x21\xfb\xa5\x12\xfc\x4c\xb8\x96\x39\x9d\xac\xa7\xd6\x29\
-\x65\x60\xac\x77\x0b\x82\x00\x96\x65\x21\xe5\x1c\x9e\xeb\x02\x84\
-\x40\x08\x01\x62\xb4\x44\x18\x86\x90\x52\x14\xc0\xd0\xbb\x49\x29\
-\x0b\x37\x05\x55\xf8\x5a\x48\x89\x24\x8e\xd1\xed\x76\x11\x45\x21\
-\x0e\x1e\x3a\x04\xce\x39\xde\x78\xfd\x0d\xb4\x9b\x3b\xf8\x7f\x5f\
-\x79\x09\xd2\x99\x85\x4c\x63\x08\x9e\x22\x4d\x52\x6c\xad\xaf\xe3\
-\xbd\x27\x2a\x7f\xf2\x99\x7f\xf2\xa9\x9f\x7a\xe7\xdd\xf7\xca\x1b\
-\xe5\xb3\xa6\x37\x92\xe0\x3b\xed\x36\xae\x5e\xb9\xf2\xe1\xe7\x9e\
-\x7b\xf6\xbf\x5c\xbc\x78\x81\x5a\xb6\x85\xb9\xf9\x05\x2c\x2d\x2d\
-\x63\x76\x6e\x2e\x17\xa8\x52\x0a\xdc\x9c\xdc\xec\xf4\x0a\x23\x9c\
-\x0c\xd0\x9e\xef\xe3\xe1\xbf\x7f\x08\x9f\xff\xfc\xdf\xc0\xf3\x3c\
-\xfc\xd6\x6f\xfe\x06\xfe\xf6\x8b\x5f\x00\x63\x0c\x7f\xf4\x07\xbf\
-\x8f\xff\xfb\x27\x7f\x04\xdf\xf7\xc7\xbe\x1f\xa5\x14\x94\x54\x39\
-\x48\xb8\xe0\x48\x79\x0a\x9e\xa6\x50\x4a\xc1\xf7\x7d\xd8\xb6\x83\
-\x95\x95\x15\x04\xe5\x00\xb6\x6d\x23\x08\x02\x54\x7c\x0a\x21\xb4\
-\x8c\x15\x00\xa5\x24\x5c\xbf\x84\xf3\xab\x9b\xef\xed\x74\x3a\x87\
-\x6f\xa4\xcf\xfc\x86\x02\xc0\xce\xce\xf6\xfd\x2b\x2b\x2b\xff\x6c\
-\x63\x7d\x03\xbe\x5f\x82\xeb\xb8\x50\x4a\xf5\x9d\xca\xb7\x7a\xd9\
-\xb6\x8d\x57\x5e\x79\x19\x2f\x3c\xff\x6d\x00\x40\x14\x45\x48\xd2\
-\x04\x00\x90\x24\x31\x92\x24\x01\x08\xf9\xae\xde\xaf\x94\x12\xb6\
-\x6d\x21\x4d\x12\x80\x00\xae\xeb\x82\x50\x0a\x25\x12\x23\xfa\x0c\
-\x49\x80\x65\x59\x68\xb4\x93\xc5\xff\xf6\xdf\x7e\xe3\x86\x02\x80\
-\x75\x23\xbd\x99\x6b\xd7\xd6\xdf\xdb\x68\xec\xbc\x43\x2a\xed\xc4\
-\x7d\x37\xe6\xa9\xdd\x6e\xe3\x67\x3e\xf3\x59\x30\xc6\x90\xc4\x31\
-\x7e\xf1\x97\xfe\x0d\x88\x31\x01\x3f\xfd\x99\xcf\x42\x4a\x89\x28\
-\xec\x7e\xf7\x36\x94\xd0\xfc\x7d\x5a\x96\x05\x02\xc0\x66\x14\x2a\
-\x95\x20\x80\x31\x4d\x3a\xda\x08\xa3\xa4\xbc\xb8\xb8\x77\x6a\xa2\
-\x01\x46\x5c\x2b\x17\x2e\xdc\xd2\xed\x76\xe7\xbf\x27\x4f\xa6\x14\
-\x28\xa5\xa0\x8c\x41\x29\xd5\xa7\x3d\x84\xd0\xf1\x3d\x40\xbe\x47\
-\x2f\xa5\xa0\xcc\xeb\x11\x13\x4a\x2a\x28\x50\x42\xd0\xea\x76\x71\
-\x79\x63\x53\xbf\x07\x45\x70\xdf\xfb\x1f\xa8\x4c\x00\x30\x4a\x6d\
-\x3b\x8e\x05\x90\xef\xd9\x7b\x92\x46\x30\xdf\xd3\x0f\x8c\xd0\x3e\
-\xdc\x68\x4d\xa5\x41\x00\xa2\xbf\xcf\x28\x01\x01\x90\xa4\x1c\xd7\
-\xb6\x76\x10\x09\x81\x24\x4d\x41\x99\x85\x2b\x57\xae\xfa\x13\x13\
-\x30\x56\xa5\x0e\x7b\x8c\xe8\xd3\x3c\x70\xcb\xa2\x00\xfd\x35\x83\
-\xc5\x18\x2c\xcb\x82\x65\x59\x3a\x86\x2f\xdc\x27\xe6\x89\xb3\x08\
-\x21\xd3\x02\x99\x7a\xce\x6e\xc5\xd7\xd4\x1e\x1c\xa0\x0c\x73\xa8\
-\x94\x02\x57\xbc\xcf\xbc\xe7\x46\x3e\x7b\xf3\x54\xff\x2e\x01\x41\
-\x27\x0c\x71\xe4\xe6\xa3\x48\xda\x2d\x6c\x6f\x6c\x81\x12\x8a\x66\
-\xa3\xe1\x4d\x00\x30\x46\x6d\x0f\x1e\x58\xa5\x14\xe2\x28\x86\x74\
-\x24\x28\x21\x80\x11\x14\x25\x44\xab\x70\xd2\xfb\x5d\x7d\x97\x18\
-\x10\x91\x82\x23\xa6\xf2\xe7\xd2\x91\x83\x30\xd1\x03\x37\x3c\x80\
-\xf9\xda\x44\x15\xdc\x3c\x26\x04\x87\xe0\xda\xfb\xd7\x8e\xa8\x42\
-\x9c\xa6\x98\x9d\x9d\xc5\x89\x13\x27\x20\x93\x7e\xa7\x54\xbf\x23\
-\xfd\x9f\x54\x12\xae\xe7\x62\x6e\x7e\x1e\xab\xcd\x06\x28\x01\x40\
-\x18\x1a\x8d\xe6\x04\x00\x23\xe5\x3f\x20\xfe\xcc\x69\xbb\xbc\x7e\
-\x19\x57\xaf\x5c\x46\x1c\x76\xa0\xa4\xec\x8b\x0a\xb8\x10\x10\x42\
-\x42\x48\x05\xa1\x14\xb8\x90\x10\x42\x82\x4b\x69\x1e\x37\x5f\x0b\
-\x01\x31\x10\x32\x0a\x29\x21\xcd\xcf\xe4\x31\xbf\x90\x26\xec\x33\
-\x61\xa5\x79\x3d\x29\x25\xa2\xe6\x26\x6e\xb9\xe5\x28\x3e\xf4\x23\
-\x1f\x06\x19\xe2\x3f\x10\x64\xd4\xb2\x06\x9b\x65\x08\x28\xa5\xb4\
-\x06\x21\x84\xa0\x31\xd1\x00\x63\x00\x20\xd5\x50\xf5\x2f\xd2\x04\
-\x8f\x3e\xf5\x3c\x56\xe7\xde\x0b\x10\x06\x99\x26\x50\x52\x41\x29\
-\x09\xa9\x00\x45\x28\x24\x28\x24\xa1\x50\x20\x50\xa0\xfa\x31\x05\
-\x28\x42\x20\x2d\x02\x6a\x11\xd8\x0e\x00\xa9\xa0\x8c\x72\x50\x0a\
-\x50\x32\x57\x20\xfa\x41\xd9\xd3\x3c\x30\x82\x83\x54\x00\xb5\xd1\
-\x7a\xf2\xbf\x63\x5f\x6b\x07\x96\x65\x0d\x2a\x2e\xe8\xc4\x12\xd1\
-\xf9\x03\x42\xcc\x83\x03\x20\x21\x14\x9d\x4e\xd7\x99\x00\x60\xa4\
-\x06\xc0\x50\x8f\x8d\x40\x81\xb8\x25\x24\xb5\x43\x20\xd4\x32\x1f\
-\xae\x82\x54\x3d\xb3\x41\xa0\x40\xa4\x16\x7f\xe6\x95\x13\xf3\xaf\
-\x0b\x02\x07\x14\x44\xf6\xbe\x07\x03\x20\x0d\x3a\x4d\xf8\x40\x49\
-\x03\x08\x95\x03\x0c\xca\x00\x93\xda\xb0\x6c\x17\x94\x92\xa1\xd1\
-\x43\x2e\x6f\xaa\x35\xc1\xa0\xf8\xb3\xaf\x85\x14\x64\x02\x80\x31\
-\x3e\x00\x19\x87\x0e\x9e\x80\x32\x59\x10\x70\xbf\x83\x56\x0c\xc9\
-\x32\x63\xe2\x82\xc2\x26\x80\x92\xa2\x70\xaa\x07\x6e\x45\x75\x90\
-\x69\x82\xe2\xd7\x4a\x42\x49\xda\x13\x23\x19\xe1\x04\x1a\x8d\x45\
-\x28\x19\x01\x65\x40\x49\x35\x01\xc0\x38\x19\x2b\x40\x0d\x0f\xd0\
-\xf5\x77\xb3\x53\xaf\xb5\xb5\x11\xb4\x52\x46\x4e\x5a\xf8\x12\x00\
-\x23\x04\x1e\x65\xa0\x4a\x87\x83\x6f\xfb\x0d\x49\x05\xca\x28\xdc\
-\xa0\x84\xd0\xb6\x0c\x48\x87\xcb\x90\x14\xfe\xcb\xfe\x0c\x32\x10\
-\xd6\x48\x29\x27\x00\x18\xcb\xa8\x8c\x89\x0d\x33\xb5\x0e\x23\x64\
-\x25\x8d\xe0\xcd\xff\x32\x41\xbb\x94\xc1\xa1\xcc\x00\x43\xf5\xc5\
-\x03\xdf\x09\xb1\xc3\x6c\x06\xcf\x77\xe0\x78\x0e\xa8\xe3\x63\x8b\
-\x1a\xd5\x3e\x4a\x84\xc4\x68\x00\x82\x91\x30\x9e\x00\x60\x7c\x14\
-\x00\x80\xa8\x41\x25\x5b\x88\xf4\x72\xf5\xae\xb2\x53\xaf\x7a\x76\
-\x9d\x12\x06\xcf\xb2\x60\x11\x02\x29\xd5\xdb\x39\xf0\x5a\xf0\x8c\
-\xc2\xab\xb8\x70\x5c\x3b\xaf\x2f\xe0\x5c\x14\x50\x44\x86\x82\xa6\
-\xc7\x57\x90\x1c\x78\x83\x66\x42\xaa\x89\x09\x18\x47\x03\xe9\x4f\
-\x67\xc4\x11\x53\x90\xda\x49\x2f\x08\x5f\x53\xbc\x04\xae\xed\xc0\
-\x65\x96\x71\x0a\xd5\xdb\x52\x3e\x84\x10\xf8\x81\x3e\xf1\x84\x12\
-\x48\x21\xa1\x84\x30\x16\x47\x19\x80\x8e\x23\xb1\x0c\x74\xc7\xa8\
-\x08\x35\xd1\x00\xd7\xf3\x02\x47\xd9\x57\xa5\x3d\x74\x62\xc4\x20\
-\x15\xa4\x92\x60\x94\xc1\x77\x5c\x58\x94\xea\xb8\xfd\x6d\x5a\x1e\
-\xdb\xb1\xe0\xfb\x0e\x98\xa5\x53\xb9\x32\x95\x03\x5a\x46\x3b\x84\
-\x24\x13\xf4\x80\x32\xc8\x40\x47\x08\xd1\xfc\x7a\x06\x42\xd2\xf3\
-\x2b\x75\xe4\x32\xd1\x00\xe3\x6d\x00\x19\x94\x21\xc9\x3f\xc5\xcc\
-\xe3\x97\x52\x80\x12\x0a\xdf\xf5\xe1\xda\x96\x71\xd6\xe4\xdb\x3c\
-\xf5\x80\xe7\x39\x70\x5c\xfd\x3c\x5a\xd5\x6b\x67\xb3\x68\x5e\x32\
-\x03\x05\x32\xca\x40\x69\x27\x90\xc2\xf0\x00\x59\x50\x6b\x40\x93\
-\xfd\x6f\xe2\x03\x5c\xdf\x0c\x8c\x7c\x48\x4a\x09\x4a\x24\x5c\xc7\
-\x85\xe7\xba\xa0\x84\x18\x47\xf0\xed\x08\x1f\xda\xd6\x7b\x36\x18\
-\xa3\x39\x13\x98\x3b\x96\x05\xce\x40\x0b\x5e\xe6\x64\x0f\xe9\x13\
-\x7a\x41\x03\x64\x3c\x40\xae\x21\xd4\xae\x48\x71\x62\x02\xc6\x5f\
-\x72\xd0\x61\xef\xd1\x2e\x0a\x16\x63\x28\x05\x15\x9d\x6f\x57\xca\
-\x9c\x7a\xf5\xb6\x84\x6f\xdb\x14\xae\xab\xff\xfc\x5e\xb1\x09\x81\
-\x32\xc9\x21\x50\xf3\x83\x52\x41\x0a\xa1\xfd\x01\x35\xbe\x86\x64\
-\x30\xa1\xd4\x73\x6c\x8b\x51\xc0\xc4\x04\x8c\x3b\xfc\x0a\x23\x72\
-\x6d\x14\x0a\x53\xd5\x00\xd4\x71\x21\xd2\x34\xb7\xb1\xb9\x8a\x7e\
-\x8b\x8e\x9f\x02\xe0\xda\x0c\xb6\x4d\x4d\x9d\x9f\x02\x61\x14\x96\
-\xe7\x82\x5a\x2c\x07\x08\x61\x9a\xf8\x11\x5c\x6a\xf7\x8f\xd8\xa0\
-\x8c\x61\xb4\x8f\xaa\x72\x33\xa0\x7a\x21\xdf\xae\xbf\x66\x62\x02\
-\xbe\x33\xe5\x9f\x3f\x48\x08\xe0\x7b\x16\x98\x63\x83\x38\x14\x50\
-\x4a\x27\x80\xb8\x28\x24\x7b\x04\x38\x37\xf4\xee\x10\x56\x91\x10\
-\x2d\x7c\x46\x74\xe5\x31\x65\x0c\x6e\xc5\x07\xb3\x98\xa6\xfc\x4d\
-\x1d\x9f\x94\x0a\x92\x0b\x4d\x15\x2b\x80\x50\x02\xe6\xd8\xa0\x16\
-\x35\xea\x7f\x38\x15\x9c\x27\x83\x8c\x36\x48\x39\xd7\x20\x20\x7d\
-\xa0\x98\x00\x60\x0c\x04\xe4\x30\x12\x35\xb3\xb9\x42\x68\xbe\x1f\
-\x52\x0b\x97\x51\x02\xdb\xb5\xf3\xea\x1b\x00\x10\x5c\x20\x49\x38\
-\xe2\x38\x45\x12\xeb\x9e\x01\xa5\x14\x18\x21\x70\x18\x05\x94\x04\
-\x97\x80\x17\x94\xe0\x96\x3c\x1d\x4a\x72\xad\xe2\x29\x25\xe0\x29\
-\x87\x02\xc0\x18\x81\x92\x14\x42\x2a\x5d\x15\xcc\x4d\xc1\x29\x19\
-\x46\x05\x93\x9e\x7f\x40\x7a\x88\xe5\x71\x82\xed\xad\xcd\x1e\x7b\
-\x39\xe1\x01\xde\x82\x09\x20\x6f\x41\x4b\x10\x80\x18\x8a\x57\x66\
-\xc9\x1c\xe8\xda\x3b\xdb\xb6\xe0\x38\x16\xa6\xeb\x65\x08\x21\x11\
-\x47\x09\xba\x9d\x18\x22\x89\x21\x84\x04\xb5\x6c\xd4\xa6\x02\x58\
-\xae\x0d\x9e\x70\x48\xa5\x05\x2f\xb8\x0e\x33\x2d\xcb\x32\x6d\x61\
-\x12\xd4\xb6\xc0\x1c\xa6\x01\x67\x3b\xba\xe4\xab\x00\xc8\x41\x0d\
-\x50\x08\x58\xa0\x94\x42\xc9\xf3\x70\xee\xcc\x59\x24\x69\x82\x69\
-\xd7\x87\x10\xe1\x44\x03\x5c\x8f\x08\xd2\xb7\x61\x52\x57\xbd\x82\
-\x91\x8c\xdf\x37\x39\x81\x8c\xa4\x91\x12\xe0\x42\x80\x51\x82\x34\
-\x15\x70\x6c\x86\x72\xe0\xa1\x5a\x2d\x41\x2a\xe4\x65\xe3\x94\x51\
-\x08\x2e\x41\x1d\x80\xa7\x00\x57\x42\x47\x02\x4a\x01\x8c\xc2\x71\
-\x7d\x38\x94\x40\x48\x2d\x59\x87\x12\x48\xca\x46\x9c\xfe\x7e\x4d\
-\x55\x04\x87\x65\x31\xd4\x7c\x1f\x2d\xc1\x61\x31\x06\xae\x81\x31\
-\x01\xc0\x98\xd3\xad\x46\xba\xf5\x85\x78\x3a\x8b\xcb\xb3\x6f\x10\
-\xad\x5a\xf5\x01\x54\x80\x30\x09\x9b\x54\x49\x08\x9e\xea\xba\x3d\
-\x42\xd0\x6e\x74\xd0\x69\x76\x60\x59\x0c\x96\xa3\xc3\x3f\x28\x05\
-\x6a\xdb\xa0\xae\x29\xde\x00\x90\x0a\x09\x91\xea\x62\x90\x38\x15\
-\x48\xb9\x40\xa2\x12\xc4\x09\x07\x25\x2e\x86\xb9\x01\x59\x18\x48\
-\xf2\xbc\x85\xf6\x25\x4a\xbe\x07\x1b\x40\x9a\xf2\x89\x0f\x70\x5d\
-\x00\x90\x51\x00\xd0\x09\x96\x3c\xa4\x52\xbd\x04\x10\x0a\xac\x5b\
-\xf6\xcb\x44\x2a\x50\x25\x20\x25\x20\xcc\x13\x77\x3b\x21\x3a\x8d\
-\x8e\x16\x70\xca\x21\xda\x5d\x48\x09\xb0\x92\x07\x52\xa6\x20\x42\
-\xf5\x3a\x80\x8c\xb6\x90\x59\x76\xd1\x68\x86\x3c\xd4\x1b\x97\x0d\
-\x24\x64\x17\x3f\x20\x95\x9c\x44\x01\x6f\x11\x01\x72\x2c\x4d\x98\
-\xa7\x76\x55\x5f\xb9\x5f\x46\x0d\x9b\x4f\x18\x44\x09\x48\x05\x08\
-\x73\x22\xe3\x28\x41\xbb\xd9\xe9\x09\x44\x48\x50\xcb\x82\x5d\x09\
-\xa0\x5c\x27\xa7\x95\x73\xd2\x27\x4f\xe5\xaa\xec\x5e\xfe\x72\xa6\
-\x2c\x71\xb4\x8a\x22\x83\xcc\xcf\x50\x90\x4f\x00\x30\xe2\x04\x29\
-\x35\xd6\x04\x64\xa9\x5d\x02\x05\x59\xd0\x02\x26\x06\x97\x02\x10\
-\xa2\x97\xff\x27\x04\x71\x92\xa0\xd3\xea\xf6\x58\x3d\xa1\x40\x7d\
-\x17\xb4\x56\xd1\xbe\x80\x90\xbb\xc8\x1a\xa5\x8a\x92\x1b\x4c\x26\
-\x8f\x09\x03\x0b\x51\x80\x1a\xf6\x07\x28\x3d\x8f\x60\x02\x80\xd1\
-\x4c\xda\xd0\x54\x1e\x21\x45\x75\x0a\x0d\x13\x10\xa3\x30\x74\x5d\
-\x3e\x78\x0a\x25\x78\x2e\x0c\xfd\x50\x8a\x6e\x27\xcc\x9d\x3f\x25\
-\x15\x58\x25\x80\x5b\x0b\x20\xcc\xd7\x7d\xb6\x63\x28\x7b\x6b\xa2\
-\x8c\x42\xb2\xe7\x7a\x8e\xe0\xb8\x8b\x52\x2a\x27\x00\x18\x6b\x02\
-\xc6\x53\x7a\xfd\x75\x76\xa6\xf8\x32\x49\xa0\x38\xef\x71\xf8\x04\
-\xe0\x29\x47\xd8\x8d\x72\xca\x58\x11\x02\x6f\x66\x0a\x28\x95\x20\
-\xa5\x30\x5c\x7f\x0f\x2c\x83\x96\xa5\x0f\x18\xaa\x9f\x90\x22\xe3\
-\x11\x50\x78\x92\xdd\xb9\x00\x4a\xc9\xc4\x04\x8c\x3c\x1d\x84\x28\
-\xb1\x2b\x4a\x22\x7d\x56\xb8\xef\xd3\xe3\x02\x2a\x89\xa1\x84\xec\
-\xa5\x6d\x01\xf0\x24\x13\x3e\xa0\x84\x04\xb1\x2d\xb8\xb3\x75\x30\
-\xd7\x31\xc4\x50\xee\x55\xf4\x4e\x78\x96\xef\x57\x03\x35\x86\xbb\
-\xd4\x39\x19\xa7\xc1\x76\xe5\x02\x30\xa0\x5c\x06\xe7\x14\x4c\x00\
-\x30\xa0\x01\x76\x3b\x49\xfd\xa7\x48\x47\x03\x04\x2a\x8d\x21\xc2\
-\xa8\x57\xac\x61\x7e\x2c\x4d\x53\x44\x61\x92\x3b\x7b\xcc\xf7\x50\
-\x9e\xaf\x43\x51\x06\x29\x44\x21\x87\xd0\x93\x6e\x51\xe7\x28\x82\
-\x01\x80\x20\x2f\x40\xc9\x6a\xfc\x46\x25\x84\x72\x00\x90\x01\xe7\
-\x40\xf5\xcc\xc9\xc4\x04\x8c\xb5\x8f\x44\x15\x6b\x3a\x54\xd1\xa6\
-\x1a\x4e\x5e\x29\x05\xd1\xed\x40\x26\xbc\xe0\xb5\xeb\x1e\xfc\x38\
-\x4a\x91\x24\x3a\x51\x24\xa5\x84\x53\x0d\xe0\xce\x4c\xe9\xef\xcb\
-\x62\xbf\xbe\x2a\x9c\xff\xde\x19\xef\xf9\x93\xaa\x57\xc4\x91\xbd\
-\x86\xf9\x66\xaf\xeb\x68\x8c\x0f\x30\xd4\x8f\xd0\x17\xa3\x74\x62\
-\x02\xc6\xa8\x50\xb9\x8b\x09\xcc\x3a\xc0\x28\x05\x49\x53\xf0\xb8\
-\x05\x95\x26\xba\x60\x23\xfb\x90\xa5\x44\x1c\xa7\x48\x13\x0e\xa5\
-\x24\x84\x02\xfc\xe9\x29\xf8\xf5\xaa\x4e\xec\x64\x4e\x60\x41\x9f\
-\xab\x42\x4f\x41\xaf\xc6\x50\xf5\xb4\x49\xce\x30\x0e\x06\x01\xa3\
-\x9d\x40\x82\xe1\x26\xa0\x4f\x83\x4d\x00\x30\x0e\x00\x54\x11\x32\
-\xdc\x49\x52\x00\xa2\x56\x07\xd4\x0d\x0a\x7c\x80\xae\xe0\x49\xa2\
-\x24\x6f\xef\x22\x84\x22\x58\x98\x86\x5d\x29\x43\x9a\x44\x50\xc6\
-\x21\x64\xa1\xa0\xec\x3b\xf7\x03\xce\x5e\x6e\x52\x7a\xbe\x40\xcf\
-\xc4\x14\xcb\xbe\x47\x14\xae\x14\x14\x80\x1a\x92\xd8\xa6\x13\x00\
-\x8c\x35\x01\x43\x2b\x3c\x88\xf1\xf6\x15\x7a\x2d\xdf\x4a\x29\xa4\
-\x09\x47\x9c\xa4\x79\xd1\x06\x71\x6c\x04\x8b\xb3\xb0\x3d\x37\x77\
-\xf6\x54\x81\x35\xcc\x4f\xb4\xec\xa9\xf4\xbe\x93\x3f\x2a\x1a\x28\
-\xb8\xa0\xdf\x69\x41\xc8\x90\x30\x70\x02\x80\x31\x1a\x40\x8e\xd2\
-\x00\x9a\xe4\x53\xa0\x52\x21\x4d\x39\x92\x38\x81\x10\x5a\x5a\x82\
-\x0b\xb8\x41\x09\xc1\xc2\x2c\x60\x31\x4d\xee\x0c\xd4\xf4\xf5\xdb\
-\xf4\x01\x55\xdf\x47\x2d\xab\x02\xc3\x3c\x10\x23\x1a\x13\x70\x5d\
-\x27\x70\x94\x13\x6b\x22\x9d\x09\x00\xc6\x84\x81\x43\x49\x34\xa2\
-\xcf\x60\x9a\x24\xe0\x29\x83\x14\xdc\x74\x6e\x69\xdb\xee\xd5\x6b\
-\x28\xcf\xd5\x35\x48\xf2\x93\xdf\x6b\x11\xeb\xef\x1f\x28\x0a\x5d\
-\x15\x12\x4b\xbd\x9f\x2d\x66\x1e\x7b\x26\x40\x15\x88\x9e\xeb\xd1\
-\x3d\xa3\x65\x4c\x19\x9b\x00\x60\xa4\x06\xa0\x54\x0e\xe7\xca\x89\
-\x19\xe0\x98\x00\xb6\xab\xbd\x7c\x21\xa1\x28\x45\xb0\x30\x03\xbf\
-\x56\xe9\x15\x75\xf6\x35\x8d\xf4\xec\xb9\xc2\x6e\x81\xf6\x3f\x5e\
-\xfc\x59\xa0\xc8\x49\xf7\x55\x9c\x8d\xd1\x00\x39\x53\x58\xac\x05\
-\x2f\x3c\x89\x6e\x5e\x99\x68\x80\xeb\xf8\x00\x44\x0d\xf7\xad\x4c\
-\xc7\xae\xd4\xe3\x5f\x6d\xdf\x43\x65\x61\x06\xcc\x75\xf3\xaa\x9f\
-\x62\xe7\x50\xae\xce\x25\xfa\xb5\x40\xd6\x5f\xa0\x8a\xc2\x55\x7d\
-\xbc\x40\x66\x26\x50\x00\x47\x26\xcb\x71\x61\xe0\x48\x1f\x40\xf5\
-\x87\xba\x13\x00\x8c\x76\x90\x46\xfb\x00\x4a\x3b\x7a\xca\x52\x28\
-\xcf\x4c\xc1\x9d\xae\x81\x52\x0a\x21\x78\xaf\x04\xbf\xa8\xf6\x07\
-\x62\xfd\xbe\xd3\x8e\x7e\xb5\x3e\x5c\x53\x60\xa0\x23\xa8\x60\x02\
-\xc6\x85\x81\x7d\x9d\x20\x64\x20\xd1\xa4\x40\xc9\xc4\x04\x5c\x07\
-\x00\xc3\x7c\x00\x6d\x02\x6c\xdf\x83\xb7\x77\x11\xae\xef\x98\x69\
-\x1e\x22\xcf\xdc\xf5\xd9\xfd\xde\x41\xee\xab\x1a\xde\xe5\x18\x66\
-\xbd\xff\x83\xaa\x5f\xf5\x83\xa3\x48\x0d\x63\x4c\x3d\x40\x1e\x1d\
-\x0e\x69\x1f\xcf\x2d\x08\x9b\x68\x80\xb1\x51\xc0\xd0\x92\x30\x00\
-\x94\x02\x95\xc5\x19\xa0\xe4\x41\xf0\x74\xf7\xa9\x2f\x78\xed\xaa\
-\xd8\x2e\x9e\x75\x13\x0d\x13\xbe\xea\x0f\xfd\x50\xf0\x0b\x80\xdd\
-\x80\x02\xae\x3f\x5b\x32\x4b\xf7\x8e\x92\x32\xa3\x13\x0d\x30\xf2\
-\x62\x8c\x4a\x32\xa6\x28\x44\x48\x09\x22\x64\xdf\x30\xa9\xa2\xcd\
-\x57\x28\xb0\x7b\x28\x3a\x7b\xc5\xae\x62\xec\xd6\x16\xc5\x16\xb0\
-\x22\x88\x0a\xc6\xbf\x18\x05\x8c\x8a\xf5\x73\x1f\x40\xf5\xca\x18\
-\xfb\x38\x05\x35\xc9\x05\x5c\xc7\x04\xb0\x91\x3e\x00\xc9\x3a\x81\
-\xa4\xea\xa3\x71\xfb\xd4\xff\x2e\x2d\x30\x04\x00\x18\x48\x03\xcb\
-\x7e\x12\xa8\xcf\xe3\x2f\x80\xa5\x97\x16\x7e\x0b\xd9\xc0\x11\x03\
-\x42\xd4\x84\x08\xba\xbe\x0f\x80\x11\x35\x81\xb9\x23\x68\xda\xb5\
-\x06\x09\x1b\x35\x44\x1b\xf4\x26\xbe\x14\x1d\xc3\x62\x34\x30\x60\
-\xf7\x31\x5c\x2b\x64\x0c\x64\xde\x19\x3c\xc6\x0c\x50\x90\xb1\xdd\
-\x6a\x93\x8a\xa0\xb7\x11\x05\x64\xa1\x97\x1c\x98\xeb\x53\x0c\xef\
-\x8a\xb6\xbf\x48\xfb\xee\x26\x80\xd4\x70\x6e\x40\x0d\x84\x8b\xd9\
-\xc0\xb0\xcc\xa3\x27\x45\x3f\x6f\x34\x02\x14\xe9\xef\x07\xdc\x15\
-\x05\x30\x32\x31\x01\xd7\x89\x02\xe4\x28\x07\xbb\xa7\x8e\x7b\x3b\
-\x7f\x7a\x66\xa0\xff\x34\xa3\x50\x40\xba\xcb\xe6\xcb\xdd\x1e\xff\
-\x6e\x3f\x21\x1b\x45\xd3\x03\xd7\xae\xd9\x00\x23\x4c\x40\x5f\x5d\
-\x60\xbf\xfc\x41\x27\x4e\xe0\x38\x27\x70\xb4\x0f\x50\x3c\xcd\x83\
-\x00\x50\x45\x20\xc8\xde\xa9\x2b\x4e\x10\xeb\xfd\x8a\x1a\xc2\x19\
-\x0c\x03\x42\x21\x23\x58\x1c\x61\x49\xc6\x3b\x81\xa0\xa4\xef\xfc\
-\x17\x79\x8c\x02\xdd\x3d\x01\xc0\x08\x00\x88\xe1\x61\xa0\xb6\xbb\
-\xb9\xfd\x97\x05\x92\x47\xf5\x0b\x15\x03\x5a\xa0\xcf\x11\xc4\x30\
-\x21\x63\x80\x23\xc0\x90\x1c\x02\xa0\xa8\x7a\x4b\x61\x60\x5f\xbf\
-\xc2\x2e\x1c\x28\xd0\x09\x0f\x30\xc6\x04\x8c\xd2\x00\xc6\xef\xca\
-\x86\x36\x90\x01\x81\xef\xca\xe1\x63\xf7\xbc\xc0\xdd\x61\x1f\xfa\
-\xb5\x43\x21\xf3\xa7\x06\x43\xc9\x02\xa7\x48\x30\x3e\x1b\x48\x19\
-\x1d\xf0\x11\xfa\xf5\xc1\x84\x09\xfc\x8e\x79\x00\xd2\xd7\x65\xa3\
-\xb9\xfd\x41\xc1\xf7\x87\x83\x3d\x7a\x77\x88\x19\x18\x00\x41\xd1\
-\xde\x67\x65\xe7\x99\xf9\xc8\xe7\x44\xe6\xf6\x23\xeb\x0a\x79\xbb\
-\xb9\xc0\x49\x18\x38\x1e\x00\x94\x09\xad\x01\x86\x7f\x46\xb2\x90\
-\xcb\x55\x7d\x4e\x60\x91\x00\x1a\x10\x3a\x06\xd4\xfc\x80\x53\x98\
-\x9d\x7a\x59\xcc\x0d\x48\xf4\xe7\x10\x0a\xb9\x85\xeb\x3a\x81\x45\
-\x70\xa8\x81\x58\x40\xa9\x49\x32\xe8\xfa\x4e\x20\xe4\xae\x46\x1c\
-\x73\x67\x78\x14\x40\x7a\x02\x1f\x3a\x36\x16\x23\x40\x30\x26\x7f\
-\x50\x4c\x17\xcb\x7e\x8d\x41\xae\xe3\x04\xee\xca\x14\xa8\x5d\x66\
-\x6e\x02\x80\x71\x3e\x00\x08\x55\xc3\xe4\x2f\x4d\xb1\xa7\x54\x14\
-\x04\x36\x54\x36\x8f\x37\x8b\xbb\xf3\xd1\xdf\xca\x94\x76\x9b\xe1\
-\xcf\x90\x85\x19\xb4\x04\x80\x1c\x70\xfe\x8a\x0c\xa2\xda\xc5\xfc\
-\xe5\xf3\x08\xb3\xee\xdf\xb7\xf0\x77\xa8\x91\xf2\x57\xa0\x64\x62\
-\x02\x46\x5e\x8e\x6d\x0b\x3a\x24\x17\xa0\x40\x50\x72\x1d\x1c\x58\
-\xfd\x3b\x70\xea\x20\xb4\x02\x70\xea\x42\x80\x42\x0a\x05\x01\x82\
-\xc4\xa9\x41\x58\x3e\x14\x61\x5a\x70\x84\x41\xd8\x25\x28\xe6\x02\
-\x66\x8c\xbc\x1e\x02\x65\x41\x11\xaa\xef\x17\xc0\xd3\x1f\x15\x98\
-\x01\x91\x7a\xea\x40\x9e\x08\xce\x67\xff\x5e\xb7\x20\x24\x13\x3d\
-\xd9\x85\x8c\x89\x0f\x30\xe6\x6a\x77\x3a\x52\x08\xa1\x8a\x2a\x36\
-\x5b\xc6\x74\xff\x83\x0f\x82\xc7\x5d\xf0\x24\x41\x9a\xc4\x88\xe3\
-\x18\x71\x1c\x99\xed\x9e\x09\xe2\x74\x07\x71\x92\x22\x4e\x12\x24\
-\x71\x8c\x38\xe5\x88\xa4\x85\x58\x02\x29\x97\x48\xd3\x04\x89\x00\
-\x22\xab\x82\x14\x36\x84\xd2\xcb\x28\x38\x2c\x24\x6e\x0d\x9c\xfa\
-\x00\xf4\xf4\x31\x49\x6d\x08\xa7\x02\xc5\x3c\x48\xb3\x56\x49\x5a\
-\x3e\xec\x34\x1d\x9b\x0e\x2e\x36\x8d\xa8\xc1\xf6\x30\x95\x3b\xba\
-\x13\x00\x8c\xba\xce\x9d\x3d\x8b\x24\x49\xcc\x4c\x7e\x98\x6e\x5a\
-\x82\xc5\x3d\x8b\x60\x8c\xf5\xb5\x69\x17\xb3\x74\x42\xea\x31\x6f\
-\xf9\x46\x10\xb3\x02\x86\xa7\x1a\x2c\x51\x14\x9a\x55\xb0\x31\x92\
-\x38\x42\x1c\x45\x08\xc3\x10\x71\x14\x1a\xf0\x6c\x23\x4d\xd6\x10\
-\x47\x31\xa2\x38\x42\x9c\x0a\xc4\x5d\x8a\x38\x95\x48\xcc\x1a\xd9\
-\x58\x12\x24\x76\x1b\xd4\xf6\xc6\xcc\xb4\x26\x43\x83\x84\x62\xf3\
-\x8a\xe7\x79\xe9\x04\x00\x63\x89\x94\xdd\xaa\x93\x31\x06\xd7\x75\
-\xf3\x85\x4f\x84\x52\x50\x42\xc0\x98\x95\x0f\x67\xa6\x94\x82\x12\
-\xaa\x97\x45\x5b\x16\x98\x59\x19\x97\x2d\x97\xca\xb4\x4a\x1c\x47\
-\x88\xe3\x04\x69\x9a\x20\x8e\x13\xc4\x71\xac\x35\x46\x1c\x23\x36\
-\x9a\x25\xc9\x6e\x89\x06\x4c\x14\x19\x6d\x93\x0a\xc4\x49\xda\x57\
-\x30\x32\xde\x09\x50\x03\xf7\x15\x3c\xcf\xe3\x13\x00\x8c\xb8\x64\
-\xb6\xd4\xa1\xf8\x06\x2d\x1b\x3c\x4d\x71\xf5\xea\x15\xc4\x51\x04\
-\xdb\x71\xe0\xb9\x1e\x3c\xcf\x83\x65\xeb\xed\xe0\x8e\xe3\xc0\x75\
-\x5d\xf8\x9e\x6f\xc8\x18\x66\x7e\xd7\xca\x81\x93\x5d\x9e\xd9\xde\
-\xdd\xdb\x48\x3a\xb0\x82\xd6\xac\x88\xe5\x5c\xec\xd2\x28\xd9\x52\
-\x69\x40\x0f\x97\x1c\x06\x5e\x35\x62\xef\x49\x16\x56\x4e\x00\x30\
-\x0e\x00\x42\xf6\x8d\x7b\xb1\x2c\x0b\x57\xaf\x5c\xc6\xc6\xfa\x3a\
-\x6e\xbe\xf9\x66\xec\x59\xdc\x0b\xcf\x73\x91\xa6\x29\xe2\x38\x06\
-\xe7\x1c\x51\x37\x44\x73\xa7\x81\x94\xa7\x20\xd0\xfb\x87\xe3\x24\
-\x41\xbd\x5e\x87\x94\x32\x5f\x3c\x4d\x19\x05\x63\x16\x18\xa3\x08\
-\x2a\x15\xb8\xae\x0b\xc1\xb5\x10\x99\x45\x61\xdb\x0e\xf4\x2c\xdf\
-\x1e\x08\xf5\xcf\x33\x48\xa6\x37\x96\x2b\xc3\x03\x70\xb3\x4d\x6c\
-\x18\x00\x84\x14\xfd\xa3\x6c\xa0\x7a\xe4\xf6\xc4\x04\x8c\xbf\x84\
-\x94\x79\xcb\x17\x25\x04\xed\x76\x1b\xeb\x6b\x6b\xf8\xc7\x3f\xf3\
-\x19\x78\x9e\x97\x9f\x42\x29\xa5\x1e\xe9\x92\xcf\xf4\x91\x66\xad\
-\x3c\xc5\xca\xca\x05\xa4\x49\x8c\x03\x07\x0f\xa1\xb1\xb3\x83\x6e\
-\xb7\x9b\x3b\x86\x9d\x4e\x1b\x49\x92\xe2\x8b\x9f\xff\x3c\x0e\x1e\
-\x3a\x84\x3d\x7b\xf7\x22\x8a\xc2\xfc\xf4\x67\x75\x86\x9c\x8b\x3c\
-\x3c\x4c\x93\x04\x94\x51\x2c\x2f\x2d\x63\x71\xcf\x5e\x58\xb6\x65\
-\xb6\x8e\x8e\x30\x5f\xc5\x92\xb2\x5d\x3e\x80\x82\xeb\xb9\x13\x0d\
-\x30\xda\x04\xa8\xc2\xe9\x63\xb8\x7a\xf5\x0a\xde\xfd\xee\x7b\xe0\
-\x79\x1e\xda\xad\x56\xae\xaa\x53\xce\xc1\xcd\x5a\xf6\xfc\xb1\x34\
-\x81\x54\x0a\x97\x56\x57\x51\xa9\x56\xb0\xb1\xb9\x81\x4e\xbb\x63\
-\xa2\x05\x7d\x4b\x13\xdd\x36\xee\x97\x4a\x98\x99\x9b\xc3\xcc\xcc\
-\x0c\xa2\x28\xd2\x13\x3d\xcd\x22\xc9\xec\xf9\xe3\x28\x42\xd8\xed\
-\xa2\x1b\x76\xb1\xb1\xbe\x81\x6f\x3e\xfe\x38\x6a\x53\x53\xb8\xef\
-\x7d\xef\xc7\x4d\x47\x8e\x20\xec\x86\x23\x01\x30\x9a\x0b\x56\xf0\
-\x6f\x30\x13\x70\x63\x95\xa7\x64\x63\x3b\x32\x8d\xc0\x39\x16\x17\
-\xf7\xe8\xa6\x4f\x4a\xfb\xf2\xed\x83\xdb\x44\x19\xd3\x9b\x43\x19\
-\x65\xa0\x84\xf4\x8a\x33\xb3\x3d\x83\x9c\x23\x8e\x63\x74\x3a\x1d\
-\x24\x49\x02\x9e\xa6\x48\x72\x30\x69\xcd\x92\x01\x40\x0a\x01\x4a\
-\x29\x3c\xdf\xc7\xfc\xfc\x02\x8e\x1d\x3f\x81\x7b\x7f\xe0\x3e\x58\
-\x96\x85\x2f\x7e\xe1\xf3\x78\xfd\xb5\xd7\xe0\x38\xce\x70\x1f\x60\
-\x94\x73\xa8\x74\x14\x50\xad\xd5\xd2\x09\x00\x46\x6a\x00\x09\x55\
-\xf8\x04\x93\x24\xbd\x6e\xb3\xe5\x2e\xe7\x9b\x0c\x30\xc8\xbb\xc2\
-\xb4\xde\x77\x72\xf0\x0c\x59\x4b\x9b\x01\x4e\x29\x05\x2e\x38\x1c\
-\xdb\xc6\xd2\xbe\x7d\x98\x9f\x9f\xc7\x37\xbe\xfe\x75\xed\x73\x10\
-\x72\x7d\x10\x14\x66\x4d\x11\x02\x3c\xf6\xf5\x47\x27\x1a\x60\x24\
-\x00\x54\xff\xc4\xae\x7c\x06\xff\x77\x80\x00\x4a\x69\x2f\x63\x37\
-\x32\x54\x53\x85\xd5\xee\x5a\xd8\xb9\xf0\x4d\xc8\x98\x03\xc1\xac\
-\xa9\x55\x4a\xc1\xf7\x7c\x04\x41\x05\xdd\x6e\x17\xd7\xd6\xae\xe5\
-\xd1\x06\x76\x95\x91\x0f\x1b\x54\x4d\xc0\x28\x55\x7f\xf9\x17\x7f\
-\x2e\x26\x00\x18\x6d\x01\x94\x52\xe8\x31\x81\x63\x56\xb4\x0d\x39\
-\xdf\x70\x1c\x07\x9d\x4e\x07\x82\xf3\x7e\x81\xec\xba\x01\x28\x2c\
-\x8d\xa6\x84\xe4\x27\x3e\x03\x45\xf6\x58\xae\x0d\x28\x85\x65\xdb\
-\x20\x94\xc0\xb2\x18\x5a\xad\x66\x8f\xb0\x32\x14\x71\xb6\xc3\xa8\
-\x37\x25\xbe\xd8\x78\xaa\x40\x29\x11\x73\xb3\xb3\x13\x0d\x30\x56\
-\x03\xa8\x81\x82\x4a\xf2\xd6\x56\x42\x58\xb6\x85\x67\x9f\x79\x1a\
-\xff\xe7\x8f\xff\x10\x52\x2a\xd4\xeb\x75\x54\xab\x35\x54\x2a\x55\
-\x54\x2a\x15\x94\x83\x00\xe5\x72\x19\xa5\x52\x09\xb6\x6d\x63\x6a\
-\xaa\x8e\x4a\xb5\x9a\x13\x4b\x6c\x8c\x16\xa0\x06\x18\x2c\x03\x06\
-\x88\x9e\x47\x00\x32\x5c\x03\x28\xb9\xdb\x3c\x28\x80\x12\x22\x83\
-\x20\xb8\xa1\x34\xc0\x0d\xb7\x3b\x98\x32\x1d\x01\x58\xb6\x0d\x42\
-\x28\x18\x65\x60\x94\xc2\xb6\xed\x3c\x69\x23\xcc\x24\x90\xec\x43\
-\xb6\x6c\x0b\x67\x4e\x9f\xc6\xc3\x7f\xff\x10\x7c\xbf\x84\x53\x2f\
-\xbc\x80\x9d\xed\x6d\x24\x69\x6a\x96\x42\x98\x65\xd1\xc6\xb9\xdb\
-\xd9\xd9\xc6\xe5\x4b\x17\x71\xd3\x91\x23\xb0\x2d\x0b\x1b\x1b\x1b\
-\x08\xc3\x50\x9f\x74\x29\x73\xc1\x2b\xa5\xa0\xcc\x7d\x69\x1e\xef\
-\x0d\x8b\x20\x03\x93\x63\x48\x6f\x24\x9d\x54\xbb\x88\x40\xdd\x13\
-\x40\x64\xb9\x5c\x9e\x84\x81\x63\x68\x60\xd5\x6e\xb7\xd5\xd9\x33\
-\xa7\x11\x04\x15\x5c\xb9\x7c\x09\xaf\xbe\xfa\x0a\x76\x1a\x3b\x7a\
-\xe6\x3f\x65\x85\x79\xfc\x45\xbb\x4f\x70\xf6\xcc\x19\x2c\x2d\x2f\
-\xe3\x81\x07\x3f\x80\xa9\xa9\x3a\x04\xe7\xf9\x34\x91\xcc\xc1\xd4\
-\x37\x81\xa5\xe5\x7d\xd8\xde\xda\xc4\x17\xfe\xe6\xaf\x71\xff\x03\
-\x0f\x62\x66\x66\x06\x57\xaf\x5e\xd5\x60\xa1\x14\xd4\x24\xa0\xf2\
-\xe8\x23\x03\x81\x52\x63\x6a\x01\x7a\x5a\x6b\xf8\xa6\x52\x05\x42\
-\x88\x28\x97\xcb\x13\x0d\x30\xea\xe2\x9c\xa3\x54\x2a\xa9\x7b\xee\
-\x79\x0f\xa4\x52\x88\xe3\x18\xe7\xcf\x9d\xc3\xb5\x6b\xd7\xf2\x70\
-\xae\x38\xc6\x55\x49\xcd\xbc\x41\x01\xad\x66\x13\x07\x0e\x1c\xc4\
-\xfe\xfd\x07\x11\xc7\x31\xe0\x01\xb6\xc9\x0b\x24\x71\x0c\x4a\x29\
-\x5c\xcf\xd3\x44\x92\x10\x38\x78\xf0\x20\x4e\x9d\x3a\x85\x87\xbe\
-\xf2\x65\x7c\xea\x27\xfe\x21\x3a\x9d\x0e\x5a\xcd\x26\x28\xa5\x48\
-\x81\xfe\x22\x53\x4a\xa1\x28\xd5\x73\x88\xe9\xe8\x9d\x80\xd2\xac\
-\xaa\x2f\x8e\x99\xd3\x9a\x8a\x41\x29\x01\x46\x89\x0c\x26\x1a\x60\
-\x9c\x06\x90\xca\x71\x1c\xcc\xcc\xce\x82\x59\x16\xf6\x6f\xee\xc7\
-\x4d\x47\x8e\x40\x29\x85\x30\x0c\x61\x31\xcb\x98\x06\x33\xf1\x5b\
-\x70\x93\x20\xb2\x70\xf4\x96\x5b\xf0\xc6\x1b\xaf\x43\x48\xa1\x57\
-\xc3\xb8\x2e\xae\x5e\xbd\x8a\x27\x1e\x7f\x0c\x17\x2f\x5e\x04\x63\
-\x0c\x87\x0e\x1e\xc2\x7d\xef\xbf\x1f\xb5\xa9\x29\x44\x51\x84\x9b\
-\x8e\x1c\xc1\x37\xbe\xfe\x35\x7c\xf3\xf1\x6f\x40\x2a\x85\xb0\x1b\
-\x82\x99\x28\x22\x1b\xe8\x98\x2d\x94\x24\x94\x82\x11\x02\x46\x7b\
-\x79\x06\xc7\xb6\xf5\xea\x19\x4a\xcd\xfc\xc2\x7e\xe0\x10\xc2\x10\
-\xb5\xb7\xd0\xda\xde\x80\x5f\x5b\x02\xa5\x54\x94\x26\x00\x18\xef\
-\xc9\x67\x55\xc1\x69\x92\xa0\x5e\x9f\xc6\x3d\xf7\xbe\xa7\x47\xd0\
-\x48\x09\x21\x38\x92\x24\x41\x14\xc5\x90\x42\x80\x59\x0c\x71\x1c\
-\xe3\xa1\x2f\x7f\x19\x71\x1c\xc3\xb6\x2c\x58\x8c\xe1\xea\x95\xcb\
-\xf8\xc3\xdf\xff\xdf\x28\x95\xcb\xf0\x7d\x0f\x71\x14\xe3\xc9\x27\
-\x9f\xc0\x33\x4f\x3f\x85\x7f\xfa\xb3\x3f\x87\xc5\xc5\x3d\x88\xc2\
-\x10\xb7\xdc\x7a\x0c\x9e\xeb\x23\x49\x13\x78\xae\x8b\x24\x49\x11\
-\x47\x11\x92\x24\x46\x9a\xa6\x48\xd3\xc4\x90\x44\x02\x80\xc2\x95\
-\x2b\x57\xd0\x69\xb7\x70\xee\xdc\xd9\xdc\xa4\x10\xa2\xf3\x0c\x50\
-\x11\x60\x52\xd3\x84\x50\x24\x71\x17\x75\xb6\x86\x1f\xfe\xd0\x1d\
-\xf8\xd2\x13\x97\x41\x40\x64\x10\x4c\x4c\xc0\x38\xf9\xab\x3e\xb6\
-\x8f\x92\x3c\x43\xa7\x85\xa1\xb3\x71\xd9\x63\x82\x73\x3d\x0d\xbc\
-\xd3\x41\x18\x45\x79\x0a\x18\x00\xbe\xf4\xc5\x2f\x60\x6e\x7e\x1e\
-\xfb\xf6\xef\x87\x92\x0a\x61\x14\xa2\x36\x55\xc3\xe9\x37\xdf\xc4\
-\x1f\xfc\xde\xef\xe1\x5f\xff\xdb\x7f\x07\x42\xa9\xc9\x0f\x24\xf0\
-\x4b\x3e\x82\x72\x00\x10\x9d\x81\xb4\x2c\x2b\xe7\x01\x8c\x76\x02\
-\x21\x14\x4f\x3d\xf5\x24\x6e\xfa\xa1\x0f\x41\x4a\x89\x30\x8c\x20\
-\x38\xc7\x4b\xa7\x5e\xc4\xad\xc7\x8f\xc1\xb2\x2c\x43\x67\x03\x20\
-\x14\x71\x7b\x03\x07\x66\x03\xfc\xec\xcf\xff\x73\x84\xf4\x4f\xf1\
-\xf0\xc3\x8f\x88\x20\xa8\x4c\x34\xc0\x38\x1e\x40\x2a\x65\x40\x40\
-\xfb\x8a\x3b\x07\x19\x43\xce\xb5\x26\xe0\x9c\xa3\xdd\x6a\x19\x01\
-\x69\x3a\xf8\xda\xfa\x35\x6c\x6f\x6d\xe1\x9e\xf7\xbc\x07\x95\x6a\
-\x15\xc4\x24\x96\x28\xa5\x38\x70\xf0\x20\xbe\xf5\xdc\x73\x78\xe9\
-\xa5\x17\x71\xeb\xb1\xe3\x98\x9d\x9d\xc3\xad\xc7\x6e\xc5\xda\xb5\
-\x35\x44\x61\x84\x28\x8c\xf4\xde\x60\x29\x4d\xed\x40\x0c\xdb\xd2\
-\x2b\xe3\x04\xe7\xd8\xdc\x58\xc7\xdd\x77\xbf\x1b\x8e\xa3\x87\x54\
-\xd8\x8e\x83\xd7\x5e\x7d\x05\x71\x1c\xc1\xb2\x82\x3c\x14\x24\x84\
-\x42\xf2\x10\x82\x27\x48\x53\x8e\x93\x27\x8f\xe1\xe1\x87\xbf\x2a\
-\x5d\xcf\xbd\xa1\x7a\x03\x6f\xac\x5c\x00\x14\x94\x89\xa1\x6c\xdb\
-\xca\x85\x30\x6a\xc0\x72\xce\xd2\xa1\x57\xb1\xcb\x2c\x0b\x61\xa7\
-\x0b\xdb\xb1\x31\x3d\x33\x83\x3d\x7b\xf7\x62\xef\xd2\x12\xa6\xa6\
-\xa6\x10\x04\x01\x7c\xcf\x47\xc9\xf7\xf1\xfa\x6b\xaf\xc1\xb2\x2c\
-\x94\x4a\x25\xd4\x6a\x53\x7a\x99\xa4\xe3\xa0\x1c\x04\x70\x5c\x17\
-\xb6\x6d\xa3\x54\x2a\xa3\x56\x9b\x82\xe7\xfb\xa0\x94\x62\xef\xd2\
-\x12\xaa\xd5\x9a\x76\x24\x4d\x38\xca\xd3\xd4\xd0\xca\x2c\x2f\x1e\
-\x95\x6a\x70\xc6\x30\x50\xad\x54\x41\x00\xe5\x38\xee\x84\x09\x1c\
-\xed\x04\xe6\xf2\xd7\xc9\x18\xcf\xc7\xc5\x95\x95\xa1\x89\x97\x7e\
-\x20\xd0\xbc\x71\x93\x80\xa0\x1c\x04\x39\x49\xe3\x38\x0e\x5c\xc7\
-\xed\xab\x0a\xb2\x6d\x1b\xed\x56\xab\xc7\xde\x29\x69\x3a\x8f\x64\
-\x5e\x20\x92\xa4\x29\xc2\x30\x44\xbb\xdd\x46\xa3\xd1\xc0\xe6\xe6\
-\x26\x3a\xdd\x2e\x5c\xd7\xed\xdb\x0d\x98\xed\x09\x26\xa4\xb7\x64\
-\x5a\x0d\x59\x5d\x9f\x24\x09\x08\x25\xd2\xf3\xbc\x49\x77\xf0\x78\
-\x0c\x68\x3f\x40\x29\x85\x85\x85\x05\xac\x5c\x58\x81\xed\x38\xd8\
-\xb3\x67\x6f\x6f\x21\x77\xc1\x36\x13\x42\xf4\x1e\x61\x63\xfb\x15\
-\x14\xe6\xe6\xe7\x11\x54\x2a\xb8\x7c\xf9\xb2\x26\x90\x00\xb4\x5a\
-\x2d\x9d\xfa\x4d\x53\x74\xc3\x2e\x66\x66\x67\x4d\xd6\xd0\x4c\xfd\
-\xc8\xb2\x8d\x19\xf3\x67\xfc\x09\x66\xf8\x03\xcb\xb2\xcc\x2a\x00\
-\x95\x83\x29\xa3\x8b\xb5\xf3\x4a\x0b\x7d\x04\xbb\x01\x10\x27\x31\
-\x08\x21\xd2\x75\x27\x00\xb8\x2e\x19\x84\x42\xba\x77\xef\xf2\x32\
-\xce\x9f\x3b\x87\xd3\x6f\xbc\x09\xcb\xb6\x10\x45\x11\xe2\x28\xd6\
-\x7d\x02\x5c\xe4\x75\x7c\x9d\x76\x1b\x53\x53\x53\x5a\x78\x96\x85\
-\xf7\xdd\xff\x00\xbe\xf0\xd7\x9f\x83\xe3\x38\x3a\x8c\xec\x74\xb1\
-\xb3\xb3\x83\x9d\x9d\x1d\xc4\x51\x82\xbb\xef\xb9\xc7\x94\x75\xf5\
-\x96\x3c\xf5\xa5\x9a\x33\x01\x17\x28\x61\xcb\xd2\x1b\xc6\x5d\xcf\
-\xeb\xfb\x79\x55\x64\x02\xfb\x6a\x1a\x7b\x49\xa1\x24\x4e\x40\x00\
-\xe5\xf9\xde\x24\x0a\xb8\x8e\x13\xa0\x8a\x7d\xf8\x8c\x52\xec\xdb\
-\xb7\x3f\x8f\x02\xb2\xea\x1d\xa5\x14\x92\x24\x41\x18\x76\x91\xa4\
-\x09\xe6\x66\x67\xd1\x68\x34\x00\x42\x90\xa6\x29\xde\x75\xd7\xdd\
-\xb8\xb6\xb6\x86\xa7\x9f\x7a\x12\xd5\x6a\x15\x5c\x08\x6c\x6f\x6d\
-\xe1\xd2\xea\x2a\x3e\xf6\x89\x4f\xe2\xd6\x5b\x8e\xe1\xda\xb5\x35\
-\x30\xc6\xe0\x79\x1e\xca\xe5\x32\xe2\x44\x87\x7c\x99\xa3\xc9\x18\
-\xcb\x29\xe4\x6a\xad\x86\x76\xbb\x0d\xdf\x2f\xc1\xf7\x7d\x44\x51\
-\x34\x60\x02\x76\x03\x40\x0a\xde\x67\x02\x28\x21\xd2\x75\xdd\x89\
-\x06\x18\x2d\xfd\x9e\x09\xc8\x4e\x9e\x6d\xdb\x50\x00\xfc\x52\x09\
-\x15\xcb\xd2\x05\x1f\x8c\xf6\x86\x31\x51\x9d\xa4\xe9\x86\x21\x9e\
-\x7b\xe6\x69\xdd\x7f\x47\x08\xd2\x24\xc5\x8f\x7c\xf8\xa3\x38\x74\
-\xf8\x30\x5e\x7c\xe1\x05\x6c\x6e\x6e\x60\xba\x5e\xc7\x27\x7f\xf4\
-\xc7\x70\xf7\x3d\xf7\x22\x49\x62\x38\xae\x8b\xf3\xe7\xce\xe1\xb1\
-\xaf\x3f\x9a\x3b\x7a\x69\x92\x82\x98\x4c\x61\x18\x86\x79\xa4\xd1\
-\xed\x76\xb0\xb3\xb3\x83\xfb\xee\x7b\x3f\x04\xe7\x66\x16\x40\xbf\
-\x29\xca\x01\x90\xad\xbb\x17\x29\x00\xdb\x00\x20\x05\x21\x50\x13\
-\x13\x30\x9e\x06\xc8\x47\x34\x65\x14\xee\xa9\x53\x2f\x02\x4a\xe5\
-\xb5\x80\xb5\xda\x14\x98\xc5\x60\x5b\x36\xa6\xea\x53\x70\x5d\x0f\
-\xae\xeb\xc2\x36\xaa\x3e\x53\xf9\xc4\x44\x0e\xef\xb8\xf3\x9d\xb8\
-\xf3\x9d\xef\x42\x1c\xc5\x60\x16\x03\x01\x10\x45\x91\x66\xfb\x08\
-\xc1\x9e\xbd\x4b\xb8\xe9\xc8\x51\x84\x51\x84\x24\x8a\x10\x91\xac\
-\x44\x4c\x57\x06\xc5\x51\x04\x21\x24\xca\xe5\x32\xee\x7f\xe0\x03\
-\x28\x95\x4a\xba\x4e\xd0\x8c\x32\xc9\x81\x48\x88\xa9\x55\x2c\x64\
-\x33\x25\xef\x01\x20\x4d\x41\x08\x91\xfe\xc4\x09\x1c\xeb\xce\x2b\
-\x18\x0d\x00\xa5\x70\xea\xc5\xe7\x71\xf7\xbb\xef\xc5\xa1\xc3\x87\
-\x11\x47\x11\xba\xdd\x2e\xa2\x28\x42\xb3\xd9\x44\xbb\xdd\x42\x92\
-\x24\xd8\x34\x99\xbc\xf5\xf5\x75\x44\x51\x88\x2f\xff\xdd\xdf\xa2\
-\x52\xa9\x68\xea\x96\x31\xd4\xeb\x75\xb8\x8e\x0b\xc7\x71\x10\x54\
-\x2a\xba\x94\x9c\x31\x13\x59\x28\x04\x41\x19\x0b\x8b\x8b\xba\xd0\
-\xd3\x84\x76\x59\xe2\x48\x9f\x62\x99\x2f\x7e\x8c\xe3\x18\x42\x08\
-\x0d\x2e\x29\xfb\x66\x42\x66\x00\x50\xb2\x67\xe2\x55\xc1\x04\xa4\
-\xa9\xd0\x4e\xa0\x37\xf1\x01\xc6\x68\x00\x4d\xa5\x33\xc6\xb0\xb1\
-\xb1\x81\xe9\xe9\x19\x1c\x3a\x7c\x08\xdd\x6e\x07\x94\xea\x72\xee\
-\xda\x54\x0d\x7b\x97\x96\x72\x4f\x3c\xbb\x7d\xed\x91\x87\x71\xec\
-\xf8\x6d\xf0\x3c\x4f\x87\x6f\xad\x16\xda\xed\x36\xd2\x34\xc5\xf6\
-\xf6\x96\x26\x82\x18\x43\x14\x86\x88\xe3\x18\x95\x4a\x05\xad\x66\
-\x13\x97\x2e\xad\x22\xa8\x54\x41\x09\x81\x65\x59\xa8\x54\xab\x39\
-\x48\x6c\xc7\xc9\x23\x02\xa5\x14\x2c\xe3\x13\x18\xd2\x01\xa4\x90\
-\x1d\xcc\x40\x5b\xf4\x01\x08\xed\xf5\x23\x74\xc3\xc4\x98\x80\x89\
-\x0f\x30\x46\x01\xf4\xc6\xc5\x5b\x16\x83\x34\x8e\x5e\xe6\x98\x01\
-\xf1\xd0\xdf\x73\x1c\x07\xdd\x6e\x17\x61\xd8\x85\xe7\x79\x28\x95\
-\x7c\x54\x2a\x41\xaf\x73\xc8\x4c\xed\xc8\x9a\x41\xd2\x54\xef\x15\
-\x7a\xec\xb1\x47\x71\xf0\xf0\x21\x4c\x4f\xcf\x62\x7b\x7b\x1b\xcd\
-\x56\x13\x8d\x46\x03\x9d\x4e\x1b\x61\x18\xc2\x75\xdd\xdc\xe9\xf4\
-\x4b\x25\xcc\xcd\xcd\x63\xff\xfe\xfd\x88\xe2\x58\x6b\x00\xb3\x46\
-\x34\x13\xf9\x60\x3d\x20\x73\x4a\xba\x8f\x80\x73\x5c\xba\x72\x0d\
-\x96\xc5\xa4\xe7\x4d\x00\x70\x5d\x13\xa0\xa4\xc4\xec\xec\x1c\xce\
-\x9c\x39\x83\xd7\x5e\x7d\x15\x07\x0e\x1e\xdc\x7d\xd2\x76\x87\x8f\
-\x10\x59\x79\xb8\x94\xe3\x40\x06\x4a\x29\x1c\xd7\x45\xb9\x54\xc6\
-\xfc\xc2\x22\xf6\xef\x3f\xa0\xeb\x0d\x0c\x97\xa0\x8b\x53\x25\xd2\
-\x94\x23\x8a\x42\xc4\x51\x8c\x6e\xb7\x83\xaf\x3d\xf2\x08\xce\x9d\
-\x39\x83\xf7\x3f\xf8\x60\x2f\x0a\xc8\x28\x27\x42\xf2\x75\xf6\x59\
-\x17\x90\xe5\xd6\xc0\x58\x07\xcf\x7d\xeb\xdb\x78\xfe\xd4\x9b\x58\
-\x9c\xf2\x64\xb5\x56\x9b\x98\x80\x71\x1a\x80\x80\xe4\x3c\xc0\x9d\
-\x77\xde\x89\x67\x9f\x7d\x06\x2f\x9d\x7a\x11\x8e\xe3\xc2\x2f\x95\
-\xe0\xf9\x1e\x3c\xd7\xd3\xf7\x3d\x0f\x9e\xeb\xa2\x5c\xa9\x20\x0a\
-\x8d\xf3\x66\xd6\x8e\x91\xd1\x3c\x43\x9e\x48\x4a\x39\x47\x14\x86\
-\x68\x77\xda\x79\x1d\x61\x11\x28\x19\x23\x59\x0e\x02\x4c\xd5\xa7\
-\xf0\x13\x9f\xfe\x34\x7e\xf3\xd7\x7f\x1d\xe7\xce\x9e\xc1\xfe\xfd\
-\x07\x90\xa6\x29\x06\xeb\x53\x72\xb6\x4a\x0a\xf8\xb5\x05\x9c\x59\
-\x3b\x8d\xff\xfc\x5b\x7f\x8a\x98\x97\xc1\x93\x50\x9d\x3d\x7d\x46\
-\xee\xd9\xbb\x6f\x02\x80\x91\x3e\x80\x99\x13\x28\x95\x82\xe7\xf9\
-\xf8\xc0\x07\x7f\x10\xad\xa6\x56\xcd\x9c\xa7\x88\xc2\x08\x1b\xeb\
-\xeb\x7a\x67\x50\x9a\x22\x0c\xbb\xb0\x1d\x17\x6b\x57\xae\x60\x7d\
-\x7d\x1d\xb5\x5a\x0d\xb6\xe3\xc0\x71\x1c\xf8\x25\x1f\xbe\xe7\xc3\
-\xf3\x3c\xb8\x9e\x89\x16\x4c\x3f\x21\x21\x04\x42\xf0\xdc\xe9\x1b\
-\x55\xcf\x9f\x75\x0c\x71\x9e\xc2\xf7\x7d\x9c\xbc\xe3\x0e\x9c\x79\
-\xf3\x34\x6e\x3a\x72\x14\x69\x06\x1a\x4d\x5c\xf4\x26\x99\x9a\xa2\
-\x15\x4a\x08\x50\xda\x8f\x34\x49\xe1\x7b\x02\x17\x57\x5e\x91\x3f\
-\xf9\x13\x3f\x2e\x4f\xaf\x5c\x99\x00\x60\x9c\x06\xc8\x1c\x3b\xc6\
-\x18\x2e\xad\xae\x62\x73\x63\x1d\x95\x6a\x0d\x95\x4a\x05\xb3\xb3\
-\x73\x38\x71\xdb\x6d\x70\x5c\x0f\x96\x95\xb5\x8c\x2b\x08\x21\xd1\
-\x6c\xec\x20\x4d\x13\xb4\xdb\x1d\x6c\x6f\x6f\x99\xec\xdd\x06\x1a\
-\x8d\x86\xf1\xd2\x75\x77\xaf\xe3\xd8\xf0\x3c\x1f\xe7\xcf\x9d\xc5\
-\xe2\x9e\xbd\x58\x5f\x5f\x87\x63\xdb\xf0\x7c\x1f\x9e\xe7\xc2\x71\
-\x7a\x40\x29\x76\x17\x3b\x8e\x83\xf3\xe7\xce\x62\x7e\x61\x31\x1f\
-\x1c\x89\xc2\xba\x78\x69\xf2\x0a\x19\xff\xa7\x0c\x9e\x29\x05\xb8\
-\x50\x60\x8c\x09\xe6\x79\x93\xf9\x00\x23\x01\x40\x7b\x6b\xe3\x6c\
-\xcb\xc2\x4b\x2f\x9d\x02\x25\x04\xfb\xf6\xef\x47\x92\x24\xd8\xde\
-\xde\x42\xab\xd9\x00\x21\x14\xdd\x6e\x17\x04\x40\xb9\x52\x81\x14\
-\x12\xf5\xe9\x3a\xaa\xd5\x2a\x5c\xd7\xc3\xf2\xbe\x7d\xb8\xf9\x96\
-\x5b\xe0\x79\x5e\x9e\x0b\xc8\xd8\xb8\x76\xbb\xad\xd5\x7e\xbb\x8d\
-\x83\x07\x75\xf9\x58\xb7\xdb\xc5\xfa\xda\x5a\x9e\x66\x0e\xc3\x50\
-\xb7\x99\x1b\xc1\x6b\x73\xe3\xe2\xe2\xca\x45\x74\x3a\x6d\x7c\xe8\
-\x87\xef\x42\x9a\x24\x66\x58\x44\x41\x7d\x19\x1f\x60\x28\xc5\x05\
-\x05\xcb\x62\xc2\x61\xe5\x09\x00\x46\x5d\x94\x10\x49\x08\x91\x8c\
-\x31\x6c\x6d\x6f\xa3\xdb\xed\xe0\xe3\x9f\xf8\xa4\xb1\xc5\x2c\xe7\
-\xe4\x8b\xf5\x00\x61\xd8\x45\x18\x86\xf8\xc6\xd7\xbf\x8e\x85\x45\
-\x7d\x32\x57\x2e\x9c\x47\xa7\xdd\x86\x50\x12\x25\xbf\x0c\xce\x53\
-\x54\x6b\x35\x04\x41\x05\x8e\x63\xa3\x3e\x3d\x83\xa9\xfa\x14\x96\
-\x97\xf7\xc1\xf5\xdc\xfc\xf5\xa5\x94\x48\x92\xd4\x70\x0c\x3a\xbf\
-\xb0\xb5\xb5\x8d\x24\x89\x11\x86\x21\x6e\x3d\x76\x0c\x47\x8e\xde\
-\x0c\x40\xd7\x2f\x66\x1a\x80\x14\xbd\x00\x59\x18\x29\x33\xb0\x77\
-\x88\x59\x4c\x7a\xd6\x44\x03\x8c\xd7\x00\x54\x9b\x80\x28\x0c\x51\
-\xaf\xd7\x11\xc7\xb1\x66\xee\x86\x38\x67\x3a\x65\xec\xa1\x3e\x3d\
-\x8d\xa5\xa5\x25\xdc\xfe\x8e\x3b\x31\x3d\x3d\xad\xa7\x7b\x9b\x66\
-\xcf\x28\x8a\xd0\xed\x74\x10\x46\x9a\x1b\x68\x34\x1a\xd8\xde\xde\
-\x46\xa7\xdd\xc6\xe5\xcb\x97\x51\xad\x56\xf3\x3e\x40\x3d\x5f\x00\
-\x98\xaa\x4f\xc3\x75\x1d\xb8\xae\x87\x43\x87\x0e\xe5\x65\xea\x4a\
-\x29\xb4\x5a\x2d\x4d\x06\xa1\x7f\x2f\x54\x96\x0e\x16\x52\xf6\x15\
-\xae\xf6\x38\x6e\x05\x8b\x31\xe1\x79\xfe\x24\x0c\x1c\xa9\x01\xb4\
-\xf0\x95\x54\x0a\xd3\x33\x33\x38\x7b\xe6\x34\x76\x76\x76\xe0\xfb\
-\xfe\xae\xd0\xae\x58\x2a\x26\xa5\x40\xa7\xd3\xc1\xf6\xf6\x26\x94\
-\xea\x6d\x10\xcd\x26\x87\x54\xaa\x15\x4c\xd5\xeb\xb0\xf6\x59\xb9\
-\x03\x08\x00\xcf\x3c\xfd\x14\x66\x66\x66\xb1\xb0\xb8\x80\x76\xab\
-\x8d\x56\xab\x85\x66\xb3\x81\x24\x49\xb0\xbe\x7e\x0d\xdd\x6e\x07\
-\x84\xd0\xbc\x76\xa0\x5a\xab\xe1\x1d\x77\xbe\x33\x17\x74\xff\x1a\
-\xd9\x5e\x6d\x81\xea\x1f\x0b\x94\x47\x1f\x8e\x6d\x89\x4a\x65\xc2\
-\x03\x8c\x31\x01\x4c\x11\x42\x95\x52\x0a\xbe\xef\xe3\xe0\xa1\x43\
-\xf8\xbb\x2f\x7d\x11\xfb\x0f\x1e\x44\xa5\x52\x81\x6f\x4e\xa9\xe3\
-\x79\x70\x6c\x3b\x1f\x19\xd3\x23\xdf\x48\xa1\x3b\x47\x40\xcb\x88\
-\xe4\x53\x3d\x8a\x5a\xc4\x75\x5d\xb4\xdb\x2d\x04\x41\x00\x42\x08\
-\x82\x8a\x06\x89\x6d\xdb\x7d\x15\x48\x59\xb4\x11\x45\x31\x1e\x79\
-\xf8\x21\x7c\xfe\x73\x7f\x85\x8f\x7c\xfc\x13\x3a\x95\x5c\x88\x1c\
-\x88\x19\x67\x2e\x45\xd6\xdf\x48\x06\x21\x00\xdb\xb2\x78\x10\x04\
-\x13\x13\x30\x26\x0a\x90\x94\x10\x49\xa0\xd7\xc0\x1f\x38\x70\x10\
-\xd5\x6a\x0d\xe7\xcf\x9d\x43\x63\x7b\x07\xad\x56\xcb\x24\x79\x74\
-\x07\x8e\x6f\xda\xbc\x82\xa0\x82\xd3\x6f\xbe\x09\xd7\x71\x31\xbf\
-\xb0\x90\x87\x7c\xba\xb8\x93\xf5\x15\x77\x16\xed\xbd\x94\x52\x73\
-\x01\x51\x94\x0f\x7d\xe8\xfd\x1c\x01\xa5\xc4\x54\xfc\xea\x5a\x80\
-\x8f\x7d\xe2\x93\xf8\x9d\xdf\xfe\x2d\xbc\xf2\xf2\xcb\x38\x76\xfc\
-\xb8\xee\x3f\x50\x03\x1a\x40\x4a\x28\x89\x5d\x2a\x40\x49\x05\xcb\
-\xb3\x78\x10\x94\x27\x1a\x60\xb4\x09\xa0\x8a\x52\x2a\x51\xe0\xd5\
-\xcb\x41\x80\x23\x47\x8f\xe6\xc2\x76\x1d\x17\x52\x49\x84\xdd\x2e\
-\xb8\xe0\x68\xec\xec\xa0\xdd\x6e\xe3\xe6\x5b\x6e\xc5\xc6\xe6\x26\
-\xd6\xd7\xd7\x21\x84\x40\x1c\xc7\x70\x3d\xd7\xa4\x94\x1d\x94\xcb\
-\x65\x78\xbe\x67\xfa\x03\xcb\xa8\x56\xab\x08\xc3\x10\x82\xf3\x5e\
-\xed\x7f\x5e\x01\xac\xbd\x76\x5d\xe1\x2b\x20\x84\x4e\x04\x49\xa9\
-\x70\xf8\xf0\x61\x5c\x5c\xb9\x80\x93\xb7\xdf\xae\x01\x80\xde\x14\
-\x71\x65\x56\xdb\x0d\xeb\x0c\x52\x50\xb0\x2d\x5b\x94\x83\xca\x04\
-\x00\x23\x01\xc0\xa8\x22\x94\x2a\x02\xc0\xb2\x6d\xac\xac\xac\xe0\
-\xd2\xea\x45\x4c\x4d\x4d\x21\x4e\x62\xb4\x9a\xad\x7c\xc8\x53\xad\
-\x56\x43\x39\xa8\xa0\x5a\xab\x62\xef\xd2\x32\x2a\x95\x0a\x3c\xdf\
-\xcf\x13\x36\xd9\x44\x90\x46\x63\x07\xcd\xa6\x2e\x07\xdb\xd8\x58\
-\x47\xbb\xd5\xd2\xd4\x6e\x18\x62\x6b\x6b\x13\xab\x17\x57\xf1\xfa\
-\x6b\xaf\xc1\x2f\xf9\x70\x5c\x17\x41\x39\x40\xa9\x5c\x46\xa9\xe4\
-\xc3\xf3\x7c\x38\x8e\x93\x87\x84\x52\x0a\x9c\x3a\xf5\x22\x4e\x9c\
-\x38\x99\x0f\x89\x2a\x18\x01\x28\xc0\x38\x81\xbb\x97\x4c\x2b\xa5\
-\x60\xdb\x16\xaf\x54\x82\x09\x00\x46\x6b\x00\x26\x29\xa5\x92\x50\
-\xed\x78\x5d\x38\x77\x16\x1f\xf9\xf8\xc7\x51\xa9\x54\x7b\xa1\x5f\
-\x1c\xa3\xd5\x6a\xa1\xdb\xed\x60\x7b\x7b\x1b\xeb\x6b\x6b\x58\x5d\
-\xb9\x88\xb3\x67\x4f\x63\x6e\x7e\x01\x94\x10\x9d\x02\xf6\x3c\x4c\
-\x4d\xd5\x31\x3d\x3d\x8d\x83\x87\x0e\x22\x08\x2a\x7d\xaf\xa5\xe7\
-\x08\xa6\xd8\xda\xda\xc2\xce\xce\x36\xa2\x28\xc6\xc6\xfa\x3a\x76\
-\xb6\xb7\x71\xf5\xca\x15\x34\x5b\x4d\x58\xcc\x82\x10\x02\x8c\x31\
-\xf8\xa5\x12\x56\x57\x56\x50\xaf\x4f\xe3\xe4\xed\xb7\x23\x89\xe3\
-\xbe\x9c\x44\xee\x03\xf4\xd5\x04\x14\x67\x1a\x2b\xd8\xb6\x25\x82\
-\xa0\x32\xf1\x01\x46\x5d\x8c\x51\xc5\x18\x55\x94\x52\x34\x1a\x3b\
-\x58\xd8\xb3\x08\x42\x29\x36\x36\xd6\xf3\x11\xad\x94\x68\x6e\xbe\
-\x36\x35\x85\x7d\xfb\x0f\x80\x31\x06\xdb\xb6\xf1\xd5\x87\x1f\xc2\
-\x2d\xb7\x1c\xd3\xce\x5d\xa7\x83\x9d\xed\x6d\x34\x9b\x0d\x5c\xba\
-\xb4\x8a\x30\x0c\x41\x09\x41\x9c\x24\xa8\xd5\x6a\x20\x84\xa0\x5e\
-\x9f\x46\x10\x04\x08\x82\x00\x7b\x97\x96\x61\xdb\x36\x6e\xbf\xfd\
-\x76\xc0\x64\xef\xb2\xd9\x81\xad\x56\x0b\xed\x76\x0b\x71\x9c\xe0\
-\xe6\x9b\x6f\xc1\xdc\xdc\x1c\xe2\x24\xe9\x5b\x05\xd7\xa7\x01\x84\
-\x30\x5b\xcd\x8b\x24\x90\x59\x7c\x69\xdb\xbc\x5c\x9e\x68\x80\xb1\
-\x1a\x80\x10\x2a\xa5\x10\x08\x2a\x55\x5c\xba\xb4\x9a\xf7\xde\x49\
-\x33\x75\x41\x12\x09\x21\xf4\x10\xc7\xec\xb2\x6d\x1b\x61\x37\x44\
-\x9c\xc4\x28\x07\x65\xd4\xeb\x75\xcc\xcd\xcf\xe9\x6e\x62\xaa\x89\
-\x9a\x34\xe5\x88\xe3\x08\x61\x37\x44\xa3\xd1\x40\x9a\xa6\x78\xfc\
-\x1b\x8f\xc1\xf3\x3c\x04\x95\x0a\xa2\x6e\x17\x9e\xef\x83\x0b\x81\
-\xba\x89\x06\x82\xa0\x82\x52\xb9\x84\xa9\xa9\x3a\x3c\xcf\x83\x02\
-\xd0\xed\x76\xf5\xfa\xba\xc2\x36\xb1\xdc\x79\x34\x89\x26\x39\xd0\
-\x44\x6a\x52\x9c\xb0\x6c\x57\x04\x95\x89\x0f\x30\xfa\xcd\xe8\x51\
-\xea\x92\x0b\x81\x5a\xb5\x0a\xdf\x2f\xe1\xa1\xaf\x7c\x19\x27\x6f\
-\xbf\x03\xbe\xaf\xed\x31\x33\xd3\x3f\x51\x48\x0b\x17\x27\x8a\x64\
-\x3d\x84\x71\xbc\x2b\xc2\x00\xa5\x14\xa5\x72\x09\xd5\x5a\x15\xbe\
-\xef\xa3\xdb\xed\x60\x71\xcf\x1e\x2c\x2d\x2d\x23\x8a\x22\x44\x61\
-\x17\xad\x76\x1b\xdd\x6e\x17\x3b\x5b\x5b\x58\x5f\x5f\x43\xfb\x6c\
-\xdb\x54\x02\x71\x78\x5e\x09\xef\xba\xeb\xae\xbc\x12\x38\x7b\xcd\
-\x3c\x17\x54\x48\x1e\x81\x16\xc7\x03\xe9\x72\x71\xdb\xb2\x79\x30\
-\xf1\x01\xc6\x39\x81\x4c\x4a\x29\x95\x32\xe1\xd9\x6d\x27\x6f\xc7\
-\xe9\x37\xde\xc0\x13\x8f\x3f\x0e\xc1\xb9\x9e\xfc\xe9\x79\xf0\x3c\
-\x17\x41\xa5\x82\x72\xb9\x8c\xa0\xac\x1d\xc1\x6e\x18\x22\x35\x1e\
-\x7d\x46\xcf\xf6\x4d\x1b\xc9\x27\x83\x0a\x70\x9e\x42\x08\x81\x6e\
-\xb7\x93\xab\x78\x21\x04\x98\x65\x61\x66\x66\x06\xf3\xf3\xf3\x60\
-\x47\x8e\x80\x9a\x5a\x7f\x29\x25\x92\x38\xc6\xd7\x1e\x79\x18\x9f\
-\xfb\xab\xbf\xd4\xf4\x74\xe6\x04\x16\x4c\x40\xa6\x01\x34\x49\x34\
-\x10\x06\x2a\x09\xc7\xb6\x78\x65\x12\x05\x8c\xf3\x01\x98\x54\x4a\
-\x49\x69\xca\xbe\x39\xe7\x38\x71\xf2\x24\x6e\x33\x4e\x57\x92\x26\
-\xe8\xb4\x3b\x68\x34\x1a\x88\xa2\x10\xab\x2b\x17\x73\x8f\x7f\xed\
-\xea\x55\xec\xec\x6c\xa3\x52\xa9\xa0\x54\xd2\xa3\x60\x82\x4a\x80\
-\x92\x5f\x82\x5f\x2a\x19\x5e\xc0\x02\x35\x66\xa1\x78\x82\x33\xf2\
-\x28\x3b\xbd\x83\xc4\x51\x46\x3d\x7f\xe8\x47\x3e\x82\xdf\xfd\x5f\
-\xff\x03\xaf\xbc\xfc\x32\x6e\x3d\x7e\x1c\x69\x92\xf4\xea\x0f\x4c\
-\x41\x88\x4e\x2f\xab\xbe\x96\xab\x6c\x37\x81\x65\x5b\xa2\x54\x9e\
-\x24\x83\xc6\x69\x00\x45\x84\x90\xc2\x94\x5b\x09\x21\xf0\xec\xd3\
-\x4f\x63\x67\x67\x1b\xe5\x20\x80\x5f\xf2\x31\x55\x9b\xc2\xfc\xfc\
-\x3c\x82\x20\x40\x39\x08\x74\x47\xae\x11\xdc\x4e\x63\x07\xcd\x66\
-\x13\x9d\x56\x1b\xdb\x3b\xdb\x68\x34\x1a\x68\x35\x9b\x39\xf1\x63\
-\x9b\x34\xb0\xef\xfb\xa8\x4f\x4f\x63\x75\x75\x15\x94\x32\x54\x6b\
-\xb5\xbc\xf1\x83\xe6\x9d\x3e\xfd\xe6\x43\x93\x46\x29\x8e\x1c\x3d\
-\x8a\x8b\x2b\x2b\x38\x71\xf2\x24\x12\xd3\x09\x54\x48\x05\x0d\x8c\
-\x3a\x54\x03\x61\xa0\xcd\x2b\x95\x0a\x26\x00\x18\xe9\x03\x50\xc9\
-\x09\x64\x56\xa0\xf1\xfc\xb7\x9e\xc3\xf1\x13\xb7\x61\x79\xf9\x7d\
-\xe8\x74\x3b\xd8\xda\xdc\x44\xab\xd5\xc2\x99\x33\xa7\x11\x47\x11\
-\x78\x9a\x82\x50\x8a\x72\xb9\x0c\xdf\x2f\x61\x7a\x66\x06\x41\x10\
-\x60\x79\x79\x5f\xee\x33\x48\x29\x91\xa6\x29\x5a\xcd\xa6\xe6\xfa\
-\x1b\x0d\x6c\xef\x6c\x63\x6b\x73\x13\x61\x37\xc4\xe9\x37\xdf\xc4\
-\xe9\x37\xdf\xd4\xf9\x7f\xdb\x46\xa9\xe4\xa3\x5c\xd6\x03\xa5\xca\
-\xe5\x40\x3f\x8f\xab\x0b\x4c\xa4\x52\x78\xe1\xf9\xe7\x35\x0f\x60\
-\xcc\x4d\x56\x31\x9c\xf9\x24\x30\x53\x41\x06\x21\xa0\x94\xd4\x61\
-\xe0\x04\x00\xa3\x2f\xdb\x76\x44\x92\xa4\x82\x80\x60\xfd\xda\x1a\
-\x2a\xd5\x0a\x6e\x3d\x76\x2b\xc2\x30\xc4\xf4\xf4\x34\xe6\xe7\x17\
-\x74\x11\x88\xb1\xcd\xda\x71\x0b\xd1\xed\x76\xf1\xb5\x47\xbe\xaa\
-\xd9\x3a\x25\x91\x26\x09\xa2\x28\x42\xa9\xa4\x8b\x32\xa7\x67\x66\
-\xe0\xfb\x25\xcc\xcc\xcc\xe0\xc0\xc1\x83\x38\x1e\xdc\x96\xe7\xfa\
-\x35\x59\xd4\x40\xb7\xdb\xc5\xd6\xf6\x16\xda\xcd\x26\xda\xed\x36\
-\xae\xad\xad\x41\x08\x81\x30\x0c\x75\xaf\x01\x80\x8d\xf5\x6b\xa8\
-\xd7\xa7\x71\xe2\xe4\x49\xc4\x49\xd2\xbf\x55\x3c\x2f\x0b\x57\x79\
-\xa1\x68\x61\xe3\x6c\xae\x01\x82\x20\x98\x00\x60\xd4\xe5\x38\x8e\
-\x08\xbb\x5d\xce\x05\x37\xa7\x48\x27\x72\x92\x24\xd1\x73\x7e\x51\
-\x5c\xdc\x68\x78\x7a\x8b\x61\x7e\x61\x1e\x4b\xcb\xcb\x38\x79\xc7\
-\x1d\x98\x9e\x9e\xd6\x63\x60\x93\x14\xdd\x6e\x07\xcd\x86\xee\x21\
-\xd8\xda\xda\xc2\xda\xda\x55\xb4\x9a\x4d\xd8\x96\x0d\x2e\x38\xca\
-\xe5\x32\x5c\xcf\x43\xbd\x3e\x8d\x72\xb9\x8c\xa5\xbd\x4b\xf0\x6f\
-\x3a\x92\x37\x9a\x26\x69\xaa\x53\xc9\x61\x88\xed\xad\x2d\xb8\x77\
-\xde\x89\xd9\x99\x39\x44\x71\xa4\x43\x41\x63\x5a\xfa\xc2\x3d\xd2\
-\x6b\x16\x29\x66\x85\xa5\x94\x70\x5d\x57\xd4\xa7\xa7\x27\x00\x18\
-\x75\xd5\x6a\xb5\x24\x8a\xa2\xa4\xd9\x6a\x61\x66\x7a\x06\xa7\x4f\
-\xbf\x89\x95\x95\x15\x2c\x2f\x2f\xe7\xc9\x9b\x62\xe9\xb5\xae\xdc\
-\x15\x20\x84\x20\x8a\x42\xb4\x9a\x8d\x7c\xaa\x67\x56\xc2\xb5\xb0\
-\xb8\x80\xbd\x6c\x09\xcc\x32\x15\xbf\x42\x9a\x45\x10\x29\x9e\x78\
-\xfc\x31\x08\x29\xe0\xd8\x0e\x56\x2e\x5c\xd0\x03\xa8\xd3\xd4\xec\
-\x20\x70\xe1\xf9\xba\xbc\xdc\xf7\x7d\x9d\x64\x72\x1c\x44\x91\x16\
-\x7e\xdf\x2a\x5b\x14\x5b\xc3\xfa\x3c\x82\x82\x13\x49\x10\x76\xbb\
-\x7c\x63\x7d\x1d\x73\xf3\x7b\x26\x00\x18\x76\xad\xad\xad\x75\xdb\
-\xed\x76\xc7\xb1\x6d\x28\x28\x9c\x38\x71\x1b\x9e\x7c\xe2\x09\x54\
-\x6b\x35\xd4\xeb\x75\x04\x95\x00\xd5\x4a\x15\xa5\x72\x59\x2f\x8c\
-\x30\x1c\x3d\x63\x0c\x94\xd0\xde\x80\x68\x23\x94\xac\xa6\x1f\x88\
-\xb3\x5e\x8e\x7c\x90\x44\x29\xd0\x3e\xc3\xde\xa5\x25\xec\x3f\x70\
-\xc0\x0c\x89\x96\x88\xa2\x08\x61\xd8\x45\xb3\xd1\xcc\xeb\x03\xd6\
-\xae\x5e\x45\xbb\xdd\x42\xca\x39\xee\xb9\xf7\xbd\xb0\x18\xdb\xa5\
-\x01\x08\x21\x66\x46\xa0\xcc\x78\xe1\xbe\xbf\xad\x5c\x2e\xe3\x4b\
-\x5f\xfc\x7c\xfa\xf7\x5f\xfe\x1c\x9e\xf9\xf6\x4b\x13\x00\x0c\xbb\
-\x1e\xff\xc6\x63\xbc\x52\xa9\x84\x37\x1d\x39\xaa\x47\xc6\x95\xcb\
-\xb8\xf7\x3d\xef\xc5\xda\xd5\xab\x68\xb5\x5b\x58\xbb\x7a\x15\xdc\
-\xf4\xeb\x39\x8e\xa3\x8b\x3d\x2a\x15\x54\xa7\x6a\x38\x7f\xfe\x3c\
-\xa6\xea\xf5\xfc\xe4\xe7\x79\xfd\x82\x73\xa6\x06\x26\x91\x73\x9e\
-\x22\x8a\x42\x5d\x3e\x26\x38\x94\x99\x35\x5c\x2e\xeb\x6c\x61\x36\
-\x45\x94\x00\x10\x42\xe2\xe9\x27\xbf\x89\x2f\x7d\xe1\x6f\xf0\xe1\
-\x8f\x7e\xbc\xb7\x5d\xdc\xb4\x82\x65\xe4\xd0\x60\x75\x71\x6f\x57\
-\x84\xc4\xcc\x74\xbd\x53\xf6\xac\x89\x09\x18\x75\xbd\xfb\x9e\x7b\
-\xd6\xe3\x38\x39\xc5\x39\xd7\xd3\x3a\x38\x07\xa1\x14\x4b\xcb\xcb\
-\x60\x79\x88\xa6\xc0\x53\x5d\xd3\xdf\x6e\xb7\x10\x87\x11\x1a\x8d\
-\x1d\x4c\x4d\x4d\xe1\xd5\x57\x5e\xc1\x6b\xaf\xbe\x0a\xa1\xed\xad\
-\xa6\x79\x83\x00\x95\x4a\xc5\x10\x47\x25\x78\x9e\x0f\xdb\xb6\x4d\
-\xb1\x28\x29\xec\x16\xee\x39\x6b\x19\x27\x90\xa9\xf5\xac\xf6\xef\
-\xbe\xfb\xef\xc7\xb9\xb3\x67\xf1\xda\xab\xaf\xe0\xd8\xf1\x13\x48\
-\x93\x04\x42\xc8\x3e\x13\x20\xd5\xf0\xae\x04\x29\x05\x16\xf7\x2c\
-\x76\x16\x17\x66\x26\x00\x18\x75\x95\x35\x49\xf2\xad\x46\xa3\x19\
-\x4b\x29\x5d\x42\x08\x60\xc2\xb8\x0c\x0c\x59\xde\xde\xb6\x6d\xcc\
-\xcd\xce\xe9\x29\x1e\xe6\x96\x31\x7d\x61\x18\x22\x8a\x42\x34\x76\
-\x1a\xe8\x76\x3b\xb8\x74\xe9\x12\xa2\x30\x44\xca\x53\x40\x21\x6f\
-\x14\xbd\x74\x69\x15\xcb\xad\x86\xde\xe4\x61\x00\x63\xdb\x7a\x20\
-\x54\xe6\x4b\xe4\xa7\x58\x29\xf0\x34\xc5\xd2\xbe\x65\x5c\x5c\x59\
-\xc5\x89\x13\xbd\x02\x10\x52\xf4\x01\xe4\x90\x7a\xb0\x0c\x00\x8b\
-\x7b\x3b\x47\x0e\x1f\x9a\x00\x60\xd4\xb5\xbc\x6f\x3f\xd2\x24\x79\
-\xfd\xb9\x67\x9f\x7d\x24\x49\x92\x1f\xca\x17\x3c\x65\x7e\xbf\x19\
-\xdd\x4a\xf5\x27\x8a\x54\x29\x10\x73\x52\x8b\x73\x7b\x74\x7f\x60\
-\x09\x73\xb3\xf3\xc6\x0c\x20\x1f\x28\x11\x47\x11\x3a\xed\xb6\x4e\
-\xf7\x5a\x16\x9a\xcd\x26\xbe\xfd\xad\x6f\x21\x32\xa5\xe0\x94\x51\
-\x04\x41\x80\x52\xa9\x8c\x4a\xb5\x92\x73\x02\x9e\xe7\xa1\xdd\x6e\
-\xe3\xb9\x67\x9f\xc5\x5d\x77\xbd\x1b\x69\x9a\xe6\x00\xc8\x85\x6c\
-\x18\xcc\xdc\x07\xc8\x52\xc1\x20\xe0\x49\x88\xbb\xee\xba\xeb\xda\
-\x7d\xef\xbb\x6f\x02\x80\x51\x57\x18\x76\x61\x59\x16\x16\xf6\x2c\
-\xfe\xc7\x4b\xab\xab\x3f\x38\x3b\x3b\xc7\x2c\x4b\x17\x72\xe6\xb6\
-\x55\x4a\xc8\x6c\xbc\x7b\xf6\x61\x13\x02\x95\x01\x80\x52\x90\xac\
-\x9b\x07\xbc\x5f\x19\x13\xa2\x73\x09\xbe\x8f\xb9\x05\x5d\x3b\x00\
-\xe8\x25\x50\x59\xfa\xb7\xd9\x68\xa0\x1b\x86\xd8\xde\xde\xc2\xce\
-\xf6\xb6\x29\x43\x23\x86\x4c\x6a\xe1\xe8\xd1\x9b\x71\xe0\xe0\x41\
-\x44\x71\x0c\x62\x1c\x4d\x65\xa8\x62\x9d\x88\x52\x43\xa3\x00\xc7\
-\xa6\x78\xfe\xdb\xcf\x5d\xdd\xd8\xb8\x86\x9f\xfb\xf9\x5f\x98\x00\
-\x60\xd8\x35\x33\x33\x0b\x42\x08\x2a\x95\xea\xa3\xab\x17\x2f\xfe\
-\xea\xf6\xf6\xf6\xaf\x38\x8e\x9e\x1a\x9e\xb5\x7c\x29\xa9\xed\x2c\
-\xcd\xbd\x6d\x93\x71\xd7\x8b\x06\xb4\x96\x00\xfa\x3a\x76\x06\xaf\
-\xbe\x3c\x40\xe1\x5f\xd7\x75\x31\xbf\xb8\x08\x00\x38\x7c\xf8\x70\
-\x9e\x8f\x48\xd3\x14\x9d\x4e\x27\xef\x28\x8a\xe2\xb8\x17\x69\x98\
-\x4e\xe3\x62\xab\xd9\xe0\x96\x03\x29\x25\xca\xbe\xd5\xbc\xf7\xde\
-\x7b\x2f\x94\x83\xea\x44\x03\x8c\xcc\x05\x98\x6a\x5c\xcb\xb2\xf0\
-\x81\x0f\x7e\xf0\x57\xff\xfc\xcf\xfe\x8c\x4c\xd5\xa7\xff\xbd\xef\
-\xfb\xe4\xc2\xf9\xf3\xa0\x94\x62\x7a\x66\x46\x73\xf7\x26\x14\x93\
-\x26\x6f\xa0\x4c\xbf\x7e\xa6\x09\xbe\x23\x00\x98\xfb\x12\x80\x32\
-\xd5\xbe\xb9\x43\x67\xee\x97\x4a\x25\x48\xa5\xb4\xf0\x0d\x1f\x41\
-\x19\x33\xc0\x70\xc0\x39\x47\x1c\x6b\xd2\x2a\x73\x1c\xb3\xe7\xe6\
-\x9c\x63\xbe\xea\x9c\x3d\x72\xf4\xe8\x65\xcb\xf6\x26\x00\x78\x2b\
-\x17\x63\x16\x66\xe7\xe6\x7e\xa5\xd9\xd8\xf9\x66\xbb\xd5\xfa\x8d\
-\xb9\xb9\xb9\xe3\x94\x31\x6c\x6c\xac\xe3\xf2\xe5\x4b\x3a\xa1\x53\
-\x9f\x46\xb5\x5a\xcd\xe7\x08\x66\xa5\xda\x19\x18\x00\x40\x8d\xda\
-\x39\x34\xe0\xe0\xe5\x61\x5d\x01\x18\xd9\xfc\xff\xec\x14\x0f\x6e\
-\x1e\xa1\x94\xe2\xca\x95\xcb\xa8\x4f\xcf\x20\x0c\x43\x70\x9e\xa2\
-\xd3\x0d\x21\x04\x40\xad\x8c\x20\xa2\xe8\xb4\xb6\xf1\xc1\x8f\xde\
-\xf7\xb9\x5b\x8f\x9f\x90\xed\x76\x67\x02\x80\xb7\xac\x11\x08\xc1\
-\xec\xec\xdc\x57\xa4\x94\xef\xba\x7c\xf9\xd2\x8f\x13\x42\x3e\x3b\
-\x37\x37\x7f\xf7\xf4\xf4\x0c\xe1\x3c\xc5\xc6\xfa\x3a\x2e\xad\x5e\
-\x04\x63\x16\xaa\xb5\x2a\xa6\xa6\xea\x28\x97\xcb\xb0\xfa\xfa\xfc\
-\x87\x6f\xf2\x1a\xf4\xf0\xd5\x80\xe0\x8b\x69\x62\x59\x00\x48\xc6\
-\x02\x4a\xe3\x7f\xbc\xfe\xda\x6b\xf8\xc4\x8f\x7e\x52\x73\x14\x9c\
-\x23\x8c\x05\x08\xb3\xf3\x75\x37\xed\x4e\x88\x9b\xf7\x05\xaf\xfd\
-\xe4\xa7\x3f\xf5\x3b\xb6\xed\xa2\x52\x61\x13\x00\x7c\x27\x97\x94\
-\x12\x8e\xe3\x46\xfb\x0f\x1c\xf8\x83\x37\xdf\x78\xfd\x8f\x3b\x9d\
-\xf6\x3b\xd6\xd7\xaf\x7d\x54\x4a\xf9\x0f\x66\x67\xe7\x6e\xaf\xd7\
-\xf7\xf8\xdc\x14\x77\x9c\x3b\x7b\x06\x49\x92\xc0\xb2\x6c\x04\x95\
-\x00\x95\x4a\x15\x41\x10\xe4\xac\x61\x96\xb3\x57\x83\xa7\xb9\xa0\
-\x05\xfa\xee\x0f\x6a\x02\x03\x06\x42\x08\xca\xe5\x32\x9e\x7e\xf2\
-\x9b\x10\x3c\xc5\x91\xa3\x37\xe3\x91\xaf\x3e\x02\x28\x81\xab\x1b\
-\x5d\x58\xce\x14\x04\xe7\xe8\x84\x21\xf6\xcf\xe2\xcd\x7f\xf1\xd9\
-\x4f\xfd\xd8\xdc\xfc\xe2\x46\x36\x7a\x6e\x02\x80\xef\xf0\xca\x56\
-\xb2\x5a\x96\x2d\x16\x16\x17\x9f\x6b\xb5\x5a\xcf\xbd\xf1\xfa\xeb\
-\xbf\x7c\xfe\xdc\xb9\xfd\xae\xeb\xdc\x55\xa9\xd6\xee\xab\xd7\xeb\
-\xf7\xd6\x6a\xb5\x63\xb3\xb3\x73\x35\xa5\x14\xa2\x38\xc2\xb5\xb5\
-\x35\xac\x5c\x38\x9f\x93\x3a\xae\xeb\xea\x62\x91\x72\x39\x8f\xfb\
-\x33\x46\x91\x98\x42\x91\x6c\xdd\x6b\xdf\xa0\xea\x42\x35\x11\x84\
-\x40\xa3\xd9\xc0\xd7\xbe\xfa\x30\x5e\x3a\xf5\x22\x7e\xe1\x5f\xfd\
-\x12\xce\x9c\x39\x83\x38\xea\xe2\xea\xda\x26\xd6\xda\x36\x04\x11\
-\x70\x11\x76\xdf\x7b\xa2\xfe\xfb\x3f\xfd\x93\x9f\xfc\x65\xdb\xf1\
-\x36\xd3\x34\x35\x5d\x4c\x6a\x02\x80\xef\x16\x0c\x04\x80\x6d\x5b\
-\xca\xf7\xfd\x0b\x96\x6d\x5d\xe0\x3c\xfd\x8b\xcd\x8d\x0d\x92\x24\
-\xc9\xfc\x85\xf3\xe7\x8f\x2f\x2d\x2f\xdf\x5d\x09\x2a\x77\x5b\xb6\
-\x75\xc7\xd2\xf2\xf2\x32\x25\xd4\x67\x8c\x21\x8a\x22\x08\x21\xb0\
-\xbd\xb5\x69\x1c\xb6\xb8\x47\x32\x99\xcc\xa2\x2a\x0c\x7e\x12\x5c\
-\x40\x2a\x3d\x10\x3a\xc9\x47\xd5\xeb\x72\xf2\x3d\x7b\xf6\xe2\x97\
-\xff\xc3\xaf\x61\x73\x73\x13\xaf\xbf\xfa\x0a\xd6\x36\x9a\x78\xea\
-\xd5\x2d\xcc\xcd\xd4\xce\x1e\x3b\x50\xfd\xf3\x3d\xd3\xee\xef\x56\
-\x2b\xa5\xb3\xa5\x72\x15\x9d\x4e\xe7\x86\xfd\x3c\xbf\xef\x00\x50\
-\x74\xe5\x33\x1f\xde\x54\xf3\xa8\x20\x08\xd6\x3c\xcf\x5d\xf3\x7d\
-\xff\x11\x10\x60\xfd\xda\x9a\xf3\xd4\x93\x4f\x2c\x2f\x2c\xee\x39\
-\xe4\x38\xce\xb1\x3d\x7b\xf6\x1e\x8b\xa3\xf8\xf8\xc2\xe2\xe2\x92\
-\x82\x9a\x75\x6c\xa7\x56\x2a\x95\x28\x65\x2c\x2f\xef\xa2\x54\x03\
-\x21\x0c\x43\x10\xe8\xc9\x61\x96\x6d\xe9\x71\x34\x9e\x0f\xc6\x18\
-\xca\x41\x19\xcd\x66\x0b\x2f\xbc\xf0\x02\x5e\x7f\xe3\x74\xba\xd3\
-\x4a\x5e\xed\xc4\xf2\xf1\x7b\x4f\xee\xfb\xeb\xa3\x07\x17\x1e\x5d\
-\x58\x98\x8f\x56\x2f\xae\x22\x4e\xb8\x5e\x69\x73\x03\x5f\xdf\xbf\
-\x00\x18\xa1\x1d\x72\x6e\x88\x12\x94\xca\xe5\x84\x31\xeb\x6c\xa9\
-\x54\x3e\xcb\x18\x7d\xd8\x71\x1c\x6c\x6e\x6c\x60\x3a\x9d\x71\xff\
-\xe7\xef\xfc\xf6\xd4\x47\x3e\xf6\xb1\xd9\x9d\x9d\x9d\x3d\x3b\xdb\
-\xdb\x4b\x0f\x3c\xf8\x81\x85\xab\x57\xaf\x4e\x6d\x6e\x6e\xd4\xd3\
-\x24\xad\xdf\x71\xe7\x9d\x53\x04\xf0\x95\x52\x8e\x02\x6c\x42\x2d\
-\x62\x59\x56\xa4\x14\xc2\xe7\x9e\x7d\xa6\x11\x04\xc1\xab\x57\xd6\
-\xd6\x5f\x11\x8a\x3c\x53\x9b\x9a\x3a\xbb\xd7\xb3\x84\xeb\x30\x80\
-\x32\x24\xa9\xe6\x03\xbe\x1f\xae\xff\x3f\x00\xeb\xbe\x99\xfd\x8f\
-\x28\x18\x4d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x9a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x01\x2c\x49\x44\x41\x54\x38\xcb\x63\
-\xf8\xff\xff\x3f\x03\x25\x98\x61\x98\x1b\x90\xbd\xd8\xfc\x6b\xea\
-\x7c\xc3\xff\xf1\x73\x75\x39\xc9\x32\x20\x79\xbe\xe1\xd7\xc6\xcd\
-\x51\xff\xc3\x67\x68\xfc\xf7\x9f\x2a\xcf\x49\xd0\x80\xfc\xa5\xb6\
-\xff\x73\x17\x9b\xff\x4d\x5f\x68\xfc\x37\x71\xae\xfe\xdf\x9a\xf5\
-\xa1\xff\x57\x9d\x9e\xf8\xbf\x64\xb5\xff\x7f\xd7\x7e\xf1\xbf\xb6\
-\xdd\x82\x3c\x78\x0d\x00\x3a\xf9\xff\x86\x73\xd3\xfe\xaf\x3d\x3b\
-\x05\xac\x71\xc5\xe9\x09\xff\x27\xec\x29\xf9\xbf\xf0\x78\xd7\xff\
-\x8c\xa5\x6e\xff\x4d\xdb\xd9\xff\xea\x36\x33\xf2\xe3\x34\x00\xe8\
-\x64\xb0\xe6\xbe\x5d\xf9\xff\x3b\x77\x64\xff\x6f\xdd\x96\xf6\xbf\
-\x61\x73\xe2\xff\xa6\xad\xe9\xff\x67\x1c\x6a\xfe\x1f\xb3\xc0\xe6\
-\xbf\x6a\x3d\xc3\x1f\x9c\x06\x44\xcf\xd6\xfc\xbf\xf2\xd4\x84\xff\
-\x4b\x4f\xf4\xfe\x5f\x78\xac\xeb\xff\xbc\xa3\x1d\x40\x43\xb2\xfe\
-\x4f\x3f\xd4\xf4\x3f\x6d\xa9\xc7\x7f\xc5\x5a\x86\x57\xd2\x95\x0c\
-\x06\x38\x0d\x08\x9c\xae\xf8\xcf\x73\xa2\xf4\x3f\xe7\x7e\xd1\x7f\
-\xd6\xdd\xfc\xff\xe2\xe6\x5b\xfd\x9f\x76\xb0\xe1\x7f\xd2\x62\xb7\
-\xff\xf2\xb5\x0c\xcf\x25\x2b\x19\xb4\x48\x8a\x05\xed\x66\xc6\xaf\
-\xf1\x0b\x9d\xff\xcb\x57\x33\x3c\x01\x6a\x56\x27\x39\x1a\x81\x4e\
-\xfe\x2a\x57\xcd\xfc\x5f\xb4\x92\x41\x91\xec\x94\x28\x5c\xce\xc0\
-\x39\xb8\xf3\x02\x00\x87\x95\xc7\xfa\x0e\xdd\xac\xec\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xfb\
-\x47\
-\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\x9c\xb3\xca\xe7\
-\xf2\xfe\xa1\xb5\xca\xc2\xda\xf2\xac\xc5\xde\x59\x72\x8a\xd8\xeb\
-\xfe\x93\xac\xc5\xcb\xe4\xfd\xa4\xbc\xd3\xbc\xd5\xed\x4a\x62\x7a\
-\xb5\xce\xe7\x8c\xa5\xbd\x9c\xb0\xc4\xf6\xf9\xfe\xbd\xd2\xe8\xbe\
-\xd7\xf0\x7d\x96\xae\xba\xd2\xe9\x90\xa8\xc0\xfa\xfc\xff\xa7\xc0\
-\xd9\x69\x82\x9b\x98\xb1\xca\xbc\xd4\xeb\xc7\xe0\xf8\xcb\xe0\xf5\
-\xf1\xf7\xfe\xc0\xd8\xef\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
-\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x78\
-\xe0\x27\x8e\x64\x69\x7e\x5e\xea\x9d\xa4\xe7\x38\x98\xb0\x9e\xa9\
-\xf3\x3c\x41\x60\xa5\xa5\x27\x24\x1b\x8e\x62\xe0\x61\x10\x76\x23\
-\xdf\x0d\x32\x89\x78\x10\x9e\x1c\x65\xe6\x7a\x30\x15\xcf\xa7\xc2\
-\x20\x99\xa1\x04\x81\x8c\x47\x22\x09\x44\xb8\x5e\x14\x20\xe0\xd1\
-\x74\x2b\x0c\x44\x37\xb9\xf6\x10\x03\x15\x02\x86\x32\x28\x50\x13\
-\x39\x4f\x11\x16\x7b\x1d\x19\x0b\x5e\x1e\x09\x09\x04\x06\x16\x00\
-\x14\x0d\x05\x88\x3d\x1e\x07\x06\x08\x1a\x03\x88\x69\x2d\x17\x05\
-\xa0\x9d\x26\x2a\xa2\x2c\x2c\x21\x00\x3b\
-\x00\x00\x02\xec\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x7e\x49\x44\x41\x54\x18\x19\x95\
-\xc1\x4b\x48\x14\x61\x00\x07\xf0\xff\xce\x7c\xb3\xce\xb4\x6b\x28\
-\x22\xa6\xd2\x29\xf4\xd0\xa1\xa0\x3c\xe4\xc5\x83\x54\x60\x87\x0e\
-\xd1\x35\x08\x3a\x08\x45\x50\xd1\x25\xbc\x46\x9d\xea\x50\x64\x74\
-\x4a\x82\x22\xe8\x22\xdd\x04\x1f\x2d\x1d\xb2\x42\xe9\x81\x68\xf8\
-\x7e\xec\xb8\xbb\xa3\xfb\x9a\x9d\xf9\x9e\xb3\x5f\x7b\xd8\x83\x84\
-\x42\xfe\x7e\x31\xad\x35\x0e\xe3\xd1\x87\xe5\x3e\x4a\xd9\x44\x85\
-\x2b\x19\x52\x71\x25\xa6\xb5\xc6\x41\xde\xa4\x76\x89\x94\xb2\x83\
-\x89\x6a\x27\xe5\xa2\x35\xe4\xe2\x62\x0c\xfa\x96\x63\x69\x70\xa9\
-\xf0\x6b\x25\x4f\x09\x0e\x30\x32\xe5\x39\x5c\xa8\x09\xa9\xa2\x5e\
-\x19\x29\x54\x23\x89\x44\x3c\x86\xa4\x6d\x82\x09\x89\x6c\x81\x23\
-\xef\x87\x84\xe0\x00\x21\x95\xb7\x6d\x4b\xf7\xb6\x34\x99\xe0\x42\
-\x83\x49\x0d\xca\x25\xb6\xf3\x01\xe2\x26\xb0\xbc\x55\x80\x28\xd3\
-\x0b\x04\xfb\x78\x35\xbe\xd4\x5d\xaa\xe6\x1e\x1f\x25\xc7\x51\xf0\
-\x25\x76\x4a\x21\x28\x97\x08\xb9\x44\xa3\x6d\x62\x39\x5d\x82\x97\
-\x2d\x0e\x7f\x7e\x79\x35\x45\xb0\xc7\xc8\x94\xe7\x48\xa1\xde\x09\
-\xb1\x7a\x49\xb5\x4c\x18\x2b\x5e\x1f\x9a\x71\x02\x4e\xdc\x40\xb6\
-\xc0\x41\x99\x80\x19\xb3\x90\x71\xcb\x90\x65\x3a\x86\x1a\x82\xba\
-\xd7\x93\x39\xc2\x85\xfa\x69\x13\xdd\x65\x39\x27\xe1\xaf\xbb\x91\
-\xe8\x4c\x99\xd3\xb3\x32\x6a\x6d\x68\x33\x93\x36\x41\x2e\xcf\x11\
-\x37\x81\xa0\x1c\x40\x84\xcc\x43\x8d\x81\xba\x0a\x55\x1d\x4c\xc8\
-\xae\xa4\x63\xc0\x22\x55\x38\x0d\xe7\xcc\xf2\xef\x33\x32\x92\x72\
-\xe8\xcf\xc6\x72\xb4\xe1\x16\xd1\x74\x84\x20\x60\x1c\x61\x21\x84\
-\xac\xd0\x34\x6a\x0c\xd4\x85\x9c\x75\x0a\x21\x41\xb9\xc4\xa6\x57\
-\x41\x3c\x1e\x83\x93\xe8\xb6\x6c\x9d\x7b\xd8\x73\xfe\xab\x99\xf5\
-\x16\xe0\xba\x45\xac\x2d\x64\x10\x96\xfc\x45\x15\x09\x17\x35\x06\
-\xea\x2a\x01\x6f\x0d\x18\x47\xc8\x24\x42\x2a\xb0\xb6\xed\xc3\xb1\
-\x62\x68\x6b\x3e\x4b\x32\x3f\x9a\xd0\x33\x30\x0f\x77\x71\x49\x65\
-\x57\x73\xa3\x2a\xe2\xa7\xe7\x27\xef\x2b\xd4\x10\xd4\x95\x42\x76\
-\xa3\xbd\xc9\x42\x48\x05\x2a\x94\x83\x32\x09\xaf\x28\x61\x5b\x26\
-\xa0\xfb\x31\x33\xfa\x49\x45\x55\x71\x6a\x6e\xf2\xc1\x3c\xf6\x20\
-\xa8\xb9\xf9\x62\xe6\x5e\xa3\x63\x5c\x8e\x13\x03\x99\x42\x80\x84\
-\x6d\xc2\x32\x35\x1a\xac\x18\x84\x90\x58\xdf\xd8\x45\x2e\xdd\x3e\
-\x34\xfb\x71\x70\x1e\xff\x20\x83\xcf\xbe\xdf\x4d\xd8\xc6\x93\x44\
-\xdc\x00\x65\x02\x96\xa9\xb1\x9e\x2e\x61\x67\xc7\x07\xf5\x19\x98\
-\x4f\xc1\x7c\xfe\x45\x71\xf6\x1c\xfb\x20\x3e\xe5\x4f\xdb\x9a\x93\
-\xd0\x3a\xc2\x66\xd6\xc7\xa6\x5b\x44\xc1\x0b\x86\x95\x10\x63\x11\
-\xe7\x5e\xc4\x55\x5a\x09\xe9\xce\x8d\xdf\x51\xd8\x07\x29\xf9\x14\
-\x1b\xdb\x11\x4c\x68\xa4\xb7\x8a\x28\xee\xfa\xfd\xd3\x6f\xaf\x4d\
-\xe1\x3f\x11\x1a\xd0\x63\x2b\xf9\x52\x46\x85\x8a\x2a\xc6\x06\xbe\
-\xbd\xbf\x9e\xc2\x21\xfc\x05\x06\xd0\x87\xe2\x89\xeb\xae\x51\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x37\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x01\xc9\x49\x44\x41\x54\x38\xcb\x63\
-\xf8\xff\xff\x3f\x03\x25\x98\x81\x66\x06\x38\xb4\xdf\x70\x70\xee\
-\xbe\xd1\xea\xd9\x77\x6b\x8a\x73\xe7\xcd\x7e\x87\x96\x1b\x13\x1c\
-\x5b\x6e\xcc\xb2\x2a\xbe\xdc\x65\x94\x74\x86\x57\x2f\xfa\x24\x23\
-\x5e\x03\xec\x9a\xaf\x07\xe7\x2c\x7f\x74\x6f\xe2\x9e\x97\xff\xfb\
-\x77\x3d\xff\xdf\xbd\xfd\xf9\xff\xc2\x25\x8f\x7e\x3b\xd5\x5d\xdb\
-\xa6\x1f\x73\x9a\x8b\xa0\x0b\xac\x6b\xaf\xc9\x84\x4d\xbb\xbb\xab\
-\x78\xe5\xe3\x4f\xc5\x2b\x1e\x7e\x2d\x5c\xf2\xf0\xbb\x5d\xf9\xe5\
-\x19\x06\xf1\xa7\x39\x88\xf2\x82\x4d\xe5\x95\xf2\x82\x65\x8f\xbe\
-\xbb\x77\xdc\x5a\xeb\x5c\x77\x6d\x41\xd3\xba\x27\xff\xad\x72\xcf\
-\xcf\x24\x2a\x0c\x2c\x0a\x2f\x2a\x25\xcf\xbe\xf7\x28\x6e\xda\x9d\
-\xfb\xa6\x99\xe7\x43\x80\xb8\xa1\x66\xe5\xa3\xff\x56\x39\x17\x97\
-\x12\x34\xc0\x34\xeb\x02\xb3\x53\xc3\xf5\x55\x59\xf3\xef\x7f\x37\
-\x49\x3b\x9b\xa6\x1f\x7b\x92\xcb\x38\xf1\x4c\x47\xe5\xb2\x87\xff\
-\x5d\xaa\xae\x5e\x52\xf7\x3a\xc4\x86\xd7\x00\xb3\xac\xf3\x31\x19\
-\x73\xef\x7f\x0b\xea\xbe\x75\xd1\x30\xfe\xb4\x9f\x5e\xe4\x71\x2d\
-\xf3\xf4\xb3\x0b\xaa\x80\x06\x04\xb7\xdd\xf8\xa4\xea\xb6\x9f\x17\
-\xa7\x01\x46\xc9\x67\x44\xe3\x26\xdf\x7e\x55\xb9\xfc\xd1\x7f\xaf\
-\xe6\x1b\x97\xad\xb2\xce\x6f\xb2\xcc\x38\xb7\xd5\xb5\xea\xea\x8d\
-\xc6\x15\x8f\xff\x87\xb5\xdd\xfc\xa9\xec\xb8\x4f\x1a\xab\x01\x06\
-\xb1\xa7\x19\xed\x4b\x2e\xcf\x06\xf9\xd5\x3c\xed\x0c\x4a\x60\x99\
-\x27\x9f\xd9\x58\xbe\xe0\xfe\xff\xa8\xce\x5b\xff\x95\xec\x76\x2b\
-\x61\x18\xa0\x1f\x73\x8a\x0b\x18\x3d\x2e\xa5\x4b\x1e\xfe\x8f\xe8\
-\xb9\xf5\x46\x27\xe8\x98\x2d\x4c\x81\x8a\xeb\x7e\x61\x75\x8f\xc3\
-\xf5\xd9\xd3\xee\xfc\x4f\xe8\xbf\xfd\x5f\xd1\x7e\x6f\x88\x9c\xc5\
-\x36\x26\x14\x03\x2c\x32\xce\xad\x8b\xed\xbf\xf5\x2f\x61\xc2\xed\
-\xff\x01\xcd\xd7\xdf\x6a\x07\x1c\xe9\x55\x76\xda\x2b\xa0\x64\xbf\
-\x47\x4b\xdb\xf7\xf0\x22\xa7\xc2\x0b\xaf\x02\xeb\xae\xfd\xf7\xad\
-\xb9\xfa\xdf\x30\xf4\xd8\x5e\x59\xcb\x6d\x86\xb4\xcf\x0b\x74\x33\
-\x00\x00\x25\x4f\xaf\xa6\x63\x18\x7c\x67\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x1c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\xae\x49\x44\x41\x54\x38\xcb\x95\
-\x92\xcb\x4b\x94\x51\x18\xc6\xdf\xef\x3a\xf3\x79\xb7\x70\xf0\x56\
-\x92\xa8\x90\x1b\x17\x41\xa0\x44\x1b\xe9\xb6\x29\xe8\x3f\x10\xca\
-\x45\xd0\xca\x42\x30\x70\xd9\x32\x82\x96\x05\x49\x0b\x09\x94\xc8\
-\xc0\x4a\xc9\xd0\xca\x4b\xd4\xc2\x30\x4d\xad\x46\x1b\x35\x71\x9c\
-\x19\xe7\xbb\x9d\xf3\x9d\xdb\x7c\x1d\x07\x8a\x20\x15\x3a\xf0\x6e\
-\x0e\xe7\xf9\xbd\xef\xfb\x9c\x47\x09\xc3\x10\x0e\x3a\x03\xd3\xb6\
-\x4e\x05\xaf\xa6\x54\xd4\xe0\x80\x57\x20\x42\x9b\x64\xdd\xf6\x31\
-\x1d\x73\x11\xb9\xa4\x1c\x04\x78\x3c\x99\xb5\xa4\x70\x8c\x0b\xd6\
-\x4a\x99\x00\xc6\x39\x08\x4e\xc1\x8a\xa8\x90\x48\xba\xf0\x7d\xd3\
-\x7b\xa9\x1f\xd4\x1d\x13\x7a\xdd\xd4\xc2\xd6\xd2\x02\x15\x08\xcb\
-\x01\xa1\x8a\xbc\x53\xc1\xf6\x09\x44\x0d\x05\xd2\x59\xa7\x7d\xdf\
-\x09\xee\x8f\x6c\x9a\x3e\xe1\x76\x55\x99\x11\xc5\x84\x40\xca\x09\
-\x76\x81\xe0\x07\x1c\x8a\x2d\x0d\x16\x57\xd3\xf0\x63\x6d\xe7\xa6\
-\xba\x5f\xf7\xab\xe7\xaa\xa8\x83\xf0\x9d\xd5\xa4\x23\x45\x14\x22\
-\x72\xd6\xac\x47\xc0\x76\x11\x78\x08\x43\x26\xe5\x01\xb5\xfd\xe5\
-\x7f\x56\x78\x34\x91\x3e\x2a\xe2\xcf\x7a\x19\x63\x5a\x6f\x67\x67\
-\x47\xe7\xdd\x19\xec\x60\x7e\xab\xb2\xdc\x8c\x16\x47\x55\xd8\x4c\
-\x05\xa0\xa9\x11\xf0\x6c\x09\x70\xd1\xf6\x9f\x15\xfa\xdf\x65\x2c\
-\x69\x54\x3f\xb3\xd7\x2f\x1c\x89\x6e\x45\x0c\xc3\x80\xd9\xd9\xd9\
-\xbe\xae\xae\xae\x8e\x33\xdd\xcf\x4f\x71\x4c\x46\x6b\x63\xc5\x56\
-\x61\x91\x21\xfd\x60\x30\x37\x15\x87\xc0\x45\x75\x79\x80\xec\xaa\
-\xcb\x8e\x0b\x11\x43\x69\x84\x50\xc0\x66\x7c\x96\x37\x94\x13\x7d\
-\x7e\x7e\xbe\x0f\x63\x7c\x45\x56\xe9\x4c\xe6\x64\x33\x0b\x82\xd1\
-\xca\x9a\x12\xcb\x4d\xfb\x90\x4c\xa4\xbe\xe6\x72\xb4\x39\xef\x01\
-\x0e\x68\x35\x26\xbc\xb1\xc0\x04\xd0\x94\x1c\x18\x87\x9b\xf4\xb7\
-\x2b\x26\x5d\x36\x4e\x3f\x94\xe2\x07\x08\xa1\xa9\xc6\xf0\xc5\x37\
-\xe6\xa2\xb3\x2b\x9f\x12\x68\x2b\xb1\xf5\x94\x8b\xa0\x65\x71\xbc\
-\x9b\xe7\x3d\xf0\x10\xad\x01\x10\x12\x14\xc2\x46\x1a\x41\x61\x54\
-\x01\xeb\x50\x8d\xc9\x96\x3e\xbf\xaa\xaf\xaf\x37\x62\xb1\x18\x0c\
-\x0e\x0e\x8e\xd7\xe9\x23\x6d\x4b\x7e\xdb\x71\x29\x4c\xfc\xf6\x2c\
-\x0f\x70\x31\xae\xd0\x14\x90\x6e\x87\x12\x16\x40\x72\x87\x41\x69\
-\x81\x0e\xb5\xc7\x1a\x8c\xc9\xb9\x37\xd0\xe2\xc5\x81\x10\x32\x3d\
-\x34\x34\x94\x91\xcf\x33\x7f\x9b\x9e\x07\xd8\x2e\x6e\x2a\xb2\x54\
-\x90\x5a\x70\x10\xd9\x5d\x09\xb6\x32\x14\xa2\xba\x06\x56\xed\x09\
-\x18\x7e\x3f\xcd\xb8\x68\xb9\xb6\xd7\x77\x6b\xdb\xb1\x8b\xa6\xcc\
-\xf4\x58\x45\x99\xa9\x39\x7e\x00\xa6\x1c\x45\xea\x40\x57\x15\x10\
-\x39\x01\x89\x95\x6d\xf9\xe7\x61\xcf\xc7\xe1\xee\x89\xbd\x00\x7a\
-\xd6\xc5\x5e\x49\x81\x6a\x08\x99\x73\x1f\x13\x58\xdb\xb0\xc1\xdd\
-\xf1\x01\x7b\x01\x04\x32\x38\xd8\xf1\xa7\x85\x10\xf7\xf6\x0b\x9c\
-\x9e\xf5\xd0\x98\x1a\x1a\xe7\x17\x52\x2e\xac\xaf\x67\x18\xf3\x83\
-\x1e\x41\xf9\xb2\x08\xe8\x36\xa7\x74\x43\xe4\xf8\xcf\x2f\xaf\x6f\
-\xf0\x7d\x01\xc8\x45\x97\x9d\x24\x7b\x22\x83\xd2\xce\x31\x2d\xfa\
-\x30\xd0\x41\xe1\x3f\xce\x2f\x64\xab\xaa\x6f\xee\xc8\x5e\x97\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x0a\
-\x47\
-\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\x69\xba\xfe\x27\
-\x53\x77\x8c\x93\x98\x5f\xaf\xf1\x76\xb7\xec\xab\xd6\xfa\x5c\xa1\
-\xdc\xa1\xc9\xeb\x66\xaa\xe3\x57\x9e\xd9\xb5\xd9\xf7\xc9\xe6\xff\
-\x69\xad\xe5\x6d\x82\x93\x95\xcd\xfc\x2d\x5c\x84\x46\x62\x7a\x1a\
-\x3c\x59\x75\xc0\xff\x61\xa7\xe0\xfd\xfd\xfd\x6f\xb2\xe9\x5f\xa5\
-\xde\xa8\xcf\xf0\xd8\xed\xfe\x5c\x76\x8b\x3c\x4f\x60\x6c\xaf\xe7\
-\x53\x9a\xd4\x42\x56\x67\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
-\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x87\
-\xe0\x27\x7e\x5e\x69\x7a\x63\x4a\x42\x42\xdb\x34\x10\xaa\x7a\x19\
-\xb6\x2c\x85\xa3\x3f\xb2\x48\x63\x84\x20\xa1\x52\x61\x48\x78\xbe\
-\x0e\xb0\x72\x31\x5d\x10\x08\x49\x04\xe5\xe9\x28\x08\x1b\xcf\x85\
-\x81\xf0\x4c\xa2\x1d\xaa\xb5\xb2\xd9\x42\xbd\x13\x40\x98\x64\xdd\
-\x30\xb8\xa5\x83\xc1\x02\x98\xb2\x15\x50\xc4\xc1\x23\x9f\xd7\xc5\
-\x05\x5f\x13\x16\x06\x85\x09\x06\x7f\x6c\x0e\x09\x83\x7b\x07\x09\
-\x09\x1c\x89\x24\x1a\x04\x91\x1c\x98\x98\x00\x01\x3d\x94\x04\x00\
-\x03\xa1\x03\x9b\x1e\x14\x33\x1a\x0f\x0f\x01\x01\x0f\x53\xa6\x2a\
-\x24\x27\x25\xb0\xb4\xb5\x21\x00\x3b\
-\x00\x00\x01\x26\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x04\x00\x00\x00\xb5\xfa\x37\xea\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\xb8\x49\x44\x41\x54\x28\xcf\x75\
-\x91\x5b\x0e\xc2\x20\x10\x45\xa7\xae\xc3\x26\xee\x81\x86\x7d\x9a\
-\xe8\x87\x1b\xd4\xf8\x8a\xb5\x4f\x28\xd4\xeb\x40\x5f\xd6\x96\x9c\
-\xe1\x87\x39\x61\x2e\x19\x02\xd1\x96\x04\xc9\x3f\x76\xb4\x01\x39\
-\x5c\x09\x95\x9a\xd6\x62\x42\xe1\xb0\x1f\x14\x57\xd2\xb4\x05\x4a\
-\xcf\x1b\x2f\x5c\x59\xb9\xe0\xd8\x2b\x44\x11\x49\x8b\x1a\x9a\x4f\
-\x8d\x1c\x29\x6e\x2c\x54\x28\x70\x62\x65\x14\xb4\xa7\xe6\x46\x86\
-\xfb\x38\x8a\xb3\x44\xbd\x60\xfc\x85\xe1\xe9\x6e\xcc\x83\x5f\x39\
-\xcf\x85\x81\x4e\xc9\x38\xc9\x73\x5d\xe8\x94\x8a\xb3\x64\x21\xc1\
-\xa2\xe1\x34\x15\x13\x14\x8c\x0f\xac\xd6\x04\xe3\x69\x18\x15\x16\
-\x9a\x91\xc0\x2f\x26\x7e\x85\xcf\x3c\x45\x4f\x4b\xb2\xdb\x45\xa2\
-\x4b\xdb\x2e\xdb\x3a\x27\xd1\x09\x31\x25\x8b\x75\x3b\x04\xc5\xa0\
-\x2f\x32\xa5\x5b\xf0\xae\x79\xb6\x4f\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x01\xfc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x01\x8e\x49\x44\x41\x54\x38\xcb\x95\
-\x93\xcd\x6a\x93\x41\x14\x86\x9f\x49\xd3\xaf\xb5\xb1\x60\x4a\x2d\
-\x5d\x44\x41\x2d\x82\xe0\xd2\x9d\x37\xd2\xb5\xb8\x16\xf4\x0e\xb2\
-\xf4\x12\x02\x8a\x77\xe4\x46\x8b\x11\x17\x0d\x66\x13\x90\x68\x4b\
-\x8a\xcd\xcc\xf9\x73\x11\xf3\xab\x62\x32\x70\x38\x67\xf3\x3e\xf3\
-\xbe\x87\x99\x14\x11\x6c\x7a\xce\xde\xbe\x78\xed\x6e\xaf\xcc\x74\
-\x54\xdf\x44\xf8\xe9\xdd\xcb\x2f\xee\x76\x52\xdd\x3e\xe6\xbc\x77\
-\xc6\x41\xad\xd2\x19\xa0\xdd\x6e\x87\xbb\x33\x2d\x33\x9b\xf5\x67\
-\x8f\x83\x1a\x4e\x75\x78\xcc\xcd\x7b\x27\xb8\x39\x71\xfe\x01\x91\
-\xcc\x0c\x60\x66\xb4\x5a\x2d\x00\x52\x4a\x4b\x3d\xe2\x23\xcd\x27\
-\x4f\x81\x44\xbe\x1a\x62\x92\x89\x70\x44\x74\x19\xb0\x2a\x9e\xce\
-\x66\x86\x9b\x51\x46\x03\x4c\x0b\x50\x23\xdc\xfe\x74\xb0\x28\x5a\
-\x9c\x55\x0b\x6e\x82\x69\xc1\xb5\x00\x89\x70\xa7\x94\xf1\x1c\xa0\
-\xaa\xff\x04\x98\x16\x42\x15\x97\x32\x71\x10\x13\x80\xca\x98\xda\
-\xdf\x1c\xac\x96\xfc\xbe\xd9\x24\x13\x72\xcd\x51\xb3\x47\x84\x52\
-\x4a\x9e\x03\x16\x1d\xac\x3a\x11\x29\x98\x2a\x56\x32\x8d\x1b\x3f\
-\x38\xb8\x35\x64\x7b\xeb\x1a\x91\xff\x44\x98\x03\xc6\xb8\x66\x4c\
-\x32\x17\xdf\xb7\x70\x3d\x24\x97\xc1\xf2\x12\xa7\x80\xd5\xfc\x29\
-\x25\x4a\xc9\xb8\x0a\x2e\x19\x13\x61\x98\xeb\xe0\x8e\x48\x59\x0f\
-\xa0\x32\x9e\xec\x40\x05\xd3\x4c\x4a\x75\xdc\x1d\xd5\x35\x01\x45\
-\xf2\x44\x2c\x19\x97\x42\x4a\x4e\xc4\x06\x00\x91\x49\x84\xbd\xe6\
-\x1d\x5c\x05\xcd\x3f\x21\x06\x98\x29\xa9\xd3\xe9\x44\xb7\xdb\xa5\
-\xdf\xef\x2f\xbd\xff\xc5\x7e\x7a\xbf\x47\x63\x7f\x9f\x9d\xdd\x06\
-\xd5\xee\x1e\xdb\xd5\x0e\xa3\xab\x0b\xbe\x7e\x7e\xff\x2d\xad\xf3\
-\x9d\xdf\x3c\xbf\x7b\x64\xa6\x0f\xcc\xe4\x91\x99\x3e\x74\xb7\x56\
-\xad\x5e\x9d\x9a\xe4\xcb\x5f\x46\x70\x4f\xed\x22\xbf\x10\x87\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xf8\
-\x47\
-\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\xb9\xe2\x93\x66\
-\x97\x42\xfe\xfe\xfd\xd3\xee\xb7\xbd\xe5\x95\xb7\xda\x95\xad\xcb\
-\x99\x6e\xa0\x49\x6a\x9d\x43\x67\x98\x44\x6a\x9a\x48\xb7\xdc\x93\
-\x9e\xbc\x89\x8a\xd4\x40\xde\xf2\xcc\x5e\x91\x3c\xb4\xd7\x95\x88\
-\xd4\x3f\xc5\xf0\x99\x87\xd0\x40\xb6\xd8\x97\x88\xd1\x40\x68\x9a\
-\x42\xc3\xee\x98\xd6\xf2\xbb\xb9\xe0\x94\xd3\xf3\xb0\xb5\xd8\x95\
-\xfe\xfe\xfe\x50\x87\x2b\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
-\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x75\
-\xe0\x27\x8e\x5e\xe9\x89\xe5\x48\x7a\x4a\x10\x28\xe5\x73\xaa\x9c\
-\x83\x60\x03\x86\x1d\x46\x97\x8a\x1c\x4f\x67\x00\x00\x54\x1a\x0b\
-\x8c\x6f\x56\xea\x30\x3a\x50\xca\x24\x42\xf0\x71\x80\x42\x8b\xa9\
-\x73\x21\x64\x96\xa4\x84\x27\x08\x2d\x83\x4d\xe8\xb4\xe9\xd3\x34\
-\x5b\x3d\xe2\x55\x47\x73\x91\x2c\x3d\x16\x2b\x4a\x28\x89\x4c\x28\
-\x65\x4f\x3f\x4d\x12\x0b\x0d\x15\x45\x10\x3e\x02\x72\x06\x07\x05\
-\x05\x1b\x10\x0a\x0e\x57\x2a\x1e\x32\x2c\x2e\x30\x33\x97\x4c\x6b\
-\x2a\xa1\xa2\xa3\x21\x00\x3b\
-"
-
-qt_resource_name = "\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x10\
-\x06\x0f\x8c\xe7\
-\x00\x6d\
-\x00\x6f\x00\x62\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x70\x00\x68\x00\x6f\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x06\x68\x0f\xa7\
-\x00\x62\
-\x00\x75\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x5f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x08\x65\xa0\xf6\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x73\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x67\x00\x69\x00\x66\
-\
-\x00\x0b\
-\x0b\x73\x9d\xc7\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\x57\x5a\xe7\
-\x00\x66\
-\x00\x6f\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x0a\x93\x87\x07\
-\x00\x64\
-\x00\x69\x00\x73\x00\x63\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0b\x9e\xc7\x56\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x69\x00\x6e\x00\x66\x00\x6f\x00\x2e\x00\x67\x00\x69\x00\x66\
-\x00\x0e\
-\x0f\x12\x91\x27\
-\x00\x70\
-\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x77\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x00\x8c\x5a\x27\
-\x00\x64\
-\x00\x6f\x00\x6f\x00\x72\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x0d\xa0\xf7\x36\
-\x00\x61\
-\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x72\x00\x65\x00\x66\x00\x72\x00\x65\x00\x73\x00\x68\x00\x2e\x00\x67\x00\x69\
-\x00\x66\
-"
-
-qt_resource_struct = "\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x02\
-\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x3e\xf4\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x37\x61\
-\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x31\xd4\
-\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x33\x72\
-\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x39\x9c\
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x34\x71\
-\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x3c\xbc\
-\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x40\xf4\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x3d\xca\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created: Fri 22. Jan 09:26:40 2010
+#      by: The Resource Compiler for PyQt (Qt v4.5.3)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt4 import QtCore
+
+qt_resource_data = "\
+\x00\x00\x31\xd0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\
+\x25\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\
+\x30\x00\x00\xea\x60\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\
+\x46\x00\x00\x31\x56\x49\x44\x41\x54\x78\xda\xec\x7d\x59\x90\x63\
+\xd7\x79\xde\x77\xce\xb9\x2b\x70\x01\x34\x7a\x9f\xe9\x9e\x95\x33\
+\x24\x67\x86\x43\x8a\x12\x29\x52\x32\x25\x92\x52\xb9\x62\xd9\xda\
+\xed\x17\xab\x1c\xd9\x49\x6c\x95\x2a\x29\x3b\x4e\x39\x8e\x93\x4a\
+\xa5\x62\x3b\x7e\xc8\x52\xb1\x63\x3b\x4e\x52\x2e\xc7\x6b\x52\x8e\
+\xcb\x65\x5b\xb6\x16\x5b\xa2\x29\x8a\xa2\x48\x71\x95\x48\x0e\x77\
+\xce\xda\xd3\xb3\xf4\xf4\x8a\xf5\x6e\x67\xc9\xc3\x39\xf7\xe2\x02\
+\x0d\x60\x28\x4a\x0f\xa3\x2a\x5c\x16\x38\x68\x74\x37\x80\xc6\xff\
+\x9d\x7f\xf9\xfe\x8d\x28\xa5\x70\xa3\x5d\x69\x9a\x62\xfd\xda\x35\
+\xa4\x42\xe1\xda\xfa\x06\x08\x14\xe2\x94\xa3\x1b\x0b\x30\xc7\xc7\
+\xb5\xed\x0e\x5c\xc7\x41\x94\x70\x74\xc3\x18\x37\xed\x5b\xb0\x9e\
+\x7d\xf9\xcc\xfc\xbb\x4e\x1c\xde\xfb\xe8\x93\x2f\x1e\xbd\xeb\xf6\
+\x9b\xf7\xbc\x7e\xf6\xe2\x2d\x29\x17\xf3\xfb\x16\xea\x33\xdb\x3b\
+\xcd\xc5\x44\xa8\x2a\xb3\x5c\x9b\x32\x46\x00\x05\x28\x00\x50\x20\
+\x84\x82\x10\x02\x42\x29\x04\xe7\x48\xd3\x14\x29\x17\xe0\x9c\xe7\
+\xff\xc6\x71\x22\x13\x2e\x62\x8b\xd1\x70\xaa\x52\xda\x4a\x52\x7e\
+\xed\xf4\xb9\xd5\xce\xc1\xe5\xb9\x6b\xb7\x1e\x39\x74\xee\xa1\x6f\
+\x7c\x6b\x67\xdf\x8c\xb3\x75\xec\xa6\xfd\x6f\x9c\x3a\xf5\xf2\xfa\
+\x47\x3f\xf4\xfe\x8d\x17\x5e\x78\x49\xc5\x71\x02\x9b\x01\x7b\xf7\
+\x2c\xa0\x54\xf2\xf1\xfe\x07\x1e\x44\x10\x04\x37\xd4\x67\x4d\xbe\
+\x1f\x00\x40\x09\xb4\xb0\x63\x01\x30\xc7\xda\xd8\xe9\x1c\xf2\x1c\
+\x76\x3c\x8c\x92\x3b\x7d\x9b\xbe\xc3\xf3\x9c\x9b\x14\x8f\x0f\x94\
+\x4a\xa5\x8a\x45\x04\xa0\x14\x7c\xcf\x01\x94\x84\x14\x02\x96\xc5\
+\xc0\x18\x05\xa3\x5a\xd8\x94\x10\x2d\xf4\xec\x46\x09\x08\xa1\xa0\
+\x94\xea\x9f\x63\x16\x2c\xdb\x06\x25\x14\x84\x52\x80\x50\xc4\x29\
+\x47\x1c\x27\x68\xb5\xda\xd8\xda\x6e\xa0\xd5\x8d\xd0\x68\x75\x70\
+\xe9\xca\x06\x22\x0e\x6c\x34\x22\x5c\xd9\xe8\x48\xc7\xa2\x3b\x15\
+\x8f\x5e\xb0\x54\xfc\x52\xc9\x51\x8f\x4f\x07\xf4\x6b\xc7\x6f\x3e\
+\xf4\xba\x5f\x2a\xe3\x07\xee\x7b\x1f\x82\x4a\x65\x02\x80\xb7\x02\
+\x80\x8d\xf5\x75\xa4\x42\x61\xed\xda\x7a\x5d\x49\x71\x52\x2a\xdc\
+\x1d\xc7\xc9\xbb\xa4\x54\xef\x22\x10\x07\x94\xe0\xae\x52\x02\x82\
+\xa7\x10\x42\x40\x70\x01\xa9\x24\x40\x08\xa4\x94\x20\x84\xc0\xb2\
+\x6c\x58\x96\x05\xc6\x2c\x78\x9e\x07\xc7\xb1\xa1\xcc\xc9\x97\x52\
+\x82\x73\x01\xce\x53\xa4\x69\x8a\x24\x8e\x21\xa4\x84\x52\x0a\x71\
+\x1c\x43\x49\x09\xdb\xb6\xc1\x18\x33\xc0\x60\x28\x97\xcb\xf0\x7d\
+\x1f\x95\x6a\x05\xb5\x6a\x15\xb6\x6d\xa3\xd9\x6c\xe2\xc2\xf9\xf3\
+\xd8\xda\xde\xc1\x85\x2b\x9b\x78\xf4\x85\x35\xa4\xa4\x04\x91\x24\
+\x50\x3c\x85\xe2\x21\x3f\xb4\xe0\x3e\xf2\xee\xdb\x96\x7e\xf1\xd3\
+\x3f\xf5\x8f\x5e\x70\x3d\x6f\x02\x80\xeb\x5d\x82\x73\x5c\xbe\x7c\
+\xf9\xae\xed\x9d\xc6\x2f\x34\x76\x76\x7e\x30\x49\xe2\x99\x38\x8e\
+\x90\xa6\x09\xa4\x90\x20\x94\xc0\x62\x16\x6c\xc7\x81\xeb\x79\x28\
+\xf9\x25\x23\x60\x07\x9e\xe7\xc1\xf3\x7d\xb8\xae\x0b\xdb\xb6\xf3\
+\x1b\xa5\xb4\xff\x35\x84\x30\x37\x0e\xce\x39\x84\x10\x48\x39\x07\
+\x4f\x0d\x20\x92\x04\x49\x9c\x20\x4e\x62\x44\x51\x84\xa8\x1b\x22\
+\x49\x13\x84\xdd\x2e\xa2\x28\x02\x65\x0c\xf3\x73\x73\x38\x7c\xd3\
+\x11\x50\x4a\xf1\xf2\xcb\x2f\x43\xf2\x18\x4f\x3e\xf7\x12\xbe\xf9\
+\x66\x0c\xdb\xf6\x20\xd2\x04\x9c\x73\x34\x9b\x6d\x38\xc9\xd5\xad\
+\xff\xfa\x6b\x3f\xf7\xc0\xd1\x9b\x6f\x39\x35\x3d\x3d\x33\x01\xc0\
+\xb8\x6b\xf5\xe2\xc5\x7f\xf9\xea\xab\xaf\xfe\xa7\xed\xed\x2d\x4a\
+\x08\x72\x21\xfb\xa5\x12\xfc\x4c\xb8\x96\x39\x9d\xac\xa7\xd6\x29\
+\x65\x60\xac\x77\x0b\x82\x00\x96\x65\x21\xe5\x1c\x9e\xeb\x02\x84\
+\x40\x08\x01\x62\xb4\x44\x18\x86\x90\x52\x14\xc0\xd0\xbb\x49\x29\
+\x0b\x37\x05\x55\xf8\x5a\x48\x89\x24\x8e\xd1\xed\x76\x11\x45\x21\
+\x0e\x1e\x3a\x04\xce\x39\xde\x78\xfd\x0d\xb4\x9b\x3b\xf8\x7f\x5f\
+\x79\x09\xd2\x99\x85\x4c\x63\x08\x9e\x22\x4d\x52\x6c\xad\xaf\xe3\
+\xbd\x27\x2a\x7f\xf2\x99\x7f\xf2\xa9\x9f\x7a\xe7\xdd\xf7\xca\x1b\
+\xe5\xb3\xa6\x37\x92\xe0\x3b\xed\x36\xae\x5e\xb9\xf2\xe1\xe7\x9e\
+\x7b\xf6\xbf\x5c\xbc\x78\x81\x5a\xb6\x85\xb9\xf9\x05\x2c\x2d\x2d\
+\x63\x76\x6e\x2e\x17\xa8\x52\x0a\xdc\x9c\xdc\xec\xf4\x0a\x23\x9c\
+\x0c\xd0\x9e\xef\xe3\xe1\xbf\x7f\x08\x9f\xff\xfc\xdf\xc0\xf3\x3c\
+\xfc\xd6\x6f\xfe\x06\xfe\xf6\x8b\x5f\x00\x63\x0c\x7f\xf4\x07\xbf\
+\x8f\xff\xfb\x27\x7f\x04\xdf\xf7\xc7\xbe\x1f\xa5\x14\x94\x54\x39\
+\x48\xb8\xe0\x48\x79\x0a\x9e\xa6\x50\x4a\xc1\xf7\x7d\xd8\xb6\x83\
+\x95\x95\x15\x04\xe5\x00\xb6\x6d\x23\x08\x02\x54\x7c\x0a\x21\xb4\
+\x8c\x15\x00\xa5\x24\x5c\xbf\x84\xf3\xab\x9b\xef\xed\x74\x3a\x87\
+\x6f\xa4\xcf\xfc\x86\x02\xc0\xce\xce\xf6\xfd\x2b\x2b\x2b\xff\x6c\
+\x63\x7d\x03\xbe\x5f\x82\xeb\xb8\x50\x4a\xf5\x9d\xca\xb7\x7a\xd9\
+\xb6\x8d\x57\x5e\x79\x19\x2f\x3c\xff\x6d\x00\x40\x14\x45\x48\xd2\
+\x04\x00\x90\x24\x31\x92\x24\x01\x08\xf9\xae\xde\xaf\x94\x12\xb6\
+\x6d\x21\x4d\x12\x80\x00\xae\xeb\x82\x50\x0a\x25\x12\x23\xfa\x0c\
+\x49\x80\x65\x59\x68\xb4\x93\xc5\xff\xf6\xdf\x7e\xe3\x86\x02\x80\
+\x75\x23\xbd\x99\x6b\xd7\xd6\xdf\xdb\x68\xec\xbc\x43\x2a\xed\xc4\
+\x7d\x37\xe6\xa9\xdd\x6e\xe3\x67\x3e\xf3\x59\x30\xc6\x90\xc4\x31\
+\x7e\xf1\x97\xfe\x0d\x88\x31\x01\x3f\xfd\x99\xcf\x42\x4a\x89\x28\
+\xec\x7e\xf7\x36\x94\xd0\xfc\x7d\x5a\x96\x05\x02\xc0\x66\x14\x2a\
+\x95\x20\x80\x31\x4d\x3a\xda\x08\xa3\xa4\xbc\xb8\xb8\x77\x6a\xa2\
+\x01\x46\x5c\x2b\x17\x2e\xdc\xd2\xed\x76\xe7\xbf\x27\x4f\xa6\x14\
+\x28\xa5\xa0\x8c\x41\x29\xd5\xa7\x3d\x84\xd0\xf1\x3d\x40\xbe\x47\
+\x2f\xa5\xa0\xcc\xeb\x11\x13\x4a\x2a\x28\x50\x42\xd0\xea\x76\x71\
+\x79\x63\x53\xbf\x07\x45\x70\xdf\xfb\x1f\xa8\x4c\x00\x30\x4a\x6d\
+\x3b\x8e\x05\x90\xef\xd9\x7b\x92\x46\x30\xdf\xd3\x0f\x8c\xd0\x3e\
+\xdc\x68\x4d\xa5\x41\x00\xa2\xbf\xcf\x28\x01\x01\x90\xa4\x1c\xd7\
+\xb6\x76\x10\x09\x81\x24\x4d\x41\x99\x85\x2b\x57\xae\xfa\x13\x13\
+\x30\x56\xa5\x0e\x7b\x8c\xe8\xd3\x3c\x70\xcb\xa2\x00\xfd\x35\x83\
+\xc5\x18\x2c\xcb\x82\x65\x59\x3a\x86\x2f\xdc\x27\xe6\x89\xb3\x08\
+\x21\xd3\x02\x99\x7a\xce\x6e\xc5\xd7\xd4\x1e\x1c\xa0\x0c\x73\xa8\
+\x94\x02\x57\xbc\xcf\xbc\xe7\x46\x3e\x7b\xf3\x54\xff\x2e\x01\x41\
+\x27\x0c\x71\xe4\xe6\xa3\x48\xda\x2d\x6c\x6f\x6c\x81\x12\x8a\x66\
+\xa3\xe1\x4d\x00\x30\x46\x6d\x0f\x1e\x58\xa5\x14\xe2\x28\x86\x74\
+\x24\x28\x21\x80\x11\x14\x25\x44\xab\x70\xd2\xfb\x5d\x7d\x97\x18\
+\x10\x91\x82\x23\xa6\xf2\xe7\xd2\x91\x83\x30\xd1\x03\x37\x3c\x80\
+\xf9\xda\x44\x15\xdc\x3c\x26\x04\x87\xe0\xda\xfb\xd7\x8e\xa8\x42\
+\x9c\xa6\x98\x9d\x9d\xc5\x89\x13\x27\x20\x93\x7e\xa7\x54\xbf\x23\
+\xfd\x9f\x54\x12\xae\xe7\x62\x6e\x7e\x1e\xab\xcd\x06\x28\x01\x40\
+\x18\x1a\x8d\xe6\x04\x00\x23\xe5\x3f\x20\xfe\xcc\x69\xbb\xbc\x7e\
+\x19\x57\xaf\x5c\x46\x1c\x76\xa0\xa4\xec\x8b\x0a\xb8\x10\x10\x42\
+\x42\x48\x05\xa1\x14\xb8\x90\x10\x42\x82\x4b\x69\x1e\x37\x5f\x0b\
+\x01\x31\x10\x32\x0a\x29\x21\xcd\xcf\xe4\x31\xbf\x90\x26\xec\x33\
+\x61\xa5\x79\x3d\x29\x25\xa2\xe6\x26\x6e\xb9\xe5\x28\x3e\xf4\x23\
+\x1f\x06\x19\xe2\x3f\x10\x64\xd4\xb2\x06\x9b\x65\x08\x28\xa5\xb4\
+\x06\x21\x84\xa0\x31\xd1\x00\x63\x00\x20\xd5\x50\xf5\x2f\xd2\x04\
+\x8f\x3e\xf5\x3c\x56\xe7\xde\x0b\x10\x06\x99\x26\x50\x52\x41\x29\
+\x09\xa9\x00\x45\x28\x24\x28\x24\xa1\x50\x20\x50\xa0\xfa\x31\x05\
+\x28\x42\x20\x2d\x02\x6a\x11\xd8\x0e\x00\xa9\xa0\x8c\x72\x50\x0a\
+\x50\x32\x57\x20\xfa\x41\xd9\xd3\x3c\x30\x82\x83\x54\x00\xb5\xd1\
+\x7a\xf2\xbf\x63\x5f\x6b\x07\x96\x65\x0d\x2a\x2e\xe8\xc4\x12\xd1\
+\xf9\x03\x42\xcc\x83\x03\x20\x21\x14\x9d\x4e\xd7\x99\x00\x60\xa4\
+\x06\xc0\x50\x8f\x8d\x40\x81\xb8\x25\x24\xb5\x43\x20\xd4\x32\x1f\
+\xae\x82\x54\x3d\xb3\x41\xa0\x40\xa4\x16\x7f\xe6\x95\x13\xf3\xaf\
+\x0b\x02\x07\x14\x44\xf6\xbe\x07\x03\x20\x0d\x3a\x4d\xf8\x40\x49\
+\x03\x08\x95\x03\x0c\xca\x00\x93\xda\xb0\x6c\x17\x94\x92\xa1\xd1\
+\x43\x2e\x6f\xaa\x35\xc1\xa0\xf8\xb3\xaf\x85\x14\x64\x02\x80\x31\
+\x3e\x00\x19\x87\x0e\x9e\x80\x32\x59\x10\x70\xbf\x83\x56\x0c\xc9\
+\x32\x63\xe2\x82\xc2\x26\x80\x92\xa2\x70\xaa\x07\x6e\x45\x75\x90\
+\x69\x82\xe2\xd7\x4a\x42\x49\xda\x13\x23\x19\xe1\x04\x1a\x8d\x45\
+\x28\x19\x01\x65\x40\x49\x35\x01\xc0\x38\x19\x2b\x40\x0d\x0f\xd0\
+\xf5\x77\xb3\x53\xaf\xb5\xb5\x11\xb4\x52\x46\x4e\x5a\xf8\x12\x00\
+\x23\x04\x1e\x65\xa0\x4a\x87\x83\x6f\xfb\x0d\x49\x05\xca\x28\xdc\
+\xa0\x84\xd0\xb6\x0c\x48\x87\xcb\x90\x14\xfe\xcb\xfe\x0c\x32\x10\
+\xd6\x48\x29\x27\x00\x18\xcb\xa8\x8c\x89\x0d\x33\xb5\x0e\x23\x64\
+\x25\x8d\xe0\xcd\xff\x32\x41\xbb\x94\xc1\xa1\xcc\x00\x43\xf5\xc5\
+\x03\xdf\x09\xb1\xc3\x6c\x06\xcf\x77\xe0\x78\x0e\xa8\xe3\x63\x8b\
+\x1a\xd5\x3e\x4a\x84\xc4\x68\x00\x82\x91\x30\x9e\x00\x60\x7c\x14\
+\x00\x80\xa8\x41\x25\x5b\x88\xf4\x72\xf5\xae\xb2\x53\xaf\x7a\x76\
+\x9d\x12\x06\xcf\xb2\x60\x11\x02\x29\xd5\xdb\x39\xf0\x5a\xf0\x8c\
+\xc2\xab\xb8\x70\x5c\x3b\xaf\x2f\xe0\x5c\x14\x50\x44\x86\x82\xa6\
+\xc7\x57\x90\x1c\x78\x83\x66\x42\xaa\x89\x09\x18\x47\x03\xe9\x4f\
+\x67\xc4\x11\x53\x90\xda\x49\x2f\x08\x5f\x53\xbc\x04\xae\xed\xc0\
+\x65\x96\x71\x0a\xd5\xdb\x52\x3e\x84\x10\xf8\x81\x3e\xf1\x84\x12\
+\x48\x21\xa1\x84\x30\x16\x47\x19\x80\x8e\x23\xb1\x0c\x74\xc7\xa8\
+\x08\x35\xd1\x00\xd7\xf3\x02\x47\xd9\x57\xa5\x3d\x74\x62\xc4\x20\
+\x15\xa4\x92\x60\x94\xc1\x77\x5c\x58\x94\xea\xb8\xfd\x6d\x5a\x1e\
+\xdb\xb1\xe0\xfb\x0e\x98\xa5\x53\xb9\x32\x95\x03\x5a\x46\x3b\x84\
+\x24\x13\xf4\x80\x32\xc8\x40\x47\x08\xd1\xfc\x7a\x06\x42\xd2\xf3\
+\x2b\x75\xe4\x32\xd1\x00\xe3\x6d\x00\x19\x94\x21\xc9\x3f\xc5\xcc\
+\xe3\x97\x52\x80\x12\x0a\xdf\xf5\xe1\xda\x96\x71\xd6\xe4\xdb\x3c\
+\xf5\x80\xe7\x39\x70\x5c\xfd\x3c\x5a\xd5\x6b\x67\xb3\x68\x5e\x32\
+\x03\x05\x32\xca\x40\x69\x27\x90\xc2\xf0\x00\x59\x50\x6b\x40\x93\
+\xfd\x6f\xe2\x03\x5c\xdf\x0c\x8c\x7c\x48\x4a\x09\x4a\x24\x5c\xc7\
+\x85\xe7\xba\xa0\x84\x18\x47\xf0\xed\x08\x1f\xda\xd6\x7b\x36\x18\
+\xa3\x39\x13\x98\x3b\x96\x05\xce\x40\x0b\x5e\xe6\x64\x0f\xe9\x13\
+\x7a\x41\x03\x64\x3c\x40\xae\x21\xd4\xae\x48\x71\x62\x02\xc6\x5f\
+\x72\xd0\x61\xef\xd1\x2e\x0a\x16\x63\x28\x05\x15\x9d\x6f\x57\xca\
+\x9c\x7a\xf5\xb6\x84\x6f\xdb\x14\xae\xab\xff\xfc\x5e\xb1\x09\x81\
+\x32\xc9\x21\x50\xf3\x83\x52\x41\x0a\xa1\xfd\x01\x35\xbe\x86\x64\
+\x30\xa1\xd4\x73\x6c\x8b\x51\xc0\xc4\x04\x8c\x3b\xfc\x0a\x23\x72\
+\x6d\x14\x0a\x53\xd5\x00\xd4\x71\x21\xd2\x34\xb7\xb1\xb9\x8a\x7e\
+\x8b\x8e\x9f\x02\xe0\xda\x0c\xb6\x4d\x4d\x9d\x9f\x02\x61\x14\x96\
+\xe7\x82\x5a\x2c\x07\x08\x61\x9a\xf8\x11\x5c\x6a\xf7\x8f\xd8\xa0\
+\x8c\x61\xb4\x8f\xaa\x72\x33\xa0\x7a\x21\xdf\xae\xbf\x66\x62\x02\
+\xbe\x33\xe5\x9f\x3f\x48\x08\xe0\x7b\x16\x98\x63\x83\x38\x14\x50\
+\x4a\x27\x80\xb8\x28\x24\x7b\x04\x38\x37\xf4\xee\x10\x56\x91\x10\
+\x2d\x7c\x46\x74\xe5\x31\x65\x0c\x6e\xc5\x07\xb3\x98\xa6\xfc\x4d\
+\x1d\x9f\x94\x0a\x92\x0b\x4d\x15\x2b\x80\x50\x02\xe6\xd8\xa0\x16\
+\x35\xea\x7f\x38\x15\x9c\x27\x83\x8c\x36\x48\x39\xd7\x20\x20\x7d\
+\xa0\x98\x00\x60\x0c\x04\xe4\x30\x12\x35\xb3\xb9\x42\x68\xbe\x1f\
+\x52\x0b\x97\x51\x02\xdb\xb5\xf3\xea\x1b\x00\x10\x5c\x20\x49\x38\
+\xe2\x38\x45\x12\xeb\x9e\x01\xa5\x14\x18\x21\x70\x18\x05\x94\x04\
+\x97\x80\x17\x94\xe0\x96\x3c\x1d\x4a\x72\xad\xe2\x29\x25\xe0\x29\
+\x87\x02\xc0\x18\x81\x92\x14\x42\x2a\x5d\x15\xcc\x4d\xc1\x29\x19\
+\x46\x05\x93\x9e\x7f\x40\x7a\x88\xe5\x71\x82\xed\xad\xcd\x1e\x7b\
+\x39\xe1\x01\xde\x82\x09\x20\x6f\x41\x4b\x10\x80\x18\x8a\x57\x66\
+\xc9\x1c\xe8\xda\x3b\xdb\xb6\xe0\x38\x16\xa6\xeb\x65\x08\x21\x11\
+\x47\x09\xba\x9d\x18\x22\x89\x21\x84\x04\xb5\x6c\xd4\xa6\x02\x58\
+\xae\x0d\x9e\x70\x48\xa5\x05\x2f\xb8\x0e\x33\x2d\xcb\x32\x6d\x61\
+\x12\xd4\xb6\xc0\x1c\xa6\x01\x67\x3b\xba\xe4\xab\x00\xc8\x41\x0d\
+\x50\x08\x58\xa0\x94\x42\xc9\xf3\x70\xee\xcc\x59\x24\x69\x82\x69\
+\xd7\x87\x10\xe1\x44\x03\x5c\x8f\x08\xd2\xb7\x61\x52\x57\xbd\x82\
+\x91\x8c\xdf\x37\x39\x81\x8c\xa4\x91\x12\xe0\x42\x80\x51\x82\x34\
+\x15\x70\x6c\x86\x72\xe0\xa1\x5a\x2d\x41\x2a\xe4\x65\xe3\x94\x51\
+\x08\x2e\x41\x1d\x80\xa7\x00\x57\x42\x47\x02\x4a\x01\x8c\xc2\x71\
+\x7d\x38\x94\x40\x48\x2d\x59\x87\x12\x48\xca\x46\x9c\xfe\x7e\x4d\
+\x55\x04\x87\x65\x31\xd4\x7c\x1f\x2d\xc1\x61\x31\x06\xae\x81\x31\
+\x01\xc0\x98\xd3\xad\x46\xba\xf5\x85\x78\x3a\x8b\xcb\xb3\x6f\x10\
+\xad\x5a\xf5\x01\x54\x80\x30\x09\x9b\x54\x49\x08\x9e\xea\xba\x3d\
+\x42\xd0\x6e\x74\xd0\x69\x76\x60\x59\x0c\x96\xa3\xc3\x3f\x28\x05\
+\x6a\xdb\xa0\xae\x29\xde\x00\x90\x0a\x09\x91\xea\x62\x90\x38\x15\
+\x48\xb9\x40\xa2\x12\xc4\x09\x07\x25\x2e\x86\xb9\x01\x59\x18\x48\
+\xf2\xbc\x85\xf6\x25\x4a\xbe\x07\x1b\x40\x9a\xf2\x89\x0f\x70\x5d\
+\x00\x90\x51\x00\xd0\x09\x96\x3c\xa4\x52\xbd\x04\x10\x0a\xac\x5b\
+\xf6\xcb\x44\x2a\x50\x25\x20\x25\x20\xcc\x13\x77\x3b\x21\x3a\x8d\
+\x8e\x16\x70\xca\x21\xda\x5d\x48\x09\xb0\x92\x07\x52\xa6\x20\x42\
+\xf5\x3a\x80\x8c\xb6\x90\x59\x76\xd1\x68\x86\x3c\xd4\x1b\x97\x0d\
+\x24\x64\x17\x3f\x20\x95\x9c\x44\x01\x6f\x11\x01\x72\x2c\x4d\x98\
+\xa7\x76\x55\x5f\xb9\x5f\x46\x0d\x9b\x4f\x18\x44\x09\x48\x05\x08\
+\x73\x22\xe3\x28\x41\xbb\xd9\xe9\x09\x44\x48\x50\xcb\x82\x5d\x09\
+\xa0\x5c\x27\xa7\x95\x73\xd2\x27\x4f\xe5\xaa\xec\x5e\xfe\x72\xa6\
+\x2c\x71\xb4\x8a\x22\x83\xcc\xcf\x50\x90\x4f\x00\x30\xe2\x04\x29\
+\x35\xd6\x04\x64\xa9\x5d\x02\x05\x59\xd0\x02\x26\x06\x97\x02\x10\
+\xa2\x97\xff\x27\x04\x71\x92\xa0\xd3\xea\xf6\x58\x3d\xa1\x40\x7d\
+\x17\xb4\x56\xd1\xbe\x80\x90\xbb\xc8\x1a\xa5\x8a\x92\x1b\x4c\x26\
+\x8f\x09\x03\x0b\x51\x80\x1a\xf6\x07\x28\x3d\x8f\x60\x02\x80\xd1\
+\x4c\xda\xd0\x54\x1e\x21\x45\x75\x0a\x0d\x13\x10\xa3\x30\x74\x5d\
+\x3e\x78\x0a\x25\x78\x2e\x0c\xfd\x50\x8a\x6e\x27\xcc\x9d\x3f\x25\
+\x15\x58\x25\x80\x5b\x0b\x20\xcc\xd7\x7d\xb6\x63\x28\x7b\x6b\xa2\
+\x8c\x42\xb2\xe7\x7a\x8e\xe0\xb8\x8b\x52\x2a\x27\x00\x18\x6b\x02\
+\xc6\x53\x7a\xfd\x75\x76\xa6\xf8\x32\x49\xa0\x38\xef\x71\xf8\x04\
+\xe0\x29\x47\xd8\x8d\x72\xca\x58\x11\x02\x6f\x66\x0a\x28\x95\x20\
+\xa5\x30\x5c\x7f\x0f\x2c\x83\x96\xa5\x0f\x18\xaa\x9f\x90\x22\xe3\
+\x11\x50\x78\x92\xdd\xb9\x00\x4a\xc9\xc4\x04\x8c\x3c\x1d\x84\x28\
+\xb1\x2b\x4a\x22\x7d\x56\xb8\xef\xd3\xe3\x02\x2a\x89\xa1\x84\xec\
+\xa5\x6d\x01\xf0\x24\x13\x3e\xa0\x84\x04\xb1\x2d\xb8\xb3\x75\x30\
+\xd7\x31\xc4\x50\xee\x55\xf4\x4e\x78\x96\xef\x57\x03\x35\x86\xbb\
+\xd4\x39\x19\xa7\xc1\x76\xe5\x02\x30\xa0\x5c\x06\xe7\x14\x4c\x00\
+\x30\xa0\x01\x76\x3b\x49\xfd\xa7\x48\x47\x03\x04\x2a\x8d\x21\xc2\
+\xa8\x57\xac\x61\x7e\x2c\x4d\x53\x44\x61\x92\x3b\x7b\xcc\xf7\x50\
+\x9e\xaf\x43\x51\x06\x29\x44\x21\x87\xd0\x93\x6e\x51\xe7\x28\x82\
+\x01\x80\x20\x2f\x40\xc9\x6a\xfc\x46\x25\x84\x72\x00\x90\x01\xe7\
+\x40\xf5\xcc\xc9\xc4\x04\x8c\xb5\x8f\x44\x15\x6b\x3a\x54\xd1\xa6\
+\x1a\x4e\x5e\x29\x05\xd1\xed\x40\x26\xbc\xe0\xb5\xeb\x1e\xfc\x38\
+\x4a\x91\x24\x3a\x51\x24\xa5\x84\x53\x0d\xe0\xce\x4c\xe9\xef\xcb\
+\x62\xbf\xbe\x2a\x9c\xff\xde\x19\xef\xf9\x93\xaa\x57\xc4\x91\xbd\
+\x86\xf9\x66\xaf\xeb\x68\x8c\x0f\x30\xd4\x8f\xd0\x17\xa3\x74\x62\
+\x02\xc6\xa8\x50\xb9\x8b\x09\xcc\x3a\xc0\x28\x05\x49\x53\xf0\xb8\
+\x05\x95\x26\xba\x60\x23\xfb\x90\xa5\x44\x1c\xa7\x48\x13\x0e\xa5\
+\x24\x84\x02\xfc\xe9\x29\xf8\xf5\xaa\x4e\xec\x64\x4e\x60\x41\x9f\
+\xab\x42\x4f\x41\xaf\xc6\x50\xf5\xb4\x49\xce\x30\x0e\x06\x01\xa3\
+\x9d\x40\x82\xe1\x26\xa0\x4f\x83\x4d\x00\x30\x0e\x00\x54\x11\x32\
+\xdc\x49\x52\x00\xa2\x56\x07\xd4\x0d\x0a\x7c\x80\xae\xe0\x49\xa2\
+\x24\x6f\xef\x22\x84\x22\x58\x98\x86\x5d\x29\x43\x9a\x44\x50\xc6\
+\x21\x64\xa1\xa0\xec\x3b\xf7\x03\xce\x5e\x6e\x52\x7a\xbe\x40\xcf\
+\xc4\x14\xcb\xbe\x47\x14\xae\x14\x14\x80\x1a\x92\xd8\xa6\x13\x00\
+\x8c\x35\x01\x43\x2b\x3c\x88\xf1\xf6\x15\x7a\x2d\xdf\x4a\x29\xa4\
+\x09\x47\x9c\xa4\x79\xd1\x06\x71\x6c\x04\x8b\xb3\xb0\x3d\x37\x77\
+\xf6\x54\x81\x35\xcc\x4f\xb4\xec\xa9\xf4\xbe\x93\x3f\x2a\x1a\x28\
+\xb8\xa0\xdf\x69\x41\xc8\x90\x30\x70\x02\x80\x31\x1a\x40\x8e\xd2\
+\x00\x9a\xe4\x53\xa0\x52\x21\x4d\x39\x92\x38\x81\x10\x5a\x5a\x82\
+\x0b\xb8\x41\x09\xc1\xc2\x2c\x60\x31\x4d\xee\x0c\xd4\xf4\xf5\xdb\
+\xf4\x01\x55\xdf\x47\x2d\xab\x02\xc3\x3c\x10\x23\x1a\x13\x70\x5d\
+\x27\x70\x94\x13\x6b\x22\x9d\x09\x00\xc6\x84\x81\x43\x49\x34\xa2\
+\xcf\x60\x9a\x24\xe0\x29\x83\x14\xdc\x74\x6e\x69\xdb\xee\xd5\x6b\
+\x28\xcf\xd5\x35\x48\xf2\x93\xdf\x6b\x11\xeb\xef\x1f\x28\x0a\x5d\
+\x15\x12\x4b\xbd\x9f\x2d\x66\x1e\x7b\x26\x40\x15\x88\x9e\xeb\xd1\
+\x3d\xa3\x65\x4c\x19\x9b\x00\x60\xa4\x06\xa0\x54\x0e\xe7\xca\x89\
+\x19\xe0\x98\x00\xb6\xab\xbd\x7c\x21\xa1\x28\x45\xb0\x30\x03\xbf\
+\x56\xe9\x15\x75\xf6\x35\x8d\xf4\xec\xb9\xc2\x6e\x81\xf6\x3f\x5e\
+\xfc\x59\xa0\xc8\x49\xf7\x55\x9c\x8d\xd1\x00\x39\x53\x58\xac\x05\
+\x2f\x3c\x89\x6e\x5e\x99\x68\x80\xeb\xf8\x00\x44\x0d\xf7\xad\x4c\
+\xc7\xae\xd4\xe3\x5f\x6d\xdf\x43\x65\x61\x06\xcc\x75\xf3\xaa\x9f\
+\x62\xe7\x50\xae\xce\x25\xfa\xb5\x40\xd6\x5f\xa0\x8a\xc2\x55\x7d\
+\xbc\x40\x66\x26\x50\x00\x47\x26\xcb\x71\x61\xe0\x48\x1f\x40\xf5\
+\x87\xba\x13\x00\x8c\x76\x90\x46\xfb\x00\x4a\x3b\x7a\xca\x52\x28\
+\xcf\x4c\xc1\x9d\xae\x81\x52\x0a\x21\x78\xaf\x04\xbf\xa8\xf6\x07\
+\x62\xfd\xbe\xd3\x8e\x7e\xb5\x3e\x5c\x53\x60\xa0\x23\xa8\x60\x02\
+\xc6\x85\x81\x7d\x9d\x20\x64\x20\xd1\xa4\x40\xc9\xc4\x04\x5c\x07\
+\x00\xc3\x7c\x00\x6d\x02\x6c\xdf\x83\xb7\x77\x11\xae\xef\x98\x69\
+\x1e\x22\xcf\xdc\xf5\xd9\xfd\xde\x41\xee\xab\x1a\xde\xe5\x18\x66\
+\xbd\xff\x83\xaa\x5f\xf5\x83\xa3\x48\x0d\x63\x4c\x3d\x40\x1e\x1d\
+\x0e\x69\x1f\xcf\x2d\x08\x9b\x68\x80\xb1\x51\xc0\xd0\x92\x30\x00\
+\x94\x02\x95\xc5\x19\xa0\xe4\x41\xf0\x74\xf7\xa9\x2f\x78\xed\xaa\
+\xd8\x2e\x9e\x75\x13\x0d\x13\xbe\xea\x0f\xfd\x50\xf0\x0b\x80\xdd\
+\x80\x02\xae\x3f\x5b\x32\x4b\xf7\x8e\x92\x32\xa3\x13\x0d\x30\xf2\
+\x62\x8c\x4a\x32\xa6\x28\x44\x48\x09\x22\x64\xdf\x30\xa9\xa2\xcd\
+\x57\x28\xb0\x7b\x28\x3a\x7b\xc5\xae\x62\xec\xd6\x16\xc5\x16\xb0\
+\x22\x88\x0a\xc6\xbf\x18\x05\x8c\x8a\xf5\x73\x1f\x40\xf5\xca\x18\
+\xfb\x38\x05\x35\xc9\x05\x5c\xc7\x04\xb0\x91\x3e\x00\xc9\x3a\x81\
+\xa4\xea\xa3\x71\xfb\xd4\xff\x2e\x2d\x30\x04\x00\x18\x48\x03\xcb\
+\x7e\x12\xa8\xcf\xe3\x2f\x80\xa5\x97\x16\x7e\x0b\xd9\xc0\x11\x03\
+\x42\xd4\x84\x08\xba\xbe\x0f\x80\x11\x35\x81\xb9\x23\x68\xda\xb5\
+\x06\x09\x1b\x35\x44\x1b\xf4\x26\xbe\x14\x1d\xc3\x62\x34\x30\x60\
+\xf7\x31\x5c\x2b\x64\x0c\x64\xde\x19\x3c\xc6\x0c\x50\x90\xb1\xdd\
+\x6a\x93\x8a\xa0\xb7\x11\x05\x64\xa1\x97\x1c\x98\xeb\x53\x0c\xef\
+\x8a\xb6\xbf\x48\xfb\xee\x26\x80\xd4\x70\x6e\x40\x0d\x84\x8b\xd9\
+\xc0\xb0\xcc\xa3\x27\x45\x3f\x6f\x34\x02\x14\xe9\xef\x07\xdc\x15\
+\x05\x30\x32\x31\x01\xd7\x89\x02\xe4\x28\x07\xbb\xa7\x8e\x7b\x3b\
+\x7f\x7a\x66\xa0\xff\x34\xa3\x50\x40\xba\xcb\xe6\xcb\xdd\x1e\xff\
+\x6e\x3f\x21\x1b\x45\xd3\x03\xd7\xae\xd9\x00\x23\x4c\x40\x5f\x5d\
+\x60\xbf\xfc\x41\x27\x4e\xe0\x38\x27\x70\xb4\x0f\x50\x3c\xcd\x83\
+\x00\x50\x45\x20\xc8\xde\xa9\x2b\x4e\x10\xeb\xfd\x8a\x1a\xc2\x19\
+\x0c\x03\x42\x21\x23\x58\x1c\x61\x49\xc6\x3b\x81\xa0\xa4\xef\xfc\
+\x17\x79\x8c\x02\xdd\x3d\x01\xc0\x08\x00\x88\xe1\x61\xa0\xb6\xbb\
+\xb9\xfd\x97\x05\x92\x47\xf5\x0b\x15\x03\x5a\xa0\xcf\x11\xc4\x30\
+\x21\x63\x80\x23\xc0\x90\x1c\x02\xa0\xa8\x7a\x4b\x61\x60\x5f\xbf\
+\xc2\x2e\x1c\x28\xd0\x09\x0f\x30\xc6\x04\x8c\xd2\x00\xc6\xef\xca\
+\x86\x36\x90\x01\x81\xef\xca\xe1\x63\xf7\xbc\xc0\xdd\x61\x1f\xfa\
+\xb5\x43\x21\xf3\xa7\x06\x43\xc9\x02\xa7\x48\x30\x3e\x1b\x48\x19\
+\x1d\xf0\x11\xfa\xf5\xc1\x84\x09\xfc\x8e\x79\x00\xd2\xd7\x65\xa3\
+\xb9\xfd\x41\xc1\xf7\x87\x83\x3d\x7a\x77\x88\x19\x18\x00\x41\xd1\
+\xde\x67\x65\xe7\x99\xf9\xc8\xe7\x44\xe6\xf6\x23\xeb\x0a\x79\xbb\
+\xb9\xc0\x49\x18\x38\x1e\x00\x94\x09\xad\x01\x86\x7f\x46\xb2\x90\
+\xcb\x55\x7d\x4e\x60\x91\x00\x1a\x10\x3a\x06\xd4\xfc\x80\x53\x98\
+\x9d\x7a\x59\xcc\x0d\x48\xf4\xe7\x10\x0a\xb9\x85\xeb\x3a\x81\x45\
+\x70\xa8\x81\x58\x40\xa9\x49\x32\xe8\xfa\x4e\x20\xe4\xae\x46\x1c\
+\x73\x67\x78\x14\x40\x7a\x02\x1f\x3a\x36\x16\x23\x40\x30\x26\x7f\
+\x50\x4c\x17\xcb\x7e\x8d\x41\xae\xe3\x04\xee\xca\x14\xa8\x5d\x66\
+\x6e\x02\x80\x71\x3e\x00\x08\x55\xc3\xe4\x2f\x4d\xb1\xa7\x54\x14\
+\x04\x36\x54\x36\x8f\x37\x8b\xbb\xf3\xd1\xdf\xca\x94\x76\x9b\xe1\
+\xcf\x90\x85\x19\xb4\x04\x80\x1c\x70\xfe\x8a\x0c\xa2\xda\xc5\xfc\
+\xe5\xf3\x08\xb3\xee\xdf\xb7\xf0\x77\xa8\x91\xf2\x57\xa0\x64\x62\
+\x02\x46\x5e\x8e\x6d\x0b\x3a\x24\x17\xa0\x40\x50\x72\x1d\x1c\x58\
+\xfd\x3b\x70\xea\x20\xb4\x02\x70\xea\x42\x80\x42\x0a\x05\x01\x82\
+\xc4\xa9\x41\x58\x3e\x14\x61\x5a\x70\x84\x41\xd8\x25\x28\xe6\x02\
+\x66\x8c\xbc\x1e\x02\x65\x41\x11\xaa\xef\x17\xc0\xd3\x1f\x15\x98\
+\x01\x91\x7a\xea\x40\x9e\x08\xce\x67\xff\x5e\xb7\x20\x24\x13\x3d\
+\xd9\x85\x8c\x89\x0f\x30\xe6\x6a\x77\x3a\x52\x08\xa1\x8a\x2a\x36\
+\x5b\xc6\x74\xff\x83\x0f\x82\xc7\x5d\xf0\x24\x41\x9a\xc4\x88\xe3\
+\x18\x71\x1c\x99\xed\x9e\x09\xe2\x74\x07\x71\x92\x22\x4e\x12\x24\
+\x71\x8c\x38\xe5\x88\xa4\x85\x58\x02\x29\x97\x48\xd3\x04\x89\x00\
+\x22\xab\x82\x14\x36\x84\xd2\xcb\x28\x38\x2c\x24\x6e\x0d\x9c\xfa\
+\x00\xf4\xf4\x31\x49\x6d\x08\xa7\x02\xc5\x3c\x48\xb3\x56\x49\x5a\
+\x3e\xec\x34\x1d\x9b\x0e\x2e\x36\x8d\xa8\xc1\xf6\x30\x95\x3b\xba\
+\x13\x00\x8c\xba\xce\x9d\x3d\x8b\x24\x49\xcc\x4c\x7e\x98\x6e\x5a\
+\x82\xc5\x3d\x8b\x60\x8c\xf5\xb5\x69\x17\xb3\x74\x42\xea\x31\x6f\
+\xf9\x46\x10\xb3\x02\x86\xa7\x1a\x2c\x51\x14\x9a\x55\xb0\x31\x92\
+\x38\x42\x1c\x45\x08\xc3\x10\x71\x14\x1a\xf0\x6c\x23\x4d\xd6\x10\
+\x47\x31\xa2\x38\x42\x9c\x0a\xc4\x5d\x8a\x38\x95\x48\xcc\x1a\xd9\
+\x58\x12\x24\x76\x1b\xd4\xf6\xc6\xcc\xb4\x26\x43\x83\x84\x62\xf3\
+\x8a\xe7\x79\xe9\x04\x00\x63\x89\x94\xdd\xaa\x93\x31\x06\xd7\x75\
+\xf3\x85\x4f\x84\x52\x50\x42\xc0\x98\x95\x0f\x67\xa6\x94\x82\x12\
+\xaa\x97\x45\x5b\x16\x98\x59\x19\x97\x2d\x97\xca\xb4\x4a\x1c\x47\
+\x88\xe3\x04\x69\x9a\x20\x8e\x13\xc4\x71\xac\x35\x46\x1c\x23\x36\
+\x9a\x25\xc9\x6e\x89\x06\x4c\x14\x19\x6d\x93\x0a\xc4\x49\xda\x57\
+\x30\x32\xde\x09\x50\x03\xf7\x15\x3c\xcf\xe3\x13\x00\x8c\xb8\x64\
+\xb6\xd4\xa1\xf8\x06\x2d\x1b\x3c\x4d\x71\xf5\xea\x15\xc4\x51\x04\
+\xdb\x71\xe0\xb9\x1e\x3c\xcf\x83\x65\xeb\xed\xe0\x8e\xe3\xc0\x75\
+\x5d\xf8\x9e\x6f\xc8\x18\x66\x7e\xd7\xca\x81\x93\x5d\x9e\xd9\xde\
+\xdd\xdb\x48\x3a\xb0\x82\xd6\xac\x88\xe5\x5c\xec\xd2\x28\xd9\x52\
+\x69\x40\x0f\x97\x1c\x06\x5e\x35\x62\xef\x49\x16\x56\x4e\x00\x30\
+\x0e\x00\x42\xf6\x8d\x7b\xb1\x2c\x0b\x57\xaf\x5c\xc6\xc6\xfa\x3a\
+\x6e\xbe\xf9\x66\xec\x59\xdc\x0b\xcf\x73\x91\xa6\x29\xe2\x38\x06\
+\xe7\x1c\x51\x37\x44\x73\xa7\x81\x94\xa7\x20\xd0\xfb\x87\xe3\x24\
+\x41\xbd\x5e\x87\x94\x32\x5f\x3c\x4d\x19\x05\x63\x16\x18\xa3\x08\
+\x2a\x15\xb8\xae\x0b\xc1\xb5\x10\x99\x45\x61\xdb\x0e\xf4\x2c\xdf\
+\x1e\x08\xf5\xcf\x33\x48\xa6\x37\x96\x2b\xc3\x03\x70\xb3\x4d\x6c\
+\x18\x00\x84\x14\xfd\xa3\x6c\xa0\x7a\xe4\xf6\xc4\x04\x8c\xbf\x84\
+\x94\x79\xcb\x17\x25\x04\xed\x76\x1b\xeb\x6b\x6b\xf8\xc7\x3f\xf3\
+\x19\x78\x9e\x97\x9f\x42\x29\xa5\x1e\xe9\x92\xcf\xf4\x91\x66\xad\
+\x3c\xc5\xca\xca\x05\xa4\x49\x8c\x03\x07\x0f\xa1\xb1\xb3\x83\x6e\
+\xb7\x9b\x3b\x86\x9d\x4e\x1b\x49\x92\xe2\x8b\x9f\xff\x3c\x0e\x1e\
+\x3a\x84\x3d\x7b\xf7\x22\x8a\xc2\xfc\xf4\x67\x75\x86\x9c\x8b\x3c\
+\x3c\x4c\x93\x04\x94\x51\x2c\x2f\x2d\x63\x71\xcf\x5e\x58\xb6\x65\
+\xb6\x8e\x8e\x30\x5f\xc5\x92\xb2\x5d\x3e\x80\x82\xeb\xb9\x13\x0d\
+\x30\xda\x04\xa8\xc2\xe9\x63\xb8\x7a\xf5\x0a\xde\xfd\xee\x7b\xe0\
+\x79\x1e\xda\xad\x56\xae\xaa\x53\xce\xc1\xcd\x5a\xf6\xfc\xb1\x34\
+\x81\x54\x0a\x97\x56\x57\x51\xa9\x56\xb0\xb1\xb9\x81\x4e\xbb\x63\
+\xa2\x05\x7d\x4b\x13\xdd\x36\xee\x97\x4a\x98\x99\x9b\xc3\xcc\xcc\
+\x0c\xa2\x28\xd2\x13\x3d\xcd\x22\xc9\xec\xf9\xe3\x28\x42\xd8\xed\
+\xa2\x1b\x76\xb1\xb1\xbe\x81\x6f\x3e\xfe\x38\x6a\x53\x53\xb8\xef\
+\x7d\xef\xc7\x4d\x47\x8e\x20\xec\x86\x23\x01\x30\x9a\x0b\x56\xf0\
+\x6f\x30\x13\x70\x63\x95\xa7\x64\x63\x3b\x32\x8d\xc0\x39\x16\x17\
+\xf7\xe8\xa6\x4f\x4a\xfb\xf2\xed\x83\xdb\x44\x19\xd3\x9b\x43\x19\
+\x65\xa0\x84\xf4\x8a\x33\xb3\x3d\x83\x9c\x23\x8e\x63\x74\x3a\x1d\
+\x24\x49\x02\x9e\xa6\x48\x72\x30\x69\xcd\x92\x01\x40\x0a\x01\x4a\
+\x29\x3c\xdf\xc7\xfc\xfc\x02\x8e\x1d\x3f\x81\x7b\x7f\xe0\x3e\x58\
+\x96\x85\x2f\x7e\xe1\xf3\x78\xfd\xb5\xd7\xe0\x38\xce\x70\x1f\x60\
+\x94\x73\xa8\x74\x14\x50\xad\xd5\xd2\x09\x00\x46\x6a\x00\x09\x55\
+\xf8\x04\x93\x24\xbd\x6e\xb3\xe5\x2e\xe7\x9b\x0c\x30\xc8\xbb\xc2\
+\xb4\xde\x77\x72\xf0\x0c\x59\x4b\x9b\x01\x4e\x29\x05\x2e\x38\x1c\
+\xdb\xc6\xd2\xbe\x7d\x98\x9f\x9f\xc7\x37\xbe\xfe\x75\xed\x73\x10\
+\x72\x7d\x10\x14\x66\x4d\x11\x02\x3c\xf6\xf5\x47\x27\x1a\x60\x24\
+\x00\x54\xff\xc4\xae\x7c\x06\xff\x77\x80\x00\x4a\x69\x2f\x63\x37\
+\x32\x54\x53\x85\xd5\xee\x5a\xd8\xb9\xf0\x4d\xc8\x98\x03\xc1\xac\
+\xa9\x55\x4a\xc1\xf7\x7c\x04\x41\x05\xdd\x6e\x17\xd7\xd6\xae\xe5\
+\xd1\x06\x76\x95\x91\x0f\x1b\x54\x4d\xc0\x28\x55\x7f\xf9\x17\x7f\
+\x2e\x26\x00\x18\x6d\x01\x94\x52\xe8\x31\x81\x63\x56\xb4\x0d\x39\
+\xdf\x70\x1c\x07\x9d\x4e\x07\x82\xf3\x7e\x81\xec\xba\x01\x28\x2c\
+\x8d\xa6\x84\xe4\x27\x3e\x03\x45\xf6\x58\xae\x0d\x28\x85\x65\xdb\
+\x20\x94\xc0\xb2\x18\x5a\xad\x66\x8f\xb0\x32\x14\x71\xb6\xc3\xa8\
+\x37\x25\xbe\xd8\x78\xaa\x40\x29\x11\x73\xb3\xb3\x13\x0d\x30\x56\
+\x03\xa8\x81\x82\x4a\xf2\xd6\x56\x42\x58\xb6\x85\x67\x9f\x79\x1a\
+\xff\xe7\x8f\xff\x10\x52\x2a\xd4\xeb\x75\x54\xab\x35\x54\x2a\x55\
+\x54\x2a\x15\x94\x83\x00\xe5\x72\x19\xa5\x52\x09\xb6\x6d\x63\x6a\
+\xaa\x8e\x4a\xb5\x9a\x13\x4b\x6c\x8c\x16\xa0\x06\x18\x2c\x03\x06\
+\x88\x9e\x47\x00\x32\x5c\x03\x28\xb9\xdb\x3c\x28\x80\x12\x22\x83\
+\x20\xb8\xa1\x34\xc0\x0d\xb7\x3b\x98\x32\x1d\x01\x58\xb6\x0d\x42\
+\x28\x18\x65\x60\x94\xc2\xb6\xed\x3c\x69\x23\xcc\x24\x90\xec\x43\
+\xb6\x6c\x0b\x67\x4e\x9f\xc6\xc3\x7f\xff\x10\x7c\xbf\x84\x53\x2f\
+\xbc\x80\x9d\xed\x6d\x24\x69\x6a\x96\x42\x98\x65\xd1\xc6\xb9\xdb\
+\xd9\xd9\xc6\xe5\x4b\x17\x71\xd3\x91\x23\xb0\x2d\x0b\x1b\x1b\x1b\
+\x08\xc3\x50\x9f\x74\x29\x73\xc1\x2b\xa5\xa0\xcc\x7d\x69\x1e\xef\
+\x0d\x8b\x20\x03\x93\x63\x48\x6f\x24\x9d\x54\xbb\x88\x40\xdd\x13\
+\x40\x64\xb9\x5c\x9e\x84\x81\x63\x68\x60\xd5\x6e\xb7\xd5\xd9\x33\
+\xa7\x11\x04\x15\x5c\xb9\x7c\x09\xaf\xbe\xfa\x0a\x76\x1a\x3b\x7a\
+\xe6\x3f\x65\x85\x79\xfc\x45\xbb\x4f\x70\xf6\xcc\x19\x2c\x2d\x2f\
+\xe3\x81\x07\x3f\x80\xa9\xa9\x3a\x04\xe7\xf9\x34\x91\xcc\xc1\xd4\
+\x37\x81\xa5\xe5\x7d\xd8\xde\xda\xc4\x17\xfe\xe6\xaf\x71\xff\x03\
+\x0f\x62\x66\x66\x06\x57\xaf\x5e\xd5\x60\xa1\x14\xd4\x24\xa0\xf2\
+\xe8\x23\x03\x81\x52\x63\x6a\x01\x7a\x5a\x6b\xf8\xa6\x52\x05\x42\
+\x88\x28\x97\xcb\x13\x0d\x30\xea\xe2\x9c\xa3\x54\x2a\xa9\x7b\xee\
+\x79\x0f\xa4\x52\x88\xe3\x18\xe7\xcf\x9d\xc3\xb5\x6b\xd7\xf2\x70\
+\xae\x38\xc6\x55\x49\xcd\xbc\x41\x01\xad\x66\x13\x07\x0e\x1c\xc4\
+\xfe\xfd\x07\x11\xc7\x31\xe0\x01\xb6\xc9\x0b\x24\x71\x0c\x4a\x29\
+\x5c\xcf\xd3\x44\x92\x10\x38\x78\xf0\x20\x4e\x9d\x3a\x85\x87\xbe\
+\xf2\x65\x7c\xea\x27\xfe\x21\x3a\x9d\x0e\x5a\xcd\x26\x28\xa5\x48\
+\x81\xfe\x22\x53\x4a\xa1\x28\xd5\x73\x88\xe9\xe8\x9d\x80\xd2\xac\
+\xaa\x2f\x8e\x99\xd3\x9a\x8a\x41\x29\x01\x46\x89\x0c\x26\x1a\x60\
+\x9c\x06\x90\xca\x71\x1c\xcc\xcc\xce\x82\x59\x16\xf6\x6f\xee\xc7\
+\x4d\x47\x8e\x40\x29\x85\x30\x0c\x61\x31\xcb\x98\x06\x33\xf1\x5b\
+\x70\x93\x20\xb2\x70\xf4\x96\x5b\xf0\xc6\x1b\xaf\x43\x48\xa1\x57\
+\xc3\xb8\x2e\xae\x5e\xbd\x8a\x27\x1e\x7f\x0c\x17\x2f\x5e\x04\x63\
+\x0c\x87\x0e\x1e\xc2\x7d\xef\xbf\x1f\xb5\xa9\x29\x44\x51\x84\x9b\
+\x8e\x1c\xc1\x37\xbe\xfe\x35\x7c\xf3\xf1\x6f\x40\x2a\x85\xb0\x1b\
+\x82\x99\x28\x22\x1b\xe8\x98\x2d\x94\x24\x94\x82\x11\x02\x46\x7b\
+\x79\x06\xc7\xb6\xf5\xea\x19\x4a\xcd\xfc\xc2\x7e\xe0\x10\xc2\x10\
+\xb5\xb7\xd0\xda\xde\x80\x5f\x5b\x02\xa5\x54\x94\x26\x00\x18\xef\
+\xc9\x67\x55\xc1\x69\x92\xa0\x5e\x9f\xc6\x3d\xf7\xbe\xa7\x47\xd0\
+\x48\x09\x21\x38\x92\x24\x41\x14\xc5\x90\x42\x80\x59\x0c\x71\x1c\
+\xe3\xa1\x2f\x7f\x19\x71\x1c\xc3\xb6\x2c\x58\x8c\xe1\xea\x95\xcb\
+\xf8\xc3\xdf\xff\xdf\x28\x95\xcb\xf0\x7d\x0f\x71\x14\xe3\xc9\x27\
+\x9f\xc0\x33\x4f\x3f\x85\x7f\xfa\xb3\x3f\x87\xc5\xc5\x3d\x88\xc2\
+\x10\xb7\xdc\x7a\x0c\x9e\xeb\x23\x49\x13\x78\xae\x8b\x24\x49\x11\
+\x47\x11\x92\x24\x46\x9a\xa6\x48\xd3\xc4\x90\x44\x02\x80\xc2\x95\
+\x2b\x57\xd0\x69\xb7\x70\xee\xdc\xd9\xdc\xa4\x10\xa2\xf3\x0c\x50\
+\x11\x60\x52\xd3\x84\x50\x24\x71\x17\x75\xb6\x86\x1f\xfe\xd0\x1d\
+\xf8\xd2\x13\x97\x41\x40\x64\x10\x4c\x4c\xc0\x38\xf9\xab\x3e\xb6\
+\x8f\x92\x3c\x43\xa7\x85\xa1\xb3\x71\xd9\x63\x82\x73\x3d\x0d\xbc\
+\xd3\x41\x18\x45\x79\x0a\x18\x00\xbe\xf4\xc5\x2f\x60\x6e\x7e\x1e\
+\xfb\xf6\xef\x87\x92\x0a\x61\x14\xa2\x36\x55\xc3\xe9\x37\xdf\xc4\
+\x1f\xfc\xde\xef\xe1\x5f\xff\xdb\x7f\x07\x42\xa9\xc9\x0f\x24\xf0\
+\x4b\x3e\x82\x72\x00\x10\x9d\x81\xb4\x2c\x2b\xe7\x01\x8c\x76\x02\
+\x21\x14\x4f\x3d\xf5\x24\x6e\xfa\xa1\x0f\x41\x4a\x89\x30\x8c\x20\
+\x38\xc7\x4b\xa7\x5e\xc4\xad\xc7\x8f\xc1\xb2\x2c\x43\x67\x03\x20\
+\x14\x71\x7b\x03\x07\x66\x03\xfc\xec\xcf\xff\x73\x84\xf4\x4f\xf1\
+\xf0\xc3\x8f\x88\x20\xa8\x4c\x34\xc0\x38\x1e\x40\x2a\x65\x40\x40\
+\xfb\x8a\x3b\x07\x19\x43\xce\xb5\x26\xe0\x9c\xa3\xdd\x6a\x19\x01\
+\x69\x3a\xf8\xda\xfa\x35\x6c\x6f\x6d\xe1\x9e\xf7\xbc\x07\x95\x6a\
+\x15\xc4\x24\x96\x28\xa5\x38\x70\xf0\x20\xbe\xf5\xdc\x73\x78\xe9\
+\xa5\x17\x71\xeb\xb1\xe3\x98\x9d\x9d\xc3\xad\xc7\x6e\xc5\xda\xb5\
+\x35\x44\x61\x84\x28\x8c\xf4\xde\x60\x29\x4d\xed\x40\x0c\xdb\xd2\
+\x2b\xe3\x04\xe7\xd8\xdc\x58\xc7\xdd\x77\xbf\x1b\x8e\xa3\x87\x54\
+\xd8\x8e\x83\xd7\x5e\x7d\x05\x71\x1c\xc1\xb2\x82\x3c\x14\x24\x84\
+\x42\xf2\x10\x82\x27\x48\x53\x8e\x93\x27\x8f\xe1\xe1\x87\xbf\x2a\
+\x5d\xcf\xbd\xa1\x7a\x03\x6f\xac\x5c\x00\x14\x94\x89\xa1\x6c\xdb\
+\xca\x85\x30\x6a\xc0\x72\xce\xd2\xa1\x57\xb1\xcb\x2c\x0b\x61\xa7\
+\x0b\xdb\xb1\x31\x3d\x33\x83\x3d\x7b\xf7\x62\xef\xd2\x12\xa6\xa6\
+\xa6\x10\x04\x01\x7c\xcf\x47\xc9\xf7\xf1\xfa\x6b\xaf\xc1\xb2\x2c\
+\x94\x4a\x25\xd4\x6a\x53\x7a\x99\xa4\xe3\xa0\x1c\x04\x70\x5c\x17\
+\xb6\x6d\xa3\x54\x2a\xa3\x56\x9b\x82\xe7\xfb\xa0\x94\x62\xef\xd2\
+\x12\xaa\xd5\x9a\x76\x24\x4d\x38\xca\xd3\xd4\xd0\xca\x2c\x2f\x1e\
+\x95\x6a\x70\xc6\x30\x50\xad\x54\x41\x00\xe5\x38\xee\x84\x09\x1c\
+\xed\x04\xe6\xf2\xd7\xc9\x18\xcf\xc7\xc5\x95\x95\xa1\x89\x97\x7e\
+\x20\xd0\xbc\x71\x93\x80\xa0\x1c\x04\x39\x49\xe3\x38\x0e\x5c\xc7\
+\xed\xab\x0a\xb2\x6d\x1b\xed\x56\xab\xc7\xde\x29\x69\x3a\x8f\x64\
+\x5e\x20\x92\xa4\x29\xc2\x30\x44\xbb\xdd\x46\xa3\xd1\xc0\xe6\xe6\
+\x26\x3a\xdd\x2e\x5c\xd7\xed\xdb\x0d\x98\xed\x09\x26\xa4\xb7\x64\
+\x5a\x0d\x59\x5d\x9f\x24\x09\x08\x25\xd2\xf3\xbc\x49\x77\xf0\x78\
+\x0c\x68\x3f\x40\x29\x85\x85\x85\x05\xac\x5c\x58\x81\xed\x38\xd8\
+\xb3\x67\x6f\x6f\x21\x77\xc1\x36\x13\x42\xf4\x1e\x61\x63\xfb\x15\
+\x14\xe6\xe6\xe7\x11\x54\x2a\xb8\x7c\xf9\xb2\x26\x90\x00\xb4\x5a\
+\x2d\x9d\xfa\x4d\x53\x74\xc3\x2e\x66\x66\x67\x4d\xd6\xd0\x4c\xfd\
+\xc8\xb2\x8d\x19\xf3\x67\xfc\x09\x66\xf8\x03\xcb\xb2\xcc\x2a\x00\
+\x95\x83\x29\xa3\x8b\xb5\xf3\x4a\x0b\x7d\x04\xbb\x01\x10\x27\x31\
+\x08\x21\xd2\x75\x27\x00\xb8\x2e\x19\x84\x42\xba\x77\xef\xf2\x32\
+\xce\x9f\x3b\x87\xd3\x6f\xbc\x09\xcb\xb6\x10\x45\x11\xe2\x28\xd6\
+\x7d\x02\x5c\xe4\x75\x7c\x9d\x76\x1b\x53\x53\x53\x5a\x78\x96\x85\
+\xf7\xdd\xff\x00\xbe\xf0\xd7\x9f\x83\xe3\x38\x3a\x8c\xec\x74\xb1\
+\xb3\xb3\x83\x9d\x9d\x1d\xc4\x51\x82\xbb\xef\xb9\xc7\x94\x75\xf5\
+\x96\x3c\xf5\xa5\x9a\x33\x01\x17\x28\x61\xcb\xd2\x1b\xc6\x5d\xcf\
+\xeb\xfb\x79\x55\x64\x02\xfb\x6a\x1a\x7b\x49\xa1\x24\x4e\x40\x00\
+\xe5\xf9\xde\x24\x0a\xb8\x8e\x13\xa0\x8a\x7d\xf8\x8c\x52\xec\xdb\
+\xb7\x3f\x8f\x02\xb2\xea\x1d\xa5\x14\x92\x24\x41\x18\x76\x91\xa4\
+\x09\xe6\x66\x67\xd1\x68\x34\x00\x42\x90\xa6\x29\xde\x75\xd7\xdd\
+\xb8\xb6\xb6\x86\xa7\x9f\x7a\x12\xd5\x6a\x15\x5c\x08\x6c\x6f\x6d\
+\xe1\xd2\xea\x2a\x3e\xf6\x89\x4f\xe2\xd6\x5b\x8e\xe1\xda\xb5\x35\
+\x30\xc6\xe0\x79\x1e\xca\xe5\x32\xe2\x44\x87\x7c\x99\xa3\xc9\x18\
+\xcb\x29\xe4\x6a\xad\x86\x76\xbb\x0d\xdf\x2f\xc1\xf7\x7d\x44\x51\
+\x34\x60\x02\x76\x03\x40\x0a\xde\x67\x02\x28\x21\xd2\x75\xdd\x89\
+\x06\x18\x2d\xfd\x9e\x09\xc8\x4e\x9e\x6d\xdb\x50\x00\xfc\x52\x09\
+\x15\xcb\xd2\x05\x1f\x8c\xf6\x86\x31\x51\x9d\xa4\xe9\x86\x21\x9e\
+\x7b\xe6\x69\xdd\x7f\x47\x08\xd2\x24\xc5\x8f\x7c\xf8\xa3\x38\x74\
+\xf8\x30\x5e\x7c\xe1\x05\x6c\x6e\x6e\x60\xba\x5e\xc7\x27\x7f\xf4\
+\xc7\x70\xf7\x3d\xf7\x22\x49\x62\x38\xae\x8b\xf3\xe7\xce\xe1\xb1\
+\xaf\x3f\x9a\x3b\x7a\x69\x92\x82\x98\x4c\x61\x18\x86\x79\xa4\xd1\
+\xed\x76\xb0\xb3\xb3\x83\xfb\xee\x7b\x3f\x04\xe7\x66\x16\x40\xbf\
+\x29\xca\x01\x90\xad\xbb\x17\x29\x00\xdb\x00\x20\x05\x21\x50\x13\
+\x13\x30\x9e\x06\xc8\x47\x34\x65\x14\xee\xa9\x53\x2f\x02\x4a\xe5\
+\xb5\x80\xb5\xda\x14\x98\xc5\x60\x5b\x36\xa6\xea\x53\x70\x5d\x0f\
+\xae\xeb\xc2\x36\xaa\x3e\x53\xf9\xc4\x44\x0e\xef\xb8\xf3\x9d\xb8\
+\xf3\x9d\xef\x42\x1c\xc5\x60\x16\x03\x01\x10\x45\x91\x66\xfb\x08\
+\xc1\x9e\xbd\x4b\xb8\xe9\xc8\x51\x84\x51\x84\x24\x8a\x10\x91\xac\
+\x44\x4c\x57\x06\xc5\x51\x04\x21\x24\xca\xe5\x32\xee\x7f\xe0\x03\
+\x28\x95\x4a\xba\x4e\xd0\x8c\x32\xc9\x81\x48\x88\xa9\x55\x2c\x64\
+\x33\x25\xef\x01\x20\x4d\x41\x08\x91\xfe\xc4\x09\x1c\xeb\xce\x2b\
+\x18\x0d\x00\xa5\x70\xea\xc5\xe7\x71\xf7\xbb\xef\xc5\xa1\xc3\x87\
+\x11\x47\x11\xba\xdd\x2e\xa2\x28\x42\xb3\xd9\x44\xbb\xdd\x42\x92\
+\x24\xd8\x34\x99\xbc\xf5\xf5\x75\x44\x51\x88\x2f\xff\xdd\xdf\xa2\
+\x52\xa9\x68\xea\x96\x31\xd4\xeb\x75\xb8\x8e\x0b\xc7\x71\x10\x54\
+\x2a\xba\x94\x9c\x31\x13\x59\x28\x04\x41\x19\x0b\x8b\x8b\xba\xd0\
+\xd3\x84\x76\x59\xe2\x48\x9f\x62\x99\x2f\x7e\x8c\xe3\x18\x42\x08\
+\x0d\x2e\x29\xfb\x66\x42\x66\x00\x50\xb2\x67\xe2\x55\xc1\x04\xa4\
+\xa9\xd0\x4e\xa0\x37\xf1\x01\xc6\x68\x00\x4d\xa5\x33\xc6\xb0\xb1\
+\xb1\x81\xe9\xe9\x19\x1c\x3a\x7c\x08\xdd\x6e\x07\x94\xea\x72\xee\
+\xda\x54\x0d\x7b\x97\x96\x72\x4f\x3c\xbb\x7d\xed\x91\x87\x71\xec\
+\xf8\x6d\xf0\x3c\x4f\x87\x6f\xad\x16\xda\xed\x36\xd2\x34\xc5\xf6\
+\xf6\x96\x26\x82\x18\x43\x14\x86\x88\xe3\x18\x95\x4a\x05\xad\x66\
+\x13\x97\x2e\xad\x22\xa8\x54\x41\x09\x81\x65\x59\xa8\x54\xab\x39\
+\x48\x6c\xc7\xc9\x23\x02\xa5\x14\x2c\xe3\x13\x18\xd2\x01\xa4\x90\
+\x1d\xcc\x40\x5b\xf4\x01\x08\xed\xf5\x23\x74\xc3\xc4\x98\x80\x89\
+\x0f\x30\x46\x01\xf4\xc6\xc5\x5b\x16\x83\x34\x8e\x5e\xe6\x98\x01\
+\xf1\xd0\xdf\x73\x1c\x07\xdd\x6e\x17\x61\xd8\x85\xe7\x79\x28\x95\
+\x7c\x54\x2a\x41\xaf\x73\xc8\x4c\xed\xc8\x9a\x41\xd2\x54\xef\x15\
+\x7a\xec\xb1\x47\x71\xf0\xf0\x21\x4c\x4f\xcf\x62\x7b\x7b\x1b\xcd\
+\x56\x13\x8d\x46\x03\x9d\x4e\x1b\x61\x18\xc2\x75\xdd\xdc\xe9\xf4\
+\x4b\x25\xcc\xcd\xcd\x63\xff\xfe\xfd\x88\xe2\x58\x6b\x00\xb3\x46\
+\x34\x13\xf9\x60\x3d\x20\x73\x4a\xba\x8f\x80\x73\x5c\xba\x72\x0d\
+\x96\xc5\xa4\xe7\x4d\x00\x70\x5d\x13\xa0\xa4\xc4\xec\xec\x1c\xce\
+\x9c\x39\x83\xd7\x5e\x7d\x15\x07\x0e\x1e\xdc\x7d\xd2\x76\x87\x8f\
+\x10\x59\x79\xb8\x94\xe3\x40\x06\x4a\x29\x1c\xd7\x45\xb9\x54\xc6\
+\xfc\xc2\x22\xf6\xef\x3f\xa0\xeb\x0d\x0c\x97\xa0\x8b\x53\x25\xd2\
+\x94\x23\x8a\x42\xc4\x51\x8c\x6e\xb7\x83\xaf\x3d\xf2\x08\xce\x9d\
+\x39\x83\xf7\x3f\xf8\x60\x2f\x0a\xc8\x28\x27\x42\xf2\x75\xf6\x59\
+\x17\x90\xe5\xd6\xc0\x58\x07\xcf\x7d\xeb\xdb\x78\xfe\xd4\x9b\x58\
+\x9c\xf2\x64\xb5\x56\x9b\x98\x80\x71\x1a\x80\x80\xe4\x3c\xc0\x9d\
+\x77\xde\x89\x67\x9f\x7d\x06\x2f\x9d\x7a\x11\x8e\xe3\xc2\x2f\x95\
+\xe0\xf9\x1e\x3c\xd7\xd3\xf7\x3d\x0f\x9e\xeb\xa2\x5c\xa9\x20\x0a\
+\x8d\xf3\x66\xd6\x8e\x91\xd1\x3c\x43\x9e\x48\x4a\x39\x47\x14\x86\
+\x68\x77\xda\x79\x1d\x61\x11\x28\x19\x23\x59\x0e\x02\x4c\xd5\xa7\
+\xf0\x13\x9f\xfe\x34\x7e\xf3\xd7\x7f\x1d\xe7\xce\x9e\xc1\xfe\xfd\
+\x07\x90\xa6\x29\x06\xeb\x53\x72\xb6\x4a\x0a\xf8\xb5\x05\x9c\x59\
+\x3b\x8d\xff\xfc\x5b\x7f\x8a\x98\x97\xc1\x93\x50\x9d\x3d\x7d\x46\
+\xee\xd9\xbb\x6f\x02\x80\x91\x3e\x80\x99\x13\x28\x95\x82\xe7\xf9\
+\xf8\xc0\x07\x7f\x10\xad\xa6\x56\xcd\x9c\xa7\x88\xc2\x08\x1b\xeb\
+\xeb\x7a\x67\x50\x9a\x22\x0c\xbb\xb0\x1d\x17\x6b\x57\xae\x60\x7d\
+\x7d\x1d\xb5\x5a\x0d\xb6\xe3\xc0\x71\x1c\xf8\x25\x1f\xbe\xe7\xc3\
+\xf3\x3c\xb8\x9e\x89\x16\x4c\x3f\x21\x21\x04\x42\xf0\xdc\xe9\x1b\
+\x55\xcf\x9f\x75\x0c\x71\x9e\xc2\xf7\x7d\x9c\xbc\xe3\x0e\x9c\x79\
+\xf3\x34\x6e\x3a\x72\x14\x69\x06\x1a\x4d\x5c\xf4\x26\x99\x9a\xa2\
+\x15\x4a\x08\x50\xda\x8f\x34\x49\xe1\x7b\x02\x17\x57\x5e\x91\x3f\
+\xf9\x13\x3f\x2e\x4f\xaf\x5c\x99\x00\x60\x9c\x06\xc8\x1c\x3b\xc6\
+\x18\x2e\xad\xae\x62\x73\x63\x1d\x95\x6a\x0d\x95\x4a\x05\xb3\xb3\
+\x73\x38\x71\xdb\x6d\x70\x5c\x0f\x96\x95\xb5\x8c\x2b\x08\x21\xd1\
+\x6c\xec\x20\x4d\x13\xb4\xdb\x1d\x6c\x6f\x6f\x99\xec\xdd\x06\x1a\
+\x8d\x86\xf1\xd2\x75\x77\xaf\xe3\xd8\xf0\x3c\x1f\xe7\xcf\x9d\xc5\
+\xe2\x9e\xbd\x58\x5f\x5f\x87\x63\xdb\xf0\x7c\x1f\x9e\xe7\xc2\x71\
+\x7a\x40\x29\x76\x17\x3b\x8e\x83\xf3\xe7\xce\x62\x7e\x61\x31\x1f\
+\x1c\x89\xc2\xba\x78\x69\xf2\x0a\x19\xff\xa7\x0c\x9e\x29\x05\xb8\
+\x50\x60\x8c\x09\xe6\x79\x93\xf9\x00\x23\x01\x40\x7b\x6b\xe3\x6c\
+\xcb\xc2\x4b\x2f\x9d\x02\x25\x04\xfb\xf6\xef\x47\x92\x24\xd8\xde\
+\xde\x42\xab\xd9\x00\x21\x14\xdd\x6e\x17\x04\x40\xb9\x52\x81\x14\
+\x12\xf5\xe9\x3a\xaa\xd5\x2a\x5c\xd7\xc3\xf2\xbe\x7d\xb8\xf9\x96\
+\x5b\xe0\x79\x5e\x9e\x0b\xc8\xd8\xb8\x76\xbb\xad\xd5\x7e\xbb\x8d\
+\x83\x07\x75\xf9\x58\xb7\xdb\xc5\xfa\xda\x5a\x9e\x66\x0e\xc3\x50\
+\xb7\x99\x1b\xc1\x6b\x73\xe3\xe2\xe2\xca\x45\x74\x3a\x6d\x7c\xe8\
+\x87\xef\x42\x9a\x24\x66\x58\x44\x41\x7d\x19\x1f\x60\x28\xc5\x05\
+\x05\xcb\x62\xc2\x61\xe5\x09\x00\x46\x5d\x94\x10\x49\x08\x91\x8c\
+\x31\x6c\x6d\x6f\xa3\xdb\xed\xe0\xe3\x9f\xf8\xa4\xb1\xc5\x2c\xe7\
+\xe4\x8b\xf5\x00\x61\xd8\x45\x18\x86\xf8\xc6\xd7\xbf\x8e\x85\x45\
+\x7d\x32\x57\x2e\x9c\x47\xa7\xdd\x86\x50\x12\x25\xbf\x0c\xce\x53\
+\x54\x6b\x35\x04\x41\x05\x8e\x63\xa3\x3e\x3d\x83\xa9\xfa\x14\x96\
+\x97\xf7\xc1\xf5\xdc\xfc\xf5\xa5\x94\x48\x92\xd4\x70\x0c\x3a\xbf\
+\xb0\xb5\xb5\x8d\x24\x89\x11\x86\x21\x6e\x3d\x76\x0c\x47\x8e\xde\
+\x0c\x40\xd7\x2f\x66\x1a\x80\x14\xbd\x00\x59\x18\x29\x33\xb0\x77\
+\x88\x59\x4c\x7a\xd6\x44\x03\x8c\xd7\x00\x54\x9b\x80\x28\x0c\x51\
+\xaf\xd7\x11\xc7\xb1\x66\xee\x86\x38\x67\x3a\x65\xec\xa1\x3e\x3d\
+\x8d\xa5\xa5\x25\xdc\xfe\x8e\x3b\x31\x3d\x3d\xad\xa7\x7b\x9b\x66\
+\xcf\x28\x8a\xd0\xed\x74\x10\x46\x9a\x1b\x68\x34\x1a\xd8\xde\xde\
+\x46\xa7\xdd\xc6\xe5\xcb\x97\x51\xad\x56\xf3\x3e\x40\x3d\x5f\x00\
+\x98\xaa\x4f\xc3\x75\x1d\xb8\xae\x87\x43\x87\x0e\xe5\x65\xea\x4a\
+\x29\xb4\x5a\x2d\x4d\x06\xa1\x7f\x2f\x54\x96\x0e\x16\x52\xf6\x15\
+\xae\xf6\x38\x6e\x05\x8b\x31\xe1\x79\xfe\x24\x0c\x1c\xa9\x01\xb4\
+\xf0\x95\x54\x0a\xd3\x33\x33\x38\x7b\xe6\x34\x76\x76\x76\xe0\xfb\
+\xfe\xae\xd0\xae\x58\x2a\x26\xa5\x40\xa7\xd3\xc1\xf6\xf6\x26\x94\
+\xea\x6d\x10\xcd\x26\x87\x54\xaa\x15\x4c\xd5\xeb\xb0\xf6\x59\xb9\
+\x03\x08\x00\xcf\x3c\xfd\x14\x66\x66\x66\xb1\xb0\xb8\x80\x76\xab\
+\x8d\x56\xab\x85\x66\xb3\x81\x24\x49\xb0\xbe\x7e\x0d\xdd\x6e\x07\
+\x84\xd0\xbc\x76\xa0\x5a\xab\xe1\x1d\x77\xbe\x33\x17\x74\xff\x1a\
+\xd9\x5e\x6d\x81\xea\x1f\x0b\x94\x47\x1f\x8e\x6d\x89\x4a\x65\xc2\
+\x03\x8c\x31\x01\x4c\x11\x42\x95\x52\x0a\xbe\xef\xe3\xe0\xa1\x43\
+\xf8\xbb\x2f\x7d\x11\xfb\x0f\x1e\x44\xa5\x52\x81\x6f\x4e\xa9\xe3\
+\x79\x70\x6c\x3b\x1f\x19\xd3\x23\xdf\x48\xa1\x3b\x47\x40\xcb\x88\
+\xe4\x53\x3d\x8a\x5a\xc4\x75\x5d\xb4\xdb\x2d\x04\x41\x00\x42\x08\
+\x82\x8a\x06\x89\x6d\xdb\x7d\x15\x48\x59\xb4\x11\x45\x31\x1e\x79\
+\xf8\x21\x7c\xfe\x73\x7f\x85\x8f\x7c\xfc\x13\x3a\x95\x5c\x88\x1c\
+\x88\x19\x67\x2e\x45\xd6\xdf\x48\x06\x21\x00\xdb\xb2\x78\x10\x04\
+\x13\x13\x30\x26\x0a\x90\x94\x10\x49\xa0\xd7\xc0\x1f\x38\x70\x10\
+\xd5\x6a\x0d\xe7\xcf\x9d\x43\x63\x7b\x07\xad\x56\xcb\x24\x79\x74\
+\x07\x8e\x6f\xda\xbc\x82\xa0\x82\xd3\x6f\xbe\x09\xd7\x71\x31\xbf\
+\xb0\x90\x87\x7c\xba\xb8\x93\xf5\x15\x77\x16\xed\xbd\x94\x52\x73\
+\x01\x51\x94\x0f\x7d\xe8\xfd\x1c\x01\xa5\xc4\x54\xfc\xea\x5a\x80\
+\x8f\x7d\xe2\x93\xf8\x9d\xdf\xfe\x2d\xbc\xf2\xf2\xcb\x38\x76\xfc\
+\xb8\xee\x3f\x50\x03\x1a\x40\x4a\x28\x89\x5d\x2a\x40\x49\x05\xcb\
+\xb3\x78\x10\x94\x27\x1a\x60\xb4\x09\xa0\x8a\x52\x2a\x51\xe0\xd5\
+\xcb\x41\x80\x23\x47\x8f\xe6\xc2\x76\x1d\x17\x52\x49\x84\xdd\x2e\
+\xb8\xe0\x68\xec\xec\xa0\xdd\x6e\xe3\xe6\x5b\x6e\xc5\xc6\xe6\x26\
+\xd6\xd7\xd7\x21\x84\x40\x1c\xc7\x70\x3d\xd7\xa4\x94\x1d\x94\xcb\
+\x65\x78\xbe\x67\xfa\x03\xcb\xa8\x56\xab\x08\xc3\x10\x82\xf3\x5e\
+\xed\x7f\x5e\x01\xac\xbd\x76\x5d\xe1\x2b\x20\x84\x4e\x04\x49\xa9\
+\x70\xf8\xf0\x61\x5c\x5c\xb9\x80\x93\xb7\xdf\xae\x01\x80\xde\x14\
+\x71\x65\x56\xdb\x0d\xeb\x0c\x52\x50\xb0\x2d\x5b\x94\x83\xca\x04\
+\x00\x23\x01\xc0\xa8\x22\x94\x2a\x02\xc0\xb2\x6d\xac\xac\xac\xe0\
+\xd2\xea\x45\x4c\x4d\x4d\x21\x4e\x62\xb4\x9a\xad\x7c\xc8\x53\xad\
+\x56\x43\x39\xa8\xa0\x5a\xab\x62\xef\xd2\x32\x2a\x95\x0a\x3c\xdf\
+\xcf\x13\x36\xd9\x44\x90\x46\x63\x07\xcd\xa6\x2e\x07\xdb\xd8\x58\
+\x47\xbb\xd5\xd2\xd4\x6e\x18\x62\x6b\x6b\x13\xab\x17\x57\xf1\xfa\
+\x6b\xaf\xc1\x2f\xf9\x70\x5c\x17\x41\x39\x40\xa9\x5c\x46\xa9\xe4\
+\xc3\xf3\x7c\x38\x8e\x93\x87\x84\x52\x0a\x9c\x3a\xf5\x22\x4e\x9c\
+\x38\x99\x0f\x89\x2a\x18\x01\x28\xc0\x38\x81\xbb\x97\x4c\x2b\xa5\
+\x60\xdb\x16\xaf\x54\x82\x09\x00\x46\x6b\x00\x26\x29\xa5\x92\x50\
+\xed\x78\x5d\x38\x77\x16\x1f\xf9\xf8\xc7\x51\xa9\x54\x7b\xa1\x5f\
+\x1c\xa3\xd5\x6a\xa1\xdb\xed\x60\x7b\x7b\x1b\xeb\x6b\x6b\x58\x5d\
+\xb9\x88\xb3\x67\x4f\x63\x6e\x7e\x01\x94\x10\x9d\x02\xf6\x3c\x4c\
+\x4d\xd5\x31\x3d\x3d\x8d\x83\x87\x0e\x22\x08\x2a\x7d\xaf\xa5\xe7\
+\x08\xa6\xd8\xda\xda\xc2\xce\xce\x36\xa2\x28\xc6\xc6\xfa\x3a\x76\
+\xb6\xb7\x71\xf5\xca\x15\x34\x5b\x4d\x58\xcc\x82\x10\x02\x8c\x31\
+\xf8\xa5\x12\x56\x57\x56\x50\xaf\x4f\xe3\xe4\xed\xb7\x23\x89\xe3\
+\xbe\x9c\x44\xee\x03\xf4\xd5\x04\x14\x67\x1a\x2b\xd8\xb6\x25\x82\
+\xa0\x32\xf1\x01\x46\x5d\x8c\x51\xc5\x18\x55\x94\x52\x34\x1a\x3b\
+\x58\xd8\xb3\x08\x42\x29\x36\x36\xd6\xf3\x11\xad\x94\x68\x6e\xbe\
+\x36\x35\x85\x7d\xfb\x0f\x80\x31\x06\xdb\xb6\xf1\xd5\x87\x1f\xc2\
+\x2d\xb7\x1c\xd3\xce\x5d\xa7\x83\x9d\xed\x6d\x34\x9b\x0d\x5c\xba\
+\xb4\x8a\x30\x0c\x41\x09\x41\x9c\x24\xa8\xd5\x6a\x20\x84\xa0\x5e\
+\x9f\x46\x10\x04\x08\x82\x00\x7b\x97\x96\x61\xdb\x36\x6e\xbf\xfd\
+\x76\xc0\x64\xef\xb2\xd9\x81\xad\x56\x0b\xed\x76\x0b\x71\x9c\xe0\
+\xe6\x9b\x6f\xc1\xdc\xdc\x1c\xe2\x24\xe9\x5b\x05\xd7\xa7\x01\x84\
+\x30\x5b\xcd\x8b\x24\x90\x59\x7c\x69\xdb\xbc\x5c\x9e\x68\x80\xb1\
+\x1a\x80\x10\x2a\xa5\x10\x08\x2a\x55\x5c\xba\xb4\x9a\xf7\xde\x49\
+\x33\x75\x41\x12\x09\x21\xf4\x10\xc7\xec\xb2\x6d\x1b\x61\x37\x44\
+\x9c\xc4\x28\x07\x65\xd4\xeb\x75\xcc\xcd\xcf\xe9\x6e\x62\xaa\x89\
+\x9a\x34\xe5\x88\xe3\x08\x61\x37\x44\xa3\xd1\x40\x9a\xa6\x78\xfc\
+\x1b\x8f\xc1\xf3\x3c\x04\x95\x0a\xa2\x6e\x17\x9e\xef\x83\x0b\x81\
+\xba\x89\x06\x82\xa0\x82\x52\xb9\x84\xa9\xa9\x3a\x3c\xcf\x83\x02\
+\xd0\xed\x76\xf5\xfa\xba\xc2\x36\xb1\xdc\x79\x34\x89\x26\x39\xd0\
+\x44\x6a\x52\x9c\xb0\x6c\x57\x04\x95\x89\x0f\x30\xfa\xcd\xe8\x51\
+\xea\x92\x0b\x81\x5a\xb5\x0a\xdf\x2f\xe1\xa1\xaf\x7c\x19\x27\x6f\
+\xbf\x03\xbe\xaf\xed\x31\x33\xd3\x3f\x51\x48\x0b\x17\x27\x8a\x64\
+\x3d\x84\x71\xbc\x2b\xc2\x00\xa5\x14\xa5\x72\x09\xd5\x5a\x15\xbe\
+\xef\xa3\xdb\xed\x60\x71\xcf\x1e\x2c\x2d\x2d\x23\x8a\x22\x44\x61\
+\x17\xad\x76\x1b\xdd\x6e\x17\x3b\x5b\x5b\x58\x5f\x5f\x43\xfb\x6c\
+\xdb\x54\x02\x71\x78\x5e\x09\xef\xba\xeb\xae\xbc\x12\x38\x7b\xcd\
+\x3c\x17\x54\x48\x1e\x81\x16\xc7\x03\xe9\x72\x71\xdb\xb2\x79\x30\
+\xf1\x01\xc6\x39\x81\x4c\x4a\x29\x95\x32\xe1\xd9\x6d\x27\x6f\xc7\
+\xe9\x37\xde\xc0\x13\x8f\x3f\x0e\xc1\xb9\x9e\xfc\xe9\x79\xf0\x3c\
+\x17\x41\xa5\x82\x72\xb9\x8c\xa0\xac\x1d\xc1\x6e\x18\x22\x35\x1e\
+\x7d\x46\xcf\xf6\x4d\x1b\xc9\x27\x83\x0a\x70\x9e\x42\x08\x81\x6e\
+\xb7\x93\xab\x78\x21\x04\x98\x65\x61\x66\x66\x06\xf3\xf3\xf3\x60\
+\x47\x8e\x80\x9a\x5a\x7f\x29\x25\x92\x38\xc6\xd7\x1e\x79\x18\x9f\
+\xfb\xab\xbf\xd4\xf4\x74\xe6\x04\x16\x4c\x40\xa6\x01\x34\x49\x34\
+\x10\x06\x2a\x09\xc7\xb6\x78\x65\x12\x05\x8c\xf3\x01\x98\x54\x4a\
+\x49\x69\xca\xbe\x39\xe7\x38\x71\xf2\x24\x6e\x33\x4e\x57\x92\x26\
+\xe8\xb4\x3b\x68\x34\x1a\x88\xa2\x10\xab\x2b\x17\x73\x8f\x7f\xed\
+\xea\x55\xec\xec\x6c\xa3\x52\xa9\xa0\x54\xd2\xa3\x60\x82\x4a\x80\
+\x92\x5f\x82\x5f\x2a\x19\x5e\xc0\x02\x35\x66\xa1\x78\x82\x33\xf2\
+\x28\x3b\xbd\x83\xc4\x51\x46\x3d\x7f\xe8\x47\x3e\x82\xdf\xfd\x5f\
+\xff\x03\xaf\xbc\xfc\x32\x6e\x3d\x7e\x1c\x69\x92\xf4\xea\x0f\x4c\
+\x41\x88\x4e\x2f\xab\xbe\x96\xab\x6c\x37\x81\x65\x5b\xa2\x54\x9e\
+\x24\x83\xc6\x69\x00\x45\x84\x90\xc2\x94\x5b\x09\x21\xf0\xec\xd3\
+\x4f\x63\x67\x67\x1b\xe5\x20\x80\x5f\xf2\x31\x55\x9b\xc2\xfc\xfc\
+\x3c\x82\x20\x40\x39\x08\x74\x47\xae\x11\xdc\x4e\x63\x07\xcd\x66\
+\x13\x9d\x56\x1b\xdb\x3b\xdb\x68\x34\x1a\x68\x35\x9b\x39\xf1\x63\
+\x9b\x34\xb0\xef\xfb\xa8\x4f\x4f\x63\x75\x75\x15\x94\x32\x54\x6b\
+\xb5\xbc\xf1\x83\xe6\x9d\x3e\xfd\xe6\x43\x93\x46\x29\x8e\x1c\x3d\
+\x8a\x8b\x2b\x2b\x38\x71\xf2\x24\x12\xd3\x09\x54\x48\x05\x0d\x8c\
+\x3a\x54\x03\x61\xa0\xcd\x2b\x95\x0a\x26\x00\x18\xe9\x03\x50\xc9\
+\x09\x64\x56\xa0\xf1\xfc\xb7\x9e\xc3\xf1\x13\xb7\x61\x79\xf9\x7d\
+\xe8\x74\x3b\xd8\xda\xdc\x44\xab\xd5\xc2\x99\x33\xa7\x11\x47\x11\
+\x78\x9a\x82\x50\x8a\x72\xb9\x0c\xdf\x2f\x61\x7a\x66\x06\x41\x10\
+\x60\x79\x79\x5f\xee\x33\x48\x29\x91\xa6\x29\x5a\xcd\xa6\xe6\xfa\
+\x1b\x0d\x6c\xef\x6c\x63\x6b\x73\x13\x61\x37\xc4\xe9\x37\xdf\xc4\
+\xe9\x37\xdf\xd4\xf9\x7f\xdb\x46\xa9\xe4\xa3\x5c\xd6\x03\xa5\xca\
+\xe5\x40\x3f\x8f\xab\x0b\x4c\xa4\x52\x78\xe1\xf9\xe7\x35\x0f\x60\
+\xcc\x4d\x56\x31\x9c\xf9\x24\x30\x53\x41\x06\x21\xa0\x94\xd4\x61\
+\xe0\x04\x00\xa3\x2f\xdb\x76\x44\x92\xa4\x82\x80\x60\xfd\xda\x1a\
+\x2a\xd5\x0a\x6e\x3d\x76\x2b\xc2\x30\xc4\xf4\xf4\x34\xe6\xe7\x17\
+\x74\x11\x88\xb1\xcd\xda\x71\x0b\xd1\xed\x76\xf1\xb5\x47\xbe\xaa\
+\xd9\x3a\x25\x91\x26\x09\xa2\x28\x42\xa9\xa4\x8b\x32\xa7\x67\x66\
+\xe0\xfb\x25\xcc\xcc\xcc\xe0\xc0\xc1\x83\x38\x1e\xdc\x96\xe7\xfa\
+\x35\x59\xd4\x40\xb7\xdb\xc5\xd6\xf6\x16\xda\xcd\x26\xda\xed\x36\
+\xae\xad\xad\x41\x08\x81\x30\x0c\x75\xaf\x01\x80\x8d\xf5\x6b\xa8\
+\xd7\xa7\x71\xe2\xe4\x49\xc4\x49\xd2\xbf\x55\x3c\x2f\x0b\x57\x79\
+\xa1\x68\x61\xe3\x6c\xae\x01\x82\x20\x98\x00\x60\xd4\xe5\x38\x8e\
+\x08\xbb\x5d\xce\x05\x37\xa7\x48\x27\x72\x92\x24\xd1\x73\x7e\x51\
+\x5c\xdc\x68\x78\x7a\x8b\x61\x7e\x61\x1e\x4b\xcb\xcb\x38\x79\xc7\
+\x1d\x98\x9e\x9e\xd6\x63\x60\x93\x14\xdd\x6e\x07\xcd\x86\xee\x21\
+\xd8\xda\xda\xc2\xda\xda\x55\xb4\x9a\x4d\xd8\x96\x0d\x2e\x38\xca\
+\xe5\x32\x5c\xcf\x43\xbd\x3e\x8d\x72\xb9\x8c\xa5\xbd\x4b\xf0\x6f\
+\x3a\x92\x37\x9a\x26\x69\xaa\x53\xc9\x61\x88\xed\xad\x2d\xb8\x77\
+\xde\x89\xd9\x99\x39\x44\x71\xa4\x43\x41\x63\x5a\xfa\xc2\x3d\xd2\
+\x6b\x16\x29\x66\x85\xa5\x94\x70\x5d\x57\xd4\xa7\xa7\x27\x00\x18\
+\x75\xd5\x6a\xb5\x24\x8a\xa2\xa4\xd9\x6a\x61\x66\x7a\x06\xa7\x4f\
+\xbf\x89\x95\x95\x15\x2c\x2f\x2f\xe7\xc9\x9b\x62\xe9\xb5\xae\xdc\
+\x15\x20\x84\x20\x8a\x42\xb4\x9a\x8d\x7c\xaa\x67\x56\xc2\xb5\xb0\
+\xb8\x80\xbd\x6c\x09\xcc\x32\x15\xbf\x42\x9a\x45\x10\x29\x9e\x78\
+\xfc\x31\x08\x29\xe0\xd8\x0e\x56\x2e\x5c\xd0\x03\xa8\xd3\xd4\xec\
+\x20\x70\xe1\xf9\xba\xbc\xdc\xf7\x7d\x9d\x64\x72\x1c\x44\x91\x16\
+\x7e\xdf\x2a\x5b\x14\x5b\xc3\xfa\x3c\x82\x82\x13\x49\x10\x76\xbb\
+\x7c\x63\x7d\x1d\x73\xf3\x7b\x26\x00\x18\x76\xad\xad\xad\x75\xdb\
+\xed\x76\xc7\xb1\x6d\x28\x28\x9c\x38\x71\x1b\x9e\x7c\xe2\x09\x54\
+\x6b\x35\xd4\xeb\x75\x04\x95\x00\xd5\x4a\x15\xa5\x72\x59\x2f\x8c\
+\x30\x1c\x3d\x63\x0c\x94\xd0\xde\x80\x68\x23\x94\xac\xa6\x1f\x88\
+\xb3\x5e\x8e\x7c\x90\x44\x29\xd0\x3e\xc3\xde\xa5\x25\xec\x3f\x70\
+\xc0\x0c\x89\x96\x88\xa2\x08\x61\xd8\x45\xb3\xd1\xcc\xeb\x03\xd6\
+\xae\x5e\x45\xbb\xdd\x42\xca\x39\xee\xb9\xf7\xbd\xb0\x18\xdb\xa5\
+\x01\x08\x21\x66\x46\xa0\xcc\x78\xe1\xbe\xbf\xad\x5c\x2e\xe3\x4b\
+\x5f\xfc\x7c\xfa\xf7\x5f\xfe\x1c\x9e\xf9\xf6\x4b\x13\x00\x0c\xbb\
+\x1e\xff\xc6\x63\xbc\x52\xa9\x84\x37\x1d\x39\xaa\x47\xc6\x95\xcb\
+\xb8\xf7\x3d\xef\xc5\xda\xd5\xab\x68\xb5\x5b\x58\xbb\x7a\x15\xdc\
+\xf4\xeb\x39\x8e\xa3\x8b\x3d\x2a\x15\x54\xa7\x6a\x38\x7f\xfe\x3c\
+\xa6\xea\xf5\xfc\xe4\xe7\x79\xfd\x82\x73\xa6\x06\x26\x91\x73\x9e\
+\x22\x8a\x42\x5d\x3e\x26\x38\x94\x99\x35\x5c\x2e\xeb\x6c\x61\x36\
+\x45\x94\x00\x10\x42\xe2\xe9\x27\xbf\x89\x2f\x7d\xe1\x6f\xf0\xe1\
+\x8f\x7e\xbc\xb7\x5d\xdc\xb4\x82\x65\xe4\xd0\x60\x75\x71\x6f\x57\
+\x84\xc4\xcc\x74\xbd\x53\xf6\xac\x89\x09\x18\x75\xbd\xfb\x9e\x7b\
+\xd6\xe3\x38\x39\xc5\x39\xd7\xd3\x3a\x38\x07\xa1\x14\x4b\xcb\xcb\
+\x60\x79\x88\xa6\xc0\x53\x5d\xd3\xdf\x6e\xb7\x10\x87\x11\x1a\x8d\
+\x1d\x4c\x4d\x4d\xe1\xd5\x57\x5e\xc1\x6b\xaf\xbe\x0a\xa1\xed\xad\
+\xa6\x79\x83\x00\x95\x4a\xc5\x10\x47\x25\x78\x9e\x0f\xdb\xb6\x4d\
+\xb1\x28\x29\xec\x16\xee\x39\x6b\x19\x27\x90\xa9\xf5\xac\xf6\xef\
+\xbe\xfb\xef\xc7\xb9\xb3\x67\xf1\xda\xab\xaf\xe0\xd8\xf1\x13\x48\
+\x93\x04\x42\xc8\x3e\x13\x20\xd5\xf0\xae\x04\x29\x05\x16\xf7\x2c\
+\x76\x16\x17\x66\x26\x00\x18\x75\x95\x35\x49\xf2\xad\x46\xa3\x19\
+\x4b\x29\x5d\x42\x08\x60\xc2\xb8\x0c\x0c\x59\xde\xde\xb6\x6d\xcc\
+\xcd\xce\xe9\x29\x1e\xe6\x96\x31\x7d\x61\x18\x22\x8a\x42\x34\x76\
+\x1a\xe8\x76\x3b\xb8\x74\xe9\x12\xa2\x30\x44\xca\x53\x40\x21\x6f\
+\x14\xbd\x74\x69\x15\xcb\xad\x86\xde\xe4\x61\x00\x63\xdb\x7a\x20\
+\x54\xe6\x4b\xe4\xa7\x58\x29\xf0\x34\xc5\xd2\xbe\x65\x5c\x5c\x59\
+\xc5\x89\x13\xbd\x02\x10\x52\xf4\x01\xe4\x90\x7a\xb0\x0c\x00\x8b\
+\x7b\x3b\x47\x0e\x1f\x9a\x00\x60\xd4\xb5\xbc\x6f\x3f\xd2\x24\x79\
+\xfd\xb9\x67\x9f\x7d\x24\x49\x92\x1f\xca\x17\x3c\x65\x7e\xbf\x19\
+\xdd\x4a\xf5\x27\x8a\x54\x29\x10\x73\x52\x8b\x73\x7b\x74\x7f\x60\
+\x09\x73\xb3\xf3\xc6\x0c\x20\x1f\x28\x11\x47\x11\x3a\xed\xb6\x4e\
+\xf7\x5a\x16\x9a\xcd\x26\xbe\xfd\xad\x6f\x21\x32\xa5\xe0\x94\x51\
+\x04\x41\x80\x52\xa9\x8c\x4a\xb5\x92\x73\x02\x9e\xe7\xa1\xdd\x6e\
+\xe3\xb9\x67\x9f\xc5\x5d\x77\xbd\x1b\x69\x9a\xe6\x00\xc8\x85\x6c\
+\x18\xcc\xdc\x07\xc8\x52\xc1\x20\xe0\x49\x88\xbb\xee\xba\xeb\xda\
+\x7d\xef\xbb\x6f\x02\x80\x51\x57\x18\x76\x61\x59\x16\x16\xf6\x2c\
+\xfe\xc7\x4b\xab\xab\x3f\x38\x3b\x3b\xc7\x2c\x4b\x17\x72\xe6\xb6\
+\x55\x4a\xc8\x6c\xbc\x7b\xf6\x61\x13\x02\x95\x01\x80\x52\x90\xac\
+\x9b\x07\xbc\x5f\x19\x13\xa2\x73\x09\xbe\x8f\xb9\x05\x5d\x3b\x00\
+\xe8\x25\x50\x59\xfa\xb7\xd9\x68\xa0\x1b\x86\xd8\xde\xde\xc2\xce\
+\xf6\xb6\x29\x43\x23\x86\x4c\x6a\xe1\xe8\xd1\x9b\x71\xe0\xe0\x41\
+\x44\x71\x0c\x62\x1c\x4d\x65\xa8\x62\x9d\x88\x52\x43\xa3\x00\xc7\
+\xa6\x78\xfe\xdb\xcf\x5d\xdd\xd8\xb8\x86\x9f\xfb\xf9\x5f\x98\x00\
+\x60\xd8\x35\x33\x33\x0b\x42\x08\x2a\x95\xea\xa3\xab\x17\x2f\xfe\
+\xea\xf6\xf6\xf6\xaf\x38\x8e\x9e\x1a\x9e\xb5\x7c\x29\xa9\xed\x2c\
+\xcd\xbd\x6d\x93\x71\xd7\x8b\x06\xb4\x96\x00\xfa\x3a\x76\x06\xaf\
+\xbe\x3c\x40\xe1\x5f\xd7\x75\x31\xbf\xb8\x08\x00\x38\x7c\xf8\x70\
+\x9e\x8f\x48\xd3\x14\x9d\x4e\x27\xef\x28\x8a\xe2\xb8\x17\x69\x98\
+\x4e\xe3\x62\xab\xd9\xe0\x96\x03\x29\x25\xca\xbe\xd5\xbc\xf7\xde\
+\x7b\x2f\x94\x83\xea\x44\x03\x8c\xcc\x05\x98\x6a\x5c\xcb\xb2\xf0\
+\x81\x0f\x7e\xf0\x57\xff\xfc\xcf\xfe\x8c\x4c\xd5\xa7\xff\xbd\xef\
+\xfb\xe4\xc2\xf9\xf3\xa0\x94\x62\x7a\x66\x46\x73\xf7\x26\x14\x93\
+\x26\x6f\xa0\x4c\xbf\x7e\xa6\x09\xbe\x23\x00\x98\xfb\x12\x80\x32\
+\xd5\xbe\xb9\x43\x67\xee\x97\x4a\x25\x48\xa5\xb4\xf0\x0d\x1f\x41\
+\x19\x33\xc0\x70\xc0\x39\x47\x1c\x6b\xd2\x2a\x73\x1c\xb3\xe7\xe6\
+\x9c\x63\xbe\xea\x9c\x3d\x72\xf4\xe8\x65\xcb\xf6\x26\x00\x78\x2b\
+\x17\x63\x16\x66\xe7\xe6\x7e\xa5\xd9\xd8\xf9\x66\xbb\xd5\xfa\x8d\
+\xb9\xb9\xb9\xe3\x94\x31\x6c\x6c\xac\xe3\xf2\xe5\x4b\x3a\xa1\x53\
+\x9f\x46\xb5\x5a\xcd\xe7\x08\x66\xa5\xda\x19\x18\x00\x40\x8d\xda\
+\x39\x34\xe0\xe0\xe5\x61\x5d\x01\x18\xd9\xfc\xff\xec\x14\x0f\x6e\
+\x1e\xa1\x94\xe2\xca\x95\xcb\xa8\x4f\xcf\x20\x0c\x43\x70\x9e\xa2\
+\xd3\x0d\x21\x04\x40\xad\x8c\x20\xa2\xe8\xb4\xb6\xf1\xc1\x8f\xde\
+\xf7\xb9\x5b\x8f\x9f\x90\xed\x76\x67\x02\x80\xb7\xac\x11\x08\xc1\
+\xec\xec\xdc\x57\xa4\x94\xef\xba\x7c\xf9\xd2\x8f\x13\x42\x3e\x3b\
+\x37\x37\x7f\xf7\xf4\xf4\x0c\xe1\x3c\xc5\xc6\xfa\x3a\x2e\xad\x5e\
+\x04\x63\x16\xaa\xb5\x2a\xa6\xa6\xea\x28\x97\xcb\xb0\xfa\xfa\xfc\
+\x87\x6f\xf2\x1a\xf4\xf0\xd5\x80\xe0\x8b\x69\x62\x59\x00\x48\xc6\
+\x02\x4a\xe3\x7f\xbc\xfe\xda\x6b\xf8\xc4\x8f\x7e\x52\x73\x14\x9c\
+\x23\x8c\x05\x08\xb3\xf3\x75\x37\xed\x4e\x88\x9b\xf7\x05\xaf\xfd\
+\xe4\xa7\x3f\xf5\x3b\xb6\xed\xa2\x52\x61\x13\x00\x7c\x27\x97\x94\
+\x12\x8e\xe3\x46\xfb\x0f\x1c\xf8\x83\x37\xdf\x78\xfd\x8f\x3b\x9d\
+\xf6\x3b\xd6\xd7\xaf\x7d\x54\x4a\xf9\x0f\x66\x67\xe7\x6e\xaf\xd7\
+\xf7\xf8\xdc\x14\x77\x9c\x3b\x7b\x06\x49\x92\xc0\xb2\x6c\x04\x95\
+\x00\x95\x4a\x15\x41\x10\xe4\xac\x61\x96\xb3\x57\x83\xa7\xb9\xa0\
+\x05\xfa\xee\x0f\x6a\x02\x03\x06\x42\x08\xca\xe5\x32\x9e\x7e\xf2\
+\x9b\x10\x3c\xc5\x91\xa3\x37\xe3\x91\xaf\x3e\x02\x28\x81\xab\x1b\
+\x5d\x58\xce\x14\x04\xe7\xe8\x84\x21\xf6\xcf\xe2\xcd\x7f\xf1\xd9\
+\x4f\xfd\xd8\xdc\xfc\xe2\x46\x36\x7a\x6e\x02\x80\xef\xf0\xca\x56\
+\xb2\x5a\x96\x2d\x16\x16\x17\x9f\x6b\xb5\x5a\xcf\xbd\xf1\xfa\xeb\
+\xbf\x7c\xfe\xdc\xb9\xfd\xae\xeb\xdc\x55\xa9\xd6\xee\xab\xd7\xeb\
+\xf7\xd6\x6a\xb5\x63\xb3\xb3\x73\x35\xa5\x14\xa2\x38\xc2\xb5\xb5\
+\x35\xac\x5c\x38\x9f\x93\x3a\xae\xeb\xea\x62\x91\x72\x39\x8f\xfb\
+\x33\x46\x91\x98\x42\x91\x6c\xdd\x6b\xdf\xa0\xea\x42\x35\x11\x84\
+\x40\xa3\xd9\xc0\xd7\xbe\xfa\x30\x5e\x3a\xf5\x22\x7e\xe1\x5f\xfd\
+\x12\xce\x9c\x39\x83\x38\xea\xe2\xea\xda\x26\xd6\xda\x36\x04\x11\
+\x70\x11\x76\xdf\x7b\xa2\xfe\xfb\x3f\xfd\x93\x9f\xfc\x65\xdb\xf1\
+\x36\xd3\x34\x35\x5d\x4c\x6a\x02\x80\xef\x16\x0c\x04\x80\x6d\x5b\
+\xca\xf7\xfd\x0b\x96\x6d\x5d\xe0\x3c\xfd\x8b\xcd\x8d\x0d\x92\x24\
+\xc9\xfc\x85\xf3\xe7\x8f\x2f\x2d\x2f\xdf\x5d\x09\x2a\x77\x5b\xb6\
+\x75\xc7\xd2\xf2\xf2\x32\x25\xd4\x67\x8c\x21\x8a\x22\x08\x21\xb0\
+\xbd\xb5\x69\x1c\xb6\xb8\x47\x32\x99\xcc\xa2\x2a\x0c\x7e\x12\x5c\
+\x40\x2a\x3d\x10\x3a\xc9\x47\xd5\xeb\x72\xf2\x3d\x7b\xf6\xe2\x97\
+\xff\xc3\xaf\x61\x73\x73\x13\xaf\xbf\xfa\x0a\xd6\x36\x9a\x78\xea\
+\xd5\x2d\xcc\xcd\xd4\xce\x1e\x3b\x50\xfd\xf3\x3d\xd3\xee\xef\x56\
+\x2b\xa5\xb3\xa5\x72\x15\x9d\x4e\xe7\x86\xfd\x3c\xbf\xef\x00\x50\
+\x74\xe5\x33\x1f\xde\x54\xf3\xa8\x20\x08\xd6\x3c\xcf\x5d\xf3\x7d\
+\xff\x11\x10\x60\xfd\xda\x9a\xf3\xd4\x93\x4f\x2c\x2f\x2c\xee\x39\
+\xe4\x38\xce\xb1\x3d\x7b\xf6\x1e\x8b\xa3\xf8\xf8\xc2\xe2\xe2\x92\
+\x82\x9a\x75\x6c\xa7\x56\x2a\x95\x28\x65\x2c\x2f\xef\xa2\x54\x03\
+\x21\x0c\x43\x10\xe8\xc9\x61\x96\x6d\xe9\x71\x34\x9e\x0f\xc6\x18\
+\xca\x41\x19\xcd\x66\x0b\x2f\xbc\xf0\x02\x5e\x7f\xe3\x74\xba\xd3\
+\x4a\x5e\xed\xc4\xf2\xf1\x7b\x4f\xee\xfb\xeb\xa3\x07\x17\x1e\x5d\
+\x58\x98\x8f\x56\x2f\xae\x22\x4e\xb8\x5e\x69\x73\x03\x5f\xdf\xbf\
+\x00\x18\xa1\x1d\x72\x6e\x88\x12\x94\xca\xe5\x84\x31\xeb\x6c\xa9\
+\x54\x3e\xcb\x18\x7d\xd8\x71\x1c\x6c\x6e\x6c\x60\x3a\x9d\x71\xff\
+\xe7\xef\xfc\xf6\xd4\x47\x3e\xf6\xb1\xd9\x9d\x9d\x9d\x3d\x3b\xdb\
+\xdb\x4b\x0f\x3c\xf8\x81\x85\xab\x57\xaf\x4e\x6d\x6e\x6e\xd4\xd3\
+\x24\xad\xdf\x71\xe7\x9d\x53\x04\xf0\x95\x52\x8e\x02\x6c\x42\x2d\
+\x62\x59\x56\xa4\x14\xc2\xe7\x9e\x7d\xa6\x11\x04\xc1\xab\x57\xd6\
+\xd6\x5f\x11\x8a\x3c\x53\x9b\x9a\x3a\xbb\xd7\xb3\x84\xeb\x30\x80\
+\x32\x24\xa9\xe6\x03\xbe\x1f\xae\xff\x3f\x00\xeb\xbe\x99\xfd\x8f\
+\x28\x18\x4d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x9a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x01\x2c\x49\x44\x41\x54\x38\xcb\x63\
+\xf8\xff\xff\x3f\x03\x25\x98\x61\x98\x1b\x90\xbd\xd8\xfc\x6b\xea\
+\x7c\xc3\xff\xf1\x73\x75\x39\xc9\x32\x20\x79\xbe\xe1\xd7\xc6\xcd\
+\x51\xff\xc3\x67\x68\xfc\xf7\x9f\x2a\xcf\x49\xd0\x80\xfc\xa5\xb6\
+\xff\x73\x17\x9b\xff\x4d\x5f\x68\xfc\x37\x71\xae\xfe\xdf\x9a\xf5\
+\xa1\xff\x57\x9d\x9e\xf8\xbf\x64\xb5\xff\x7f\xd7\x7e\xf1\xbf\xb6\
+\xdd\x82\x3c\x78\x0d\x00\x3a\xf9\xff\x86\x73\xd3\xfe\xaf\x3d\x3b\
+\x05\xac\x71\xc5\xe9\x09\xff\x27\xec\x29\xf9\xbf\xf0\x78\xd7\xff\
+\x8c\xa5\x6e\xff\x4d\xdb\xd9\xff\xea\x36\x33\xf2\xe3\x34\x00\xe8\
+\x64\xb0\xe6\xbe\x5d\xf9\xff\x3b\x77\x64\xff\x6f\xdd\x96\xf6\xbf\
+\x61\x73\xe2\xff\xa6\xad\xe9\xff\x67\x1c\x6a\xfe\x1f\xb3\xc0\xe6\
+\xbf\x6a\x3d\xc3\x1f\x9c\x06\x44\xcf\xd6\xfc\xbf\xf2\xd4\x84\xff\
+\x4b\x4f\xf4\xfe\x5f\x78\xac\xeb\xff\xbc\xa3\x1d\x40\x43\xb2\xfe\
+\x4f\x3f\xd4\xf4\x3f\x6d\xa9\xc7\x7f\xc5\x5a\x86\x57\xd2\x95\x0c\
+\x06\x38\x0d\x08\x9c\xae\xf8\xcf\x73\xa2\xf4\x3f\xe7\x7e\xd1\x7f\
+\xd6\xdd\xfc\xff\xe2\xe6\x5b\xfd\x9f\x76\xb0\xe1\x7f\xd2\x62\xb7\
+\xff\xf2\xb5\x0c\xcf\x25\x2b\x19\xb4\x48\x8a\x05\xed\x66\xc6\xaf\
+\xf1\x0b\x9d\xff\xcb\x57\x33\x3c\x01\x6a\x56\x27\x39\x1a\x81\x4e\
+\xfe\x2a\x57\xcd\xfc\x5f\xb4\x92\x41\x91\xec\x94\x28\x5c\xce\xc0\
+\x39\xb8\xf3\x02\x00\x87\x95\xc7\xfa\x0e\xdd\xac\xec\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xfb\
+\x47\
+\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\x9c\xb3\xca\xe7\
+\xf2\xfe\xa1\xb5\xca\xc2\xda\xf2\xac\xc5\xde\x59\x72\x8a\xd8\xeb\
+\xfe\x93\xac\xc5\xcb\xe4\xfd\xa4\xbc\xd3\xbc\xd5\xed\x4a\x62\x7a\
+\xb5\xce\xe7\x8c\xa5\xbd\x9c\xb0\xc4\xf6\xf9\xfe\xbd\xd2\xe8\xbe\
+\xd7\xf0\x7d\x96\xae\xba\xd2\xe9\x90\xa8\xc0\xfa\xfc\xff\xa7\xc0\
+\xd9\x69\x82\x9b\x98\xb1\xca\xbc\xd4\xeb\xc7\xe0\xf8\xcb\xe0\xf5\
+\xf1\xf7\xfe\xc0\xd8\xef\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
+\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x78\
+\xe0\x27\x8e\x64\x69\x7e\x5e\xea\x9d\xa4\xe7\x38\x98\xb0\x9e\xa9\
+\xf3\x3c\x41\x60\xa5\xa5\x27\x24\x1b\x8e\x62\xe0\x61\x10\x76\x23\
+\xdf\x0d\x32\x89\x78\x10\x9e\x1c\x65\xe6\x7a\x30\x15\xcf\xa7\xc2\
+\x20\x99\xa1\x04\x81\x8c\x47\x22\x09\x44\xb8\x5e\x14\x20\xe0\xd1\
+\x74\x2b\x0c\x44\x37\xb9\xf6\x10\x03\x15\x02\x86\x32\x28\x50\x13\
+\x39\x4f\x11\x16\x7b\x1d\x19\x0b\x5e\x1e\x09\x09\x04\x06\x16\x00\
+\x14\x0d\x05\x88\x3d\x1e\x07\x06\x08\x1a\x03\x88\x69\x2d\x17\x05\
+\xa0\x9d\x26\x2a\xa2\x2c\x2c\x21\x00\x3b\
+\x00\x00\x02\xec\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x02\x7e\x49\x44\x41\x54\x18\x19\x95\
+\xc1\x4b\x48\x14\x61\x00\x07\xf0\xff\xce\x7c\xb3\xce\xb4\x6b\x28\
+\x22\xa6\xd2\x29\xf4\xd0\xa1\xa0\x3c\xe4\xc5\x83\x54\x60\x87\x0e\
+\xd1\x35\x08\x3a\x08\x45\x50\xd1\x25\xbc\x46\x9d\xea\x50\x64\x74\
+\x4a\x82\x22\xe8\x22\xdd\x04\x1f\x2d\x1d\xb2\x42\xe9\x81\x68\xf8\
+\x7e\xec\xb8\xbb\xa3\xfb\x9a\x9d\xf9\x9e\xb3\x5f\x7b\xd8\x83\x84\
+\x42\xfe\x7e\x31\xad\x35\x0e\xe3\xd1\x87\xe5\x3e\x4a\xd9\x44\x85\
+\x2b\x19\x52\x71\x25\xa6\xb5\xc6\x41\xde\xa4\x76\x89\x94\xb2\x83\
+\x89\x6a\x27\xe5\xa2\x35\xe4\xe2\x62\x0c\xfa\x96\x63\x69\x70\xa9\
+\xf0\x6b\x25\x4f\x09\x0e\x30\x32\xe5\x39\x5c\xa8\x09\xa9\xa2\x5e\
+\x19\x29\x54\x23\x89\x44\x3c\x86\xa4\x6d\x82\x09\x89\x6c\x81\x23\
+\xef\x87\x84\xe0\x00\x21\x95\xb7\x6d\x4b\xf7\xb6\x34\x99\xe0\x42\
+\x83\x49\x0d\xca\x25\xb6\xf3\x01\xe2\x26\xb0\xbc\x55\x80\x28\xd3\
+\x0b\x04\xfb\x78\x35\xbe\xd4\x5d\xaa\xe6\x1e\x1f\x25\xc7\x51\xf0\
+\x25\x76\x4a\x21\x28\x97\x08\xb9\x44\xa3\x6d\x62\x39\x5d\x82\x97\
+\x2d\x0e\x7f\x7e\x79\x35\x45\xb0\xc7\xc8\x94\xe7\x48\xa1\xde\x09\
+\xb1\x7a\x49\xb5\x4c\x18\x2b\x5e\x1f\x9a\x71\x02\x4e\xdc\x40\xb6\
+\xc0\x41\x99\x80\x19\xb3\x90\x71\xcb\x90\x65\x3a\x86\x1a\x82\xba\
+\xd7\x93\x39\xc2\x85\xfa\x69\x13\xdd\x65\x39\x27\xe1\xaf\xbb\x91\
+\xe8\x4c\x99\xd3\xb3\x32\x6a\x6d\x68\x33\x93\x36\x41\x2e\xcf\x11\
+\x37\x81\xa0\x1c\x40\x84\xcc\x43\x8d\x81\xba\x0a\x55\x1d\x4c\xc8\
+\xae\xa4\x63\xc0\x22\x55\x38\x0d\xe7\xcc\xf2\xef\x33\x32\x92\x72\
+\xe8\xcf\xc6\x72\xb4\xe1\x16\xd1\x74\x84\x20\x60\x1c\x61\x21\x84\
+\xac\xd0\x34\x6a\x0c\xd4\x85\x9c\x75\x0a\x21\x41\xb9\xc4\xa6\x57\
+\x41\x3c\x1e\x83\x93\xe8\xb6\x6c\x9d\x7b\xd8\x73\xfe\xab\x99\xf5\
+\x16\xe0\xba\x45\xac\x2d\x64\x10\x96\xfc\x45\x15\x09\x17\x35\x06\
+\xea\x2a\x01\x6f\x0d\x18\x47\xc8\x24\x42\x2a\xb0\xb6\xed\xc3\xb1\
+\x62\x68\x6b\x3e\x4b\x32\x3f\x9a\xd0\x33\x30\x0f\x77\x71\x49\x65\
+\x57\x73\xa3\x2a\xe2\xa7\xe7\x27\xef\x2b\xd4\x10\xd4\x95\x42\x76\
+\xa3\xbd\xc9\x42\x48\x05\x2a\x94\x83\x32\x09\xaf\x28\x61\x5b\x26\
+\xa0\xfb\x31\x33\xfa\x49\x45\x55\x71\x6a\x6e\xf2\xc1\x3c\xf6\x20\
+\xa8\xb9\xf9\x62\xe6\x5e\xa3\x63\x5c\x8e\x13\x03\x99\x42\x80\x84\
+\x6d\xc2\x32\x35\x1a\xac\x18\x84\x90\x58\xdf\xd8\x45\x2e\xdd\x3e\
+\x34\xfb\x71\x70\x1e\xff\x20\x83\xcf\xbe\xdf\x4d\xd8\xc6\x93\x44\
+\xdc\x00\x65\x02\x96\xa9\xb1\x9e\x2e\x61\x67\xc7\x07\xf5\x19\x98\
+\x4f\xc1\x7c\xfe\x45\x71\xf6\x1c\xfb\x20\x3e\xe5\x4f\xdb\x9a\x93\
+\xd0\x3a\xc2\x66\xd6\xc7\xa6\x5b\x44\xc1\x0b\x86\x95\x10\x63\x11\
+\xe7\x5e\xc4\x55\x5a\x09\xe9\xce\x8d\xdf\x51\xd8\x07\x29\xf9\x14\
+\x1b\xdb\x11\x4c\x68\xa4\xb7\x8a\x28\xee\xfa\xfd\xd3\x6f\xaf\x4d\
+\xe1\x3f\x11\x1a\xd0\x63\x2b\xf9\x52\x46\x85\x8a\x2a\xc6\x06\xbe\
+\xbd\xbf\x9e\xc2\x21\xfc\x05\x06\xd0\x87\xe2\x89\xeb\xae\x51\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x37\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x01\xc9\x49\x44\x41\x54\x38\xcb\x63\
+\xf8\xff\xff\x3f\x03\x25\x98\x81\x66\x06\x38\xb4\xdf\x70\x70\xee\
+\xbe\xd1\xea\xd9\x77\x6b\x8a\x73\xe7\xcd\x7e\x87\x96\x1b\x13\x1c\
+\x5b\x6e\xcc\xb2\x2a\xbe\xdc\x65\x94\x74\x86\x57\x2f\xfa\x24\x23\
+\x5e\x03\xec\x9a\xaf\x07\xe7\x2c\x7f\x74\x6f\xe2\x9e\x97\xff\xfb\
+\x77\x3d\xff\xdf\xbd\xfd\xf9\xff\xc2\x25\x8f\x7e\x3b\xd5\x5d\xdb\
+\xa6\x1f\x73\x9a\x8b\xa0\x0b\xac\x6b\xaf\xc9\x84\x4d\xbb\xbb\xab\
+\x78\xe5\xe3\x4f\xc5\x2b\x1e\x7e\x2d\x5c\xf2\xf0\xbb\x5d\xf9\xe5\
+\x19\x06\xf1\xa7\x39\x88\xf2\x82\x4d\xe5\x95\xf2\x82\x65\x8f\xbe\
+\xbb\x77\xdc\x5a\xeb\x5c\x77\x6d\x41\xd3\xba\x27\xff\xad\x72\xcf\
+\xcf\x24\x2a\x0c\x2c\x0a\x2f\x2a\x25\xcf\xbe\xf7\x28\x6e\xda\x9d\
+\xfb\xa6\x99\xe7\x43\x80\xb8\xa1\x66\xe5\xa3\xff\x56\x39\x17\x97\
+\x12\x34\xc0\x34\xeb\x02\xb3\x53\xc3\xf5\x55\x59\xf3\xef\x7f\x37\
+\x49\x3b\x9b\xa6\x1f\x7b\x92\xcb\x38\xf1\x4c\x47\xe5\xb2\x87\xff\
+\x5d\xaa\xae\x5e\x52\xf7\x3a\xc4\x86\xd7\x00\xb3\xac\xf3\x31\x19\
+\x73\xef\x7f\x0b\xea\xbe\x75\xd1\x30\xfe\xb4\x9f\x5e\xe4\x71\x2d\
+\xf3\xf4\xb3\x0b\xaa\x80\x06\x04\xb7\xdd\xf8\xa4\xea\xb6\x9f\x17\
+\xa7\x01\x46\xc9\x67\x44\xe3\x26\xdf\x7e\x55\xb9\xfc\xd1\x7f\xaf\
+\xe6\x1b\x97\xad\xb2\xce\x6f\xb2\xcc\x38\xb7\xd5\xb5\xea\xea\x8d\
+\xc6\x15\x8f\xff\x87\xb5\xdd\xfc\xa9\xec\xb8\x4f\x1a\xab\x01\x06\
+\xb1\xa7\x19\xed\x4b\x2e\xcf\x06\xf9\xd5\x3c\xed\x0c\x4a\x60\x99\
+\x27\x9f\xd9\x58\xbe\xe0\xfe\xff\xa8\xce\x5b\xff\x95\xec\x76\x2b\
+\x61\x18\xa0\x1f\x73\x8a\x0b\x18\x3d\x2e\xa5\x4b\x1e\xfe\x8f\xe8\
+\xb9\xf5\x46\x27\xe8\x98\x2d\x4c\x81\x8a\xeb\x7e\x61\x75\x8f\xc3\
+\xf5\xd9\xd3\xee\xfc\x4f\xe8\xbf\xfd\x5f\xd1\x7e\x6f\x88\x9c\xc5\
+\x36\x26\x14\x03\x2c\x32\xce\xad\x8b\xed\xbf\xf5\x2f\x61\xc2\xed\
+\xff\x01\xcd\xd7\xdf\x6a\x07\x1c\xe9\x55\x76\xda\x2b\xa0\x64\xbf\
+\x47\x4b\xdb\xf7\xf0\x22\xa7\xc2\x0b\xaf\x02\xeb\xae\xfd\xf7\xad\
+\xb9\xfa\xdf\x30\xf4\xd8\x5e\x59\xcb\x6d\x86\xb4\xcf\x0b\x74\x33\
+\x00\x00\x25\x4f\xaf\xa6\x63\x18\x7c\x67\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x1c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x02\xae\x49\x44\x41\x54\x38\xcb\x95\
+\x92\xcb\x4b\x94\x51\x18\xc6\xdf\xef\x3a\xf3\x79\xb7\x70\xf0\x56\
+\x92\xa8\x90\x1b\x17\x41\xa0\x44\x1b\xe9\xb6\x29\xe8\x3f\x10\xca\
+\x45\xd0\xca\x42\x30\x70\xd9\x32\x82\x96\x05\x49\x0b\x09\x94\xc8\
+\xc0\x4a\xc9\xd0\xca\x4b\xd4\xc2\x30\x4d\xad\x46\x1b\x35\x71\x9c\
+\x19\xe7\xbb\x9d\xf3\x9d\xdb\x7c\x1d\x07\x8a\x20\x15\x3a\xf0\x6e\
+\x0e\xe7\xf9\xbd\xef\xfb\x9c\x47\x09\xc3\x10\x0e\x3a\x03\xd3\xb6\
+\x4e\x05\xaf\xa6\x54\xd4\xe0\x80\x57\x20\x42\x9b\x64\xdd\xf6\x31\
+\x1d\x73\x11\xb9\xa4\x1c\x04\x78\x3c\x99\xb5\xa4\x70\x8c\x0b\xd6\
+\x4a\x99\x00\xc6\x39\x08\x4e\xc1\x8a\xa8\x90\x48\xba\xf0\x7d\xd3\
+\x7b\xa9\x1f\xd4\x1d\x13\x7a\xdd\xd4\xc2\xd6\xd2\x02\x15\x08\xcb\
+\x01\xa1\x8a\xbc\x53\xc1\xf6\x09\x44\x0d\x05\xd2\x59\xa7\x7d\xdf\
+\x09\xee\x8f\x6c\x9a\x3e\xe1\x76\x55\x99\x11\xc5\x84\x40\xca\x09\
+\x76\x81\xe0\x07\x1c\x8a\x2d\x0d\x16\x57\xd3\xf0\x63\x6d\xe7\xa6\
+\xba\x5f\xf7\xab\xe7\xaa\xa8\x83\xf0\x9d\xd5\xa4\x23\x45\x14\x22\
+\x72\xd6\xac\x47\xc0\x76\x11\x78\x08\x43\x26\xe5\x01\xb5\xfd\xe5\
+\x7f\x56\x78\x34\x91\x3e\x2a\xe2\xcf\x7a\x19\x63\x5a\x6f\x67\x67\
+\x47\xe7\xdd\x19\xec\x60\x7e\xab\xb2\xdc\x8c\x16\x47\x55\xd8\x4c\
+\x05\xa0\xa9\x11\xf0\x6c\x09\x70\xd1\xf6\x9f\x15\xfa\xdf\x65\x2c\
+\x69\x54\x3f\xb3\xd7\x2f\x1c\x89\x6e\x45\x0c\xc3\x80\xd9\xd9\xd9\
+\xbe\xae\xae\xae\x8e\x33\xdd\xcf\x4f\x71\x4c\x46\x6b\x63\xc5\x56\
+\x61\x91\x21\xfd\x60\x30\x37\x15\x87\xc0\x45\x75\x79\x80\xec\xaa\
+\xcb\x8e\x0b\x11\x43\x69\x84\x50\xc0\x66\x7c\x96\x37\x94\x13\x7d\
+\x7e\x7e\xbe\x0f\x63\x7c\x45\x56\xe9\x4c\xe6\x64\x33\x0b\x82\xd1\
+\xca\x9a\x12\xcb\x4d\xfb\x90\x4c\xa4\xbe\xe6\x72\xb4\x39\xef\x01\
+\x0e\x68\x35\x26\xbc\xb1\xc0\x04\xd0\x94\x1c\x18\x87\x9b\xf4\xb7\
+\x2b\x26\x5d\x36\x4e\x3f\x94\xe2\x07\x08\xa1\xa9\xc6\xf0\xc5\x37\
+\xe6\xa2\xb3\x2b\x9f\x12\x68\x2b\xb1\xf5\x94\x8b\xa0\x65\x71\xbc\
+\x9b\xe7\x3d\xf0\x10\xad\x01\x10\x12\x14\xc2\x46\x1a\x41\x61\x54\
+\x01\xeb\x50\x8d\xc9\x96\x3e\xbf\xaa\xaf\xaf\x37\x62\xb1\x18\x0c\
+\x0e\x0e\x8e\xd7\xe9\x23\x6d\x4b\x7e\xdb\x71\x29\x4c\xfc\xf6\x2c\
+\x0f\x70\x31\xae\xd0\x14\x90\x6e\x87\x12\x16\x40\x72\x87\x41\x69\
+\x81\x0e\xb5\xc7\x1a\x8c\xc9\xb9\x37\xd0\xe2\xc5\x81\x10\x32\x3d\
+\x34\x34\x94\x91\xcf\x33\x7f\x9b\x9e\x07\xd8\x2e\x6e\x2a\xb2\x54\
+\x90\x5a\x70\x10\xd9\x5d\x09\xb6\x32\x14\xa2\xba\x06\x56\xed\x09\
+\x18\x7e\x3f\xcd\xb8\x68\xb9\xb6\xd7\x77\x6b\xdb\xb1\x8b\xa6\xcc\
+\xf4\x58\x45\x99\xa9\x39\x7e\x00\xa6\x1c\x45\xea\x40\x57\x15\x10\
+\x39\x01\x89\x95\x6d\xf9\xe7\x61\xcf\xc7\xe1\xee\x89\xbd\x00\x7a\
+\xd6\xc5\x5e\x49\x81\x6a\x08\x99\x73\x1f\x13\x58\xdb\xb0\xc1\xdd\
+\xf1\x01\x7b\x01\x04\x32\x38\xd8\xf1\xa7\x85\x10\xf7\xf6\x0b\x9c\
+\x9e\xf5\xd0\x98\x1a\x1a\xe7\x17\x52\x2e\xac\xaf\x67\x18\xf3\x83\
+\x1e\x41\xf9\xb2\x08\xe8\x36\xa7\x74\x43\xe4\xf8\xcf\x2f\xaf\x6f\
+\xf0\x7d\x01\xc8\x45\x97\x9d\x24\x7b\x22\x83\xd2\xce\x31\x2d\xfa\
+\x30\xd0\x41\xe1\x3f\xce\x2f\x64\xab\xaa\x6f\xee\xc8\x5e\x97\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x0a\
+\x47\
+\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\x69\xba\xfe\x27\
+\x53\x77\x8c\x93\x98\x5f\xaf\xf1\x76\xb7\xec\xab\xd6\xfa\x5c\xa1\
+\xdc\xa1\xc9\xeb\x66\xaa\xe3\x57\x9e\xd9\xb5\xd9\xf7\xc9\xe6\xff\
+\x69\xad\xe5\x6d\x82\x93\x95\xcd\xfc\x2d\x5c\x84\x46\x62\x7a\x1a\
+\x3c\x59\x75\xc0\xff\x61\xa7\xe0\xfd\xfd\xfd\x6f\xb2\xe9\x5f\xa5\
+\xde\xa8\xcf\xf0\xd8\xed\xfe\x5c\x76\x8b\x3c\x4f\x60\x6c\xaf\xe7\
+\x53\x9a\xd4\x42\x56\x67\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
+\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x87\
+\xe0\x27\x7e\x5e\x69\x7a\x63\x4a\x42\x42\xdb\x34\x10\xaa\x7a\x19\
+\xb6\x2c\x85\xa3\x3f\xb2\x48\x63\x84\x20\xa1\x52\x61\x48\x78\xbe\
+\x0e\xb0\x72\x31\x5d\x10\x08\x49\x04\xe5\xe9\x28\x08\x1b\xcf\x85\
+\x81\xf0\x4c\xa2\x1d\xaa\xb5\xb2\xd9\x42\xbd\x13\x40\x98\x64\xdd\
+\x30\xb8\xa5\x83\xc1\x02\x98\xb2\x15\x50\xc4\xc1\x23\x9f\xd7\xc5\
+\x05\x5f\x13\x16\x06\x85\x09\x06\x7f\x6c\x0e\x09\x83\x7b\x07\x09\
+\x09\x1c\x89\x24\x1a\x04\x91\x1c\x98\x98\x00\x01\x3d\x94\x04\x00\
+\x03\xa1\x03\x9b\x1e\x14\x33\x1a\x0f\x0f\x01\x01\x0f\x53\xa6\x2a\
+\x24\x27\x25\xb0\xb4\xb5\x21\x00\x3b\
+\x00\x00\x01\x26\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x04\x00\x00\x00\xb5\xfa\x37\xea\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x00\xb8\x49\x44\x41\x54\x28\xcf\x75\
+\x91\x5b\x0e\xc2\x20\x10\x45\xa7\xae\xc3\x26\xee\x81\x86\x7d\x9a\
+\xe8\x87\x1b\xd4\xf8\x8a\xb5\x4f\x28\xd4\xeb\x40\x5f\xd6\x96\x9c\
+\xe1\x87\x39\x61\x2e\x19\x02\xd1\x96\x04\xc9\x3f\x76\xb4\x01\x39\
+\x5c\x09\x95\x9a\xd6\x62\x42\xe1\xb0\x1f\x14\x57\xd2\xb4\x05\x4a\
+\xcf\x1b\x2f\x5c\x59\xb9\xe0\xd8\x2b\x44\x11\x49\x8b\x1a\x9a\x4f\
+\x8d\x1c\x29\x6e\x2c\x54\x28\x70\x62\x65\x14\xb4\xa7\xe6\x46\x86\
+\xfb\x38\x8a\xb3\x44\xbd\x60\xfc\x85\xe1\xe9\x6e\xcc\x83\x5f\x39\
+\xcf\x85\x81\x4e\xc9\x38\xc9\x73\x5d\xe8\x94\x8a\xb3\x64\x21\xc1\
+\xa2\xe1\x34\x15\x13\x14\x8c\x0f\xac\xd6\x04\xe3\x69\x18\x15\x16\
+\x9a\x91\xc0\x2f\x26\x7e\x85\xcf\x3c\x45\x4f\x4b\xb2\xdb\x45\xa2\
+\x4b\xdb\x2e\xdb\x3a\x27\xd1\x09\x31\x25\x8b\x75\x3b\x04\xc5\xa0\
+\x2f\x32\xa5\x5b\xf0\xae\x79\xb6\x4f\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x01\xfc\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x01\x8e\x49\x44\x41\x54\x38\xcb\x95\
+\x93\xcd\x6a\x93\x41\x14\x86\x9f\x49\xd3\xaf\xb5\xb1\x60\x4a\x2d\
+\x5d\x44\x41\x2d\x82\xe0\xd2\x9d\x37\xd2\xb5\xb8\x16\xf4\x0e\xb2\
+\xf4\x12\x02\x8a\x77\xe4\x46\x8b\x11\x17\x0d\x66\x13\x90\x68\x4b\
+\x8a\xcd\xcc\xf9\x73\x11\xf3\xab\x62\x32\x70\x38\x67\xf3\x3e\xf3\
+\xbe\x87\x99\x14\x11\x6c\x7a\xce\xde\xbe\x78\xed\x6e\xaf\xcc\x74\
+\x54\xdf\x44\xf8\xe9\xdd\xcb\x2f\xee\x76\x52\xdd\x3e\xe6\xbc\x77\
+\xc6\x41\xad\xd2\x19\xa0\xdd\x6e\x87\xbb\x33\x2d\x33\x9b\xf5\x67\
+\x8f\x83\x1a\x4e\x75\x78\xcc\xcd\x7b\x27\xb8\x39\x71\xfe\x01\x91\
+\xcc\x0c\x60\x66\xb4\x5a\x2d\x00\x52\x4a\x4b\x3d\xe2\x23\xcd\x27\
+\x4f\x81\x44\xbe\x1a\x62\x92\x89\x70\x44\x74\x19\xb0\x2a\x9e\xce\
+\x66\x86\x9b\x51\x46\x03\x4c\x0b\x50\x23\xdc\xfe\x74\xb0\x28\x5a\
+\x9c\x55\x0b\x6e\x82\x69\xc1\xb5\x00\x89\x70\xa7\x94\xf1\x1c\xa0\
+\xaa\xff\x04\x98\x16\x42\x15\x97\x32\x71\x10\x13\x80\xca\x98\xda\
+\xdf\x1c\xac\x96\xfc\xbe\xd9\x24\x13\x72\xcd\x51\xb3\x47\x84\x52\
+\x4a\x9e\x03\x16\x1d\xac\x3a\x11\x29\x98\x2a\x56\x32\x8d\x1b\x3f\
+\x38\xb8\x35\x64\x7b\xeb\x1a\x91\xff\x44\x98\x03\xc6\xb8\x66\x4c\
+\x32\x17\xdf\xb7\x70\x3d\x24\x97\xc1\xf2\x12\xa7\x80\xd5\xfc\x29\
+\x25\x4a\xc9\xb8\x0a\x2e\x19\x13\x61\x98\xeb\xe0\x8e\x48\x59\x0f\
+\xa0\x32\x9e\xec\x40\x05\xd3\x4c\x4a\x75\xdc\x1d\xd5\x35\x01\x45\
+\xf2\x44\x2c\x19\x97\x42\x4a\x4e\xc4\x06\x00\x91\x49\x84\xbd\xe6\
+\x1d\x5c\x05\xcd\x3f\x21\x06\x98\x29\xa9\xd3\xe9\x44\xb7\xdb\xa5\
+\xdf\xef\x2f\xbd\xff\xc5\x7e\x7a\xbf\x47\x63\x7f\x9f\x9d\xdd\x06\
+\xd5\xee\x1e\xdb\xd5\x0e\xa3\xab\x0b\xbe\x7e\x7e\xff\x2d\xad\xf3\
+\x9d\xdf\x3c\xbf\x7b\x64\xa6\x0f\xcc\xe4\x91\x99\x3e\x74\xb7\x56\
+\xad\x5e\x9d\x9a\xe4\xcb\x5f\x46\x70\x4f\xed\x22\xbf\x10\x87\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xf8\
+\x47\
+\x49\x46\x38\x39\x61\x10\x00\x10\x00\xc4\x1f\x00\xb9\xe2\x93\x66\
+\x97\x42\xfe\xfe\xfd\xd3\xee\xb7\xbd\xe5\x95\xb7\xda\x95\xad\xcb\
+\x99\x6e\xa0\x49\x6a\x9d\x43\x67\x98\x44\x6a\x9a\x48\xb7\xdc\x93\
+\x9e\xbc\x89\x8a\xd4\x40\xde\xf2\xcc\x5e\x91\x3c\xb4\xd7\x95\x88\
+\xd4\x3f\xc5\xf0\x99\x87\xd0\x40\xb6\xd8\x97\x88\xd1\x40\x68\x9a\
+\x42\xc3\xee\x98\xd6\xf2\xbb\xb9\xe0\x94\xd3\xf3\xb0\xb5\xd8\x95\
+\xfe\xfe\xfe\x50\x87\x2b\xff\xff\xff\xff\xff\xff\x21\xf9\x04\x01\
+\x00\x00\x1f\x00\x2c\x00\x00\x00\x00\x10\x00\x10\x00\x00\x05\x75\
+\xe0\x27\x8e\x5e\xe9\x89\xe5\x48\x7a\x4a\x10\x28\xe5\x73\xaa\x9c\
+\x83\x60\x03\x86\x1d\x46\x97\x8a\x1c\x4f\x67\x00\x00\x54\x1a\x0b\
+\x8c\x6f\x56\xea\x30\x3a\x50\xca\x24\x42\xf0\x71\x80\x42\x8b\xa9\
+\x73\x21\x64\x96\xa4\x84\x27\x08\x2d\x83\x4d\xe8\xb4\xe9\xd3\x34\
+\x5b\x3d\xe2\x55\x47\x73\x91\x2c\x3d\x16\x2b\x4a\x28\x89\x4c\x28\
+\x65\x4f\x3f\x4d\x12\x0b\x0d\x15\x45\x10\x3e\x02\x72\x06\x07\x05\
+\x05\x1b\x10\x0a\x0e\x57\x2a\x1e\x32\x2c\x2e\x30\x33\x97\x4c\x6b\
+\x2a\xa1\xa2\xa3\x21\x00\x3b\
+"
+
+qt_resource_name = "\
+\x00\x06\
+\x07\x03\x7d\xc3\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
+\x00\x10\
+\x06\x0f\x8c\xe7\
+\x00\x6d\
+\x00\x6f\x00\x62\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x70\x00\x68\x00\x6f\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x06\x68\x0f\xa7\
+\x00\x62\
+\x00\x75\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x5f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x08\x65\xa0\xf6\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x73\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x67\x00\x69\x00\x66\
+\
+\x00\x0b\
+\x0b\x73\x9d\xc7\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x57\x5a\xe7\
+\x00\x66\
+\x00\x6f\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0a\x93\x87\x07\
+\x00\x64\
+\x00\x69\x00\x73\x00\x63\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x0b\x9e\xc7\x56\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x69\x00\x6e\x00\x66\x00\x6f\x00\x2e\x00\x67\x00\x69\x00\x66\
+\x00\x0e\
+\x0f\x12\x91\x27\
+\x00\x70\
+\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x77\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x00\x8c\x5a\x27\
+\x00\x64\
+\x00\x6f\x00\x6f\x00\x72\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x12\
+\x0d\xa0\xf7\x36\
+\x00\x61\
+\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x72\x00\x65\x00\x66\x00\x72\x00\x65\x00\x73\x00\x68\x00\x2e\x00\x67\x00\x69\
+\x00\x66\
+"
+
+qt_resource_struct = "\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x02\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x3e\xf4\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x37\x61\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x31\xd4\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x33\x72\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x39\x9c\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x34\x71\
+\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x3c\xbc\
+\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x40\xf4\
+\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x3d\xca\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,371 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for changing facility passwords (AT+CPWD) on many modems at once.
+
+The old and new passwords of each modem are read from a CSV file with a row
+for each password to change:
+
+    port,facility,old_password,new_password
+    /dev/ttyUSB0,P2,5678,8765
+    /dev/ttyUSB0,AB,0000,4321
+    /dev/ttyUSB1,P2,5678,2468
+
+A number of ports are open at a time, the password changes of each are queued
+at once and a port is closed to make room for the next as soon as its changes
+have finished. The result of every change is appended to a journal file as it
+arrives. A change that returned OK, ERROR or "+CME ERROR" is not sent again
+when the job is run again with the same journal, so an interrupted job can be
+resumed without redoing finished modems and a rejected old password is never
+sent twice. Changes that timed out or whose port failed are sent again. The
+late reply to a change that timed out is discarded by the command queue, so it
+is never recorded as the result of the next change.
+
+Numeric error codes are turned on with AT+CMEE=1 before the changes are
+sent, and the verbose form ("+CME ERROR: incorrect password") is recognised
+too, for devices that do not accept it.
+
+Each change is also written to the journal before it is sent. A change that
+was sent but has no final result may have been made, so when the job is
+resumed the new password is tried first (changing it to itself), and the old
+one is only used if the modem rejects it as incorrect. This avoids sending the
+old password for changes that were made just before the job was interrupted.
+
+Note that a wrong password counts towards blocking it either way: if the
+change was never made, trying the new password uses up one attempt (e.g. of
+PIN2's three) before the old password is sent. A correct password resets the
+count, so this only blocks a password that already had a single attempt left.
+Passwords are not written to the journal, so use a new journal for each
+rotation.
+"""
+
+# Standard library modules
+import csv
+import json
+import os
+import time
+
+# 3rd party modules
+import serial
+
+# Local application modules
+from atcommands import build
+from commandqueue import DEFAULT_TIMEOUT, DEFAULT_WINDOW
+from session import AtSession, SessionLoop
+
+# Number of ports open at a time
+DEFAULT_PARALLEL = 8
+
+# Columns of the credentials file
+COLUMNS = ('port', 'facility', 'old_password', 'new_password')
+
+# Journal result of a change that has been sent, and the result codes of an
+# incorrect password, numeric and verbose
+SENT = 'SENT'
+INCORRECT_PASSWORD = ('+CME ERROR: 16', '+CME ERROR: INCORRECT PASSWORD')
+
+class PasswordChange(object):
+    """
+    A password to change on the modem connected to a port.
+    """
+
+    def __init__(self, port, facility, old_password, new_password, line_number=None):
+        self.port = port
+        self.facility = facility
+        self.command = build('change_password', facility=facility,
+                             old_password=old_password, new_password=new_password)
+        self.verify_command = build('change_password', facility=facility,
+                                    old_password=new_password, new_password=new_password)
+        self.line_number = line_number
+
+    def __repr__(self):
+        return '<PasswordChange %s %s>' % (self.port, self.facility)
+
+    def key(self):
+        return '%s/%s' % (self.port, self.facility)
+
+def parse_credentials(lines):
+    """
+    Parse the rows of a credentials file into a list of "PasswordChange"
+    objects. Raises a ValueError naming the line of the first error.
+    """
+    reader = csv.DictReader(lines)
+    missing = [c for c in COLUMNS if c not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError('Line 1: missing column "%s"' % missing[0])
+    changes = []
+    keys = set()
+    for row in reader:
+        line_number = reader.line_num
+        values = dict((c, (row[c] or '').strip()) for c in COLUMNS)
+        if not any(values.values()):
+            continue
+        values['facility'] = values['facility'].upper()
+        try:
+            change = PasswordChange(line_number=line_number, **values)
+        except ValueError, e:
+            raise ValueError('Line %d: %s' % (line_number, e))
+        if change.key() in keys:
+            raise ValueError('Line %d: %s is listed more than once' % (line_number, change.key()))
+        keys.add(change.key())
+        changes.append(change)
+    return changes
+
+def load_credentials(path):
+    """
+    Parse the credentials in a CSV file.
+    """
+    with open(path, 'rb') as f:
+        return parse_credentials(f)
+
+def is_incorrect_password(result):
+    """
+    Return True if a result code means the password given was wrong.
+    """
+    return result is not None and result.upper() in INCORRECT_PASSWORD
+
+def is_final(result):
+    """
+    Return True if a result means the change must not be sent again:
+    it succeeded, or the modem rejected it (e.g. the old password was
+    wrong, which counts towards blocking the SIM card). A plain ERROR is
+    final too, as modems without numeric error codes answer a wrong
+    password with it.
+    """
+    return result in ('OK', 'ERROR') or result.startswith('+CME ERROR')
+
+class Journal(object):
+    """
+    The results of the password changes of a job, one JSON object per
+    line, appended and flushed to disk as each arrives.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.results = {}
+        self.sent = set()
+        try:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short when the job was interrupted
+                        continue
+                    key = '%s/%s' % (entry['port'], entry['facility'])
+                    self.results[key] = entry['result']
+                    if entry['result'] == SENT:
+                        self.sent.add(key)
+        except IOError:
+            pass
+        self.file = None
+
+    def is_done(self, change):
+        result = self.results.get(change.key())
+        return result is not None and is_final(result)
+
+    def record(self, change, result):
+        if self.file is None:
+            self.file = open(self.path, 'a')
+        entry = {
+            'port': change.port,
+            'facility': change.facility,
+            'result': result,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime()),
+        }
+        self.file.write(json.dumps(entry, sort_keys=True) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.results[change.key()] = result
+        if result == SENT:
+            self.sent.add(change.key())
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class PasswordRotation(object):
+    """
+    Changes passwords on many modems, with at most "parallel" ports open at
+    a time, recording the results in a "Journal". Changes the journal shows
+    as finished are skipped.
+    """
+
+    def __init__(self, changes, journal, baudrate=9600, parallel=DEFAULT_PARALLEL,
+                 window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, report=None):
+        self.journal = journal
+        self.baudrate = baudrate
+        self.parallel = max(1, parallel)
+        self.window = window
+        self.timeout = timeout
+        self.report = report if report is not None else (lambda change, result: None)
+        self.loop = SessionLoop()
+        self.skipped = [change for change in changes if journal.is_done(change)]
+
+        # Changes still to send, grouped by port in the order first listed
+        self.pending = []
+        self.changes = {}
+        for change in changes:
+            if journal.is_done(change):
+                continue
+            if change.port not in self.changes:
+                self.pending.append(change.port)
+                self.changes[change.port] = []
+            self.changes[change.port].append(change)
+
+        # Open ports, the number of their changes still running and the
+        # changes whose results have been recorded in this run
+        self.sessions = {}
+        self.running = {}
+        self.recorded = set()
+
+    def record(self, change, result):
+        self.journal.record(change, result)
+        self.recorded.add(change.key())
+        self.report(change, result)
+
+    def start_port(self, port):
+        """
+        Open a port and queue all of its password changes. Changes that were
+        sent in an earlier run try the new password first.
+        """
+        try:
+            session = AtSession.open(port, self.baudrate, window=self.window, timeout=self.timeout)
+        except serial.SerialException, e:
+            for change in self.changes[port]:
+                self.record(change, 'PORT ERROR: %s' % e)
+            return
+
+        # Drop replies to commands sent before an interrupted run, so they are
+        # not taken as the replies to this run's commands
+        session.serial_conn.flushInput()
+        self.sessions[port] = session
+        self.running[port] = len(self.changes[port])
+        self.loop.add(session)
+        session.command(build('error_format', mode=1))
+        for change in self.changes[port]:
+            if change.key() in self.journal.sent:
+                response = session.command(change.verify_command)
+                response.add_callback(lambda response, change=change: self.verify_finished(change, response))
+            else:
+                self.send_change(change)
+
+    def send_change(self, change):
+        self.journal.record(change, SENT)
+        response = self.sessions[change.port].command(change.command)
+        response.add_callback(lambda response, change=change: self.change_finished(change, response))
+
+    def verify_finished(self, change, response):
+        """
+        Send a change that was sent in an earlier run, unless the modem
+        already has the new password.
+        """
+        if is_incorrect_password(response.result) and change.port in self.sessions:
+            self.send_change(change)
+        else:
+            self.change_finished(change, response)
+
+    def change_finished(self, change, response):
+        # Commands cancelled because the port failed or was closed are
+        # recorded by "finish_port"
+        if response.timed_out:
+            self.record(change, 'TIMEOUT')
+        elif response.result is not None:
+            self.record(change, response.result)
+        if change.port in self.running:
+            self.running[change.port] -= 1
+
+    def finish_port(self, port, error=None):
+        """
+        Close a port whose changes have finished. If its serial port failed
+        the changes that did not finish are recorded as failed.
+        """
+        session = self.sessions.pop(port)
+        del self.running[port]
+        if session in self.loop.sessions:
+            self.loop.remove(session)
+        session.close()
+        if error is not None:
+            for change in self.changes[port]:
+                if change.key() not in self.recorded:
+                    self.record(change, 'PORT ERROR: %s' % error)
+
+    def run(self):
+        """
+        Run the job until every change has finished.
+        """
+        try:
+            while self.pending or self.sessions:
+                while self.pending and len(self.sessions) < self.parallel:
+                    self.start_port(self.pending.pop(0))
+                if self.loop.sessions:
+                    self.loop.run_once()
+                for port, session in self.sessions.items():
+                    if session in self.loop.failed:
+                        self.finish_port(port, self.loop.failed.pop(session))
+                    elif self.running[port] == 0:
+                        self.finish_port(port)
+        finally:
+            for port in self.sessions.keys():
+                self.finish_port(port)
+            self.journal.close()
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    import sys
+
+    parser = OptionParser(usage='%prog [options] CREDENTIALS JOURNAL')
+    parser.add_option('-b', '--baud', type='int', default=9600,
+                      help='baud rate of the ports [default: %default]')
+    parser.add_option('-p', '--parallel', type='int', default=DEFAULT_PARALLEL,
+                      help='number of ports open at a time [default: %default]')
+    parser.add_option('-t', '--timeout', type='float', default=DEFAULT_TIMEOUT,
+                      help='seconds to wait for each response [default: %default]')
+    parser.add_option('-w', '--window', type='int', default=DEFAULT_WINDOW,
+                      help='number of commands sent before waiting for a response [default: %default]')
+    options, args = parser.parse_args()
+    if len(args) != 2:
+        parser.error('a credentials file and a journal file are required')
+    credentials_path, journal_path = args
+
+    try:
+        changes = load_credentials(credentials_path)
+    except (IOError, ValueError), e:
+        sys.exit('%s: %s' % (credentials_path, e))
+
+    def report(change, result):
+        print '%-20s %-3s %s' % (change.port, change.facility, result)
+        sys.stdout.flush()
+
+    journal = Journal(journal_path)
+    rotation = PasswordRotation(changes, journal, options.baud, options.parallel,
+                                options.window, options.timeout, report)
+    if rotation.skipped:
+        print '%d changes already finished' % len(rotation.skipped)
+    try:
+        rotation.run()
+    except KeyboardInterrupt:
+        sys.exit('Interrupted, run again with the same journal to resume')
+
+    results = [journal.results[change.key()] for change in changes]
+    succeeded = results.count('OK')
+    rejected = len([result for result in results if result != 'OK' and is_final(result)])
+    print '%d of %d changed, %d rejected, %d to retry' % (succeeded, len(changes), rejected,
+                                                          len(changes) - succeeded - rejected)
+    sys.exit(0 if succeeded == len(changes) else 1)
@@ -0,0 +1,290 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the AT command session, which talks to a modem without
+depending on Qt.
+
+An "AtSession" owns a serial port and the queue of commands sent to it.
+A "SessionLoop" drives any number of sessions from a single thread: it
+waits on all of the serial ports at once with poll() (or select() where
+poll() is not available) and reads from whichever have data, so an idle
+session costs nothing and one process can talk to many modems.
+
+The loop relies on poll()/select() accepting serial ports, which is the
+case on POSIX systems only. Elsewhere (and in the GUI, which reads the port
+from its own thread) the data read from the port is passed to the
+session's "feed" method instead.
+
+Example:
+
+    session = AtSession.open('/dev/ttyUSB0', 115200)
+    response = session.execute('AT+CGSN')
+    print response.lines, response.result
+"""
+
+# Standard library modules
+import select
+
+# 3rd party modules
+import serial
+
+# Local application modules
+from clock import monotonic
+from commandqueue import CommandQueue, DEFAULT_TIMEOUT, DEFAULT_WINDOW
+from urc import UrcDispatcher
+
+# Directions passed to session monitors
+SENT = '>'
+RECEIVED = '<'
+
+class AtSession(object):
+    """
+    A session with a single modem.
+
+    Commands are queued with "command", which returns a "CommandResponse"
+    object straight away, or run with "execute", which waits for the
+    response. Functions registered with "add_monitor" are called with
+    the direction ("SENT" or "RECEIVED") and the data of all traffic.
+    Handlers for unsolicited result codes are registered with the
+    session's "urcs" dispatcher, e.g. session.urcs.register('RING', f).
+
+    The serial port may be given later with "attach", commands queued
+    until then are sent once the port is attached. If the connection is
+    lost, "detach" fails the commands waiting for a response and keeps the
+    commands that have not been sent until a new port is attached.
+    """
+
+    def __init__(self, serial_conn=None, window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, write_error=None):
+        self.serial_conn = serial_conn
+        self.urcs = UrcDispatcher()
+        self.queue = CommandQueue(self.write, window, timeout, write_error, self.urcs)
+        self.monitors = []
+        if serial_conn is None:
+            self.queue.pause()
+
+    @classmethod
+    def open(cls, port, baudrate=9600, **kwargs):
+        """
+        Open a serial port (with the default data format) and return a
+        session for it. Keyword arguments are passed on to the session.
+        """
+        serial_conn = serial.Serial(port, baudrate, timeout=0)
+        return cls(serial_conn, **kwargs)
+
+    def __repr__(self):
+        port = self.serial_conn.portstr if self.serial_conn is not None else None
+        return '<AtSession %s>' % port
+
+    def fileno(self):
+        """
+        Return the file descriptor of the serial port, so that sessions
+        can be passed to select().
+        """
+        return self.serial_conn.fileno()
+
+    def add_monitor(self, monitor):
+        """
+        Register a function to be called with the direction and data of
+        everything sent to and received from the modem.
+        """
+        self.monitors.append(monitor)
+
+    def remove_monitor(self, monitor):
+        """
+        Unregister a function registered with "add_monitor", so that it is
+        no longer called with the data sent and received.
+        """
+        self.monitors.remove(monitor)
+
+    def command(self, command, timeout=None):
+        """
+        Queue a command and return the "CommandResponse" object that will
+        hold its response. Leading and trailing white space is stripped.
+        """
+        return self.queue.submit(str(command).strip(), timeout)
+
+    def execute(self, command, timeout=None):
+        """
+        Send a command and wait for its response, driving the session with
+        a private "SessionLoop". Returns the finished "CommandResponse".
+        """
+        response = self.command(command, timeout)
+        SessionLoop([self]).run_until_done([response])
+        return response
+
+    def write(self, command):
+        """
+        Write a command to the serial port.
+
+        This is invoked by the command queue when the command is due to
+        be sent.
+        """
+        data = command + '\r\n'
+        for monitor in self.monitors:
+            monitor(SENT, data)
+        self.serial_conn.write(data)
+
+    def read(self):
+        """
+        Read the data waiting at the serial port and process it.
+
+        Raises "serial.SerialException" if the port has failed.
+        """
+        data = self.serial_conn.read(max(1, self.serial_conn.inWaiting()))
+        if data:
+            self.feed(data)
+
+    def feed(self, data):
+        """
+        Process data received from the modem.
+        """
+        for monitor in self.monitors:
+            monitor(RECEIVED, data)
+        self.queue.feed(data)
+
+    def flush(self):
+        """
+        Send any queued commands that the in-flight window allows.
+        """
+        self.queue.send_next()
+
+    def next_deadline(self):
+        return self.queue.next_deadline()
+
+    def check_timeouts(self):
+        self.queue.check_timeouts()
+
+    def attach(self, serial_conn):
+        """
+        Start using a serial port and send any queued commands.
+        """
+        self.serial_conn = serial_conn
+        self.queue.resume()
+
+    def detach(self):
+        """
+        Stop using the serial port (without closing it) because the
+        connection has been lost, and return it. Commands waiting for a
+        response are finished without a result code, as they may have been
+        carried out, and nothing is sent until "attach" is called.
+        """
+        serial_conn, self.serial_conn = self.serial_conn, None
+        self.queue.pause()
+        self.queue.cancel_in_flight()
+        return serial_conn
+
+    def close(self):
+        """
+        Cancel all queued commands and close the serial port.
+        """
+        self.queue.reset()
+        if self.serial_conn is not None:
+            self.serial_conn.close()
+
+class SessionLoop(object):
+    """
+    Drives a set of sessions from a single thread.
+
+    Each call to "run_once" waits until one of the serial ports has data
+    or a command times out, then processes the data of the sessions that
+    have some and the timeouts of those that are due. A session whose
+    serial port fails is closed and moved to the "failed" dictionary,
+    along with the exception that was raised.
+    """
+
+    def __init__(self, sessions=()):
+        self.sessions = []
+        self.failed = {}
+        if hasattr(select, 'poll'):
+            self.poller = select.poll()
+            self.fds = {}
+        else:
+            self.poller = None
+        for session in sessions:
+            self.add(session)
+
+    def add(self, session):
+        self.sessions.append(session)
+        if self.poller is not None:
+            fd = session.fileno()
+            self.fds[fd] = session
+            self.poller.register(fd, select.POLLIN | select.POLLPRI)
+
+    def remove(self, session):
+        self.sessions.remove(session)
+        if self.poller is not None:
+            for fd, s in self.fds.items():
+                if s is session:
+                    self.poller.unregister(fd)
+                    del self.fds[fd]
+
+    def wait(self, timeout):
+        """
+        Wait up to "timeout" seconds (forever if None) for serial ports to
+        have data and return the list of their sessions.
+        """
+        if not self.sessions:
+            return []
+        if self.poller is None:
+            return select.select(self.sessions, [], [], timeout)[0]
+        if timeout is not None:
+            timeout = int(timeout * 1000 + 0.999)
+        return [self.fds[fd] for fd, event in self.poller.poll(timeout)]
+
+    def run_once(self, timeout=None):
+        """
+        Wait up to "timeout" seconds (forever if None) for activity and
+        process it.
+        """
+        deadlines = [d for d in (s.next_deadline() for s in self.sessions) if d is not None]
+        if deadlines:
+            wait = max(0, min(deadlines) - monotonic())
+            timeout = wait if timeout is None else min(timeout, wait)
+
+        for session in self.wait(timeout):
+            try:
+                session.read()
+            except serial.SerialException, e:
+                self.remove(session)
+                self.failed[session] = e
+                session.close()
+
+        now = monotonic()
+        for session in self.sessions:
+            deadline = session.next_deadline()
+            if deadline is not None and deadline <= now:
+                session.check_timeouts()
+
+    def run_until_done(self, responses, timeout=None):
+        """
+        Run the loop until all of the responses have finished, or until
+        "timeout" seconds have passed. Returns True if all finished.
+        """
+        end = monotonic() + timeout if timeout is not None else None
+        while True:
+            if all(response.is_done() for response in responses):
+                return True
+            if not self.sessions:
+                return False
+            if end is None:
+                self.run_once()
+            else:
+                remaining = end - monotonic()
+                if remaining <= 0:
+                    return False
+                self.run_once(remaining)
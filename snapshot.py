@@ -0,0 +1,181 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for taking a snapshot of the identity of a device.
+
+A snapshot sends all of the Basic Info commands (IMEI, IMSI, manufacturer,
+model, software revision, modem capabilities and the available AT commands)
+at once, pipelined up to the session's window, and parses the responses into
+a record with one field per command. Each field is cached with a time to live,
+so a snapshot taken again soon after only sends the commands whose fields have
+expired. Records can be exported as JSON.
+"""
+
+# Standard library modules
+import json
+import time
+
+# Local application modules
+from atcommands import INFO_COMMANDS, build
+from capabilities import parse_command_list, response_value
+from clock import monotonic
+from session import SessionLoop
+
+# Fields of a snapshot, the catalog names of the Basic Info commands
+FIELDS = tuple(name for name, command, description in INFO_COMMANDS)
+
+# Seconds a field is cached for. The IMSI changes when the SIM card is
+# swapped, so it expires sooner than the fields describing the device.
+DEFAULT_TTL = 300.0
+FIELD_TTLS = {'imsi': 30.0}
+
+def parse_field(name, response):
+    """
+    Return the value of a snapshot field from its command's response:
+    a list for "capabilities" and "commands", otherwise a string.
+    """
+    if name == 'capabilities':
+        text = response_value(response, '+GCAP')
+        return [item.strip() for item in text.split(',') if item.strip()]
+    if name == 'commands':
+        return sorted(parse_command_list(response.lines))
+    prefix = {'manufacturer': '+GMI', 'model': '+GMM', 'revision': '+GMR',
+              'imei': '+CGSN', 'imsi': '+CIMI'}[name]
+    return response_value(response, prefix)
+
+class SnapshotCache(object):
+    """
+    The values of the snapshot fields of one device, with the time each
+    was read.
+
+    The cache belongs to a "source", e.g. the serial port connection. If a
+    different source is given to "check_source" the cache is cleared, as it
+    may be a different device.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, field_ttls=FIELD_TTLS):
+        self.ttl = ttl
+        self.field_ttls = dict(field_ttls)
+        self.values = {}
+        self.times = {}
+        self.source = None
+
+    def check_source(self, source):
+        if source is not self.source:
+            self.clear()
+            self.source = source
+
+    def clear(self):
+        self.values.clear()
+        self.times.clear()
+
+    def put(self, name, value):
+        self.values[name] = value
+        self.times[name] = monotonic()
+
+    def is_fresh(self, name):
+        if name not in self.times:
+            return False
+        return monotonic() - self.times[name] < self.field_ttls.get(name, self.ttl)
+
+    def stale_fields(self, fields=FIELDS):
+        return [name for name in fields if not self.is_fresh(name)]
+
+    def record(self, fields=FIELDS):
+        """
+        Return the cached fields as a dictionary, None for fields that
+        have not been read.
+        """
+        return dict((name, self.values.get(name)) for name in fields)
+
+class SnapshotTaker(object):
+    """
+    Takes a snapshot of a device through a function that queues a command
+    and returns its "CommandResponse" (e.g. "AtSession.command" or
+    "TerminalWidget.send_command").
+
+    Only the commands of stale fields are sent. "done" is called with the
+    record once their responses have arrived; a field whose command failed
+    keeps its previous value, or None, and is listed in "errors".
+    """
+
+    def __init__(self, send, cache, done, fields=FIELDS):
+        self.send = send
+        self.cache = cache
+        self.done = done
+        self.fields = fields
+        self.responses = {}
+        self.errors = {}
+        self.record = None
+
+    def start(self):
+        """
+        Queue the commands of the stale fields. If every field is fresh
+        "done" is called straight away.
+        """
+        stale = self.cache.stale_fields(self.fields)
+        if not stale:
+            self.finish()
+            return
+        for name in stale:
+            self.responses[name] = self.send(build(name))
+        for name, response in self.responses.items():
+            response.add_callback(self.response_finished)
+
+    def response_finished(self, response):
+        if self.record is not None or not all(r.is_done() for r in self.responses.values()):
+            return
+        for name, response in self.responses.items():
+            if response.is_ok():
+                self.cache.put(name, parse_field(name, response))
+            else:
+                self.errors[name] = 'TIMEOUT' if response.timed_out else response.result or 'FAILED'
+        self.finish()
+
+    def finish(self):
+        self.record = self.cache.record(self.fields)
+        self.done(self.record)
+
+def take_snapshot(session, cache, loop=None):
+    """
+    Take a snapshot of the device connected to a session, waiting for the
+    responses, and return the record.
+    """
+    if loop is None:
+        loop = SessionLoop([session])
+    taker = SnapshotTaker(session.command, cache, lambda record: None)
+    taker.start()
+    while taker.record is None and session in loop.sessions:
+        loop.run_once()
+    return taker.record
+
+def export_data(record, **extra):
+    """
+    Return a snapshot record for export, with the current time and any
+    extra fields given (e.g. port='/dev/ttyUSB0').
+    """
+    data = dict(record)
+    data['time'] = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+    data.update(extra)
+    return data
+
+def export_json(record, f, **extra):
+    """
+    Write a snapshot record to a file as JSON.
+    """
+    json.dump(export_data(record, **extra), f, indent=2, sort_keys=True)
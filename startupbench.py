@@ -0,0 +1,132 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of the application's startup time, from the start of the
+imports to the first paint of the main window.
+
+Each measurement runs in a fresh Python process, alternately loading the
+icons from the binary resource file and from the "resources" module, so
+that the two can be compared. The COM port connection dialog is not
+shown. The results are printed as JSON; a display is needed (e.g. Xvfb).
+
+    python startupbench.py --runs 10 --output startup.json
+"""
+
+# Standard library modules
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# Local application modules
+from benchmark import percentile
+from clock import monotonic
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'at_command_toolkit.pyw')
+
+def measure_startup(binary):
+    """
+    Start the application in this process and return the times (in ms
+    from the start of the imports) at which each startup phase finished.
+    """
+    start = monotonic()
+    import imp
+    app_module = imp.load_source('at_command_toolkit', APP_PATH)
+    imported = monotonic()
+
+    from PyQt4.QtCore import QEvent, QObject, QTimer
+    from PyQt4.QtGui import QApplication
+
+    app = QApplication(sys.argv)
+    app_module.load_resources(binary)
+    resources_loaded = monotonic()
+
+    window = app_module.MainWindow(connect_port=False)
+    window_built = monotonic()
+
+    painted = []
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not painted:
+                painted.append(monotonic())
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+    window.show()
+    app.exec_()
+
+    return {
+        'imported_ms': (imported - start) * 1000,
+        'resources_loaded_ms': (resources_loaded - start) * 1000,
+        'window_built_ms': (window_built - start) * 1000,
+        'first_paint_ms': (painted[0] - start) * 1000,
+    }
+
+def run(runs=5):
+    """
+    Run the startup benchmark "runs" times with each kind of resources and
+    return the results as a dictionary.
+    """
+    samples = {'rcc': [], 'py': []}
+    for i in range(runs):
+        for mode in ('rcc', 'py'):
+            start = time.time()
+            output = subprocess.Popen([sys.executable, __file__, '--child', mode],
+                                      stdout=subprocess.PIPE).communicate()[0]
+            sample = json.loads(output)
+            sample['process_ms'] = (time.time() - start) * 1000
+            samples[mode].append(sample)
+
+    results = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs,
+    }
+    for mode, mode_samples in samples.items():
+        results[mode] = dict((key, {'p50': percentile([s[key] for s in mode_samples], 0.5),
+                                    'min': min(s[key] for s in mode_samples)})
+                             for key in mode_samples[0])
+    return results
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('--runs', type='int', default=5,
+                      help='number of runs with each kind of resources [default: %default]')
+    parser.add_option('--output', metavar='FILE',
+                      help='write the results to FILE instead of stdout')
+    parser.add_option('--child', choices=('rcc', 'py'),
+                      help='measure a single startup (used internally)')
+    options, args = parser.parse_args()
+
+    if options.child:
+        print json.dumps(measure_startup(options.child == 'rcc'))
+        sys.exit(0)
+
+    output = json.dumps(run(options.runs), indent=2, sort_keys=True)
+    if options.output:
+        open(options.output, 'w').write(output + '\n')
+    else:
+        print output
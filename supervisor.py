@@ -0,0 +1,108 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the connection supervisor, which reopens a serial port
+after the connection to the device has been lost.
+
+USB modems often disappear for a moment and come back (for example when
+they reset). The supervisor remembers the settings of the last good
+connection and tries to reopen the port with them, waiting longer after
+each failed attempt (exponential backoff). On POSIX systems no attempt
+is made until the device node exists again.
+
+The supervisor does not keep time itself, the caller waits for the delay
+returned by "next_delay" between calls to "try_reconnect".
+"""
+
+# Standard library modules
+import os
+
+# 3rd party modules
+import serial
+
+# Delays between reconnection attempts, in seconds
+INITIAL_DELAY = 0.5
+MAX_DELAY = 30.0
+BACKOFF_FACTOR = 2.0
+
+# Serial port settings that are copied from the last good connection
+SERIAL_SETTINGS = ('port', 'baudrate', 'bytesize', 'parity', 'stopbits',
+                   'timeout', 'xonxoff', 'rtscts')
+
+class ConnectionSupervisor(object):
+    """
+    Reopens a serial port with the settings of the last good connection.
+    """
+
+    def __init__(self, settings, initial_delay=INITIAL_DELAY, max_delay=MAX_DELAY, factor=BACKOFF_FACTOR):
+        self.settings = dict(settings)
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.reset()
+
+    @classmethod
+    def from_serial(cls, serial_conn, **kwargs):
+        """
+        Create a supervisor for the settings of an open serial port.
+        """
+        settings = dict((name, getattr(serial_conn, name)) for name in SERIAL_SETTINGS)
+        return cls(settings, **kwargs)
+
+    def reset(self):
+        """
+        Start again from the initial delay (after a successful connection).
+        """
+        self.delay = self.initial_delay
+        self.attempts = 0
+
+    def next_delay(self):
+        """
+        Return the number of seconds to wait before the next attempt and
+        increase the delay for the attempt after that.
+        """
+        delay = self.delay
+        self.delay = min(self.delay * self.factor, self.max_delay)
+        return delay
+
+    def device_present(self):
+        """
+        Check whether the device node of the port exists. Ports that are
+        not paths (e.g. "COM3") are assumed to be present.
+        """
+        port = self.settings['port']
+        if not port.startswith('/'):
+            return True
+        return os.path.exists(port)
+
+    def try_reconnect(self):
+        """
+        Try to reopen the port. Returns the open "serial.Serial" object, or
+        None if the device is not present or the port could not be opened.
+        """
+        self.attempts += 1
+        if not self.device_present():
+            return None
+
+        try:
+            serial_conn = serial.Serial(**self.settings)
+        except (serial.SerialException, OSError):
+            return None
+
+        self.reset()
+        return serial_conn
@@ -1,77 +1,182 @@
-# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
-#
-# This file is part of the "AT Command Toolkit" application.
-#
-# The "AT Command Toolkit" is free software: you can redistribute it and/or
-# modify it under the terms of the GNU General Public License as published by
-# the Free Software Foundation, either version 3 of the License, or (at your
-# option) any later version.
-#
-# This program is distributed in the hope that it will be useful, but WITHOUT
-# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
-# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
-# details.
-#
-# You should have received a copy of the GNU General Public License along with
-# this program. If not, see <http://www.gnu.org/licenses/>.
-
-"""
-Module containing the "Basic Info" commands class/widget.
-"""
-
-# 3rd party modules
-from PyQt4.QtCore import *
-from PyQt4.QtGui import *
-
-class BasicInfoWidget(QWidget):
-    """
-    Defines the GUI and behaviour of the "Basic Info" commands widget.
-    """
-    TITLE = 'Basic Info'
-
-    def __init__(self, terminal, parent=None):
-        """
-        Initialize the interface widgets.
-        """
-        QWidget.__init__(self, parent)
-
-        # Create the buttons
-        imei_btn = QPushButton(self.tr('IMEI'))
-        imsi_btn = QPushButton(self.tr('IMSI'))
-        manufacturer_btn = QPushButton(self.tr('Manufacturer'))
-        model_btn = QPushButton(self.tr('Model'))
-        software_btn = QPushButton(self.tr('Software Revision'))
-        modem_btn = QPushButton(self.tr('Modem Capabilities'))
-        commands_btn = QPushButton(self.tr('Available AT Commands'))
-
-        # Create the button groupbox & layout
-        display_btns = QGroupBox(self.tr('Display Information:'))
-        button_box = QVBoxLayout()
-        button_box.addWidget(imei_btn)
-        button_box.addWidget(imsi_btn)
-        button_box.addWidget(manufacturer_btn)
-        button_box.addWidget(model_btn)
-        button_box.addWidget(software_btn)
-        button_box.addWidget(modem_btn)
-        button_box.addWidget(commands_btn)
-        display_btns.setLayout(button_box)
-
-        # Create main layout
-        container = QHBoxLayout()
-        container.addStretch()
-        container.addWidget(display_btns)
-        container.addStretch()
-        self.setLayout(container)
-
-        # Connect widgets
-        self.connect(imei_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+CGSN'))
-        self.connect(imsi_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+CIMI'))
-        self.connect(manufacturer_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+GMI'))
-        self.connect(model_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+GMM'))
-        self.connect(software_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+GMR'))
-        self.connect(modem_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+GCAP'))
-        self.connect(commands_btn, SIGNAL('clicked()'), lambda: terminal.send_command('AT+CLAC'))
-
-if __name__ == '__main__':
-    from standalone import run_standalone
-    run_standalone(BasicInfoWidget)
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the "Basic Info" commands class/widget.
+"""
+
+# 3rd party modules
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+
+# Local application modules
+from atcommands import build
+from snapshot import FIELDS, SnapshotCache, SnapshotTaker, export_json
+
+# Labels of the snapshot fields
+FIELD_LABELS = {
+    'imei': 'IMEI',
+    'imsi': 'IMSI',
+    'manufacturer': 'Manufacturer',
+    'model': 'Model',
+    'revision': 'Software Revision',
+    'capabilities': 'Modem Capabilities',
+    'commands': 'Available AT Commands',
+}
+
+class BasicInfoWidget(QWidget):
+    """
+    Defines the GUI and behaviour of the "Basic Info" commands widget.
+    """
+    TITLE = 'Basic Info'
+
+    def __init__(self, terminal, parent=None):
+        """
+        Initialize the interface widgets.
+        """
+        QWidget.__init__(self, parent)
+
+        # Store the terminal object for later reference
+        self.terminal = terminal
+        self.snapshot_cache = SnapshotCache()
+        self.snapshot = None
+        self.capabilities = None
+
+        # Create the buttons
+        imei_btn = QPushButton(self.tr('IMEI'))
+        imsi_btn = QPushButton(self.tr('IMSI'))
+        manufacturer_btn = QPushButton(self.tr('Manufacturer'))
+        model_btn = QPushButton(self.tr('Model'))
+        software_btn = QPushButton(self.tr('Software Revision'))
+        modem_btn = QPushButton(self.tr('Modem Capabilities'))
+        commands_btn = QPushButton(self.tr('Available AT Commands'))
+
+        # Create the button groupbox & layout
+        display_btns = QGroupBox(self.tr('Display Information:'))
+        button_box = QVBoxLayout()
+        button_box.addWidget(imei_btn)
+        button_box.addWidget(imsi_btn)
+        button_box.addWidget(manufacturer_btn)
+        button_box.addWidget(model_btn)
+        button_box.addWidget(software_btn)
+        button_box.addWidget(modem_btn)
+        button_box.addWidget(commands_btn)
+        display_btns.setLayout(button_box)
+
+        # Create the snapshot table, buttons & group box
+        self.snapshot_table = QTableWidget(len(FIELDS), 1)
+        self.snapshot_table.setVerticalHeaderLabels([self.tr(FIELD_LABELS[name]) for name in FIELDS])
+        self.snapshot_table.horizontalHeader().hide()
+        self.snapshot_table.horizontalHeader().setStretchLastSection(True)
+        self.snapshot_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.snapshot_btn = QPushButton(self.tr('Take Snapshot'))
+        self.export_btn = QPushButton(self.tr('Export JSON...'))
+        self.export_btn.setDisabled(True)
+
+        snapshot_box = QGroupBox(self.tr('Snapshot:'))
+        snapshot_layout = QGridLayout()
+        snapshot_layout.addWidget(self.snapshot_table, 0, 0, 1, 2)
+        snapshot_layout.addWidget(self.snapshot_btn, 1, 0)
+        snapshot_layout.addWidget(self.export_btn, 1, 1)
+        snapshot_box.setLayout(snapshot_layout)
+
+        # Create main layout
+        container = QHBoxLayout()
+        container.addWidget(display_btns)
+        container.addWidget(snapshot_box, 1)
+        self.setLayout(container)
+
+        # Buttons by the catalog name of their command
+        self.command_btns = (
+            ('imei', imei_btn),
+            ('imsi', imsi_btn),
+            ('manufacturer', manufacturer_btn),
+            ('model', model_btn),
+            ('revision', software_btn),
+            ('capabilities', modem_btn),
+            ('commands', commands_btn),
+        )
+
+        # Connect widgets
+        for name, button in self.command_btns:
+            self.connect(button, SIGNAL('clicked()'), lambda name=name: terminal.send_command(build(name)))
+        self.connect(self.snapshot_btn, SIGNAL('clicked()'), self.take_snapshot)
+        self.connect(self.export_btn, SIGNAL('clicked()'), self.export_snapshot)
+
+    def set_capabilities(self, capabilities):
+        """
+        Disable the buttons of commands the device does not support, and
+        leave them out of snapshots.
+        """
+        self.capabilities = capabilities
+        for name, button in self.command_btns:
+            button.setEnabled(capabilities is None or capabilities.supports_name(name))
+
+    def take_snapshot(self):
+        """
+        Send the commands of the fields that are not cached, all at once,
+        and show the snapshot when their responses have arrived. The cache
+        is cleared when the serial port connection changes.
+        """
+        self.snapshot_cache.check_source(getattr(self.terminal, 'serial_conn', None))
+        self.snapshot_btn.setDisabled(True)
+        fields = [name for name in FIELDS
+                  if self.capabilities is None or self.capabilities.supports_name(name)]
+        taker = SnapshotTaker(self.terminal.send_command, self.snapshot_cache, self.show_snapshot, fields)
+        taker.start()
+
+    def show_snapshot(self, record):
+        """
+        Show the fields of a snapshot record in the table.
+        """
+        self.snapshot = record
+        for row, name in enumerate(FIELDS):
+            value = record.get(name)
+            if value is None:
+                text = ''
+            elif isinstance(value, list):
+                text = ', '.join(value)
+            else:
+                text = value
+            item = QTableWidgetItem(text)
+            item.setToolTip(text)
+            self.snapshot_table.setItem(row, 0, item)
+        self.snapshot_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+
+    def export_snapshot(self):
+        """
+        Ask for a file name and write the last snapshot to it as JSON.
+        """
+        path = QFileDialog.getSaveFileName(self,
+                                           self.tr('Export Snapshot'),
+                                           '',
+                                           self.tr('JSON Files (*.json)'))
+        if not path:
+            return
+
+        serial_conn = getattr(self.terminal, 'serial_conn', None)
+        port = serial_conn.portstr if serial_conn is not None else None
+        try:
+            with open(str(path), 'w') as f:
+                export_json(self.snapshot, f, port=port)
+        except IOError, e:
+            QMessageBox.critical(self, self.tr('Error'), self.tr(str(e)), QMessageBox.Ok)
+
+if __name__ == '__main__':
+    from standalone import run_standalone
+    run_standalone(BasicInfoWidget)
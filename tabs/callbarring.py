@@ -1,250 +1,317 @@
-# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
-#
-# This file is part of the "AT Command Toolkit" application.
-#
-# The "AT Command Toolkit" is free software: you can redistribute it and/or
-# modify it under the terms of the GNU General Public License as published by
-# the Free Software Foundation, either version 3 of the License, or (at your
-# option) any later version.
-#
-# This program is distributed in the hope that it will be useful, but WITHOUT
-# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
-# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
-# details.
-#
-# You should have received a copy of the GNU General Public License along with
-# this program. If not, see <http://www.gnu.org/licenses/>.
-
-"""
-Module containing the "Call Barring" commands class/widget.
-"""
-
-# 3rd party modules
-from PyQt4.QtCore import *
-from PyQt4.QtGui import *
-
-class CallBarringWidget(QWidget):
-    """
-    Defines the GUI and behaviour of the "Call Barring" commands widget.
-    """
-    TITLE = 'Call Barring'
-
-    def __init__(self, terminal, parent=None):
-        """
-        Initialize the interface widgets.
-        """
-        QWidget.__init__(self, parent)
-
-        # Store the terminal object for later reference
-        self.terminal = terminal
-
-        # Create "Facility" widgets & group box
-        self.facility_ao = QRadioButton(self.tr('AO (BAOC)'))
-        self.facility_ao.setChecked(True)
-        self.facility_oi = QRadioButton(self.tr('OI (BOIC)'))
-        self.facility_ox = QRadioButton(self.tr('OX (BOIC-exHC)'))
-        self.facility_ai = QRadioButton(self.tr('AI (BAIC)'))
-        self.facility_ir = QRadioButton(self.tr('IR (BIC-Roam)'))
-        self.facility_ac = QRadioButton(self.tr('AC (All Incoming)'))
-        self.facility_ag = QRadioButton(self.tr('AG (All Outgoing)'))
-        self.facility_ab = QRadioButton(self.tr('AB (All Barring)'))
-
-        facility_box = QGroupBox(self.tr('Facility:'))
-        facility_box_layout = QVBoxLayout()
-        facility_box_layout.addWidget(self.facility_ao)
-        facility_box_layout.addWidget(self.facility_oi)
-        facility_box_layout.addWidget(self.facility_ox)
-        facility_box_layout.addWidget(self.facility_ai)
-        facility_box_layout.addWidget(self.facility_ir)
-        facility_box_layout.addWidget(self.facility_ac)
-        facility_box_layout.addWidget(self.facility_ag)
-        facility_box_layout.addWidget(self.facility_ab)
-        facility_box.setLayout(facility_box_layout)
-
-        # Create "Class" widgets & group box
-        class_toggle = QCheckBox(self.tr('(Toggle All Classes)'))
-        self.class_voice = QCheckBox(self.tr('1 (Voice)'))
-        self.class_data = QCheckBox(self.tr('2 (Data)'))
-        self.class_fax = QCheckBox(self.tr('4 (Fax)'))
-        self.class_sms = QCheckBox(self.tr('8 (SMS)'))
-        self.class_sync = QCheckBox(self.tr('16 (Data Circuit Sync)'))
-        self.class_async = QCheckBox(self.tr('32 (Data Circuit ASync)'))
-        self.class_packet_access = QCheckBox(self.tr('64 (Dedicated Packet Access)'))
-        self.class_pad_access = QCheckBox(self.tr('128 (Dedicated Pad Access)'))
-
-        class_box = QGroupBox(self.tr('Classes:'))
-        class_box_layout = QVBoxLayout()
-        class_box_layout.addWidget(class_toggle)
-        class_box_layout.addWidget(self.class_voice)
-        class_box_layout.addWidget(self.class_data)
-        class_box_layout.addWidget(self.class_fax)
-        class_box_layout.addWidget(self.class_sms)
-        class_box_layout.addWidget(self.class_sync)
-        class_box_layout.addWidget(self.class_async)
-        class_box_layout.addWidget(self.class_packet_access)
-        class_box_layout.addWidget(self.class_pad_access)
-        class_box.setLayout(class_box_layout)
-
-        # Create buttons & network password widget
-        self.cb_enable_btn = QPushButton(self.tr('Enable'))
-        self.cb_disable_btn = QPushButton(self.tr('Disable'))
-        self.cb_interrogate_btn = QPushButton(self.tr('Interrogate'))
-        self.network_pw = QLineEdit()
-        self.network_pw.setMaximumWidth(40)
-        network_pw_box = QHBoxLayout()
-        network_pw_box.addWidget(QLabel(self.tr('Network Password:')))
-        network_pw_box.addWidget(self.network_pw)
-
-        # Create right hand side layout
-        actions_layout = QVBoxLayout()
-        actions_layout.addWidget(self.cb_enable_btn)
-        actions_layout.addWidget(self.cb_disable_btn)
-        actions_layout.addWidget(self.cb_interrogate_btn)
-        actions_layout.addLayout(network_pw_box)
-        actions_layout.addStretch()
-
-        # Create main layout
-        container = QHBoxLayout()
-        container.addWidget(facility_box)
-        container.addWidget(class_box)
-        container.addLayout(actions_layout)
-        self.setLayout(container)
-
-        # Connect widgets
-        self.connect(self.facility_ao, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_oi, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ox, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ai, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ir, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ac, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ag, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(self.facility_ab, SIGNAL('toggled(bool)'), self.check_facility)
-        self.connect(class_toggle, SIGNAL('stateChanged(int)'), self.toggle_classes)
-        self.connect(self.cb_enable_btn, SIGNAL('clicked()'), self.enable_command)
-        self.connect(self.cb_disable_btn, SIGNAL('clicked()'), self.disable_command)
-        self.connect(self.cb_interrogate_btn, SIGNAL('clicked()'), self.interrogate_facility)
-
-    def validate_network_pw(self, network_pw):
-        """
-        Check that a given network password is valid. The network
-        password must be exactly 4 digits.
-        """
-        network_pw = str(network_pw)
-
-        # Check that the network password is not empty
-        if len(network_pw) == 0:
-            raise ValueError('Please enter a network password.')
-
-        # Check that the network password is only digits
-        if not network_pw.isdigit():
-            raise ValueError('The network password can only contain digits.')
-
-    def get_facility(self):
-        """
-        Determine which facility is selected on the GUI and return
-        the corresponding code to be used in AT commands.
-        """
-        if self.facility_ao.isChecked(): return 'AO'
-        if self.facility_oi.isChecked(): return 'OI'
-        if self.facility_ox.isChecked(): return 'OX'
-        if self.facility_ai.isChecked(): return 'AI'
-        if self.facility_ir.isChecked(): return 'IR'
-        if self.facility_ac.isChecked(): return 'AC'
-        if self.facility_ag.isChecked(): return 'AG'
-        if self.facility_ab.isChecked(): return 'AB'
-
-    def get_classes(self):
-        """
-        Determine which classes are selected on the GUI and return
-        the corresponding class integer to be used in AT commands.
-        """
-        i = 0
-        if self.class_voice.isChecked(): i += 1
-        if self.class_data.isChecked(): i += 2
-        if self.class_fax.isChecked(): i += 4
-        if self.class_sms.isChecked(): i += 8
-        if self.class_sync.isChecked(): i += 16
-        if self.class_async.isChecked(): i += 32
-        if self.class_packet_access.isChecked(): i += 64
-        if self.class_pad_access.isChecked(): i += 128
-        return i
-
-    def toggle_classes(self, state):
-        """
-        Toggle the "class" check boxes on and off according to
-        the "Toggle All Classes" check box state.
-
-        This is invoked whenever the "Toggle All Classes" state is changed.
-        """
-        value = True if state == 2 else False
-
-        self.class_voice.setChecked(value)
-        self.class_data.setChecked(value)
-        self.class_fax.setChecked(value)
-        self.class_sms.setChecked(value)
-        self.class_sync.setChecked(value)
-        self.class_async.setChecked(value)
-        self.class_packet_access.setChecked(value)
-        self.class_pad_access.setChecked(value)
-
-    def enable_command(self):
-        self.barring_command(True)
-
-    def disable_command(self):
-        self.barring_command(False)
-
-    def barring_command(self, enable):
-
-        # Get the necessary options
-        facility = self.get_facility()
-        action = 1 if enable else 0
-        network_pw = str(self.network_pw.text())
-        classes = self.get_classes()
-
-        # Validate the network password
-        try:
-            self.validate_network_pw(network_pw)
-        except ValueError, e:
-            QMessageBox.critical(self, self.tr('Error'), self.tr(e.message), QMessageBox.Ok)
-            self.network_pw.setFocus()
-            self.network_pw.selectAll()
-            return
-
-        if classes:
-            command = 'AT+CLCK="%s", %d, "%s", %d' % (facility, action, network_pw, classes)
-        else:
-            command = 'AT+CLCK="%s", %d, "%s"' % (facility, action, network_pw)
-
-        # Run the AT command in the terminal
-        self.terminal.send_command(command)
-
-    def interrogate_facility(self):
-        """
-        Send the AT command to interrogate the currently selected facility.
-        The result will be displayed in the terminal window.
-        """
-        self.terminal.send_command('AT+CLCK="%s", 2' % self.get_facility())
-
-    def check_facility(self):
-        """
-        Check which facility has been selected and disable any commands
-        that are not available to the chosen facility.
-
-        This method is triggered whenever a facility radio box is selected.
-        """
-
-        # Enable the "enable" and "interrogate" buttons
-        self.cb_enable_btn.setEnabled(True)
-        self.cb_interrogate_btn.setEnabled(True)
-
-        # Define a list of facilities that can only be disabled
-        disable_only = ('AC', 'AG', 'AB')
-
-        # Get the currently selected facility code & disable any necessary widgets
-        if self.get_facility() in disable_only:
-            self.cb_enable_btn.setDisabled(True)
-            self.cb_interrogate_btn.setDisabled(True)
-
-if __name__ == '__main__':
-    from standalone import run_standalone
-    run_standalone(CallBarringWidget)
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the "Call Barring" commands class/widget.
+"""
+
+# 3rd party modules
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+
+# Local application modules
+from atcommands import DISABLE_ONLY_FACILITIES, build, validate_password
+from barring import SWEEP_FACILITIES, BarringSweep, BarringSync, format_change, load_policy
+
+# Facilities as (code, label)
+FACILITIES = (
+    ('AO', 'AO (BAOC)'),
+    ('OI', 'OI (BOIC)'),
+    ('OX', 'OX (BOIC-exHC)'),
+    ('AI', 'AI (BAIC)'),
+    ('IR', 'IR (BIC-Roam)'),
+    ('AC', 'AC (All Incoming)'),
+    ('AG', 'AG (All Outgoing)'),
+    ('AB', 'AB (All Barring)'),
+)
+
+# Bearer service classes as (class, label)
+CLASSES = (
+    (1, '1 (Voice)'),
+    (2, '2 (Data)'),
+    (4, '4 (Fax)'),
+    (8, '8 (SMS)'),
+    (16, '16 (Data Circuit Sync)'),
+    (32, '32 (Data Circuit ASync)'),
+    (64, '64 (Dedicated Packet Access)'),
+    (128, '128 (Dedicated Pad Access)'),
+)
+
+# Text of each barring status in the sweep table
+STATUS_TEXT = {True: 'Yes', False: 'No', None: '?'}
+
+class CallBarringWidget(QWidget):
+    """
+    Defines the GUI and behaviour of the "Call Barring" commands widget.
+    """
+    TITLE = 'Call Barring'
+
+    def __init__(self, terminal, parent=None):
+        """
+        Initialize the interface widgets.
+        """
+        QWidget.__init__(self, parent)
+
+        # Store the terminal object for later reference
+        self.terminal = terminal
+        self.sweep = None
+        self.sweep_pending = False
+        self.sync = None
+
+        # Create "Facility" widgets & group box, the ID of each radio button
+        # is the index of its facility in FACILITIES
+        self.facility_group = QButtonGroup(self)
+        facility_box = QGroupBox(self.tr('Facility:'))
+        facility_box_layout = QVBoxLayout()
+        for index, (facility, label) in enumerate(FACILITIES):
+            facility_rad = QRadioButton(self.tr(label))
+            self.facility_group.addButton(facility_rad, index)
+            facility_box_layout.addWidget(facility_rad)
+        self.facility_group.button(0).setChecked(True)
+        facility_box.setLayout(facility_box_layout)
+
+        # Create "Class" widgets & group box
+        class_toggle = QCheckBox(self.tr('(Toggle All Classes)'))
+        class_box = QGroupBox(self.tr('Classes:'))
+        class_box_layout = QVBoxLayout()
+        class_box_layout.addWidget(class_toggle)
+        self.class_checks = []
+        for bearer_class, label in CLASSES:
+            class_check = QCheckBox(self.tr(label))
+            self.class_checks.append((bearer_class, class_check))
+            class_box_layout.addWidget(class_check)
+        class_box.setLayout(class_box_layout)
+
+        # Create buttons & network password widget
+        self.cb_enable_btn = QPushButton(self.tr('Enable'))
+        self.cb_disable_btn = QPushButton(self.tr('Disable'))
+        self.cb_interrogate_btn = QPushButton(self.tr('Interrogate'))
+        self.cb_sweep_btn = QPushButton(self.tr('Interrogate All'))
+        self.cb_policy_btn = QPushButton(self.tr('Apply Policy...'))
+        self.network_pw = QLineEdit()
+        self.network_pw.setMaximumWidth(40)
+        network_pw_box = QHBoxLayout()
+        network_pw_box.addWidget(QLabel(self.tr('Network Password:')))
+        network_pw_box.addWidget(self.network_pw)
+
+        # Create right hand side layout
+        actions_layout = QVBoxLayout()
+        actions_layout.addWidget(self.cb_enable_btn)
+        actions_layout.addWidget(self.cb_disable_btn)
+        actions_layout.addWidget(self.cb_interrogate_btn)
+        actions_layout.addWidget(self.cb_sweep_btn)
+        actions_layout.addWidget(self.cb_policy_btn)
+        actions_layout.addLayout(network_pw_box)
+        actions_layout.addStretch()
+
+        # Create the sweep table & group box, with a row for each facility
+        # and a column for each class
+        self.sweep_table = QTableWidget(len(SWEEP_FACILITIES), len(CLASSES))
+        self.sweep_table.setVerticalHeaderLabels(list(SWEEP_FACILITIES))
+        self.sweep_table.setHorizontalHeaderLabels([str(bearer_class) for bearer_class, label in CLASSES])
+        for column, (bearer_class, label) in enumerate(CLASSES):
+            self.sweep_table.horizontalHeaderItem(column).setToolTip(self.tr(label))
+        self.sweep_table.horizontalHeader().setResizeMode(QHeaderView.Stretch)
+        self.sweep_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        sweep_box = QGroupBox(self.tr('Barred Classes:'))
+        sweep_layout = QVBoxLayout()
+        sweep_layout.addWidget(self.sweep_table)
+        sweep_box.setLayout(sweep_layout)
+
+        # Create main layout
+        container = QHBoxLayout()
+        container.addWidget(facility_box)
+        container.addWidget(class_box)
+        container.addLayout(actions_layout)
+        container.addWidget(sweep_box, 1)
+        self.setLayout(container)
+
+        # Connect widgets
+        for facility_rad in self.facility_group.buttons():
+            self.connect(facility_rad, SIGNAL('toggled(bool)'), self.check_facility)
+        self.connect(class_toggle, SIGNAL('stateChanged(int)'), self.toggle_classes)
+        self.connect(self.cb_enable_btn, SIGNAL('clicked()'), self.enable_command)
+        self.connect(self.cb_disable_btn, SIGNAL('clicked()'), self.disable_command)
+        self.connect(self.cb_interrogate_btn, SIGNAL('clicked()'), self.interrogate_facility)
+        self.connect(self.cb_sweep_btn, SIGNAL('clicked()'), self.sweep_facilities)
+        self.connect(self.cb_policy_btn, SIGNAL('clicked()'), self.apply_policy)
+
+    def validate_network_pw(self, network_pw):
+        """
+        Check that a given network password is valid. The network
+        password must be exactly 4 digits.
+        """
+        validate_password(network_pw)
+
+    def get_facility(self):
+        """
+        Determine which facility is selected on the GUI and return
+        the corresponding code to be used in AT commands.
+        """
+        return FACILITIES[self.facility_group.checkedId()][0]
+
+    def get_classes(self):
+        """
+        Determine which classes are selected on the GUI and return
+        the corresponding class integer to be used in AT commands.
+        """
+        return sum(bearer_class for bearer_class, class_check in self.class_checks if class_check.isChecked())
+
+    def toggle_classes(self, state):
+        """
+        Toggle the "class" check boxes on and off according to
+        the "Toggle All Classes" check box state.
+
+        This is invoked whenever the "Toggle All Classes" state is changed.
+        """
+        value = True if state == 2 else False
+
+        for bearer_class, class_check in self.class_checks:
+            class_check.setChecked(value)
+
+    def enable_command(self):
+        self.barring_command(True)
+
+    def disable_command(self):
+        self.barring_command(False)
+
+    def barring_command(self, enable):
+
+        # Get the necessary options
+        facility = self.get_facility()
+        network_pw = str(self.network_pw.text())
+        classes = self.get_classes()
+
+        # Validate the network password
+        try:
+            self.validate_network_pw(network_pw)
+        except ValueError, e:
+            QMessageBox.critical(self, self.tr('Error'), self.tr(e.message), QMessageBox.Ok)
+            self.network_pw.setFocus()
+            self.network_pw.selectAll()
+            return
+
+        command = build('barring_enable' if enable else 'barring_disable',
+                        facility=facility, password=network_pw, classes=classes)
+
+        # Run the AT command in the terminal
+        self.terminal.send_command(command)
+
+    def interrogate_facility(self):
+        """
+        Send the AT command to interrogate the currently selected facility.
+        The result will be displayed in the terminal window.
+        """
+        self.terminal.send_command(build('barring_query', facility=self.get_facility()))
+
+    def sweep_facilities(self):
+        """
+        Send the AT commands to interrogate every facility for every class,
+        all at once, and show the results in the sweep table when their
+        responses have arrived. If a sweep is still running another one is
+        started when it has finished, so their results are not mixed.
+        """
+        if self.sweep is not None and self.sweep.matrix is None:
+            self.sweep_pending = True
+            return
+
+        self.cb_sweep_btn.setDisabled(True)
+        self.sweep = BarringSweep(self.terminal.send_command, self.show_sweep)
+        self.sweep.start()
+
+    def show_sweep(self, matrix):
+        """
+        Show the barring status of each facility and class in the sweep
+        table. The rows of facilities that could not be interrogated show
+        the error as a tool tip.
+        """
+        for row, facility in enumerate(SWEEP_FACILITIES):
+            error = self.sweep.errors.get(facility, '')
+            self.sweep_table.verticalHeaderItem(row).setToolTip(error)
+            for column, (bearer_class, label) in enumerate(CLASSES):
+                item = QTableWidgetItem(self.tr(STATUS_TEXT[matrix[facility][bearer_class]]))
+                item.setTextAlignment(Qt.AlignCenter)
+                item.setToolTip(error)
+                self.sweep_table.setItem(row, column, item)
+        self.cb_sweep_btn.setEnabled(True)
+
+        if self.sweep_pending:
+            self.sweep_pending = False
+            self.sweep_facilities()
+
+    def apply_policy(self):
+        """
+        Ask for a policy file and send only the commands needed to bring the
+        barring status to it, using the network password entered.
+        """
+        path = QFileDialog.getOpenFileName(self,
+                                           self.tr('Apply Policy'),
+                                           '',
+                                           self.tr('JSON Files (*.json)'))
+        if not path:
+            return
+
+        try:
+            policy = load_policy(str(path))
+            self.sync = BarringSync(self.terminal.send_command, policy,
+                                    str(self.network_pw.text()), self.policy_applied)
+        except (IOError, ValueError), e:
+            QMessageBox.critical(self, self.tr('Error'), self.tr(str(e)), QMessageBox.Ok)
+            return
+
+        self.cb_policy_btn.setDisabled(True)
+        self.sync.start()
+
+    def policy_applied(self, changes):
+        """
+        Show the changes sent to apply a policy and their results, then
+        interrogate every facility again to show the new status.
+        """
+        lines = [format_change(change, result) for change, result in zip(changes, self.sync.results)]
+        lines.extend('%s: %s' % error for error in sorted(self.sync.errors.items()))
+        QMessageBox.information(self, self.tr('Apply Policy'),
+                                self.tr('\n'.join(lines) or 'No changes were needed.'),
+                                QMessageBox.Ok)
+        self.cb_policy_btn.setEnabled(True)
+        self.sweep_facilities()
+
+    def check_facility(self):
+        """
+        Check which facility has been selected and disable any commands
+        that are not available to the chosen facility.
+
+        This method is triggered whenever a facility radio box is selected.
+        """
+
+        # Enable the "enable" and "interrogate" buttons
+        self.cb_enable_btn.setEnabled(True)
+        self.cb_interrogate_btn.setEnabled(True)
+
+        # Get the currently selected facility code & disable any necessary widgets
+        if self.get_facility() in DISABLE_ONLY_FACILITIES:
+            self.cb_enable_btn.setDisabled(True)
+            self.cb_interrogate_btn.setDisabled(True)
+
+    def set_capabilities(self, capabilities):
+        """
+        Disable the widget if the device does not support call barring (AT+CLCK).
+        """
+        self.setEnabled(capabilities is None or capabilities.supports_name('barring_query'))
+
+if __name__ == '__main__':
+    from standalone import run_standalone
+    run_standalone(CallBarringWidget)
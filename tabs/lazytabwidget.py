@@ -0,0 +1,98 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the tab widget that builds its tabs on demand.
+"""
+
+# 3rd party modules
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+
+class LazyTabWidget(QTabWidget):
+    """
+    A tab widget whose tabs are registered with the name of the module and
+    class of the tab widget, rather than with the widget itself.
+
+    Each tab starts as an empty placeholder. The tab's module is imported
+    and its widget created (with the terminal as its parameter) the first
+    time the tab is selected, so registering a tab costs almost nothing
+    until it is used.
+
+    The capabilities of the connected device are passed to the
+    "set_capabilities" method of every tab widget that has one, including
+    tabs built later.
+    """
+
+    def __init__(self, terminal, parent=None):
+        QTabWidget.__init__(self, parent)
+        self.terminal = terminal
+        self.descriptors = {}
+        self.tab_widgets = []
+        self.capabilities = None
+        self.connect(self, SIGNAL('currentChanged(int)'), self.build_tab)
+
+    def add_lazy_tab(self, module_name, class_name, title):
+        """
+        Register a tab, to be built from the given module and class when it
+        is first selected. The current tab is built straight away.
+        """
+        placeholder = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        placeholder.setLayout(layout)
+
+        index = self.addTab(placeholder, title)
+        self.descriptors[index] = (module_name, class_name)
+        if index == self.currentIndex():
+            self.build_tab(index)
+        return index
+
+    def build_tab(self, index):
+        """
+        Import the module of a tab and create its widget in the tab's
+        placeholder, unless that has already been done.
+
+        This is invoked whenever the current tab changes.
+        """
+        if index not in self.descriptors:
+            return
+
+        module_name, class_name = self.descriptors.pop(index)
+        module = __import__(module_name, globals(), locals(), [class_name])
+        widget = getattr(module, class_name)(self.terminal)
+        self.widget(index).layout().addWidget(widget)
+        self.tab_widgets.append(widget)
+        if self.capabilities is not None and hasattr(widget, 'set_capabilities'):
+            widget.set_capabilities(self.capabilities)
+
+    def set_capabilities(self, capabilities):
+        """
+        Let the tabs disable the commands the connected device does not
+        support. None means they are not known, so all are enabled.
+        """
+        self.capabilities = capabilities
+        for widget in self.tab_widgets:
+            if hasattr(widget, 'set_capabilities'):
+                widget.set_capabilities(capabilities)
+
+    def build_all(self):
+        """
+        Build every tab that has not been built yet.
+        """
+        for index in self.descriptors.keys():
+            self.build_tab(index)
@@ -1,181 +1,446 @@
-# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
-#
-# This file is part of the "AT Command Toolkit" application.
-#
-# The "AT Command Toolkit" is free software: you can redistribute it and/or
-# modify it under the terms of the GNU General Public License as published by
-# the Free Software Foundation, either version 3 of the License, or (at your
-# option) any later version.
-#
-# This program is distributed in the hope that it will be useful, but WITHOUT
-# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
-# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
-# details.
-#
-# You should have received a copy of the GNU General Public License along with
-# this program. If not, see <http://www.gnu.org/licenses/>.
-
-"""
-Module containing the Terminal class/widget for serial port communication.
-"""
-
-# 3rd party modules
-from PyQt4.QtCore import *
-from PyQt4.QtGui import *
-import serial
-
-class TerminalWidget(QWidget):
-    """
-    The terminal widget handles sending commands to the serial port.
-    It also handles receiving and displaying data from the serial port.
-
-    The purpose behind the class is to abstract all interaction with the
-    serial port away from the rest of the application so that commands
-    can be constructed by other parts of the application then sent to
-    the serial port through this class/widget, without having to deal
-    with serial port communication in any way.
-
-    The widget essentially provides a basic terminal interface, but also
-    provides the ability for other modules to send commands to the serial
-    port via the "send_command" method.
-    """
-
-    def __init__(self, parent=None):
-        QWidget.__init__(self, parent)
-
-        # Create the terminal widgets
-        self.command_txt = QLineEdit()
-        self.log = QTextEdit()
-        self.log.setReadOnly(True)
-
-        # Create the command buttons
-        self.send_command_btn = QPushButton(QIcon(':/images/bullet_go.png'), '')
-        self.clear_log_btn = QPushButton(QIcon(':/images/page_white.png'), '')
-
-        # Create the form layout
-        button_box = QHBoxLayout()
-        button_box.addWidget(self.command_txt)
-        button_box.addWidget(self.send_command_btn)
-        button_box.addWidget(self.clear_log_btn)
-
-        container = QVBoxLayout()
-        container.addLayout(button_box)
-        container.addWidget(self.log)
-
-        self.setLayout(container)
-
-        # Create a timer to read from the serial port
-        self.read_timer = QTimer(self)
-
-        # Connect the widgets
-        self.connect(self.command_txt, SIGNAL('returnPressed()'), self.send_line_command)
-        self.connect(self.send_command_btn, SIGNAL('clicked()'), self.send_line_command)
-        self.connect(self.clear_log_btn, SIGNAL('clicked()'), self.log.clear)
-        self.connect(self.log, SIGNAL('textChanged()'), self.scroll_log)
-        self.connect(self.read_timer, SIGNAL('timeout()'), self.read_serial_data)
-
-    def connect_com_port(self):
-
-        # Start the timer that reads the COM port
-        self.read_timer.start(100)
-
-        # Enable the GUI widgets
-        self.command_txt.setEnabled(True)
-        self.send_command_btn.setEnabled(True)
-        self.clear_log_btn.setEnabled(True)
-        self.log.setEnabled(True)
-
-    def disconnect_com_port(self):
-
-        # Stop the timer that reads the COM port
-        self.read_timer.stop()
-
-        # Close the COM port
-        self.serial_conn.close()
-
-        # Disable the GUI widgets
-        self.command_txt.setDisabled(True)
-        self.send_command_btn.setDisabled(True)
-        self.clear_log_btn.setDisabled(True)
-        self.log.setDisabled(True)
-
-    def send_command(self, command):
-        """
-        Send a command to the serial port.
-
-        The command is expected to be an AT command string. Leading and
-        trailing white space is stripped from the command string.
-        """
-        command = str(command).strip()
-
-        try:
-
-            # Add a command marker in the terminal & send the command
-            self.log.append('> ')
-            self.serial_conn.write(command + '\r\n')
-
-        except serial.SerialException:
-            QMessageBox.critical(self,
-                                 self.tr('Serial Port Error'),
-                                 self.tr('There was a communication error with the serial port.'),
-                                 QMessageBox.Ok)
-
-    def set_font(self, font):
-        """
-        Set the font of the terminal.
-
-        Expects a QFont object as the parameter.
-        """
-        self.log.setFont(font)
-        self.command_txt.setFont(font)
-
-    def send_line_command(self):
-        """
-        Send a command from the "command_txt" line edit widget.
-        """
-        
-        # Get the command text (cast to string and strip whitespace)
-        command = str(self.command_txt.text()).strip()
-
-        # Empty the text box and set focus
-        self.command_txt.setText('')
-        self.command_txt.setFocus()
-
-        # Send the entered text as a command
-        if command:
-            self.send_command(command)
-
-    def read_serial_data(self):
-        """
-        Read any buffered data from the serial port.
-
-        This is invoked at regular intervals by the "read_timer"
-        timer that is created in the class initializer.
-        """
-        try:
-            buffer_size = self.serial_conn.inWaiting()
-            if buffer_size:
-                current_text = str(self.log.toPlainText())
-                new_text = self.serial_conn.read(buffer_size)
-                new_text = new_text.replace('\r\n', '\n')
-                new_text = new_text.replace('\r', '')
-                self.log.setText(current_text + new_text)
-
-        except serial.SerialException:
-
-            self.emit(SIGNAL('connectionError()'))
-            QMessageBox.critical(self,
-                                 self.tr('Serial Port Error'),
-                                 self.tr('There was a communication error with the serial port.'),
-                                 QMessageBox.Ok)
-
-    def scroll_log(self):
-        """
-        Moves the terminal log text cursor to the bottom of the text box.
-
-        This is invoked every time the text changes in the terminal log
-        so that the most current text is always shown.
-        """
-        cursor = self.log.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log.setTextCursor(cursor)
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the Terminal class/widget for serial port communication.
+"""
+
+# 3rd party modules
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+import serial
+
+# Local application modules
+from clock import monotonic
+from session import AtSession, SENT
+from supervisor import ConnectionSupervisor
+
+# Default limits on the amount of history kept in the terminal log
+LOG_MAX_LINES = 5000
+LOG_MAX_CHARS = 512 * 1024
+
+class TerminalLog(QPlainTextEdit):
+    """
+    Read-only text view used as the terminal log.
+
+    Received data is only ever appended to the end of the document, the
+    existing text is never copied or re-rendered. The history is bounded
+    by a maximum number of lines and characters; once either limit is
+    exceeded the oldest lines are discarded, so the cost of adding text
+    stays the same however long the session runs.
+    """
+
+    def __init__(self, max_lines=LOG_MAX_LINES, max_chars=LOG_MAX_CHARS, parent=None):
+        QPlainTextEdit.__init__(self, parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.set_limits(max_lines, max_chars)
+
+    def set_limits(self, max_lines, max_chars):
+        """
+        Set the maximum number of lines and characters kept in the log.
+        A limit of 0 means that history is not limited by that measure.
+        """
+        self.max_chars = max_chars
+        self.document().setMaximumBlockCount(max_lines)
+        self.trim()
+
+    def append_text(self, text):
+        """
+        Insert text at the end of the log, without starting a new line.
+        """
+        if not text:
+            return
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.trim()
+
+    def append_line(self, text):
+        """
+        Insert text at the start of a new line at the end of the log. No
+        new line is started if the last line of the log is empty.
+        """
+        if self.document().lastBlock().length() > 1:
+            text = '\n' + text
+        self.append_text(text)
+
+    def trim(self):
+        """
+        Remove whole lines from the start of the log until the number
+        of characters is within the "max_chars" limit.
+        """
+        document = self.document()
+        if not self.max_chars or document.characterCount() <= self.max_chars:
+            return
+
+        # Find the first line that can be kept, always keeping the last one
+        excess = document.characterCount() - self.max_chars
+        block = document.firstBlock()
+        while excess > 0 and block.next().isValid():
+            excess -= block.length()
+            block = block.next()
+
+        cursor = QTextCursor(document)
+        cursor.setPosition(block.position(), QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+
+class SerialReader(QThread):
+    """
+    Thread that reads data from the serial port as soon as it arrives.
+
+    The thread blocks on the serial port rather than polling it, so data
+    is passed on with minimal delay and no time is spent while the line
+    is idle. Each chunk of data read is emitted with the
+    "dataReceived(PyQt_PyObject)" signal and a "readError()" signal is
+    emitted if the serial port fails.
+
+    The serial port read timeout determines how quickly the thread
+    notices that it has been stopped.
+    """
+
+    def __init__(self, serial_conn, parent=None):
+        QThread.__init__(self, parent)
+        self.serial_conn = serial_conn
+        self.running = False
+
+    def run(self):
+        self.running = True
+        while self.running:
+            try:
+                # Block until some data arrives, then also take anything
+                # else that is already buffered
+                data = self.serial_conn.read(1)
+                if data:
+                    buffer_size = self.serial_conn.inWaiting()
+                    if buffer_size:
+                        data += self.serial_conn.read(buffer_size)
+                    self.emit(SIGNAL('dataReceived(PyQt_PyObject)'), data)
+
+            except serial.SerialException:
+                if self.running:
+                    self.emit(SIGNAL('readError()'))
+                self.running = False
+
+    def stop(self):
+        """
+        Stop the thread and wait for it to finish.
+        """
+        self.running = False
+        self.wait()
+
+class TerminalWidget(QWidget):
+    """
+    The terminal widget handles sending commands to the serial port.
+    It also handles receiving and displaying data from the serial port.
+
+    The purpose behind the class is to abstract all interaction with the
+    serial port away from the rest of the application so that commands
+    can be constructed by other parts of the application then sent to
+    the serial port through this class/widget, without having to deal
+    with serial port communication in any way.
+
+    The widget essentially provides a basic terminal interface, but also
+    provides the ability for other modules to send commands to the serial
+    port via the "send_command" method, which returns a "CommandResponse"
+    object that receives the response to the command.
+
+    The commands themselves are handled by an "AtSession" object, the
+    widget only displays the traffic and passes the data read by its
+    reader thread to the session. Unsolicited result codes received from
+    the modem are emitted with the "urcReceived(PyQt_PyObject)" signal.
+
+    If the connection to the serial port is lost and automatic reconnection
+    is enabled, a "connectionLost()" signal is emitted and the port is
+    reopened as soon as possible (see "ConnectionSupervisor"), after which
+    a "connectionRestored()" signal is emitted. Commands are kept in the
+    queue in the meantime. Otherwise a "connectionError()" signal is
+    emitted.
+    """
+
+    def __init__(self, parent=None):
+        QWidget.__init__(self, parent)
+
+        # Create the terminal widgets
+        self.command_txt = QLineEdit()
+        self.log = TerminalLog()
+
+        # Create the command buttons
+        self.send_command_btn = QPushButton(QIcon(':/images/bullet_go.png'), '')
+        self.clear_log_btn = QPushButton(QIcon(':/images/page_white.png'), '')
+
+        # Create the form layout
+        button_box = QHBoxLayout()
+        button_box.addWidget(self.command_txt)
+        button_box.addWidget(self.send_command_btn)
+        button_box.addWidget(self.clear_log_btn)
+
+        container = QVBoxLayout()
+        container.addLayout(button_box)
+        container.addWidget(self.log)
+
+        self.setLayout(container)
+
+        # The serial port reader thread & connection supervisor are created
+        # when a port is connected
+        self.reader = None
+        self.supervisor = None
+        self.auto_reconnect = True
+        self.reconnect_timer = QTimer(self)
+        self.reconnect_timer.setSingleShot(True)
+
+        # Create the session that handles the commands & a timer to check
+        # for commands that have not been answered in time
+        self.session = AtSession(write_error=self.write_error)
+        self.session.add_monitor(self.display_data)
+        self.session.urcs.register(None, self.urc_received)
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+
+        # Connect the widgets
+        self.connect(self.command_txt, SIGNAL('returnPressed()'), self.send_line_command)
+        self.connect(self.send_command_btn, SIGNAL('clicked()'), self.send_line_command)
+        self.connect(self.clear_log_btn, SIGNAL('clicked()'), self.log.clear)
+        self.connect(self.log, SIGNAL('textChanged()'), self.scroll_log)
+        self.connect(self.timeout_timer, SIGNAL('timeout()'), self.check_timeouts)
+        self.connect(self.reconnect_timer, SIGNAL('timeout()'), self.try_reconnect)
+
+    def connect_com_port(self):
+
+        # Remember the port settings in case the connection is lost
+        self.supervisor = ConnectionSupervisor.from_serial(self.serial_conn)
+
+        # Give the serial port to the session & start reading it
+        self.session.attach(self.serial_conn)
+        self.start_reader()
+
+        # Enable the GUI widgets
+        self.command_txt.setEnabled(True)
+        self.send_command_btn.setEnabled(True)
+        self.clear_log_btn.setEnabled(True)
+        self.log.setEnabled(True)
+
+    def disconnect_com_port(self):
+
+        # Stop reconnecting & stop the thread that reads the COM port
+        self.reconnect_timer.stop()
+        self.stop_reader()
+
+        # Give up on any commands still waiting to be sent or answered
+        # and close the COM port
+        self.session.close()
+        self.serial_conn.close()
+        self.timeout_timer.stop()
+
+        # Disable the GUI widgets
+        self.command_txt.setDisabled(True)
+        self.send_command_btn.setDisabled(True)
+        self.clear_log_btn.setDisabled(True)
+        self.log.setDisabled(True)
+
+    def start_reader(self):
+        """
+        Start the thread that reads the COM port.
+        """
+        self.reader = SerialReader(self.serial_conn, self)
+        self.connect(self.reader, SIGNAL('dataReceived(PyQt_PyObject)'), self.read_serial_data, Qt.QueuedConnection)
+        self.connect(self.reader, SIGNAL('readError()'), self.read_error, Qt.QueuedConnection)
+        self.reader.start()
+
+    def stop_reader(self):
+        """
+        Stop the thread that reads the COM port.
+        """
+        if self.reader is not None:
+            self.reader.stop()
+            self.reader = None
+
+    def send_command(self, command, timeout=None):
+        """
+        Queue a command to be sent to the serial port.
+
+        The command is expected to be an AT command string. Leading and
+        trailing white space is stripped from the command string. The
+        timeout is the number of seconds to wait for the response, the
+        queue's default timeout is used if it is not given.
+
+        Returns a "CommandResponse" object that holds the response lines,
+        final result code and round trip time once the response arrives.
+        """
+        response = self.session.command(command, timeout)
+        self.update_timeout_timer()
+        return response
+
+    def display_data(self, direction, data):
+        """
+        Display the data sent to or received from the serial port.
+
+        This is invoked by the session for all traffic. Sent commands are
+        shown as a command marker, the command itself is normally shown
+        when the modem echoes it.
+        """
+        if direction == SENT:
+            self.log.append_line('> ')
+        else:
+            new_text = data.replace('\r\n', '\n')
+            new_text = new_text.replace('\r', '')
+            self.log.append_text(new_text)
+
+    def urc_received(self, line, data):
+        """
+        Emit the "urcReceived" signal for an unsolicited result code.
+
+        This is invoked by the session's URC dispatcher.
+        """
+        self.emit(SIGNAL('urcReceived(PyQt_PyObject)'), line)
+
+    def write_error(self, error):
+        """
+        Report a failure to write a command to the serial port.
+        """
+        if not isinstance(error, serial.SerialException):
+            raise error
+
+        QMessageBox.critical(self,
+                             self.tr('Serial Port Error'),
+                             self.tr('There was a communication error with the serial port.'),
+                             QMessageBox.Ok)
+
+    def set_command_options(self, window, timeout):
+        """
+        Set the number of commands that may be waiting for a response at
+        once and the default number of seconds to wait for a response.
+        """
+        self.session.queue.set_window(window)
+        self.session.queue.timeout = timeout
+
+    def check_timeouts(self):
+        """
+        Finish the responses of any commands that have timed out.
+
+        This is invoked by the "timeout_timer" timer.
+        """
+        self.session.check_timeouts()
+        self.update_timeout_timer()
+
+    def update_timeout_timer(self):
+        """
+        Start the "timeout_timer" timer so that it fires when the next
+        command times out, or stop it if no commands are in flight.
+        """
+        deadline = self.session.next_deadline()
+        if deadline is None:
+            self.timeout_timer.stop()
+        else:
+            delay = max(0, int((deadline - monotonic()) * 1000) + 1)
+            self.timeout_timer.start(delay)
+
+    def set_font(self, font):
+        """
+        Set the font of the terminal.
+
+        Expects a QFont object as the parameter.
+        """
+        self.log.setFont(font)
+        self.command_txt.setFont(font)
+
+    def set_log_limits(self, max_lines, max_chars):
+        """
+        Set the maximum number of lines and characters of history kept
+        in the terminal log.
+        """
+        self.log.set_limits(max_lines, max_chars)
+
+    def send_line_command(self):
+        """
+        Send a command from the "command_txt" line edit widget.
+        """
+        
+        # Get the command text (cast to string and strip whitespace)
+        command = str(self.command_txt.text()).strip()
+
+        # Empty the text box and set focus
+        self.command_txt.setText('')
+        self.command_txt.setFocus()
+
+        # Send the entered text as a command
+        if command:
+            self.send_command(command)
+
+    def read_serial_data(self, data):
+        """
+        Pass data received from the serial port on to the session.
+
+        This is invoked by the "reader" thread whenever data arrives.
+        """
+        self.session.feed(data)
+        self.update_timeout_timer()
+
+    def read_error(self):
+        """
+        Handle a failure of the serial port while reading.
+
+        This is invoked by the "reader" thread when the read fails.
+        """
+        if not self.auto_reconnect:
+            self.emit(SIGNAL('connectionError()'))
+            QMessageBox.critical(self,
+                                 self.tr('Serial Port Error'),
+                                 self.tr('There was a communication error with the serial port.'),
+                                 QMessageBox.Ok)
+            return
+
+        # Keep the commands not yet sent & close the failed port
+        self.stop_reader()
+        self.session.detach()
+        self.serial_conn.close()
+        self.timeout_timer.stop()
+
+        self.log.append_line('--- Connection lost, reconnecting ---\n')
+        self.emit(SIGNAL('connectionLost()'))
+        self.reconnect_timer.start(int(self.supervisor.next_delay() * 1000))
+
+    def try_reconnect(self):
+        """
+        Try to reopen the COM port after the connection was lost, and try
+        again later if that fails.
+
+        This is invoked by the "reconnect_timer" timer.
+        """
+        serial_conn = self.supervisor.try_reconnect()
+        if serial_conn is None:
+            self.reconnect_timer.start(int(self.supervisor.next_delay() * 1000))
+            return
+
+        self.log.append_line('--- Connection restored ---\n')
+        self.serial_conn = serial_conn
+        self.session.attach(serial_conn)
+        self.start_reader()
+        self.update_timeout_timer()
+        self.emit(SIGNAL('connectionRestored()'))
+
+    def scroll_log(self):
+        """
+        Moves the terminal log text cursor to the bottom of the text box.
+
+        This is invoked every time the text changes in the terminal log
+        so that the most current text is always shown.
+        """
+        cursor = self.log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        self.log.setTextCursor(cursor)
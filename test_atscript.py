@@ -0,0 +1,76 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of parsing and running scripts, run against the modem simulator.
+
+Run with "python -m unittest test_atscript".
+"""
+
+# Standard library modules
+import threading
+import unittest
+
+# Local application modules
+from atscript import ScriptRunner, parse_script
+from modemsim import ModemSimulator
+from session import AtSession
+
+class ParseTest(unittest.TestCase):
+
+    def test_options(self):
+        steps = parse_script(['AT+CGSN\n', '  expect: ^35\n', '  retries: 2\n', 'AT+CIMI\n'])
+        self.assertEqual([step.command for step in steps], ['AT+CGSN', 'AT+CIMI'])
+        self.assertEqual((steps[0].retries, len(steps[0].expect)), (2, 1))
+        self.assertEqual((steps[1].retries, steps[1].expect), (0, []))
+
+    def test_option_before_command(self):
+        self.assertRaises(ValueError, parse_script, ['  retries: 1\n'])
+
+class RunTest(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = ModemSimulator()
+        self.simulator.start()
+        self.session = AtSession.open(self.simulator.port, timeout=2.0)
+
+    def tearDown(self):
+        self.session.close()
+        self.simulator.stop()
+
+    def test_stops_on_failure(self):
+        self.simulator.fail_commands.add('+CGSN')
+        steps = parse_script(['AT+GMI\n', 'AT+CGSN\n', '  retries: 1\n', 'AT+CIMI\n'])
+        results = ScriptRunner(self.session, steps).run()
+        self.assertEqual([(r['passed'], r['skipped']) for r in results],
+                         [(True, False), (False, False), (False, True)])
+
+    def test_retry_after_timeout(self):
+        # The first attempt times out and its reply arrives late, while the
+        # retry is due; neither the retry nor the next step may take it
+        self.simulator.latency = 0.5
+        threading.Timer(0.3, setattr, (self.simulator, 'latency', 0.0)).start()
+        steps = parse_script(['AT+CGSN\n', '  timeout: 0.2\n', '  retries: 1\n',
+                              'AT+CIMI\n', '  expect: ^00101\n'])
+        results = ScriptRunner(self.session, steps).run()
+        self.assertEqual([r['passed'] for r in results], [True, True])
+        self.assertEqual(results[0]['attempts'], 2)
+        self.assertEqual(results[0]['lines'], ['350000000000001'])
+        self.assertEqual(results[1]['lines'], ['001010123456789'])
+
+if __name__ == '__main__':
+    unittest.main()
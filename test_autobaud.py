@@ -0,0 +1,63 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of detecting the settings of a modem, run against the modem
+simulator.
+
+Run with "python -m unittest test_autobaud".
+"""
+
+# Standard library modules
+import unittest
+
+# 3rd party modules
+import serial
+
+# Local application modules
+from autobaud import detect
+from modemsim import ModemSimulator
+
+class DetectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = ModemSimulator()
+        self.simulator.start()
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def test_detect(self):
+        settings = detect(self.simulator.port, baudrates=(115200,))
+        self.assertEqual(settings, {'baudrate': 115200, 'bytesize': serial.EIGHTBITS,
+                                    'parity': serial.PARITY_NONE, 'stopbits': serial.STOPBITS_ONE})
+
+    def test_cancelled(self):
+        tried = []
+
+        def cancelled():
+            tried.append(True)
+            return True
+
+        self.assertEqual(detect(self.simulator.port, cancelled=cancelled), None)
+        self.assertEqual(len(tried), 1)
+
+    def test_port_error(self):
+        self.assertRaises(serial.SerialException, detect, '/dev/does-not-exist')
+
+if __name__ == '__main__':
+    unittest.main()
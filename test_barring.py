@@ -0,0 +1,63 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the call barring sweep and policy sync.
+
+Run with "python -m unittest test_barring".
+"""
+
+# Standard library modules
+import unittest
+
+# Local application modules
+from barring import BarringSweep, BarringSync, parse_policy
+from framing import CommandResponse
+
+class EmptyPolicyTest(unittest.TestCase):
+    """
+    A policy that names no facilities sends nothing and finishes at once.
+    """
+
+    def setUp(self):
+        self.sent = []
+        self.done = []
+
+    def send(self, command):
+        self.sent.append(command)
+        response = CommandResponse(command)
+        response.finish('OK')
+        return response
+
+    def test_parse(self):
+        self.assertEqual(parse_policy({}), {})
+
+    def test_sweep(self):
+        sweep = BarringSweep(self.send, self.done.append, ())
+        sweep.start()
+        self.assertEqual(self.sent, [])
+        self.assertEqual(self.done, [{}])
+
+    def test_sync(self):
+        sync = BarringSync(self.send, parse_policy({}), '0000', self.done.append)
+        sync.start()
+        self.assertEqual(self.sent, [])
+        self.assertTrue(sync.finished)
+        self.assertEqual(self.done, [[]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of finding and caching the commands a device supports.
+
+Run with "python -m unittest test_capabilities".
+"""
+
+# Standard library modules
+import os
+import shutil
+import tempfile
+import unittest
+
+# Local application modules
+from capabilities import Capabilities, CapabilityCache, CapabilityProbe, parse_command_list
+from framing import CommandResponse, ResponseMatcher
+from urc import UrcDispatcher
+
+# Identification of the device used by the tests
+IDENTITY = {'AT+GMI': 'ACME', 'AT+GMM': 'M1', 'AT+GMR': '1.0'}
+
+class CommandListTest(unittest.TestCase):
+
+    def test_parse(self):
+        lines = ['AT+CGMI', 'AT+CLCK,AT+CPWD', '+COPS  Operator selection', 'ATD', 'AT&F']
+        self.assertEqual(parse_command_list(lines), set(['+CGMI', '+CLCK', '+CPWD', '+COPS', 'D', '&F']))
+
+    def test_names_not_taken_as_urcs(self):
+        # Devices that list commands without "AT" give lines that start
+        # like URCs, they belong to the AT+CLAC response
+        urcs = []
+        dispatcher = UrcDispatcher()
+        dispatcher.register(None, lambda line, data: urcs.append(line))
+        matcher = ResponseMatcher(dispatcher)
+        response = matcher.command_sent('AT+CLAC')
+        matcher.feed('\r\n+CGMI\r\n+CMT\r\n+CMTI\r\n+CREG\r\n\r\nOK\r\n')
+        self.assertEqual(response.lines, ['+CGMI', '+CMT', '+CMTI', '+CREG'])
+        self.assertEqual(urcs, [])
+
+        matcher.feed('\r\n+CMTI: "SM",1\r\n')
+        self.assertEqual(urcs, ['+CMTI: "SM",1'])
+
+class ProbeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = CapabilityCache(os.path.join(self.directory, 'capabilities.json'))
+        self.command_list = []
+        self.results = []
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def send(self, command):
+        response = CommandResponse(command)
+        if command in IDENTITY:
+            response.lines = [IDENTITY[command]]
+        elif command == 'AT+CLAC':
+            response.lines = list(self.command_list)
+        response.finish('OK')
+        return response
+
+    def probe(self):
+        CapabilityProbe(self.send, self.cache, self.results.append).start()
+        return self.results[-1]
+
+    def test_found_and_cached(self):
+        self.command_list = ['AT+CGMI', 'AT+CLCK']
+        capabilities = self.probe()
+        self.assertTrue(capabilities.supports_name('barring_query'))
+        cached = CapabilityCache(self.cache.path).get('ACME/M1/1.0')
+        self.assertEqual(cached.commands, frozenset(['+CGMI', '+CLCK']))
+
+    def test_empty_list_not_cached(self):
+        self.assertEqual(self.probe(), None)
+        self.assertFalse(os.path.exists(self.cache.path))
+
+    def test_empty_cache_entry_ignored(self):
+        self.cache.put(Capabilities('ACME/M1/1.0', []))
+        self.command_list = ['AT+CGMI']
+        self.assertEqual(self.probe().commands, frozenset(['+CGMI']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of writing, reading and replaying captures.
+
+Run with "python -m unittest test_capture".
+"""
+
+# Standard library modules
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+# Local application modules
+from capture import INDEX_SIZE, RECORD_FORMAT, CaptureReader, CaptureWriter, index_path, replay
+from session import RECEIVED, SENT
+
+class CaptureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'session.cap')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self):
+        reader = CaptureReader(self.path)
+        try:
+            return [(direction, data) for timestamp, direction, data in reader]
+        finally:
+            reader.close()
+
+    def write(self, records):
+        writer = CaptureWriter(self.path)
+        for direction, data in records:
+            writer.record(direction, data)
+        writer.close()
+
+    def test_round_trip(self):
+        records = [(SENT, 'AT+CGMI\r'), (RECEIVED, 'AT+CGMI\r\r\nACME\r\n\r\nOK\r\n'), (RECEIVED, '\x00\xff')]
+        self.write(records)
+        self.assertEqual(self.read(), records)
+
+    def test_replay(self):
+        self.write([(SENT, 'AT+CGMI\r\n'), (RECEIVED, '\r\nACME\r\n'), (RECEIVED, '\r\nOK\r\n')])
+        responses = replay(self.path)
+        self.assertEqual([(r.command, r.lines, r.result) for r in responses], [('AT+CGMI', ['ACME'], 'OK')])
+
+    def test_missing_index_rebuilt(self):
+        self.write([(SENT, 'AT\r'), (RECEIVED, '\r\nOK\r\n')])
+        os.remove(index_path(self.path))
+        self.assertEqual(len(self.read()), 2)
+        self.assertEqual(os.path.getsize(index_path(self.path)), 2 * INDEX_SIZE)
+
+    def test_corrupt_index_rebuilt(self):
+        self.write([(SENT, 'AT\r'), (RECEIVED, '\r\nOK\r\n')])
+        with open(index_path(self.path), 'wb') as f:
+            f.write(struct.pack('<Q', 1 << 40))
+        self.assertEqual(len(self.read()), 2)
+        self.assertEqual(os.path.getsize(index_path(self.path)), 2 * INDEX_SIZE)
+
+    def test_read_while_writing(self):
+        writer = CaptureWriter(self.path)
+        writer.record(SENT, 'AT\r')
+        self.assertEqual(self.read(), [(SENT, 'AT\r')])
+
+        # A record whose index entry has not been written yet, and a
+        # record cut short, as a reader may find them mid-write
+        writer.capture_file.write(struct.pack(RECORD_FORMAT, 0.1, RECEIVED, 6) + '\r\nOK\r\n')
+        writer.capture_file.write(struct.pack(RECORD_FORMAT, 0.2, RECEIVED, 10) + '\r\n')
+        writer.capture_file.flush()
+        self.assertEqual(self.read(), [(SENT, 'AT\r'), (RECEIVED, '\r\nOK\r\n')])
+
+        # The reader must not have touched the index the writer is using
+        self.assertEqual(os.path.getsize(index_path(self.path)), INDEX_SIZE)
+        writer.close()
+
+    def test_writer_continues_after_read(self):
+        writer = CaptureWriter(self.path)
+        records = [(SENT, 'AT+CGSN\r'), (RECEIVED, '\r\n350000000000001\r\n'), (RECEIVED, '\r\nOK\r\n')]
+        writer.record(*records[0])
+        self.read()
+        for record in records[1:]:
+            writer.record(*record)
+        self.assertEqual(self.read(), records)
+        writer.close()
+        self.assertEqual(os.path.getsize(index_path(self.path)), 3 * INDEX_SIZE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the command queue's window and timeouts.
+
+Run with "python -m unittest test_commandqueue".
+"""
+
+# Standard library modules
+import unittest
+
+# Local application modules
+from commandqueue import CommandQueue
+
+class WindowTest(unittest.TestCase):
+    """
+    Commands are sent in order, at most "window" at a time.
+    """
+
+    def setUp(self):
+        self.written = []
+
+    def test_waits_for_response(self):
+        queue = CommandQueue(self.written.append)
+        first = queue.submit('AT+CGMI')
+        second = queue.submit('AT+CGMM')
+        self.assertEqual(self.written, ['AT+CGMI'])
+        queue.feed('AT+CGMI\r\r\nACME\r\n\r\nOK\r\n')
+        self.assertEqual((first.result, first.lines), ('OK', ['ACME']))
+        self.assertEqual(self.written, ['AT+CGMI', 'AT+CGMM'])
+        self.assertFalse(second.is_done())
+
+    def test_pipelines_up_to_window(self):
+        queue = CommandQueue(self.written.append, window=2)
+        responses = [queue.submit(command) for command in ('AT+CGMI', 'AT+CGMM', 'AT+CGMR')]
+        self.assertEqual(self.written, ['AT+CGMI', 'AT+CGMM'])
+        queue.feed('\r\nACME\r\n\r\nOK\r\n\r\nM1\r\n\r\nOK\r\n')
+        self.assertEqual([r.lines for r in responses[:2]], [['ACME'], ['M1']])
+        self.assertEqual(self.written, ['AT+CGMI', 'AT+CGMM', 'AT+CGMR'])
+
+    def test_write_error_cancels(self):
+        errors = []
+
+        def write(command):
+            raise IOError('port closed')
+
+        queue = CommandQueue(write, write_error=errors.append)
+        response = queue.submit('AT')
+        self.assertTrue(response.is_done())
+        self.assertEqual(response.result, None)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(queue.in_flight(), 0)
+
+class TimeoutTest(unittest.TestCase):
+    """
+    A reply that arrives after its command timed out is not credited to
+    the next command.
+    """
+
+    def setUp(self):
+        self.written = []
+        self.queue = CommandQueue(self.written.append, timeout=0)
+
+    def test_late_reply_discarded(self):
+        imei = self.queue.submit('AT+CGSN')
+        imsi = self.queue.submit('AT+CIMI', timeout=60)
+        self.queue.check_timeouts()
+        self.assertTrue(imei.timed_out)
+        self.assertEqual(imei.result, None)
+
+        # The window is held until the late reply has arrived
+        self.assertEqual(self.written, ['AT+CGSN'])
+        self.queue.feed('AT+CGSN\r\r\n350000000000001\r\n\r\nOK\r\n')
+        self.assertEqual(imei.lines, [])
+        self.assertEqual(self.written, ['AT+CGSN', 'AT+CIMI'])
+        self.assertFalse(imsi.is_done())
+
+        self.queue.feed('AT+CIMI\r\r\n001010123456789\r\n\r\nOK\r\n')
+        self.assertEqual((imsi.result, imsi.lines), ('OK', ['001010123456789']))
+
+    def test_late_reply_with_window(self):
+        self.queue.set_window(2)
+        imei = self.queue.submit('AT+CGSN')
+        imsi = self.queue.submit('AT+CIMI', timeout=60)
+        self.queue.check_timeouts()
+        self.assertTrue(imei.timed_out)
+        self.queue.feed('\r\n350000000000001\r\n\r\nOK\r\n\r\n001010123456789\r\n\r\nOK\r\n')
+        self.assertEqual((imsi.result, imsi.lines), ('OK', ['001010123456789']))
+
+    def test_no_late_reply(self):
+        self.queue.submit('AT+CGSN')
+        imsi = self.queue.submit('AT+CIMI', timeout=60)
+        self.queue.check_timeouts()
+        self.assertEqual(self.queue.in_flight(), 1)
+        self.assertTrue(self.queue.next_deadline() is not None)
+
+        # Nothing arrived within a further timeout, stop waiting for it
+        self.queue.check_timeouts()
+        self.assertEqual(self.written, ['AT+CGSN', 'AT+CIMI'])
+        self.queue.feed('\r\n001010123456789\r\n\r\nOK\r\n')
+        self.assertEqual(imsi.lines, ['001010123456789'])
+
+    def test_short_timeout_waits_for_queue_timeout(self):
+        queue = CommandQueue(self.written.append, timeout=60)
+        imei = queue.submit('AT+CGSN', timeout=0)
+        queue.submit('AT+CIMI')
+        queue.check_timeouts()
+        queue.check_timeouts()
+        self.assertTrue(imei.timed_out)
+        self.assertEqual(self.written, ['AT+CGSN'])
+
+    def test_cancel_in_flight_drops_late_reply(self):
+        self.queue.submit('AT+CGSN')
+        self.queue.check_timeouts()
+        self.queue.cancel_in_flight()
+        self.assertEqual(self.queue.in_flight(), 0)
+        self.assertEqual(self.queue.next_deadline(), None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of streaming DTMF tones in chunks.
+
+Run with "python -m unittest test_dtmf".
+"""
+
+# Standard library modules
+import unittest
+
+# Local application modules
+from dtmf import DtmfStream, parse_tones
+from framing import CommandResponse
+
+class FakeDevice(object):
+    """
+    Answers AT+VTS commands at once, rejecting those with more than
+    "vts_max" tones with "length_error" and failing the commands listed
+    in "errors" in turn.
+    """
+
+    def __init__(self, vts_max=None, length_error='ERROR', errors=()):
+        self.vts_max = vts_max
+        self.length_error = length_error
+        self.errors = list(errors)
+        self.commands = []
+        self.tones = ''
+
+    def send(self, command):
+        self.commands.append(command)
+        response = CommandResponse(command)
+        if command.startswith('AT+VTS='):
+            tones = command[len('AT+VTS='):].strip('"').replace(',', '')
+            if self.errors:
+                error = self.errors.pop(0)
+                if error == 'TIMEOUT':
+                    response.timed_out = True
+                    response.finish()
+                else:
+                    response.finish(error)
+                return response
+            if self.vts_max is not None and len(tones) > self.vts_max:
+                response.finish(self.length_error)
+                return response
+            self.tones += tones
+        response.finish('OK')
+        return response
+
+class DtmfStreamTest(unittest.TestCase):
+
+    def stream(self, device, tones, **kwargs):
+        streams = []
+        stream = DtmfStream(device.send, tones, streams.append, **kwargs)
+        stream.start()
+        self.assertEqual(streams, [stream])
+        return stream
+
+    def test_parse_tones(self):
+        self.assertEqual(parse_tones('1, 2 a,#'), '12A#')
+        self.assertRaises(ValueError, parse_tones, '12X')
+        self.assertRaises(ValueError, parse_tones, ' , ')
+
+    def test_chunks(self):
+        device = FakeDevice()
+        stream = self.stream(device, '0123456789', chunk_size=4, duration=2)
+        self.assertEqual(device.commands[0], 'AT+VTD=2')
+        self.assertEqual(device.tones, '0123456789')
+        self.assertEqual((stream.chunks, stream.error), (3, None))
+
+    def test_halved_on_length_error(self):
+        device = FakeDevice(vts_max=5)
+        stream = self.stream(device, '0123456789ABCD*#')
+        self.assertEqual(device.tones, '0123456789ABCD*#')
+        self.assertEqual((stream.chunk_size, stream.error), (4, None))
+
+    def test_halved_on_incorrect_parameters(self):
+        device = FakeDevice(vts_max=2, length_error='+CME ERROR: 50')
+        stream = self.stream(device, '01234567', chunk_size=8)
+        self.assertEqual(device.tones, '01234567')
+        self.assertEqual(stream.chunk_size, 2)
+
+    def test_other_error_retried_once(self):
+        # An error that has nothing to do with the length keeps the size
+        device = FakeDevice(errors=['+CME ERROR: 3'])
+        stream = self.stream(device, '01234567', chunk_size=8)
+        self.assertEqual((device.tones, stream.chunk_size, stream.error), ('01234567', 8, None))
+
+    def test_other_error_stops(self):
+        device = FakeDevice(errors=['+CME ERROR: 3', '+CME ERROR: 3'])
+        stream = self.stream(device, '01234567', chunk_size=8)
+        self.assertEqual((device.tones, stream.chunk_size, stream.error), ('', 8, '+CME ERROR: 3'))
+        self.assertEqual(len(device.commands), 2)
+
+    def test_timeout_stops(self):
+        device = FakeDevice(errors=['TIMEOUT'])
+        stream = self.stream(device, '0123')
+        self.assertEqual((stream.position, stream.error), (0, 'TIMEOUT'))
+
+    def test_single_tone_rejected(self):
+        device = FakeDevice(vts_max=0)
+        stream = self.stream(device, '01', chunk_size=2)
+        self.assertEqual((stream.chunk_size, stream.error), (1, 'ERROR'))
+
+if __name__ == '__main__':
+    unittest.main()
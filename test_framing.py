@@ -0,0 +1,115 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of splitting received data into lines and matching responses to
+commands.
+
+Run with "python -m unittest test_framing".
+"""
+
+# Standard library modules
+import unittest
+
+# Local application modules
+from framing import LineFramer, ResponseMatcher, is_error_result, is_ok_result
+from urc import UrcDispatcher
+
+class LineFramerTest(unittest.TestCase):
+
+    def test_lines_split_across_chunks(self):
+        framer = LineFramer()
+        self.assertEqual(framer.feed('\r\nAC'), [])
+        self.assertEqual(framer.feed('ME\r\n\r\nO'), ['ACME'])
+        self.assertEqual(framer.feed('K\r\n'), ['OK'])
+
+    def test_reset_drops_partial_line(self):
+        framer = LineFramer()
+        framer.feed('garbage')
+        framer.reset()
+        self.assertEqual(framer.feed('OK\r\n'), ['OK'])
+
+class ResultCodeTest(unittest.TestCase):
+
+    def test_result_codes(self):
+        self.assertTrue(is_ok_result('OK'))
+        self.assertTrue(is_ok_result('CONNECT 9600'))
+        self.assertTrue(is_error_result('NO CARRIER'))
+        self.assertTrue(is_error_result('+CME ERROR: 16'))
+        self.assertFalse(is_ok_result('OKAY'))
+        self.assertFalse(is_error_result('+CMEE: 1'))
+
+class ResponseMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.urcs = []
+        dispatcher = UrcDispatcher()
+        dispatcher.register(None, lambda line, data: self.urcs.append(line))
+        self.matcher = ResponseMatcher(dispatcher)
+
+    def test_responses_in_order(self):
+        first = self.matcher.command_sent('AT+CGMI')
+        second = self.matcher.command_sent('AT+CLCK="SC",2')
+        self.matcher.feed('AT+CGMI\r\r\nACME\r\n\r\nOK\r\n\r\n+CME ERROR: 10\r\n')
+        self.assertEqual((first.lines, first.result), (['ACME'], 'OK'))
+        self.assertEqual((second.lines, second.result), ([], '+CME ERROR: 10'))
+        self.assertTrue(second.is_error())
+        self.assertEqual(first.round_trip_time() >= 0, True)
+
+    def test_echo_dropped(self):
+        # Only an echo before the information lines is dropped
+        response = self.matcher.command_sent('at+cgmi')
+        self.matcher.feed('AT+CGMI\r\nACME\r\nAT+CGMI\r\nOK\r\n')
+        self.assertEqual(response.lines, ['ACME', 'AT+CGMI'])
+
+    def test_urc_inside_response(self):
+        response = self.matcher.command_sent('AT+CGSN')
+        self.matcher.feed('\r\n350000000000001\r\n\r\nRING\r\n\r\nOK\r\n')
+        self.assertEqual(response.lines, ['350000000000001'])
+        self.assertEqual(self.urcs, ['RING'])
+
+    def test_lines_without_command_are_urcs(self):
+        self.matcher.feed('\r\n+CREG: 1\r\n\r\nOK\r\n')
+        self.assertEqual(self.urcs, ['+CREG: 1', 'OK'])
+
+    def test_expire_keeps_place(self):
+        first = self.matcher.command_sent('AT+CGSN')
+        second = self.matcher.command_sent('AT+CIMI')
+        placeholder = self.matcher.expire(first)
+        self.assertTrue(first.is_done())
+        self.assertEqual(first.result, None)
+        self.matcher.feed('\r\n350000000000001\r\n\r\nOK\r\n\r\n001010123456789\r\n\r\nOK\r\n')
+        self.assertEqual(first.lines, [])
+        self.assertEqual(placeholder.result, 'OK')
+        self.assertEqual(second.lines, ['001010123456789'])
+
+    def test_expire_finished_response(self):
+        response = self.matcher.command_sent('AT')
+        self.matcher.feed('OK\r\n')
+        self.assertEqual(self.matcher.expire(response), None)
+
+    def test_reset_cancels_pending(self):
+        response = self.matcher.command_sent('AT+CGSN')
+        self.matcher.feed('\r\n3500')
+        self.matcher.reset()
+        self.assertTrue(response.is_done())
+        self.assertEqual(response.result, None)
+        self.matcher.feed('\r\nRING\r\n')
+        self.assertEqual(self.urcs, ['RING'])
+
+if __name__ == '__main__':
+    unittest.main()
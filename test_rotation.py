@@ -0,0 +1,94 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the password rotation journal and resuming a rotation, run
+against the modem simulator.
+
+Run with "python -m unittest test_rotation".
+"""
+
+# Standard library modules
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+# Local application modules
+from modemsim import ModemSimulator
+from rotation import Journal, PasswordChange, PasswordRotation
+
+class RotationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.directory, 'journal.jsonl')
+        self.simulator = None
+
+    def tearDown(self):
+        if self.simulator is not None:
+            self.simulator.stop()
+        shutil.rmtree(self.directory)
+
+    def start_simulator(self, **kwargs):
+        self.simulator = ModemSimulator(**kwargs)
+        self.simulator.start()
+        return self.simulator.port
+
+    def rotate(self, changes, timeout=2.0):
+        journal = Journal(self.journal_path)
+        rotation = PasswordRotation(changes, journal, timeout=timeout)
+        rotation.run()
+        return rotation, journal
+
+    def test_plain_error_is_final(self):
+        # A modem without numeric error codes answers a wrong password with
+        # a plain ERROR, which must not be sent again when resuming
+        port = self.start_simulator(fail_commands=('+CMEE',))
+        self.simulator.error_format = 0
+        changes = [PasswordChange(port, 'P2', '0000', '8765')]
+
+        rotation, journal = self.rotate(changes)
+        self.assertEqual(journal.results[changes[0].key()], 'ERROR')
+
+        rotation, journal = self.rotate(changes)
+        self.assertEqual(rotation.skipped, changes)
+        self.assertEqual(self.simulator.passwords['P2'], '5678')
+
+    def test_resume_after_timeout(self):
+        # Every command times out, and the late reply to each must not be
+        # recorded as the result of the next change
+        port = self.start_simulator(latency=0.5)
+        changes = [PasswordChange(port, 'P2', '5678', '8765'),
+                   PasswordChange(port, 'AB', '9999', '4321')]
+
+        rotation, journal = self.rotate(changes, timeout=0.3)
+        self.assertEqual([journal.results[change.key()] for change in changes], ['TIMEOUT', 'TIMEOUT'])
+
+        # Let the simulator answer the commands still queued, then resume
+        time.sleep(1.0)
+        self.simulator.latency = 0.0
+        rotation, journal = self.rotate(changes)
+        self.assertEqual(rotation.skipped, [])
+        self.assertEqual([journal.results[change.key()] for change in changes],
+                         ['OK', '+CME ERROR: 16'])
+        self.assertEqual(self.simulator.passwords['P2'], '8765')
+        self.assertEqual(self.simulator.passwords['AB'], '0000')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of dispatching unsolicited result codes.
+
+Run with "python -m unittest test_urc".
+"""
+
+# Standard library modules
+import unittest
+
+# Local application modules
+from urc import UrcDispatcher, command_name
+
+class UrcDispatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatched = []
+        self.dispatcher = UrcDispatcher()
+
+    def handler(self, line, data):
+        self.dispatched.append((line, data))
+
+    def test_command_name(self):
+        self.assertEqual(command_name('AT+CREG?'), '+CREG')
+        self.assertEqual(command_name('at+clck="SC",2;+CGMI'), '+CLCK')
+
+    def test_dispatch_by_prefix(self):
+        self.dispatcher.register('+CLIP', self.handler)
+        self.assertTrue(self.dispatcher.process_line('+CLIP: "123",145'))
+        self.assertTrue(self.dispatcher.process_line('RING'))
+        self.assertEqual(self.dispatched, [('+CLIP: "123",145', None)])
+
+    def test_catch_all_handler(self):
+        self.dispatcher.register(None, self.handler)
+        self.dispatcher.process_line('RING')
+        self.assertEqual(self.dispatched, [('RING', None)])
+
+    def test_registered_prefix_recognised(self):
+        self.dispatcher.register('^SYSSTART', self.handler)
+        self.assertTrue(self.dispatcher.process_line('^SYSSTART', 'AT+CGMI'))
+        self.assertEqual(self.dispatched, [('^SYSSTART', None)])
+
+    def test_response_of_waiting_command(self):
+        self.dispatcher.register(None, self.handler)
+        self.assertFalse(self.dispatcher.process_line('+CREG: 0,1', 'AT+CREG?'))
+        self.assertFalse(self.dispatcher.process_line('ACME', 'AT+CGMI'))
+        self.assertTrue(self.dispatcher.process_line('+CREG: 1', 'AT+CGMI'))
+        self.assertEqual(self.dispatched, [('+CREG: 1', None)])
+
+    def test_listing_command_keeps_lines(self):
+        self.dispatcher.register(None, self.handler)
+        self.assertFalse(self.dispatcher.process_line('+CMTI', 'AT+CLAC'))
+        self.assertEqual(self.dispatched, [])
+
+    def test_data_urc(self):
+        self.dispatcher.register('+CMT', self.handler)
+        self.assertTrue(self.dispatcher.process_line('+CMT: "+123",,"10/01/01,12:00:00+00"', 'AT+CGMI'))
+        self.assertTrue(self.dispatcher.process_line('Hello', 'AT+CGMI'))
+        self.assertEqual(self.dispatched, [('+CMT: "+123",,"10/01/01,12:00:00+00"', 'Hello')])
+
+    def test_reset_drops_data_urc(self):
+        self.dispatcher.register('+CMT', self.handler)
+        self.dispatcher.process_line('+CMT: "+123"')
+        self.dispatcher.reset()
+        self.assertFalse(self.dispatcher.process_line('ACME', 'AT+CGMI'))
+        self.assertEqual(self.dispatched, [])
+
+if __name__ == '__main__':
+    unittest.main()
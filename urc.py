@@ -0,0 +1,134 @@
+# Copyright (c) 2010 Shelltoad Computing <info@shelltoad.com>
+#
+# This file is part of the "AT Command Toolkit" application.
+#
+# The "AT Command Toolkit" is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module containing the dispatcher for unsolicited result codes (URCs).
+
+URCs are lines the modem sends by itself to report events, such as an
+incoming call ("RING", "+CLIP: ...") or a new SMS ("+CMTI: ..."). They
+can arrive at any time, including in the middle of the response to a
+command, so lines are checked by the dispatcher before they are added to
+a response.
+"""
+
+# URC prefixes that are recognised without a handler being registered
+KNOWN_URCS = ('RING', '+CRING', '+CLIP', '+CCWA', '+CMTI', '+CMT', '+CDSI',
+              '+CDS', '+CBM', '+CREG', '+CGREG', '+CEREG', '+CUSD', '+CSSI',
+              '+CSSU', '+CGEV', '+CIEV')
+
+# URCs that are followed by a line of data (e.g. the text of an SMS)
+DATA_URCS = ('+CMT', '+CDS', '+CBM')
+
+# Commands whose responses list command names, which some devices give
+# without the "AT" prefix (e.g. "+CMTI") so they look like URCs
+LISTING_COMMANDS = ('+CLAC',)
+
+def line_prefix(line):
+    """
+    Return the part of a line before the first colon, or the whole line
+    if it has no colon.
+    """
+    index = line.find(':')
+    if index < 0:
+        return line
+    return line[:index]
+
+def command_name(command):
+    """
+    Return the name of an AT command, e.g. "+CREG" for "AT+CREG?".
+    Only the first command of a compound command line is considered.
+    """
+    name = command.upper()
+    if name.startswith('AT'):
+        name = name[2:]
+    for separator in ';=?':
+        index = name.find(separator)
+        if index >= 0:
+            name = name[:index]
+    return name.strip()
+
+class UrcDispatcher(object):
+    """
+    Routes URCs to the handlers registered for their prefix.
+
+    Each line is looked up by its prefix (the text before the colon) in a
+    dictionary, so checking a line costs the same however many handlers
+    are registered. Handlers are called with the line and, for the URCs
+    in "DATA_URCS", the line of data that follows it (otherwise None).
+    Handlers registered for the prefix None are called for every URC.
+
+    A line whose prefix matches the name of the command waiting for a
+    response is taken to be part of that response rather than a URC,
+    e.g. "+CREG: 0,1" in reply to "AT+CREG?". While a command of
+    "LISTING_COMMANDS" is waiting, every line is part of its response.
+    """
+
+    def __init__(self, prefixes=KNOWN_URCS):
+        self.prefixes = set(prefixes)
+        self.handlers = {}
+        self.data_urc = None
+
+    def register(self, prefix, handler):
+        """
+        Register a function to be called for URCs with the given prefix.
+        """
+        if prefix is not None:
+            self.prefixes.add(prefix)
+        self.handlers.setdefault(prefix, []).append(handler)
+
+    def unregister(self, prefix, handler):
+        self.handlers[prefix].remove(handler)
+
+    def process_line(self, line, command=None):
+        """
+        Dispatch the line if it is a URC and return True, otherwise return
+        False. "command" is the command waiting for a response, if any;
+        every line received while no command is waiting is a URC.
+        """
+
+        # The line is the data that follows a URC
+        if self.data_urc is not None:
+            urc, self.data_urc = self.data_urc, None
+            self.dispatch(urc, line)
+            return True
+
+        prefix = line_prefix(line)
+        if command is not None:
+            name = command_name(command)
+            if prefix not in self.prefixes or prefix == name or name in LISTING_COMMANDS:
+                return False
+
+        if prefix in DATA_URCS:
+            self.data_urc = line
+        else:
+            self.dispatch(line)
+        return True
+
+    def dispatch(self, line, data=None):
+        """
+        Call the handlers of a URC.
+        """
+        for handler in self.handlers.get(line_prefix(line), ()):
+            handler(line, data)
+        for handler in self.handlers.get(None, ()):
+            handler(line, data)
+
+    def reset(self):
+        """
+        Discard a URC that is waiting for its line of data.
+        """
+        self.data_urc = None